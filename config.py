@@ -8,6 +8,7 @@ class Config:
         FPS (int): Frames per second for the game loop.
         FONT_SMALL_SIZE (int): Font size for small text.
         FONT_LARGE_SIZE (int): Font size for large text.
+        FONT_LABEL_SIZE (int): Font size for the chord labels on the circle.
         COLORS (dict): Dictionary of commonly used colors.
         CIRCLE_CENTER (tuple): (x, y) coordinates for the center of the circle.
         CIRCLE_RADIUS (int): Outer radius of the circle.
@@ -20,9 +21,11 @@ class Config:
     FPS = 60
     FONT_SMALL_SIZE = 20
     FONT_LARGE_SIZE = 48
+    FONT_LABEL_SIZE = 30
     COLORS = {
         "background": (30, 30, 30),
         "text": (255, 255, 255),
+        "flash": (255, 220, 90),
     }
     CIRCLE_CENTER = (400, 360)
     CIRCLE_RADIUS = 200
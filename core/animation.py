@@ -0,0 +1,288 @@
+import time
+from typing import Callable, Optional, Set
+
+from core.timer_wheel import TICK_SECONDS, Timer, TimerWheel
+
+# Seconds between toggles of the blinking chord highlight.
+BLINK_SECONDS: float = 0.5
+
+
+class AnimationScheduler:
+    """
+    Schedules animation callbacks on a TimerWheel read against an injectable clock.
+
+    Effects schedule their state changes here instead of counting frames, so they run at the
+    same speed at any frame rate, and next_deadline() tells an idle loop how long it may sleep.
+    Tests and replays pass a virtual clock to run animations faster than real time.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, tick_seconds: float = TICK_SECONDS) -> None:
+        """
+        Initializes the scheduler at the clock's current time.
+
+        Args:
+            clock (Callable[[], float]): Time source in seconds.
+            tick_seconds (float): Resolution of the timer wheel.
+        """
+        self.clock = clock
+        self.wheel = TimerWheel(tick_seconds, clock())
+        self.changed: bool = False
+        # Effects that change every frame while active, such as fades.
+        self.continuous: Set[object] = set()
+
+    def now(self) -> float:
+        """
+        Returns the clock's current time in seconds.
+        """
+        return self.clock()
+
+    def after(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+        Runs a callback once after a delay.
+
+        Args:
+            delay (float): Delay in seconds.
+            callback (Callable[[], None]): Called with no arguments.
+
+        Returns:
+            Timer: Handle for cancel().
+        """
+        return self.wheel.schedule(self.clock(), delay, callback)
+
+    def every(self, interval: float, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Runs a callback repeatedly. Each run is scheduled from the previous deadline rather than
+        from when it ran, so late frames do not make the period drift.
+
+        Args:
+            interval (float): Period in seconds.
+            callback (Callable[[], None]): Called with no arguments.
+
+        Returns:
+            Callable[[], None]: Stops the repetition.
+        """
+        handle = {"deadline": self.clock() + interval, "timer": None}
+
+        def run() -> None:
+            handle["deadline"] += interval
+            handle["timer"] = self.wheel.schedule_at(handle["deadline"], run)
+            callback()
+
+        handle["timer"] = self.wheel.schedule_at(handle["deadline"], run)
+        return lambda: self.wheel.cancel(handle["timer"])
+
+    def cancel(self, timer: Optional[Timer]) -> None:
+        """
+        Cancels a timer returned by after(); None is ignored.
+        """
+        if timer is not None:
+            self.wheel.cancel(timer)
+
+    def mark_changed(self) -> None:
+        """
+        Records that an effect changed what is drawn, for the next update().
+        """
+        self.changed = True
+
+    def update(self) -> bool:
+        """
+        Runs every callback that is due.
+
+        Returns:
+            bool: True if the screen needs redrawing: a callback ran, an effect changed or a
+                continuous effect is active.
+        """
+        fired = self.wheel.advance(self.clock())
+        changed = self.changed or fired > 0 or bool(self.continuous)
+        self.changed = False
+        return changed
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Returns the time by which update() must be called again, or None if nothing is
+        scheduled. While a continuous effect is active, that is now.
+        """
+        if self.continuous or self.changed:
+            return self.clock()
+        return self.wheel.next_deadline()
+
+
+class Blink:
+    """
+    Toggles between on and off at a fixed interval.
+    """
+
+    def __init__(self, scheduler: AnimationScheduler, interval: float = BLINK_SECONDS) -> None:
+        """
+        Initializes a stopped blink in the off state.
+
+        Args:
+            scheduler (AnimationScheduler): The scheduler driving the blink.
+            interval (float): Seconds between toggles.
+        """
+        self.scheduler = scheduler
+        self.interval = interval
+        self.on: bool = False
+        self.stop: Optional[Callable[[], None]] = None
+
+    def _toggle(self) -> None:
+        self.on = not self.on
+
+    def start(self) -> None:
+        """
+        Starts blinking from the off state.
+        """
+        self.reset()
+        self.stop = self.scheduler.every(self.interval, self._toggle)
+
+    def reset(self) -> None:
+        """
+        Turns the blink off and restarts its interval, if it is running.
+        """
+        running = self.stop is not None
+        if running:
+            self.stop()
+            self.stop = None
+        if self.on:
+            self.on = False
+            self.scheduler.mark_changed()
+        if running:
+            self.stop = self.scheduler.every(self.interval, self._toggle)
+
+
+class Flash:
+    """
+    Stays active for a fixed time after each trigger, e.g. to highlight feedback.
+    """
+
+    def __init__(self, scheduler: AnimationScheduler, duration: float = 0.3) -> None:
+        """
+        Initializes an inactive flash.
+
+        Args:
+            scheduler (AnimationScheduler): The scheduler driving the flash.
+            duration (float): Seconds the flash stays active.
+        """
+        self.scheduler = scheduler
+        self.duration = duration
+        self.active: bool = False
+        self.timer: Optional[Timer] = None
+
+    def _end(self) -> None:
+        self.active = False
+        self.timer = None
+
+    def trigger(self) -> None:
+        """
+        Activates the flash, restarting it if it is already active.
+        """
+        self.scheduler.cancel(self.timer)
+        self.active = True
+        self.timer = self.scheduler.after(self.duration, self._end)
+        self.scheduler.mark_changed()
+
+
+class Fade:
+    """
+    Interpolates from 0.0 to 1.0 over a fixed time. While it runs the scheduler asks for a
+    redraw every frame.
+    """
+
+    def __init__(self, scheduler: AnimationScheduler, duration: float = 0.25) -> None:
+        """
+        Initializes a fade that has finished.
+
+        Args:
+            scheduler (AnimationScheduler): The scheduler driving the fade.
+            duration (float): Length of the fade in seconds.
+        """
+        self.scheduler = scheduler
+        self.duration = duration
+        self.started: Optional[float] = None
+        self.timer: Optional[Timer] = None
+
+    def _end(self) -> None:
+        self.started = None
+        self.timer = None
+        self.scheduler.continuous.discard(self)
+
+    def start(self) -> None:
+        """
+        Starts the fade from 0.0.
+        """
+        self.scheduler.cancel(self.timer)
+        self.started = self.scheduler.now()
+        self.timer = self.scheduler.after(self.duration, self._end)
+        self.scheduler.continuous.add(self)
+
+    @property
+    def running(self) -> bool:
+        """
+        Returns whether the fade is in progress.
+        """
+        return self.started is not None
+
+    def value(self) -> float:
+        """
+        Returns the progress of the fade, 1.0 once it has finished.
+        """
+        if self.started is None:
+            return 1.0
+        return min(1.0, (self.scheduler.now() - self.started) / self.duration)
+
+
+class Countdown:
+    """
+    Counts down whole seconds and calls back when it reaches zero.
+    """
+
+    def __init__(
+        self,
+        scheduler: AnimationScheduler,
+        seconds: int,
+        on_expire: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Initializes a stopped countdown.
+
+        Args:
+            scheduler (AnimationScheduler): The scheduler driving the countdown.
+            seconds (int): Length of the countdown in seconds.
+            on_expire (Optional[Callable[[], None]]): Called when the countdown reaches zero.
+        """
+        self.scheduler = scheduler
+        self.seconds = seconds
+        self.on_expire = on_expire
+        self.remaining: int = seconds
+        self.stop: Optional[Callable[[], None]] = None
+
+    def _tick(self) -> None:
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.cancel()
+            if self.on_expire is not None:
+                self.on_expire()
+
+    def start(self) -> None:
+        """
+        Starts or restarts the countdown from its full length.
+        """
+        self.cancel()
+        self.remaining = self.seconds
+        self.stop = self.scheduler.every(1.0, self._tick)
+        self.scheduler.mark_changed()
+
+    def cancel(self) -> None:
+        """
+        Stops the countdown where it is.
+        """
+        if self.stop is not None:
+            self.stop()
+            self.stop = None
+
+    @property
+    def done(self) -> bool:
+        """
+        Returns whether the countdown has reached zero.
+        """
+        return self.remaining <= 0
@@ -0,0 +1,386 @@
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from core.chord import Chord
+from core.circle import CircleOfFifths, ChordType, QuestionType
+from core.game_core import ANSWERS_BY_RESULT, QUESTIONS
+from core.key_distance import CREDIT_BY_DISTANCE, DISTANCES, key_index
+from core.naming import ENGLISH, NamingSystem
+from core.questions import question_kind
+
+CHORD_TYPES: List[ChordType] = [ChordType.MAJOR, ChordType.MINOR]
+# Number of correct answers a ring question can have (ANY accepts three).
+MAX_ANSWERS: int = 3
+NOT_FOUND: int = -1
+
+# The distance and credit tables of core.key_distance as arrays, for vectorized lookups.
+DISTANCE_MATRIX: np.ndarray = np.array(DISTANCES, dtype=np.int8)
+DISTANCE_MATRIX.setflags(write=False)
+CREDIT_TABLE: np.ndarray = np.array(CREDIT_BY_DISTANCE)
+CREDIT_TABLE.setflags(write=False)
+
+
+def distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Returns the circle distances for arrays of key pairs in one vectorized lookup.
+
+    Args:
+        a (np.ndarray): Integer array of first key numbers.
+        b (np.ndarray): Integer array of second key numbers, broadcastable against a.
+
+    Returns:
+        np.ndarray: The step counts.
+    """
+    return DISTANCE_MATRIX[a, b]
+
+
+def build_answer_table(circle: CircleOfFifths, question_types: Sequence[QuestionType]) -> np.ndarray:
+    """
+    Precomputes the correct answers of every (question type, key) pair from
+    CircleOfFifths.get_next_chord, so the batch engine grades exactly like GameCore.
+
+    Args:
+        circle (CircleOfFifths): The circle.
+        question_types (Sequence[QuestionType]): The ring question types.
+
+    Returns:
+        np.ndarray: int16 array of shape (len(question_types), keys, MAX_ANSWERS) holding key
+            numbers; questions with fewer answers repeat their first one.
+    """
+    size = len(circle.major_chords)
+    table = np.zeros((len(question_types), 2 * size, MAX_ANSWERS), dtype=np.int16)
+    for q, question_type in enumerate(question_types):
+        for minor, chord_type in enumerate(CHORD_TYPES):
+            for i, chord in enumerate(circle.get_chord_list(chord_type)):
+                answers = [circle.key_indices[c] for c in circle.get_next_chord(chord, question_type, chord_type)]
+                answers += answers[:1] * (MAX_ANSWERS - len(answers))
+                table[q, key_index(i, bool(minor), size)] = answers
+    return table
+
+
+class BatchGameCore:
+    """
+    Struct-of-arrays engine that runs many quiz sessions at once.
+
+    Every per-session field of GameCore is a NumPy array indexed by session number, so drawing
+    questions or grading answers for all sessions is a handful of vectorized operations instead
+    of a Python call per session. Only ring questions are supported; theory questions need the
+    per-question detail that GameCore keeps.
+    """
+
+    def __init__(
+        self,
+        sessions: int,
+        seed: Optional[int] = None,
+        question_types: Optional[Sequence[QuestionType]] = None,
+        naming: Optional[NamingSystem] = None,
+        circle: Optional[CircleOfFifths] = None,
+    ) -> None:
+        """
+        Initializes the sessions with every chord selected and no question asked yet.
+
+        Args:
+            sessions (int): Number of sessions.
+            seed (Optional[int]): Seed for the question generator of all sessions.
+            question_types (Optional[Sequence[QuestionType]]): Ring question types to ask.
+                Defaults to fill-in questions only.
+            naming (Optional[NamingSystem]): How typed answers are written. Defaults to English.
+            circle (Optional[CircleOfFifths]): The circle to practice. Defaults to the built-in
+                circle of fifths.
+
+        Raises:
+            ValueError: If a question type that is not answered by ring moves, such as theory
+                and progression questions, is requested.
+        """
+        self.circle = circle or CircleOfFifths()
+        self.naming: NamingSystem = naming or ENGLISH
+        self.question_types: List[QuestionType] = list(question_types or [QuestionType.FILL_IN])
+        for question_type in self.question_types:
+            kind = question_kind(question_type)
+            if kind.check is not None or not 0 < len(kind.moves) <= MAX_ANSWERS:
+                raise ValueError(f"The batch engine only asks question types answered by 1 to {MAX_ANSWERS} ring moves")
+        # Upper bounds of each question type's share of [0, 1), by registered weight.
+        weights = np.array([question_kind(q).weight for q in self.question_types], dtype=np.float64)
+        self.question_bounds = np.cumsum(weights) / weights.sum()
+        self.size = len(self.circle.major_chords)
+        self.sessions = sessions
+        self.rng = np.random.default_rng(seed)
+        self.answer_table = build_answer_table(self.circle, self.question_types)
+        if self.circle.is_standard:
+            self.distance_matrix, self.credit_table = DISTANCE_MATRIX, CREDIT_TABLE
+        else:
+            self.distance_matrix = np.array(self.circle.distances, dtype=np.int8)
+            self.credit_table = np.array(self.circle.credit_by_distance)
+        self.chords: List[Chord] = self.circle.major_chords + self.circle.minor_chords
+        self._answer_keys: Dict[str, int] = {}
+
+        self.selection = np.ones((sessions, self.size), dtype=bool)
+        self.chord_type = np.zeros(sessions, dtype=np.int8)
+        self.current_index = np.full(sessions, NOT_FOUND, dtype=np.int16)
+        self.current_question = np.zeros(sessions, dtype=np.int8)
+        self.correct_answers = np.zeros(sessions, dtype=np.int64)
+        self.total_questions = np.zeros(sessions, dtype=np.int64)
+        self.total_score = np.zeros(sessions, dtype=np.float64)
+        self.time_sum = np.zeros(sessions, dtype=np.float64)
+        self.answered = np.zeros(sessions, dtype=bool)
+        self.last_answer = np.full(sessions, NOT_FOUND, dtype=np.int16)
+        self.last_correct = np.zeros(sessions, dtype=bool)
+        self.last_score = np.zeros(sessions, dtype=np.float64)
+
+    def _rows(self, sessions: Optional[np.ndarray]) -> Union[slice, np.ndarray]:
+        return slice(None) if sessions is None else np.asarray(sessions)
+
+    def current_keys(self, sessions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Returns the key number of each session's current chord.
+        """
+        rows = self._rows(sessions)
+        return self.current_index[rows] + self.size * self.chord_type[rows]
+
+    def next_questions(self, sessions: Optional[np.ndarray] = None) -> None:
+        """
+        Draws a new question for every given session with one call to the generator.
+
+        The chord is picked uniformly among each session's selected chords by giving every
+        chord a random key and taking the largest key among the selected ones. The question
+        type is picked by the registered weights, as GameCore does.
+
+        Args:
+            sessions (Optional[np.ndarray]): Session numbers, or None for all sessions.
+
+        Raises:
+            ValueError: If a session has no chords selected.
+        """
+        rows = self._rows(sessions)
+        selection = self.selection[rows]
+        if not selection.any(axis=1).all():
+            raise ValueError("Every session needs at least one selected chord")
+        draws = self.rng.random((selection.shape[0], self.size + 2))
+        self.chord_type[rows] = draws[:, 0] < 0.5
+        question = np.searchsorted(self.question_bounds, draws[:, 1], side="right")
+        self.current_question[rows] = np.minimum(question, len(self.question_types) - 1)
+        keys = np.where(selection, draws[:, 2:], -1.0)
+        self.current_index[rows] = keys.argmax(axis=1)
+        self.answered[rows] = False
+        QUESTIONS.inc(selection.shape[0])
+
+    def answer_keys(self, answers: Sequence[str]) -> np.ndarray:
+        """
+        Looks up the key number of each typed answer, NOT_FOUND for unknown chords. Each
+        distinct string is resolved with CircleOfFifths.find_chord once and then cached.
+
+        Args:
+            answers (Sequence[str]): The answers.
+        """
+        cache = self._answer_keys
+        keys = np.empty(len(answers), dtype=np.int16)
+        for i, answer in enumerate(answers):
+            key = cache.get(answer)
+            if key is None:
+                chord = self.circle.find_chord(self.naming.normalize(answer))
+                key = cache[answer] = NOT_FOUND if chord is None else self.circle.key_indices[chord]
+            keys[i] = key
+        return keys
+
+    def submit_answers(
+        self,
+        answers: Union[np.ndarray, Sequence[str]],
+        sessions: Optional[np.ndarray] = None,
+        seconds: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Grades one answer per given session, with the same partial credit as GameCore.
+
+        Args:
+            answers (Union[np.ndarray, Sequence[str]]): Answered key numbers (NOT_FOUND for
+                unknown chords), or the answers as typed.
+            sessions (Optional[np.ndarray]): Session numbers, or None for all sessions.
+            seconds (Optional[np.ndarray]): Response times to add to the sessions' totals.
+
+        Returns:
+            np.ndarray: Whether each answer is correct.
+
+        Raises:
+            ValueError: If a session has not been asked a question yet.
+        """
+        rows = self._rows(sessions)
+        if (self.current_index[rows] == NOT_FOUND).any():
+            raise ValueError("Every session needs a question before it can be graded")
+        if not isinstance(answers, np.ndarray):
+            answers = self.answer_keys(answers)
+        expected = self.answer_table[self.current_question[rows], self.current_keys(sessions)]
+        found = answers >= 0
+        correct = found & (expected == answers[:, None]).any(axis=1)
+        steps = self.distance_matrix[np.where(found, answers, 0)[:, None], expected].min(axis=1)
+        score = np.where(found, self.credit_table[steps], 0.0)
+
+        self.total_questions[rows] += 1
+        self.correct_answers[rows] += correct
+        self.total_score[rows] += score
+        if seconds is not None:
+            self.time_sum[rows] += seconds
+        self.answered[rows] = True
+        self.last_answer[rows] = answers
+        self.last_correct[rows] = correct
+        self.last_score[rows] = score
+
+        right = int(np.count_nonzero(correct))
+        not_found = int(np.count_nonzero(~found))
+        ANSWERS_BY_RESULT["correct"].inc(right)
+        ANSWERS_BY_RESULT["not_found"].inc(not_found)
+        ANSWERS_BY_RESULT["incorrect"].inc(len(correct) - right - not_found)
+        return correct
+
+    def session(self, index: int) -> "BatchSession":
+        """
+        Returns a GameCore-compatible view of one session.
+        """
+        if not 0 <= index < self.sessions:
+            raise IndexError(index)
+        return BatchSession(self, index)
+
+
+class BatchSession:
+    """
+    View of one session of a BatchGameCore with the interface of GameCore. Reads and writes
+    go straight to the engine's arrays.
+    """
+
+    def __init__(self, engine: BatchGameCore, index: int) -> None:
+        """
+        Initializes the view.
+
+        Args:
+            engine (BatchGameCore): The engine holding the session.
+            index (int): The session number.
+        """
+        self.engine = engine
+        self.index = index
+
+    @property
+    def circle(self) -> CircleOfFifths:
+        """
+        The engine's circle.
+        """
+        return self.engine.circle
+
+    @property
+    def chord_type(self) -> ChordType:
+        """
+        The chord type of the current question.
+        """
+        return CHORD_TYPES[self.engine.chord_type[self.index]]
+
+    @property
+    def current_index(self) -> Optional[int]:
+        """
+        Ring index of the current chord, or None before the first question.
+        """
+        index = int(self.engine.current_index[self.index])
+        return None if index == NOT_FOUND else index
+
+    @property
+    def current_chord(self) -> Optional[Chord]:
+        """
+        The chord of the current question.
+        """
+        if self.current_index is None:
+            return None
+        return self.engine.chords[int(self.engine.current_keys(np.array([self.index]))[0])]
+
+    @property
+    def current_question(self) -> Optional[QuestionType]:
+        """
+        The type of the current question.
+        """
+        if self.current_index is None:
+            return None
+        return self.engine.question_types[self.engine.current_question[self.index]]
+
+    @property
+    def correct_answers(self) -> int:
+        """
+        Number of correct answers.
+        """
+        return int(self.engine.correct_answers[self.index])
+
+    @property
+    def total_questions(self) -> int:
+        """
+        Number of answered questions.
+        """
+        return int(self.engine.total_questions[self.index])
+
+    @property
+    def last_result(self) -> Optional[Dict[str, Any]]:
+        """
+        The result of the last answer, shaped like GameCore.last_result.
+        """
+        engine, i = self.engine, self.index
+        if not engine.answered[i]:
+            return None
+        if engine.last_answer[i] == NOT_FOUND:
+            return {"correct": False, "reason": "not_found", "score": 0.0}
+        return {
+            "correct": bool(engine.last_correct[i]),
+            "answer": engine.chords[engine.last_answer[i]],
+            "score": float(engine.last_score[i]),
+        }
+
+    def set_selected_chord_indices(self, indices: List[int]) -> None:
+        """
+        Sets the selected chord indices of the session.
+        """
+        row = self.engine.selection[self.index]
+        row[:] = False
+        row[list(indices)] = True
+
+    def get_selected_chord_indices(self) -> set:
+        """
+        Returns the set of selected chord indices.
+        """
+        return set(np.flatnonzero(self.engine.selection[self.index]).tolist())
+
+    def next_question(self) -> None:
+        """
+        Draws the next question of this session.
+        """
+        self.engine.next_questions(np.array([self.index]))
+
+    def submit_answer(self, answer: str) -> bool:
+        """
+        Grades an answer and returns whether it is correct.
+        """
+        return bool(self.engine.submit_answers([answer], np.array([self.index]))[0])
+
+    def get_stats(self) -> tuple:
+        """
+        Returns (correct answers, total questions).
+        """
+        return self.correct_answers, self.total_questions
+
+    def get_score(self) -> float:
+        """
+        Returns the total credit earned.
+        """
+        return float(self.engine.total_score[self.index])
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Returns the session state like GameCore.get_state.
+        """
+        return {
+            "chord_type": self.chord_type,
+            "current_chord": self.current_chord,
+            "current_question": self.current_question,
+            "question_detail": {},
+            "selected_chord_indices": sorted(self.get_selected_chord_indices()),
+            "last_result": self.last_result,
+            "naming": self.engine.naming,
+        }
+
+    def get_chord_list(self, chord_type: ChordType) -> List[Chord]:
+        """
+        Returns the list of chords for a chord type.
+        """
+        return self.engine.circle.get_chord_list(chord_type)
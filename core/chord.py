@@ -1,4 +1,5 @@
 from typing import List, Any
+from core.chord_symbol import ChordSymbol, parse_chord_symbol
 
 class Chord:
     """
@@ -24,6 +25,19 @@ class Chord:
         """
         return self.name
 
+    @property
+    def symbol(self) -> ChordSymbol:
+        """
+        Returns the parsed chord symbol of the chord's main name.
+
+        Returns:
+            ChordSymbol: The interned symbol with root and pitch-class set.
+
+        Raises:
+            ValueError: If the main name is not a valid chord symbol.
+        """
+        return parse_chord_symbol(self.alternative_names[0])
+
     def contains(self, name: str) -> bool:
         """
         Checks if the given name matches any of the chord's alternative names.
@@ -0,0 +1,212 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+NOTE_PITCH_CLASSES: Dict[str, int] = {
+    "C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11,
+}
+
+PITCH_CLASS_NAMES: Tuple[str, ...] = ("C", "C#", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B")
+
+FULL_MASK: int = 0xFFF
+
+# Semitone intervals above the root, keyed by canonical quality suffix.
+QUALITY_INTERVALS: Dict[str, Tuple[int, ...]] = {
+    "": (0, 4, 7),
+    "m": (0, 3, 7),
+    "dim": (0, 3, 6),
+    "aug": (0, 4, 8),
+    "sus2": (0, 2, 7),
+    "sus4": (0, 5, 7),
+    "5": (0, 7),
+    "6": (0, 4, 7, 9),
+    "m6": (0, 3, 7, 9),
+    "7": (0, 4, 7, 10),
+    "maj7": (0, 4, 7, 11),
+    "m7": (0, 3, 7, 10),
+    "mmaj7": (0, 3, 7, 11),
+    "dim7": (0, 3, 6, 9),
+    "m7b5": (0, 3, 6, 10),
+    "aug7": (0, 4, 8, 10),
+    "7sus4": (0, 5, 7, 10),
+    "add9": (0, 2, 4, 7),
+    "madd9": (0, 2, 3, 7),
+    "9": (0, 2, 4, 7, 10),
+    "maj9": (0, 2, 4, 7, 11),
+    "m9": (0, 2, 3, 7, 10),
+    "11": (0, 2, 4, 5, 7, 10),
+    "13": (0, 2, 4, 7, 9, 10),
+}
+
+# Alternative spellings of the quality suffixes.
+QUALITY_ALIASES: Dict[str, str] = {
+    "M": "", "maj": "", "major": "",
+    "min": "m", "minor": "m", "-": "m",
+    "°": "dim", "o": "dim",
+    "+": "aug",
+    "sus": "sus4",
+    "M7": "maj7", "Δ": "maj7", "Δ7": "maj7", "ma7": "maj7",
+    "min7": "m7", "-7": "m7",
+    "mM7": "mmaj7", "m(maj7)": "mmaj7", "mMaj7": "mmaj7",
+    "°7": "dim7", "o7": "dim7",
+    "ø": "m7b5", "ø7": "m7b5", "m7(b5)": "m7b5", "min7b5": "m7b5",
+    "+7": "aug7", "7#5": "aug7", "7+5": "aug7",
+    "M9": "maj9", "min9": "m9", "add2": "add9",
+}
+
+_SYMBOL_RE = re.compile(r"^([A-G])([#b]*)(.*?)(?:/([A-G])([#b]*))?$")
+
+
+def pitch_class(letter: str, accidentals: str) -> int:
+    """
+    Returns the pitch class (0-11, C = 0) of a note letter with accidentals.
+
+    Args:
+        letter (str): Note letter A-G.
+        accidentals (str): Any number of '#' and 'b' characters.
+    """
+    return (NOTE_PITCH_CLASSES[letter] + accidentals.count("#") - accidentals.count("b")) % 12
+
+
+def mask_from_pitch_classes(pitch_classes) -> int:
+    """
+    Returns the 12-bit set with a bit for each pitch class.
+    """
+    mask = 0
+    for pc in pitch_classes:
+        mask |= 1 << (pc % 12)
+    return mask
+
+
+def transpose_mask(mask: int, semitones: int) -> int:
+    """
+    Transposes a 12-bit pitch-class set by rotating its bits.
+
+    Args:
+        mask (int): The pitch-class set.
+        semitones (int): Number of semitones up (negative for down).
+    """
+    n = semitones % 12
+    return ((mask << n) | (mask >> (12 - n))) & FULL_MASK
+
+
+def mask_pitch_classes(mask: int) -> List[int]:
+    """
+    Returns the pitch classes in a 12-bit set, in ascending order.
+    """
+    return [pc for pc in range(12) if mask >> pc & 1]
+
+
+class ChordSymbol:
+    """
+    A parsed chord symbol: root, quality, optional bass note and 12-bit pitch-class set.
+
+    Instances are interned, so equal symbols are the same object and can be compared with `is`.
+    """
+
+    __slots__ = ("root", "quality", "bass", "mask", "root_mask")
+
+    _interned: Dict[Tuple[int, str, Optional[int]], "ChordSymbol"] = {}
+
+    def __init__(self, root: int, quality: str, bass: Optional[int]) -> None:
+        """
+        Initializes the symbol. Use ChordSymbol.get or parse_chord_symbol instead.
+        """
+        self.root: int = root
+        self.quality: str = quality
+        self.bass: Optional[int] = bass
+        self.root_mask: int = transpose_mask(mask_from_pitch_classes(QUALITY_INTERVALS[quality]), root)
+        self.mask: int = self.root_mask | (1 << bass if bass is not None else 0)
+
+    @classmethod
+    def get(cls, root: int, quality: str = "", bass: Optional[int] = None) -> "ChordSymbol":
+        """
+        Returns the interned symbol for a root, quality and bass.
+
+        Args:
+            root (int): Root pitch class.
+            quality (str): Canonical quality, a key of QUALITY_INTERVALS.
+            bass (Optional[int]): Bass pitch class of a slash chord; None if it is the root.
+        """
+        root %= 12
+        if bass is not None:
+            bass %= 12
+            if bass == root:
+                bass = None
+        key = (root, quality, bass)
+        symbol = cls._interned.get(key)
+        if symbol is None:
+            symbol = cls._interned[key] = cls(root, quality, bass)
+        return symbol
+
+    @property
+    def pitch_classes(self) -> List[int]:
+        """
+        Returns the pitch classes of the chord in ascending order.
+        """
+        return mask_pitch_classes(self.mask)
+
+    def transpose(self, semitones: int) -> "ChordSymbol":
+        """
+        Returns the symbol transposed by the given number of semitones.
+        """
+        bass = None if self.bass is None else self.bass + semitones
+        return ChordSymbol.get(self.root + semitones, self.quality, bass)
+
+    def same_notes(self, other: "ChordSymbol") -> bool:
+        """
+        Returns True if both chords contain the same pitch classes, e.g. a chord and its inversion.
+        """
+        return self.mask == other.mask
+
+    def contains(self, other: "ChordSymbol") -> bool:
+        """
+        Returns True if every pitch class of other is also in this chord.
+        """
+        return other.mask & ~self.mask == 0
+
+    def __str__(self) -> str:
+        name = PITCH_CLASS_NAMES[self.root] + self.quality
+        if self.bass is not None:
+            name += "/" + PITCH_CLASS_NAMES[self.bass]
+        return name
+
+    def __repr__(self) -> str:
+        return f"ChordSymbol({str(self)!r})"
+
+
+@lru_cache(maxsize=4096)
+def parse_chord_symbol(text: str) -> ChordSymbol:
+    """
+    Parses a chord symbol such as C, Cm, C7, Cmaj7, Cm7b5, Csus4 or C/E.
+
+    Args:
+        text (str): The chord symbol. Unicode sharps and flats are accepted.
+
+    Returns:
+        ChordSymbol: The interned parsed symbol.
+
+    Raises:
+        ValueError: If the text is not a recognized chord symbol.
+    """
+    normalized = text.strip().replace("♯", "#").replace("♭", "b")
+    match = _SYMBOL_RE.match(normalized)
+    if match is None:
+        raise ValueError(f"Not a chord symbol: {text!r}")
+    letter, accidentals, quality, bass_letter, bass_accidentals = match.groups()
+    quality = QUALITY_ALIASES.get(quality, quality)
+    if quality not in QUALITY_INTERVALS:
+        raise ValueError(f"Unknown chord quality in {text!r}")
+    root = pitch_class(letter, accidentals)
+    bass = pitch_class(bass_letter, bass_accidentals or "") if bass_letter else None
+    return ChordSymbol.get(root, quality, bass)
+
+
+def try_parse_chord_symbol(text: str) -> Optional[ChordSymbol]:
+    """
+    Parses a chord symbol, returning None instead of raising for invalid text.
+    """
+    try:
+        return parse_chord_symbol(text)
+    except ValueError:
+        return None
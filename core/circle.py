@@ -1,22 +1,14 @@
 from core.chord import Chord
+from core.chord_symbol import try_parse_chord_symbol
+from core.circle_definition import CompiledCircle, standard_circle
+from core.constants import CIRCLE_SIZE, ChordType, QuestionType
+from core.questions import QUESTION_KINDS
 from enum import Enum
-from typing import List, Optional
-from core.chord_lists import major_chords, minor_chords
+from typing import Dict, List, Optional, Tuple
 
-class QuestionType(Enum):
-    """Enumeration for the different types of quiz questions."""
-    CLOCKWISE = 1
-    COUNTERCLOCKWISE = 2
-    ALTERNATIVE_CIRCLE = 3
-    ANY = 4
-    FILL_IN = 5
+# The compiled built-in circle, which theory questions assume.
+STANDARD_CIRCLE: CompiledCircle = standard_circle()
 
-class ChordType(Enum):
-    """Enumeration for chord types (major or minor)."""
-    MAJOR = 1
-    MINOR = 2
-
-CIRCLE_SIZE: int = 12  # Number of chords in the circle
 
 class CircleOfFifths:
     """
@@ -24,12 +16,63 @@ class CircleOfFifths:
     for chord lookup, neighbor calculation, and answer checking.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, compiled: Optional[CompiledCircle] = None) -> None:
+        """
+        Initializes the circle from its compiled lookup tables.
+
+        Args:
+            compiled (Optional[CompiledCircle]): A circle compiled by core.circle_definition.
+                Defaults to the built-in circle of fifths.
+        """
+        if compiled is None:
+            compiled = STANDARD_CIRCLE
+        self.compiled = compiled
+        self.name: str = compiled.name
+        self.size: int = compiled.size
+        self.major_chords: List[Chord] = compiled.major_chords
+        self.minor_chords: List[Chord] = compiled.minor_chords
+
+        # Lookup tables for find_chord: every alternative name, and the pitch-class set of each chord.
+        self.name_index: Dict[str, Chord] = compiled.name_index
+        self.mask_index: Dict[int, Chord] = compiled.mask_index
+
+        # Position of each chord on its ring, its key number in the distance matrix, and the
+        # credit for an answer by its distance from a correct one.
+        self.ring_indices: Dict[Chord, int] = compiled.ring_indices
+        self.key_indices: Dict[Chord, int] = compiled.key_indices
+        self.distances: List[List[int]] = compiled.distances
+        self.credit_by_distance: Tuple[float, ...] = compiled.credit_by_distance
+
+        # Registered question types, and the correct answers of each one by chord type and ring
+        # index, filled in the first time a question type is asked about.
+        self.question_kinds = QUESTION_KINDS
+        self.answer_sets: Dict[Tuple[Enum, ChordType], List[Tuple[Chord, ...]]] = {}
+
+    @property
+    def is_standard(self) -> bool:
         """
-        Initializes the Circle of Fifths with major and minor chords.
+        Returns whether this is the built-in circle of fifths, which theory questions assume.
         """
-        self.major_chords: List[Chord] = major_chords
-        self.minor_chords: List[Chord] = minor_chords
+        return self.compiled is STANDARD_CIRCLE
+
+    def index_of(self, chord_list: List[Chord], chord: Chord) -> int:
+        """
+        Returns the index of a chord in a chord list, in O(1) for the circle's own lists.
+
+        Args:
+            chord_list (List[Chord]): The list of chords (major or minor).
+            chord (Chord): The chord to find.
+
+        Returns:
+            int: The index of the chord.
+
+        Raises:
+            ValueError: If the chord is not in the list.
+        """
+        idx = self.ring_indices.get(chord)
+        if idx is not None and idx < len(chord_list) and chord_list[idx] == chord:
+            return idx
+        return chord_list.index(chord)
 
     def get_chord_list(self, chord_type: ChordType) -> List[Chord]:
         """
@@ -52,16 +95,22 @@ class CircleOfFifths:
         """
         Finds the chord with the given name (including alternative names).
 
+        Names that are not listed are parsed as chord symbols and matched by pitch content,
+        so other spellings and inversions such as "Cmaj", "Ebm" or "C/E" are found too.
+
         Args:
             name (str): The name or alternative name of the chord.
 
         Returns:
             Optional[Chord]: The matching Chord object, or None if not found.
         """
-        for chord in self.minor_chords + self.major_chords:
-            if chord.contains(name):
-                return chord
-        return None
+        chord = self.name_index.get(name)
+        if chord is not None:
+            return chord
+        symbol = try_parse_chord_symbol(name)
+        if symbol is None:
+            return None
+        return self.mask_index.get(symbol.mask)
 
     def get_chord(self, index: int, chord_type: ChordType = ChordType.MAJOR) -> Chord:
         """
@@ -75,7 +124,7 @@ class CircleOfFifths:
             Chord: The chord at the specified index.
         """
         chord_list = self.get_chord_list(chord_type)
-        return chord_list[index % CIRCLE_SIZE]
+        return chord_list[index % self.size]
 
     def get_next_chord(
         self,
@@ -94,23 +143,41 @@ class CircleOfFifths:
         Returns:
             List[Chord]: List of Chord(s) that are the answer(s) for the given direction.
         """
+        return list(self.answers_for(chord, direction, chord_type))
+
+    def answers_for(self, chord: Chord, question_type: Enum, chord_type: ChordType) -> Tuple[Chord, ...]:
+        """
+        Returns the correct answers to a question from the precomputed answer sets, in O(1).
+
+        Args:
+            chord (Chord): The chord the question is about.
+            question_type (Enum): A question type registered with core.questions.
+            chord_type (ChordType): The type of chord (MAJOR or MINOR).
+
+        Returns:
+            Tuple[Chord, ...]: The correct answers; empty if the chord is not on the ring or the
+                question type is not answered by a fixed ring move.
+        """
         chord_list = self.get_chord_list(chord_type)
-        alt_list = self.get_chord_list(ChordType.MINOR if chord_type == ChordType.MAJOR else ChordType.MAJOR)
-        n = len(chord_list)
         try:
-            idx = chord_list.index(chord)
+            idx = self.index_of(chord_list, chord)
         except ValueError:
-            return []
-        if direction == QuestionType.FILL_IN:
-            return [chord_list[idx % n]]
-        elif direction == QuestionType.CLOCKWISE:
-            return [chord_list[(idx + 1) % n]]
-        elif direction == QuestionType.COUNTERCLOCKWISE:
-            return [chord_list[(idx - 1) % n]]
-        elif direction == QuestionType.ALTERNATIVE_CIRCLE:
-            return [alt_list[idx]]
-        else:  # ANY
-            return [chord_list[(idx + 1) % n], chord_list[(idx - 1) % n], alt_list[idx]]
+            return ()
+        answers = self.answer_sets.get((question_type, chord_type))
+        if answers is None:
+            answers = self.answer_sets[(question_type, chord_type)] = self._build_answer_set(question_type, chord_type)
+        return answers[idx]
+
+    def _build_answer_set(self, question_type: Enum, chord_type: ChordType) -> List[Tuple[Chord, ...]]:
+        chord_list = self.get_chord_list(chord_type)
+        alt_list = self.get_chord_list(ChordType.MINOR if chord_type == ChordType.MAJOR else ChordType.MAJOR)
+        kind = self.question_kinds.get(question_type)
+        moves = kind.moves if kind is not None else ()
+        n = len(chord_list)
+        return [
+            tuple((alt_list if other_ring else chord_list)[(idx + steps) % n] for other_ring, steps in moves)
+            for idx in range(n)
+        ]
 
     def check_answer(
         self,
@@ -131,10 +198,68 @@ class CircleOfFifths:
         Returns:
             bool: True if the answer is correct, False otherwise.
         """
-        potential_answers = self.get_next_chord(
-            selected_chord, question_type, chord_type
-        )
-        return chord_answer in potential_answers
+        return chord_answer in self.answers_for(selected_chord, question_type, chord_type)
+
+    def distance(self, chord_a: Chord, chord_b: Chord) -> int:
+        """
+        Returns the number of circle steps between two chords, counting moves around a ring
+        and moves across to the relative key.
+
+        Args:
+            chord_a (Chord): The first chord.
+            chord_b (Chord): The second chord.
+
+        Returns:
+            int: The step count, looked up in the precomputed distance matrix.
+        """
+        return self.distances[self.key_indices[chord_a]][self.key_indices[chord_b]]
+
+    def grade_answer(
+        self,
+        chord_answer: Chord,
+        selected_chord: Chord,
+        question_type: QuestionType,
+        chord_type: ChordType
+    ) -> Tuple[bool, float]:
+        """
+        Checks and scores an answer, looking up the correct answers only once.
+
+        Args:
+            chord_answer (Chord): The chord provided as an answer.
+            selected_chord (Chord): The chord the question is about.
+            question_type (QuestionType): The type of question.
+            chord_type (ChordType): The type of chord (major or minor).
+
+        Returns:
+            Tuple[bool, float]: Whether the answer is correct, and its score: 1.0 for a correct
+                answer, less the further the answer is from a correct one.
+        """
+        potential_answers = self.answers_for(selected_chord, question_type, chord_type)
+        if not potential_answers or chord_answer not in self.key_indices:
+            return chord_answer in potential_answers, 0.0
+        steps = min(self.distance(chord_answer, answer) for answer in potential_answers)
+        return steps == 0, self.credit_by_distance[steps]
+
+    def score_answer(
+        self,
+        chord_answer: Chord,
+        selected_chord: Chord,
+        question_type: QuestionType,
+        chord_type: ChordType
+    ) -> float:
+        """
+        Scores an answer, giving partial credit to wrong answers close to a correct one.
+
+        Args:
+            chord_answer (Chord): The chord provided as an answer.
+            selected_chord (Chord): The chord the question is about.
+            question_type (QuestionType): The type of question.
+            chord_type (ChordType): The type of chord (major or minor).
+
+        Returns:
+            float: 1.0 for a correct answer, less the further the answer is from a correct one.
+        """
+        return self.grade_answer(chord_answer, selected_chord, question_type, chord_type)[1]
 
     def get_neighbor_indices(self, chord_list: List[Chord], chord: Chord) -> List[int]:
         """
@@ -149,7 +274,7 @@ class CircleOfFifths:
         """
         n = len(chord_list)
         try:
-            idx = chord_list.index(chord)
+            idx = self.index_of(chord_list, chord)
         except ValueError:
             return []
         return [(idx - 1) % n, (idx + 1) % n]
@@ -173,9 +298,8 @@ class CircleOfFifths:
         """
         n = len(chord_list)
         try:
-            idx = chord_list.index(chord)
-            neighbor_indices = [(idx - 1) % n, (idx + 1) % n]
-            return chord_list.index(maybe_neighbor) in neighbor_indices
+            idx = self.index_of(chord_list, chord)
+            return (self.index_of(chord_list, maybe_neighbor) - idx) % n in (1, n - 1)
         except ValueError:
             return False
 
@@ -0,0 +1,274 @@
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.chord import Chord
+from core.chord_lists import major_chords, minor_chords
+from core.chord_symbol import try_parse_chord_symbol
+from core.key_distance import build_distance_matrix, key_index, partial_credit
+
+# Bumped whenever CompiledCircle changes, so stale files in a compile cache are ignored.
+COMPILED_FORMAT_VERSION: int = 1
+# A ring needs at least three chords for its clockwise and counterclockwise neighbors to differ.
+MIN_RING_SIZE: int = 3
+DEFINITION_KEYS = frozenset({"name", "major", "minor", "practice_sets"})
+
+
+@dataclass(frozen=True)
+class CircleDefinition:
+    """
+    A circle as written by a teacher: two rings of chord names and optional practice sets.
+
+    Attributes:
+        name (str): Name of the circle, e.g. "fourths".
+        major (Tuple[str, ...]): Chords of the outer ring in order; alternatives are separated
+            by "/", as in "F#/Gb".
+        minor (Tuple[str, ...]): Chords of the inner ring; chord i is drawn inside major chord i.
+        practice_sets (Tuple[Tuple[str, Tuple[int, ...]], ...]): Named subsets of ring indices
+            to practice, in file order.
+    """
+    name: str
+    major: Tuple[str, ...]
+    minor: Tuple[str, ...]
+    practice_sets: Tuple[Tuple[str, Tuple[int, ...]], ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the definition in the layout of a definition file.
+        """
+        return {
+            "name": self.name,
+            "major": list(self.major),
+            "minor": list(self.minor),
+            "practice_sets": {name: list(indices) for name, indices in self.practice_sets},
+        }
+
+    def digest(self) -> str:
+        """
+        Returns a hash of the definition's content, used as its compile cache key.
+        """
+        canonical = json.dumps([COMPILED_FORMAT_VERSION, self.to_dict()], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CompiledCircle:
+    """
+    The lookup tables CircleOfFifths works from, built once per definition.
+
+    Attributes:
+        name (str): Name of the circle.
+        major_chords (List[Chord]): Chords of the outer ring.
+        minor_chords (List[Chord]): Chords of the inner ring.
+        name_index (Dict[str, Chord]): Every alternative name to its chord.
+        mask_index (Dict[int, Chord]): Pitch-class set of each parseable chord to the chord.
+        ring_indices (Dict[Chord, int]): Position of each chord on its ring.
+        key_indices (Dict[Chord, int]): Key number of each chord: i on the outer ring, size + i
+            on the inner ring.
+        distances (List[List[int]]): Circle steps between every pair of key numbers.
+        credit_by_distance (Tuple[float, ...]): Partial credit for an answer that many steps away.
+        practice_sets (Dict[str, List[int]]): Named subsets of ring indices.
+    """
+    name: str
+    major_chords: List[Chord]
+    minor_chords: List[Chord]
+    name_index: Dict[str, Chord] = field(default_factory=dict)
+    mask_index: Dict[int, Chord] = field(default_factory=dict)
+    ring_indices: Dict[Chord, int] = field(default_factory=dict)
+    key_indices: Dict[Chord, int] = field(default_factory=dict)
+    distances: List[List[int]] = field(default_factory=list)
+    credit_by_distance: Tuple[float, ...] = ()
+    practice_sets: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of chords per ring.
+        """
+        return len(self.major_chords)
+
+
+def _ring(data: Dict[str, Any], key: str) -> Tuple[str, ...]:
+    ring = data.get(key)
+    if not isinstance(ring, list) or not all(isinstance(name, str) and name.strip() for name in ring):
+        raise ValueError(f"'{key}' must be a list of chord names")
+    return tuple(name.strip() for name in ring)
+
+
+def parse_circle_definition(data: Any) -> CircleDefinition:
+    """
+    Validates a parsed definition file.
+
+    Args:
+        data (Any): The parsed JSON or TOML document.
+
+    Returns:
+        CircleDefinition: The validated definition.
+
+    Raises:
+        ValueError: If the document is not a valid circle definition.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("A circle definition must be a table/object")
+    unknown = set(data) - DEFINITION_KEYS
+    if unknown:
+        raise ValueError(f"Unknown keys in circle definition: {', '.join(sorted(unknown))}")
+    name = data.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("'name' must be a non-empty string")
+    major, minor = _ring(data, "major"), _ring(data, "minor")
+    if len(major) != len(minor):
+        raise ValueError(f"The rings differ in size: {len(major)} major and {len(minor)} minor chords")
+    if len(major) < MIN_RING_SIZE:
+        raise ValueError(f"A ring needs at least {MIN_RING_SIZE} chords")
+    seen: Dict[str, str] = {}
+    for chord_name in major + minor:
+        for alternative in Chord(chord_name).alternative_names:
+            if alternative in seen:
+                raise ValueError(f"'{alternative}' appears in both '{seen[alternative]}' and '{chord_name}'")
+            seen[alternative] = chord_name
+
+    sets = data.get("practice_sets", {})
+    if not isinstance(sets, dict):
+        raise ValueError("'practice_sets' must map names to lists of ring indices")
+    practice_sets = []
+    for set_name, indices in sets.items():
+        if (
+            not isinstance(indices, list) or not indices
+            or not all(isinstance(i, int) and not isinstance(i, bool) and 0 <= i < len(major) for i in indices)
+        ):
+            raise ValueError(f"Practice set '{set_name}' must list ring indices from 0 to {len(major) - 1}")
+        practice_sets.append((set_name, tuple(sorted(set(indices)))))
+    return CircleDefinition(name.strip(), major, minor, tuple(practice_sets))
+
+
+def read_circle_definition(path: str) -> CircleDefinition:
+    """
+    Reads and validates a .json or .toml circle definition.
+
+    Args:
+        path (str): The definition file.
+
+    Raises:
+        ValueError: If the file cannot be parsed or is not a valid definition.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        if path.lower().endswith(".toml"):
+            import tomllib
+            data = tomllib.loads(raw.decode("utf-8"))
+        else:
+            data = json.loads(raw.decode("utf-8"))
+    except ImportError as e:
+        raise ValueError("Reading TOML circle definitions needs Python 3.11 or later") from e
+    except (UnicodeDecodeError, json.JSONDecodeError, ValueError) as e:
+        raise ValueError(f"Could not parse {path}: {e}") from e
+    return parse_circle_definition(data)
+
+
+def compile_circle(
+    definition: CircleDefinition,
+    chords: Optional[Tuple[List[Chord], List[Chord]]] = None,
+) -> CompiledCircle:
+    """
+    Builds the lookup tables of a circle.
+
+    Args:
+        definition (CircleDefinition): A validated definition.
+        chords (Optional[Tuple[List[Chord], List[Chord]]]): Existing Chord objects for the
+            major and minor ring, instead of new ones built from the names.
+
+    Returns:
+        CompiledCircle: The tables.
+    """
+    size = len(definition.major)
+    if chords is None:
+        chords = ([Chord(name) for name in definition.major], [Chord(name) for name in definition.minor])
+    compiled = CompiledCircle(definition.name, chords[0], chords[1])
+    for chord in compiled.minor_chords + compiled.major_chords:
+        for name in chord.alternative_names:
+            compiled.name_index.setdefault(name, chord)
+        symbol = try_parse_chord_symbol(chord.alternative_names[0])
+        if symbol is not None:
+            compiled.mask_index.setdefault(symbol.mask, chord)
+    for minor, chords in ((False, compiled.major_chords), (True, compiled.minor_chords)):
+        for i, chord in enumerate(chords):
+            compiled.ring_indices[chord] = i
+            compiled.key_indices[chord] = key_index(i, minor, size)
+    compiled.distances = build_distance_matrix(size)
+    max_distance = max(max(row) for row in compiled.distances)
+    compiled.credit_by_distance = tuple(partial_credit(d, max_distance) for d in range(max_distance + 1))
+    compiled.practice_sets = {name: list(indices) for name, indices in definition.practice_sets}
+    return compiled
+
+
+_compiled: Dict[str, CompiledCircle] = {}
+
+
+def load_compiled_circle(definition: CircleDefinition, cache_dir: Optional[str] = None) -> CompiledCircle:
+    """
+    Returns the compiled tables of a definition, compiling each distinct definition once per
+    process and, with a cache directory, once across runs.
+
+    Args:
+        definition (CircleDefinition): A validated definition.
+        cache_dir (Optional[str]): Directory for compiled tables. If None, nothing is written
+            to disk.
+    """
+    key = definition.digest()
+    compiled = _compiled.get(key)
+    if compiled is not None:
+        return compiled
+    path = os.path.join(cache_dir, f"circle_{key}.pickle") if cache_dir else None
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            compiled = pickle.load(f)
+    else:
+        compiled = compile_circle(definition)
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Written under a temporary name first, so a crash never leaves half a file behind.
+            with open(path + ".tmp", "wb") as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".tmp", path)
+    _compiled[key] = compiled
+    return compiled
+
+
+def load_circle_file(path: str, cache_dir: Optional[str] = None) -> CompiledCircle:
+    """
+    Reads, validates and compiles a circle definition file.
+
+    Args:
+        path (str): A .json or .toml definition.
+        cache_dir (Optional[str]): Directory for compiled tables, see load_compiled_circle.
+
+    Raises:
+        ValueError: If the file is not a valid definition.
+    """
+    return load_compiled_circle(read_circle_definition(path), cache_dir)
+
+
+STANDARD_DEFINITION = CircleDefinition(
+    "fifths",
+    tuple(chord.name for chord in major_chords),
+    tuple(chord.name for chord in minor_chords),
+)
+
+
+_standard: Optional[CompiledCircle] = None
+
+
+def standard_circle() -> CompiledCircle:
+    """
+    Returns the compiled built-in circle of fifths, built once from the chord lists of
+    core.chord_lists.
+    """
+    global _standard
+    if _standard is None:
+        _standard = compile_circle(STANDARD_DEFINITION, (major_chords, minor_chords))
+    return _standard
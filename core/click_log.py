@@ -0,0 +1,220 @@
+import argparse
+import time
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import Config
+from core.collision import RING_HOLE, RING_MAJOR, RING_MINOR, RING_OUTSIDE, classify_points
+from core.constants import CIRCLE_SIZE
+
+# Fields of a logged click, and the dtype each is stored as.
+CLICK_FIELDS: Tuple[Tuple[str, type], ...] = (
+    ("time", np.float64),
+    ("x", np.int32),
+    ("y", np.int32),
+    ("button", np.int8),
+    ("rotation", np.float32),
+)
+INITIAL_CAPACITY: int = 1024
+# Clicks closer than this many pixels to a wedge border count as near misses.
+NEAR_BORDER_PIXELS: float = 6.0
+
+
+class ClickLog:
+    """
+    Buffers mouse clicks in growable NumPy columns, for aggregating where students click.
+
+    Recording a click writes one row into preallocated arrays, doubling them when full, so
+    logging stays cheap during play. Logs are saved as .npz files, along with the number of
+    chords per ring of the circle clicked on, and can be loaded and classified together in one
+    vectorized pass, whatever their number of clicks.
+    """
+
+    def __init__(
+        self,
+        capacity: int = INITIAL_CAPACITY,
+        clock: Callable[[], float] = time.time,
+        segments: int = CIRCLE_SIZE,
+    ) -> None:
+        """
+        Initializes an empty log.
+
+        Args:
+            capacity (int): Number of clicks the first buffers hold.
+            clock (Callable[[], float]): Time source for click timestamps, in seconds.
+            segments (int): Number of chords per ring of the circle being played.
+        """
+        self.clock = clock
+        self.segments = segments
+        self.count: int = 0
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.empty(max(1, capacity), dtype=dtype) for name, dtype in CLICK_FIELDS
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, pos: Tuple[int, int], button: int, rotation: float = 0.0) -> None:
+        """
+        Appends a click.
+
+        Args:
+            pos (Tuple[int, int]): Window coordinates of the click.
+            button (int): Mouse button, as in pygame's MOUSEBUTTONDOWN events.
+            rotation (float): Clockwise rotation of the circle in degrees at the time.
+        """
+        if self.count == len(self.columns["time"]):
+            for name, column in self.columns.items():
+                grown = np.empty(2 * len(column), dtype=column.dtype)
+                grown[:self.count] = column
+                self.columns[name] = grown
+        row = self.count
+        self.columns["time"][row] = self.clock()
+        self.columns["x"][row], self.columns["y"][row] = pos
+        self.columns["button"][row] = button
+        self.columns["rotation"][row] = rotation
+        self.count += 1
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Returns views of the recorded clicks, one array per field, and "segments", a 0-d
+        array with the number of chords per ring.
+        """
+        clicks = {name: column[:self.count] for name, column in self.columns.items()}
+        clicks["segments"] = np.array(self.segments)
+        return clicks
+
+    def save(self, path: str) -> None:
+        """
+        Writes the clicks and the segment count to a compressed .npz file.
+        """
+        np.savez_compressed(path, **self.arrays())
+
+
+def load_click_logs(paths: Iterable[str]) -> Dict[str, np.ndarray]:
+    """
+    Loads and concatenates saved click logs.
+
+    Args:
+        paths (Iterable[str]): Files written by ClickLog.save, all on circles with the same
+            number of chords per ring. Logs saved without a segment count are taken to be of
+            the built-in circle.
+
+    Returns:
+        Dict[str, np.ndarray]: One array per field of CLICK_FIELDS, covering every click, and
+            "segments", a 0-d array with the number of chords per ring.
+
+    Raises:
+        ValueError: If the logs were saved on circles of different sizes.
+    """
+    parts: Dict[str, list] = {name: [] for name, _ in CLICK_FIELDS}
+    segments = set()
+    for path in paths:
+        with np.load(path) as data:
+            segments.add(int(data["segments"]) if "segments" in data else CIRCLE_SIZE)
+            for name, _ in CLICK_FIELDS:
+                parts[name].append(data[name])
+    if len(segments) > 1:
+        raise ValueError(f"Click logs of circles with different sizes: {sorted(segments)}")
+    clicks = {
+        name: np.concatenate(parts[name]) if parts[name] else np.empty(0, dtype=dtype)
+        for name, dtype in CLICK_FIELDS
+    }
+    clicks["segments"] = np.array(segments.pop() if segments else CIRCLE_SIZE)
+    return clicks
+
+
+def click_segments(clicks: Dict[str, np.ndarray]) -> int:
+    """
+    Returns the number of chords per ring stored with loaded clicks, CIRCLE_SIZE if none is.
+    """
+    return int(clicks["segments"]) if "segments" in clicks else CIRCLE_SIZE
+
+
+def classify_clicks(
+    clicks: Dict[str, np.ndarray], segments: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Hit-tests logged clicks against the circle as drawn by the game, at each click's rotation.
+
+    Args:
+        clicks (Dict[str, np.ndarray]): Clicks as returned by ClickLog.arrays or load_click_logs.
+        segments (Optional[int]): Number of chords per ring. Defaults to the count saved with
+            the clicks.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Ring, segment and distance to the wedge
+            border of every click, see core.collision.classify_points.
+    """
+    return classify_points(
+        Config.CIRCLE_CENTER, clicks["x"], clicks["y"],
+        Config.CIRCLE_RADIUS, Config.CIRCLE_INNER_RADIUS, Config.CIRCLE_INNER_OUTER_RADIUS,
+        clicks["rotation"].astype(np.float64), click_segments(clicks) if segments is None else segments,
+    )
+
+
+def click_counts(
+    ring: np.ndarray,
+    segment: np.ndarray,
+    border: np.ndarray,
+    segments: int = 12,
+    near_border: float = NEAR_BORDER_PIXELS,
+) -> Dict[str, np.ndarray]:
+    """
+    Aggregates classified clicks into per-wedge heatmap counts.
+
+    Args:
+        ring (np.ndarray): Ring of each click.
+        segment (np.ndarray): Segment of each click.
+        border (np.ndarray): Distance of each click to its wedge border.
+        segments (int): Number of chords per ring.
+        near_border (float): Clicks on a ring closer than this to a border count as near misses.
+
+    Returns:
+        Dict[str, np.ndarray]: "clicks" and "near_border" of shape (2, segments), major ring
+            first, and "hole" and "outside" of shape (segments,), by the angle of the click.
+    """
+    on_ring = (ring == RING_MAJOR) | (ring == RING_MINOR)
+    cells = ring * segments + segment
+
+    def per_wedge(mask: np.ndarray) -> np.ndarray:
+        return np.bincount(cells[mask], minlength=2 * segments).reshape(2, segments)
+
+    return {
+        "clicks": per_wedge(on_ring),
+        "near_border": per_wedge(on_ring & (border < near_border)),
+        "hole": np.bincount(segment[ring == RING_HOLE], minlength=segments),
+        "outside": np.bincount(segment[ring == RING_OUTSIDE], minlength=segments),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point: prints where the clicks of saved logs landed.
+    """
+    parser = argparse.ArgumentParser(description="Aggregate logged clicks on the circle.")
+    parser.add_argument("paths", nargs="+", help="Click logs written with --click-log.")
+    parser.add_argument("--near-border", type=float, default=NEAR_BORDER_PIXELS,
+                        help="Distance in pixels to a wedge border that counts as a near miss.")
+    parser.add_argument("--segments", type=int, default=None,
+                        help="Chords per ring, for logs saved without it. Defaults to the saved count.")
+    args = parser.parse_args(argv)
+
+    try:
+        clicks = load_click_logs(args.paths)
+    except ValueError as e:
+        parser.error(str(e))
+    segments = click_segments(clicks) if args.segments is None else args.segments
+    ring, segment, border = classify_clicks(clicks, segments)
+    counts = click_counts(ring, segment, border, segments, near_border=args.near_border)
+    print(f"clicks={len(ring)} hole={counts['hole'].sum()} outside={counts['outside'].sum()}")
+    print(f"  {'segment':<9}{'major':>8}{'near':>7}{'minor':>8}{'near':>7}{'hole':>7}")
+    for i in range(len(counts["hole"])):
+        print(f"  {i:<9}{counts['clicks'][0, i]:>8}{counts['near_border'][0, i]:>7}"
+              f"{counts['clicks'][1, i]:>8}{counts['near_border'][1, i]:>7}{counts['hole'][i]:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,14 @@
-from typing import Tuple
+from typing import Tuple, Union
 import math
 
+import numpy as np
+
+# Ring codes returned by classify_points.
+RING_OUTSIDE: int = -1
+RING_MAJOR: int = 0
+RING_MINOR: int = 1
+RING_HOLE: int = 2
+
 def is_inside_circle(center: Tuple[int, int], radius: int, point: Tuple[int, int]) -> bool:
     """
     Determine if a point is inside a given circle.
@@ -16,26 +24,82 @@ def is_inside_circle(center: Tuple[int, int], radius: int, point: Tuple[int, int
     x, y = point
     return (x - center[0])**2 + (y - center[1])**2 <= radius**2
 
-def get_chord_index(center: Tuple[int, int], point: Tuple[int, int]) -> int:
+def get_chord_index(
+    center: Tuple[int, int], point: Tuple[int, int], rotation: float = 0.0, segments: int = 12
+) -> int:
     """
     Calculate the index of the chord segment at the given point in the circle.
 
     Args:
         center (Tuple[int, int]): The (x, y) coordinates of the circle's center.
         point (Tuple[int, int]): The (x, y) coordinates of the point to check.
+        rotation (float): Clockwise rotation of the drawn circle in degrees.
+        segments (int): Number of chords per ring.
 
     Returns:
-        int: The index of the chord segment (0-11).
+        int: The index of the chord segment (0 to segments - 1).
     """
-    SEGMENTS = 12
     x, y = point
-    segment_size = 360 / SEGMENTS
-    angle = math.degrees(math.atan2(y - center[1], x - center[0])) % 360
-    angle = angle + 90 + segment_size / 2
-    if angle < 0:
-        angle += 360
-    if angle > 360:
-        angle -= 360
+    segment_size = 360 / segments
+    angle = math.degrees(math.atan2(y - center[1], x - center[0])) - rotation
+    angle = (angle + 90 + segment_size / 2) % 360
 
     index = int(angle // segment_size)
-    return index
\ No newline at end of file
+    return index % segments
+
+
+def classify_points(
+    center: Tuple[int, int],
+    xs: np.ndarray,
+    ys: np.ndarray,
+    radius: float,
+    inner_radius: float,
+    hole_radius: float,
+    rotation: Union[float, np.ndarray] = 0.0,
+    segments: int = 12,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Hit-tests many points at once, e.g. logged clicks, in one vectorized pass.
+
+    Args:
+        center (Tuple[int, int]): The (x, y) coordinates of the circle's center.
+        xs (np.ndarray): x coordinates of the points.
+        ys (np.ndarray): y coordinates of the points.
+        radius (float): Outer radius of the major ring.
+        inner_radius (float): Radius between the major and minor ring.
+        hole_radius (float): Inner radius of the minor ring, around the center hole.
+        rotation (Union[float, np.ndarray]): Clockwise rotation of the drawn circle in degrees,
+            one for all points or one per point.
+        segments (int): Number of chords per ring.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Per point, the ring (RING_MAJOR, RING_MINOR,
+            RING_HOLE or RING_OUTSIDE), the segment its angle falls in as get_chord_index
+            computes it, and its distance in pixels to the nearest border of its wedge: a ring
+            edge or a divider. For points in the hole or outside the circle it is the distance
+            to the nearest ring.
+    """
+    dx = np.asarray(xs, dtype=np.float64) - center[0]
+    dy = np.asarray(ys, dtype=np.float64) - center[1]
+    distance = np.hypot(dx, dy)
+    segment_size = 360.0 / segments
+    # Angle in wedge units, shifted so wedge i spans [i, i + 1).
+    position = (np.degrees(np.arctan2(dy, dx)) - rotation + 90.0 + segment_size / 2) % 360.0 / segment_size
+    segment = np.floor(position).astype(np.intp) % segments
+
+    ring = np.select(
+        [distance <= hole_radius, distance <= inner_radius, distance <= radius],
+        [RING_HOLE, RING_MINOR, RING_MAJOR],
+        RING_OUTSIDE,
+    )
+    outer = np.where(ring == RING_MAJOR, radius, inner_radius)
+    inner = np.where(ring == RING_MAJOR, inner_radius, hole_radius)
+    to_edge = np.minimum(distance - inner, outer - distance)
+    offset = position - np.floor(position)
+    to_divider = distance * np.sin(np.radians(np.minimum(offset, 1.0 - offset) * segment_size))
+    border = np.select(
+        [ring == RING_HOLE, ring == RING_OUTSIDE],
+        [hole_radius - distance, distance - radius],
+        np.minimum(to_edge, to_divider),
+    )
+    return ring, segment, border
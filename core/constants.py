@@ -0,0 +1,29 @@
+from enum import Enum
+from typing import Tuple
+
+class QuestionType(Enum):
+    """Enumeration for the different types of quiz questions."""
+    CLOCKWISE = 1
+    COUNTERCLOCKWISE = 2
+    ALTERNATIVE_CIRCLE = 3
+    ANY = 4
+    FILL_IN = 5
+    DIATONIC_DEGREE = 6
+    KEY_FROM_SIGNATURE = 7
+    SIGNATURE_OF_KEY = 8
+    PROGRESSION = 9
+
+class ChordType(Enum):
+    """Enumeration for chord types (major or minor)."""
+    MAJOR = 1
+    MINOR = 2
+
+CIRCLE_SIZE: int = 12  # Number of chords in the built-in circle
+
+# Movement kinds between two consecutive chords.
+MOVE_SAME: str = "same"
+MOVE_CLOCKWISE: str = "clockwise"
+MOVE_COUNTERCLOCKWISE: str = "counterclockwise"
+MOVE_RELATIVE: str = "relative"
+MOVE_JUMP: str = "jump"
+MOVES: Tuple[str, ...] = (MOVE_SAME, MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE, MOVE_RELATIVE, MOVE_JUMP)
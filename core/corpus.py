@@ -0,0 +1,436 @@
+import argparse
+import os
+import re
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from core.chord_symbol import ChordSymbol, try_parse_chord_symbol
+from core.circle import CircleOfFifths
+from core.constants import (
+    MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE, MOVE_JUMP, MOVE_RELATIVE, MOVE_SAME, MOVES,
+)
+from core.key_distance import CIRCLE_SIZE, KEY_COUNT, MAX_DISTANCE, distance
+
+CHART_EXTENSIONS: Tuple[str, ...] = (".txt", ".chopro", ".chordpro", ".cho", ".crd", ".pro")
+DEFAULT_CHUNK_BYTES: int = 1 << 20
+
+# Extended chords are reduced to the major or minor triad they are built on.
+MINOR_QUALITIES = frozenset({"m", "m6", "m7", "mmaj7", "madd9", "m9"})
+MAJOR_QUALITIES = frozenset({"", "6", "7", "maj7", "add9", "9", "maj9", "11", "13"})
+
+# Tokens that separate chords on a chart line without being chords themselves.
+_SEPARATOR_RE = re.compile(r"^(\||\|\||:?\|:?|/|-|%|x\d+|\(?x?\d+x?\)?|N\.?C\.?)$", re.IGNORECASE)
+_CHORDPRO_RE = re.compile(r"\[([^\]]+)\]")
+
+
+def classify_move(a: int, b: int, circle_size: int = CIRCLE_SIZE) -> Tuple[str, int]:
+    """
+    Classifies the circle movement from one key to another.
+
+    Args:
+        a (int): Key number of the first chord.
+        b (int): Key number of the second chord.
+        circle_size (int): Number of chords per ring.
+
+    Returns:
+        Tuple[str, int]: One of MOVES and the number of circle steps taken.
+    """
+    steps = distance(a, b)
+    if a == b:
+        return MOVE_SAME, 0
+    ring_a, index_a = divmod(a, circle_size)
+    ring_b, index_b = divmod(b, circle_size)
+    if ring_a == ring_b:
+        offset = (index_b - index_a) % circle_size
+        if offset == 1:
+            return MOVE_CLOCKWISE, steps
+        if offset == circle_size - 1:
+            return MOVE_COUNTERCLOCKWISE, steps
+    elif index_a == index_b:
+        return MOVE_RELATIVE, steps
+    return MOVE_JUMP, steps
+
+
+class KeyResolver:
+    """
+    Resolves chord names to key numbers through the CircleOfFifths lookup, caching every token.
+    """
+
+    def __init__(self, circle: Optional[CircleOfFifths] = None) -> None:
+        """
+        Initializes the resolver.
+
+        Args:
+            circle (Optional[CircleOfFifths]): The circle to look chords up in.
+        """
+        self.circle = circle or CircleOfFifths()
+        self.cache: Dict[str, Optional[int]] = {}
+
+    def _reduce(self, symbol: ChordSymbol) -> Optional[int]:
+        if symbol.quality in MINOR_QUALITIES:
+            triad = ChordSymbol.get(symbol.root, "m")
+        elif symbol.quality in MAJOR_QUALITIES:
+            triad = ChordSymbol.get(symbol.root)
+        else:
+            return None
+        chord = self.circle.mask_index.get(triad.mask)
+        return None if chord is None else self.circle.key_indices[chord]
+
+    def resolve(self, token: str) -> Optional[int]:
+        """
+        Returns the key number of a chord name, or None if it is not a major or minor chord.
+
+        Args:
+            token (str): The chord name, e.g. "Am", "Bb7" or "C/E".
+        """
+        try:
+            return self.cache[token]
+        except KeyError:
+            pass
+        chord = self.circle.find_chord(token)
+        if chord is not None:
+            key = self.circle.key_indices[chord]
+        else:
+            symbol = try_parse_chord_symbol(token)
+            key = None if symbol is None else self._reduce(symbol)
+        self.cache[token] = key
+        return key
+
+
+def chord_tokens(line: str) -> List[str]:
+    """
+    Returns the chord names on a chart line, or an empty list for lyric and text lines.
+
+    ChordPro lines yield their bracketed chords. Plain lines count as chord lines when every
+    token is a chord symbol or a bar separator.
+
+    Args:
+        line (str): One line of a chord chart.
+    """
+    if "[" in line:
+        return _CHORDPRO_RE.findall(line)
+    tokens = line.replace("|", " | ").split()
+    chords = []
+    for token in tokens:
+        if _SEPARATOR_RE.match(token):
+            continue
+        if try_parse_chord_symbol(token) is None:
+            return []
+        chords.append(token)
+    return chords
+
+
+@dataclass
+class CorpusStats:
+    """
+    Aggregated transitions of a corpus, or of one chunk of it.
+
+    first and last hold the first and last resolved key of the source so adjacent chunks of
+    the same file can be joined by the transition that crosses their boundary.
+    """
+
+    transitions: array
+    chord_counts: array
+    step_counts: array
+    move_counts: Dict[str, int]
+    source: Optional[str] = None
+    first: Optional[int] = None
+    last: Optional[int] = None
+    files: int = 0
+    lines: int = 0
+    chords: int = 0
+    unresolved: int = 0
+
+    @classmethod
+    def empty(cls, source: Optional[str] = None) -> "CorpusStats":
+        """
+        Returns statistics with every counter at zero.
+        """
+        return cls(
+            transitions=array("Q", bytes(8 * KEY_COUNT * KEY_COUNT)),
+            chord_counts=array("Q", bytes(8 * KEY_COUNT)),
+            step_counts=array("Q", bytes(8 * (MAX_DISTANCE + 1))),
+            move_counts=dict.fromkeys(MOVES, 0),
+            source=source,
+        )
+
+    @property
+    def transition_total(self) -> int:
+        """
+        Returns the number of counted transitions.
+        """
+        return sum(self.move_counts.values())
+
+    def add_chord(self, key: int) -> None:
+        """
+        Counts a chord and the transition from the previous chord of the same source.
+
+        Args:
+            key (int): Key number of the chord.
+        """
+        if self.first is None:
+            self.first = key
+        if self.last is not None:
+            self.add_transition(self.last, key)
+        self.chord_counts[key] += 1
+        self.chords += 1
+        self.last = key
+
+    def add_transition(self, a: int, b: int) -> None:
+        """
+        Counts one transition between two keys.
+        """
+        move, steps = classify_move(a, b)
+        self.transitions[a * KEY_COUNT + b] += 1
+        self.step_counts[steps] += 1
+        self.move_counts[move] += 1
+
+    def merge(self, other: "CorpusStats") -> None:
+        """
+        Adds the statistics of the chunk that directly follows this one.
+
+        If both cover the same file, the transition across the chunk boundary is added, so
+        merging chunk results in order gives exactly the counts of a single pass.
+
+        Args:
+            other (CorpusStats): Statistics of the following chunk.
+        """
+        same_source = other.source is not None and other.source == self.source
+        if same_source and self.last is not None and other.first is not None:
+            self.add_transition(self.last, other.first)
+        for i, count in enumerate(other.transitions):
+            if count:
+                self.transitions[i] += count
+        for i in range(KEY_COUNT):
+            self.chord_counts[i] += other.chord_counts[i]
+        for i in range(MAX_DISTANCE + 1):
+            self.step_counts[i] += other.step_counts[i]
+        for move, count in other.move_counts.items():
+            self.move_counts[move] += count
+        if self.first is None and (same_source or self.source is None):
+            self.first = other.first
+        if other.last is not None or not same_source:
+            self.last = other.last
+        self.source = other.source
+        self.files += other.files
+        self.lines += other.lines
+        self.chords += other.chords
+        self.unresolved += other.unresolved
+
+    def transition_count(self, a: int, b: int) -> int:
+        """
+        Returns how often key a was followed by key b.
+        """
+        return self.transitions[a * KEY_COUNT + b]
+
+    def top_transitions(self, count: int = 10) -> List[Tuple[int, int, int]]:
+        """
+        Returns the most frequent transitions between different keys.
+
+        Returns:
+            List[Tuple[int, int, int]]: (from key, to key, count) tuples, most frequent first.
+        """
+        pairs = [
+            (i // KEY_COUNT, i % KEY_COUNT, n)
+            for i, n in enumerate(self.transitions)
+            if n and i // KEY_COUNT != i % KEY_COUNT
+        ]
+        pairs.sort(key=lambda item: (-item[2], item[0], item[1]))
+        return pairs[:count]
+
+
+def analyze_lines(
+    lines: Iterable[str],
+    resolver: KeyResolver,
+    source: Optional[str] = None,
+) -> CorpusStats:
+    """
+    Analyzes a stream of chart lines from a single source.
+
+    Args:
+        lines (Iterable[str]): The lines, consumed one at a time.
+        resolver (KeyResolver): Resolver for chord names.
+        source (Optional[str]): Name of the file the lines come from.
+
+    Returns:
+        CorpusStats: Statistics of the lines.
+    """
+    stats = CorpusStats.empty(source)
+    for line in lines:
+        stats.lines += 1
+        for token in chord_tokens(line):
+            key = resolver.resolve(token)
+            if key is None:
+                stats.unresolved += 1
+            else:
+                stats.add_chord(key)
+    return stats
+
+
+def read_chunk(path: str, start: int, end: int) -> Iterator[str]:
+    """
+    Yields the lines of a file that begin within the byte range [start, end).
+
+    Args:
+        path (str): The file.
+        start (int): First byte of the chunk.
+        end (int): Byte after the chunk.
+    """
+    with open(path, "rb") as f:
+        if start > 0:
+            # Skip the line that began in the previous chunk.
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode("utf-8", errors="replace")
+
+
+def iter_chunks(paths: Iterable[str], chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[Tuple[str, int, int]]:
+    """
+    Splits files into byte ranges of at most chunk_bytes, in file order.
+
+    Args:
+        paths (Iterable[str]): The files.
+        chunk_bytes (int): Size of each chunk.
+
+    Yields:
+        Tuple[str, int, int]: (path, start, end) of each chunk.
+    """
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), chunk_bytes):
+            yield path, start, min(start + chunk_bytes, size)
+
+
+def iter_chart_files(paths: Iterable[str], extensions: Sequence[str] = CHART_EXTENSIONS) -> Iterator[str]:
+    """
+    Yields chart files, walking directories recursively in sorted order.
+
+    Args:
+        paths (Iterable[str]): Files and directories.
+        extensions (Sequence[str]): File extensions to pick up inside directories.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(tuple(extensions)):
+                    yield os.path.join(root, name)
+
+
+_worker_resolver: Optional[KeyResolver] = None
+
+
+def _init_worker() -> None:
+    """
+    Process pool initializer: builds one resolver, and its token cache, per worker.
+    """
+    global _worker_resolver
+    _worker_resolver = KeyResolver()
+
+
+def _analyze_chunk(chunk: Tuple[str, int, int]) -> CorpusStats:
+    path, start, end = chunk
+    if _worker_resolver is None:
+        _init_worker()
+    stats = analyze_lines(read_chunk(path, start, end), _worker_resolver, path)
+    if start == 0:
+        stats.files = 1
+    return stats
+
+
+def analyze_corpus(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_pending: Optional[int] = None,
+) -> CorpusStats:
+    """
+    Analyzes chord charts in parallel, streaming each file in byte-range chunks.
+
+    Chunks are handed to a process pool a few at a time and their results merged in order as
+    they come back, so memory stays bounded by the number of chunks in flight whatever the
+    size of the corpus.
+
+    Args:
+        paths (Iterable[str]): Chart files and directories.
+        workers (Optional[int]): Number of worker processes. 1 analyzes in this process.
+        chunk_bytes (int): Size of each chunk in bytes.
+        max_pending (Optional[int]): Chunks in flight at once; defaults to twice the workers.
+
+    Returns:
+        CorpusStats: The merged statistics.
+    """
+    chunks = iter_chunks(iter_chart_files(paths), chunk_bytes)
+    total = CorpusStats.empty()
+    if workers == 1:
+        for chunk in chunks:
+            total.merge(_analyze_chunk(chunk))
+        return total
+
+    workers = workers or os.cpu_count() or 1
+    limit = max_pending or 2 * workers
+    with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_analyze_chunk, chunk))
+            if len(pending) >= limit:
+                total.merge(pending.popleft().result())
+        while pending:
+            total.merge(pending.popleft().result())
+    return total
+
+
+def key_name(key: int, circle: Optional[CircleOfFifths] = None) -> str:
+    """
+    Returns the display name of a key number.
+    """
+    circle = circle or CircleOfFifths()
+    minor, index = divmod(key, CIRCLE_SIZE)
+    chord_list = circle.minor_chords if minor else circle.major_chords
+    return chord_list[index].name
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point: prints how the charts in a corpus move around the circle.
+    """
+    parser = argparse.ArgumentParser(description="Analyze circle movements in chord charts.")
+    parser.add_argument("paths", nargs="+", help="Chart files or directories.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--chunk-kb", type=int, default=DEFAULT_CHUNK_BYTES // 1024,
+                        help="Size of the chunks files are split into.")
+    parser.add_argument("--top", type=int, default=10, help="Number of top transitions to list.")
+    args = parser.parse_args(argv)
+
+    stats = analyze_corpus(args.paths, workers=args.workers, chunk_bytes=args.chunk_kb * 1024)
+    total = stats.transition_total
+    print(f"files={stats.files} lines={stats.lines} chords={stats.chords} "
+          f"unresolved={stats.unresolved} transitions={total}")
+    for move in MOVES:
+        count = stats.move_counts[move]
+        share = 100.0 * count / total if total else 0.0
+        print(f"  {move:<17}{count:>10}  {share:5.1f}%")
+    print("steps:")
+    for steps, count in enumerate(stats.step_counts):
+        print(f"  {steps:<17}{count:>10}")
+    circle = CircleOfFifths()
+    print("top transitions:")
+    for a, b, count in stats.top_transitions(args.top):
+        print(f"  {key_name(a, circle):>8} -> {key_name(b, circle):<8}{count:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,27 @@
+import math
 import pygame
+import time
 from enum import Enum
+from typing import Callable, Optional, Sequence
 from config import Config
 from core.game_core import GameCore
-from core.blink_manager import BlinkManager
+from core.circle import CircleOfFifths, QuestionType
+from core.progression import TransitionModel
+from core.click_log import ClickLog
+from core.animation import BLINK_SECONDS, AnimationScheduler, Blink, Flash
 from ui.game_renderer import GameRenderer
 from core.types import GameStateDict
 from ui.interfaces import IGameRenderer
+from localization import Localization, LocaleWatcher
 from core.collision import is_inside_circle, get_chord_index
+from core.rotation import RotationAnimator, rotation_for_index
+from core.naming import NamingSystem, naming_for_locale
+from ui.heatmap import next_heatmap_mode
+
+# Seconds the feedback message is highlighted after an answer is submitted.
+FEEDBACK_FLASH_SECONDS: float = 0.3
+# Longest wait for input while no animation is due, so a reloaded locale still shows promptly.
+MAX_IDLE_MS: int = 250
 
 class GameState(Enum):
     """Enumeration for the different game states."""
@@ -20,17 +35,61 @@ class CircleOfFifthsGame:
     Handles game state, event processing, rendering, and quiz logic.
     """
 
-    def __init__(self, lang: str = "en", renderer: IGameRenderer = None) -> None:
+    def __init__(
+        self,
+        lang: str = "en",
+        renderer: IGameRenderer = None,
+        seed: Optional[int] = None,
+        recorder=None,
+        chord_player=None,
+        watch_locales: bool = False,
+        rotate: bool = False,
+        question_types: Optional[Sequence[QuestionType]] = None,
+        naming: Optional[NamingSystem] = None,
+        screen_recorder=None,
+        clock: Callable[[], float] = time.perf_counter,
+        circle: Optional[CircleOfFifths] = None,
+        progression_model: Optional[TransitionModel] = None,
+        click_log: Optional[ClickLog] = None,
+    ) -> None:
         """
         Initializes the game, pygame, and all game state.
 
         Args:
             lang (str): Language code for localization (default "en").
             renderer (IGameRenderer, optional): Renderer instance. If None, a default GameRenderer is used.
+            seed (Optional[int]): Seed for the question generator, for reproducible sessions.
+            recorder (InputRecorder, optional): Recorder that captures every handled input event.
+            chord_player (ChordPlayer, optional): If given, each question also plays its chord.
+            watch_locales (bool): Reload the locale file when it changes on disk.
+            rotate (bool): Rotate the circle so each question's chord animates to 12 o'clock.
+            question_types (Optional[Sequence[QuestionType]]): Question types to ask. Defaults
+                to fill-in questions only.
+            naming (Optional[NamingSystem]): How chord names are written and displayed.
+                Defaults to the naming system of the language.
+            screen_recorder (ScreenRecorder, optional): Receives every redrawn frame; it is
+                closed when the game loop ends.
+            clock (Callable[[], float]): Time source in seconds for animations. Replays and
+                tests pass a virtual clock.
+            circle (Optional[CircleOfFifths]): The circle to practice. Defaults to the built-in
+                circle of fifths.
+            progression_model (Optional[TransitionModel]): Draws the chords of progression
+                questions. Defaults to hand-specified move weights.
+            click_log (Optional[ClickLog]): If given, receives every mouse click, for click
+                heatmaps.
         """
 
-        self.core = GameCore()
+        if naming is None:
+            naming = naming_for_locale(Localization(lang))
+        self.core = GameCore(
+            seed, question_types=question_types, naming=naming, circle=circle, progression_model=progression_model
+        )
         self.core.next_question()
+        self.recorder = recorder
+        self.screen_recorder = screen_recorder
+        self.chord_player = chord_player
+        self.click_log = click_log
+        self.play_current_chord()
 
         pygame.display.set_caption("Circle of Fifths Quiz")
         self.clock: pygame.time.Clock = pygame.time.Clock()
@@ -38,27 +97,50 @@ class CircleOfFifthsGame:
         self.input_text: str = ""
         self.state: GameState = GameState.ACTIVE
         self.redraw: bool = True
-        self.blink_manager = BlinkManager()
+        self.running: bool = True
+        self.animations = AnimationScheduler(clock)
+        self.blink = Blink(self.animations, BLINK_SECONDS)
+        self.blink.start()
+        self.feedback_flash = Flash(self.animations, FEEDBACK_FLASH_SECONDS)
+        self.heatmap: Optional[str] = None
+        self.rotation: Optional[RotationAnimator] = RotationAnimator(clock=clock) if rotate else None
+        if self.rotation is not None and self.core.current_index is not None:
+            self.rotation.snap_to(rotation_for_index(self.core.current_index, self.core.circle.size))
 
         if renderer is None:
-            renderer = GameRenderer(lang)
+            renderer = GameRenderer(lang, naming, self.core.circle)
         self.renderer: IGameRenderer = renderer
 
-    def handle_events(self) -> None:
+        self.locale_watcher: Optional[LocaleWatcher] = None
+        if watch_locales:
+            self.locale_watcher = LocaleWatcher(Localization(lang))
+            self.locale_watcher.start()
+
+    def handle_events(self, events: Optional[Sequence[pygame.event.Event]] = None) -> None:
         """
         Handles all pygame events, including keyboard and mouse input.
         Processes quit, keyboard, and mouse events, and updates game state accordingly.
+
+        Args:
+            events (Optional[Sequence[pygame.event.Event]]): Events to process. If None,
+                the pending events are read from the pygame event queue.
         """
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        if self.recorder is not None:
+            self.recorder.capture(events)
+        for event in events:
             if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
+                self.running = False
+                return
 
             if event.type == pygame.KEYDOWN:
                 self.redraw = True
                 if event.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    exit()
+                    self.running = False
+                    return
+                elif event.key == pygame.K_F2:
+                    self.heatmap = next_heatmap_mode(self.heatmap)
                 elif self.state == GameState.ACTIVE:
                     self.handle_input(event)
                 elif self.state == GameState.INACTIVE and event.key == pygame.K_RETURN:
@@ -68,10 +150,14 @@ class CircleOfFifthsGame:
                 self.reset_for_next_question()
 
             if event.type == pygame.MOUSEBUTTONDOWN:
+                if self.click_log is not None:
+                    self.click_log.record(event.pos, event.button, self.rotation_angle())
                 if event.button == 1:
-                    mouse_pos = pygame.mouse.get_pos()
+                    mouse_pos = event.pos
                     if is_inside_circle(Config.CIRCLE_CENTER, Config.CIRCLE_RADIUS, mouse_pos):
-                        selected_chord_index = get_chord_index(Config.CIRCLE_CENTER, mouse_pos)
+                        selected_chord_index = get_chord_index(
+                            Config.CIRCLE_CENTER, mouse_pos, self.rotation_angle(), self.core.circle.size
+                        )
                         if selected_chord_index is not None:
                             indices = self.core.get_selected_chord_indices()
                             if selected_chord_index in indices:
@@ -93,18 +179,35 @@ class CircleOfFifthsGame:
         elif event.key == pygame.K_RETURN:
             self.state = GameState.INACTIVE
             self.core.submit_answer(self.input_text)
+            self.feedback_flash.trigger()
         else:
             self.input_text += event.unicode
 
     def reset_for_next_question(self) -> None:
         """
         Resets the state for the next quiz question.
-        Clears input, generates a new question, resets state and blink manager.
+        Clears input, generates a new question, resets state and blinking.
         """
         self.input_text = ""
         self.core.next_question()
         self.state = GameState.ACTIVE
-        self.blink_manager.reset()
+        self.blink.reset()
+        if self.rotation is not None and self.core.current_index is not None:
+            self.rotation.rotate_to(rotation_for_index(self.core.current_index, self.core.circle.size))
+        self.play_current_chord()
+
+    def rotation_angle(self) -> float:
+        """
+        Returns the current clockwise rotation of the circle in degrees, 0 if rotation is off.
+        """
+        return self.rotation.angle if self.rotation is not None else 0.0
+
+    def play_current_chord(self) -> None:
+        """
+        Plays the chord of the current question, if ear training is enabled.
+        """
+        if self.chord_player is not None and self.core.current_chord is not None:
+            self.chord_player.play(self.core.current_chord, self.core.chord_type)
 
     def render(self) -> None:
         """
@@ -119,18 +222,80 @@ class CircleOfFifthsGame:
         state["game_state"] = self.state.name
         state["chord_list"] = self.core.get_chord_list(state["chord_type"])
         state["stats"] = self.core.get_stats()
+        state["response_times"] = self.core.get_response_percentiles((50, 90))
+        state["score"] = self.core.get_score()
+        state["rotation"] = self.rotation_angle()
+        state["heatmap"] = self.heatmap
+        state["stats_tracker"] = self.core.stats
+        state["feedback_flash"] = self.feedback_flash.active
 
         self.redraw = False
-        self.renderer.render(state, self.input_text, self.blink_manager.is_blinking())
+        self.renderer.render(state, self.input_text, self.blink.on)
+        if self.screen_recorder is not None:
+            self.screen_recorder.capture(self.renderer.screen)
 
     def run(self) -> None:
         """
         Main game loop.
-        Handles events, updates blink state, renders the game, and maintains frame rate.
+        Handles events, runs animations and renders the game. Between frames it sleeps until
+        the next input or animation deadline, at most Config.FPS frames per second while
+        something is moving. Returns when the player quits.
         """
-        while True:
-            self.handle_events()
-            if self.blink_manager.update():
-                self.redraw = True
-            self.render()
-            self.clock.tick(Config.FPS)
\ No newline at end of file
+        events = None
+        while self.running:
+            self.step(events)
+            self.clock.tick(Config.FPS)
+            events = self.wait_for_events(self.idle_ms())
+        if self.locale_watcher is not None:
+            self.locale_watcher.stop()
+        if self.screen_recorder is not None:
+            self.screen_recorder.close()
+        self.renderer.close()
+        pygame.quit()
+
+    def idle_ms(self) -> int:
+        """
+        Returns how long the loop may wait for input before the screen has to change, in
+        milliseconds; 0 while the circle is rotating.
+        """
+        if self.rotation is not None and self.rotation.animating:
+            return 0
+        deadline = self.animations.next_deadline()
+        if deadline is None:
+            return MAX_IDLE_MS
+        wait = math.ceil((deadline - self.animations.now()) * 1000)
+        return max(0, min(MAX_IDLE_MS, wait))
+
+    def wait_for_events(self, timeout_ms: int) -> list:
+        """
+        Blocks until an event arrives or the timeout passes, and returns every pending event.
+
+        Args:
+            timeout_ms (int): Longest wait in milliseconds; 0 only collects pending events.
+        """
+        if timeout_ms <= 0:
+            return pygame.event.get()
+        event = pygame.event.wait(timeout_ms)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def step(self, events: Optional[Sequence[pygame.event.Event]] = None) -> None:
+        """
+        Advances the game by one frame: handles events, runs due animations and renders.
+
+        Args:
+            events (Optional[Sequence[pygame.event.Event]]): Events for this frame. If None,
+                the pending events are read from the pygame event queue.
+        """
+        self.handle_events(events)
+        if not self.running:
+            return
+        if self.animations.update():
+            self.redraw = True
+        if self.rotation is not None and self.rotation.animating:
+            self.rotation.update()
+            self.redraw = True
+        if self.locale_watcher is not None and self.locale_watcher.apply():
+            self.redraw = True
+        self.render()
\ No newline at end of file
@@ -1,7 +1,56 @@
 from core.circle import CircleOfFifths, QuestionType, ChordType
 from core.chord import Chord
+from core.stats import StatsTracker
+from core.metrics import REGISTRY
+from core.progression import PROGRESSION_LENGTH, AliasTable, TransitionModel, default_model
+from core.questions import QUESTION_KINDS, question_kind
+from core.naming import ENGLISH, NamingSystem
 import random
-from typing import List, Dict, Any
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Dict, Any, Optional, Sequence, Tuple
+
+# Questions GameCore draws ahead, so their text can be prepared before they are asked.
+PREFETCH_DEPTH: int = 3
+
+RESPONSE_TIME_BUCKETS: Tuple[float, ...] = (0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 20.0, 30.0, 60.0)
+
+QUESTIONS = REGISTRY.counter("quiz_questions_total", "Questions asked.").labels()
+NEXT_QUESTION_SECONDS = REGISTRY.histogram(
+    "quiz_next_question_seconds", "Time spent generating a question."
+).labels()
+ANSWERS = REGISTRY.counter("quiz_answers_total", "Answers submitted, by result.", ("result",))
+ANSWERS_BY_RESULT = {result: ANSWERS.labels(result) for result in ("correct", "incorrect", "not_found", "not_signature")}
+SUBMIT_ANSWER_SECONDS = REGISTRY.histogram(
+    "quiz_submit_answer_seconds", "Time spent checking and recording an answer."
+).labels()
+SCORE = REGISTRY.gauge("quiz_score", "Total credit earned in the current session.").labels()
+RESPONSE_SECONDS = REGISTRY.histogram(
+    "quiz_response_time_seconds", "Time students take to answer.", buckets=RESPONSE_TIME_BUCKETS
+).labels()
+
+@dataclass(frozen=True, eq=False)
+class Question:
+    """
+    A drawn question, waiting in GameCore's queue of upcoming questions or being asked.
+
+    Attributes:
+        number (int): Serial number of the question in the session, never reused.
+        chord_type (ChordType): Ring of the question's chord.
+        index (int): Position of the question's chord on its ring.
+        chord (Chord): The question's chord.
+        question_type (QuestionType): The type of the question.
+        detail (Dict[str, Any]): Extra parameters of theory and progression questions.
+        rng_state (tuple): State of the question generator before the question was drawn.
+    """
+    number: int
+    chord_type: ChordType
+    index: int
+    chord: Chord
+    question_type: QuestionType
+    detail: Dict[str, Any]
+    rng_state: tuple
 
 class GameCore:
     """
@@ -9,18 +58,91 @@ class GameCore:
     No UI or rendering code here.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.perf_counter,
+        question_types: Optional[Sequence[QuestionType]] = None,
+        naming: Optional[NamingSystem] = None,
+        circle: Optional[CircleOfFifths] = None,
+        progression_model: Optional[TransitionModel] = None,
+        progression_length: int = PROGRESSION_LENGTH,
+        prefetch_depth: int = PREFETCH_DEPTH,
+    ):
         """
         Initializes the core game logic, including the circle, state, and statistics.
+
+        Args:
+            seed (Optional[int]): Seed for the question generator. Passing the same seed
+                reproduces the same sequence of questions.
+            clock (Callable[[], float]): Clock returning seconds, used to measure response times.
+            question_types (Optional[Sequence[QuestionType]]): Question types to ask, picked at
+                random per question by their registered weights. Types added with
+                core.questions.register_question_type may be passed too. Defaults to fill-in
+                questions only.
+            naming (Optional[NamingSystem]): How students write chord names, e.g. with H for B.
+                Defaults to English names.
+            circle (Optional[CircleOfFifths]): The circle to practice, e.g. one loaded from a
+                definition file. Defaults to the built-in circle of fifths.
+            progression_model (Optional[TransitionModel]): Draws the chords of progression
+                questions, e.g. one learned from a corpus. Defaults to hand-specified move
+                weights.
+            progression_length (int): Number of chords per progression; the learner names
+                every chord after the first.
+            prefetch_depth (int): Number of questions drawn ahead of the current one.
+
+        Raises:
+            ValueError: If a question type is not registered, theory questions are asked on a
+                circle other than the built-in one, or the progression model is for a circle of
+                a different size.
         """
-        self.circle = CircleOfFifths()
+        self.seed: Optional[int] = seed
+        self.rng: random.Random = random.Random(seed)
+        self.clock: Callable[[], float] = clock
+        self.circle = circle or CircleOfFifths()
+        self.naming: NamingSystem = naming or ENGLISH
         self.chord_type = ChordType.MAJOR
-        self.selected_chord_indices = set(range(12))
+        self.selected_chord_indices = set(range(self.circle.size))
+        self.question_types: List[QuestionType] = list(question_types or [QuestionType.FILL_IN])
+        # Question types are picked uniformly unless their registered weights differ.
+        weights = [question_kind(question_type).weight for question_type in self.question_types]
+        self.question_type_table: Optional[AliasTable] = AliasTable(weights) if len(set(weights)) > 1 else None
+        if not self.circle.is_standard and any(question_kind(q).needs_standard_circle for q in self.question_types):
+            raise ValueError("Theory questions need the built-in circle of fifths")
+        if progression_model is not None and progression_model.circle_size != self.circle.size:
+            raise ValueError("The progression model is for a circle of a different size")
+        if progression_length < 2:
+            raise ValueError("A progression needs at least two chords")
+        self.progression_model: TransitionModel = progression_model or default_model(self.circle.size)
+        self.progression_length: int = progression_length
+        # Key numbers of the progression so far.
+        self.progression_keys: List[int] = []
+        # Questions drawn ahead from the current selection; changing the selection drops them.
+        self.prefetch_depth: int = prefetch_depth
+        self.upcoming: Deque[Question] = deque()
+        self.questions_drawn: int = 0
+        self.question: Optional[Question] = None
         self.current_question = None
+        self.question_detail: Dict[str, Any] = {}
         self.current_chord = None
+        self.current_index: Optional[int] = None
+        self.question_started: float = 0.0
         self.last_result = None
         self.correct_answers: int = 0
         self.total_questions: int = 0
+        self.total_score: float = 0.0
+        self.stats: StatsTracker = StatsTracker(self.circle.size)
+        self.answer_listeners: List[Callable[..., None]] = []
+
+    def add_answer_listener(self, listener: Callable[..., None]) -> None:
+        """
+        Registers a callback that receives every answer, e.g. to store progress durably.
+
+        Args:
+            listener (Callable[..., None]): Called with the same arguments as StatsTracker.record:
+                chord index, chord type, question type, correctness, seconds and score.
+        """
+        self.answer_listeners.append(listener)
 
     def set_selected_chord_indices(self, indices: List[int]) -> None:
         """
@@ -30,6 +152,23 @@ class GameCore:
             indices (List[int]): List of selected chord indices.
         """
         self.selected_chord_indices = set(indices)
+        self._discard_upcoming()
+        self.progression_keys = []
+
+    def use_practice_set(self, name: str) -> None:
+        """
+        Selects the chords of one of the circle's practice sets.
+
+        Args:
+            name (str): Name of the practice set in the circle definition.
+
+        Raises:
+            ValueError: If the circle has no practice set with that name.
+        """
+        indices = self.circle.compiled.practice_sets.get(name)
+        if indices is None:
+            raise ValueError(f"Unknown practice set: {name}")
+        self.set_selected_chord_indices(indices)
 
     def get_selected_chord_indices(self) -> set:
         """
@@ -42,37 +181,110 @@ class GameCore:
 
     def next_question(self) -> None:
         """
-        Generates the next quiz question and selects a new chord.
+        Moves on to the next quiz question, drawn ahead of time from the current selection.
         Resets the last result.
         """
-        self.chord_type = random.choice(list(ChordType))
-        chord_list = self.circle.get_chord_list(self.chord_type)
-        available = [chord_list[i] for i in self.selected_chord_indices]
-        self.current_chord = random.choice(available)
-        self.current_question = QuestionType.FILL_IN  # random.choice(list(QuestionType))
+        started = time.perf_counter()
+        self._fill_upcoming(1)
+        question = self.upcoming.popleft()
+        self.question = question
+        self.chord_type = question.chord_type
+        self.current_index = question.index
+        self.current_chord = question.chord
+        self.current_question = question.question_type
+        self.question_detail = question.detail
         self.last_result = None
+        self.question_started = self.clock()
+        self._fill_upcoming(self.prefetch_depth)
+        QUESTIONS.inc()
+        NEXT_QUESTION_SECONDS.observe(time.perf_counter() - started)
+
+    def upcoming_questions(self) -> List["Question"]:
+        """
+        Returns the questions drawn ahead, in the order they will be asked, e.g. to prepare
+        their text before they are shown.
+        """
+        return list(self.upcoming)
+
+    def _fill_upcoming(self, depth: int) -> None:
+        while len(self.upcoming) < depth:
+            self.upcoming.append(self._draw_question())
+
+    def _discard_upcoming(self) -> None:
+        """
+        Drops the questions drawn ahead and rewinds the generator to before the first of them,
+        so a seeded session asks the same questions as if nothing had been drawn ahead.
+        """
+        if self.upcoming:
+            self.rng.setstate(self.upcoming[0].rng_state)
+            self.upcoming.clear()
+
+    def _draw_question(self) -> "Question":
+        """
+        Draws a question from the current selection and question types.
+        """
+        rng_state = self.rng.getstate()
+        chord_type = self.rng.choice(list(ChordType))
+        index = self.rng.choice(list(self.selected_chord_indices))
+        if self.question_type_table is not None:
+            question_type = self.question_types[self.question_type_table.sample(self.rng)]
+        elif len(self.question_types) > 1:
+            question_type = self.rng.choice(self.question_types)
+        else:
+            question_type = self.question_types[0]
+        kind = question_kind(question_type)
+        if kind.detail is not None:
+            chord_type, index, detail = kind.detail(self, chord_type, index)
+        else:
+            detail = {}
+        self.questions_drawn += 1
+        chord = self.circle.get_chord_list(chord_type)[index]
+        return Question(self.questions_drawn, chord_type, index, chord, question_type, detail, rng_state)
 
     def submit_answer(self, answer: str) -> bool:
         """
         Submits an answer and checks if it is correct.
 
         Args:
-            answer (str): The user's answer.
+            answer (str): The user's answer, in the session's naming system.
 
         Returns:
             bool: True if the answer is correct, False otherwise.
         """
+        started = time.perf_counter()
+        answer = self.naming.normalize(answer)
         self.total_questions += 1
-        chord = self.circle.find_chord(answer)
-        if chord is None:
-            self.last_result = {"correct": False, "reason": "not_found"}
-            return False
-        correct = self.circle.check_answer(
-            chord, self.current_chord, self.current_question, self.chord_type
-        )
-        self.last_result = {"correct": correct, "answer": chord}
+        elapsed = self.clock() - self.question_started
+        kind = QUESTION_KINDS.get(self.current_question)
+        if kind is not None and kind.check is not None:
+            correct, score, self.last_result = kind.check(self, answer)
+        else:
+            chord = self.circle.find_chord(answer)
+            if chord is None:
+                self.last_result = {"correct": False, "reason": "not_found"}
+                correct = False
+                score = 0.0
+            else:
+                correct, score = self.circle.grade_answer(
+                    chord, self.current_chord, self.current_question, self.chord_type
+                )
+                self.last_result = {"correct": correct, "answer": chord}
+        self.last_result["response_time"] = elapsed
+        self.last_result["score"] = score
+        self.total_score += score
         if correct:
             self.correct_answers += 1
+        if self.current_index is not None:
+            self.stats.record(
+                self.current_index, self.chord_type, self.current_question, correct, elapsed, score
+            )
+            for listener in self.answer_listeners:
+                listener(self.current_index, self.chord_type, self.current_question, correct, elapsed, score)
+        result = "correct" if correct else self.last_result.get("reason", "incorrect")
+        (ANSWERS_BY_RESULT.get(result) or ANSWERS.labels(result)).inc()
+        SCORE.set(self.total_score)
+        RESPONSE_SECONDS.observe(elapsed)
+        SUBMIT_ANSWER_SECONDS.observe(time.perf_counter() - started)
         return correct
 
     def get_stats(self) -> tuple:
@@ -84,6 +296,27 @@ class GameCore:
         """
         return self.correct_answers, self.total_questions
 
+    def get_score(self) -> float:
+        """
+        Returns the total credit earned so far, including partial credit for near misses.
+
+        Returns:
+            float: The score.
+        """
+        return self.total_score
+
+    def get_response_percentiles(self, percentiles: Tuple[float, ...] = (50, 90)) -> Tuple[float, ...]:
+        """
+        Returns percentiles of the response times of all answers so far.
+
+        Args:
+            percentiles (Tuple[float, ...]): The percentiles to compute, between 0 and 100.
+
+        Returns:
+            Tuple[float, ...]: Response times in seconds, 0.0 if nothing was answered yet.
+        """
+        return self.stats.percentiles(percentiles)
+
     def get_state(self) -> Dict[str, Any]:
         """
         Returns the current game state as a dictionary.
@@ -95,8 +328,12 @@ class GameCore:
             "chord_type": self.chord_type,
             "current_chord": self.current_chord,
             "current_question": self.current_question,
+            "question_detail": self.question_detail,
+            "question_number": self.question.number if self.question is not None else None,
+            "upcoming": self.upcoming_questions(),
             "selected_chord_indices": list(self.selected_chord_indices),
             "last_result": self.last_result,
+            "naming": self.naming,
         }
 
     def get_chord_list(self, chord_type: ChordType) -> List[Chord]:
@@ -1,7 +1,59 @@
 from core.circle import QuestionType, ChordType
 from core.chord import Chord
+from core.naming import ENGLISH
+from core.questions import QUESTION_KINDS, QuestionKind
+from core.theory import signature_text_args
 from localization import Localization
-from typing import List
+from typing import Any, Dict, List
+
+def theory_text_args(state: dict, loc: Localization) -> Dict[str, Any]:
+    """
+    Returns the localized format arguments of a theory question: tonic, degree and signature.
+
+    Args:
+        state (dict): The current game state dictionary.
+        loc (Localization): The localization instance to use for translations.
+
+    Returns:
+        Dict[str, Any]: The arguments, empty for ring questions.
+    """
+    detail = state.get("question_detail") or {}
+    if "signature" not in detail:
+        return {}
+    signature_key, count = signature_text_args(detail["signature"])
+    naming = state.get("naming") or ENGLISH
+    return {
+        "tonic": naming.display(detail["tonic"]),
+        "degree": detail.get("numeral", ""),
+        "signature": loc.t(signature_key, count=count),
+    }
+
+def progression_text_args(state: dict, loc: Localization) -> Dict[str, Any]:
+    """
+    Returns the localized format arguments of a progression question: the chords so far and
+    the move to the chord asked for.
+
+    Args:
+        state (dict): The current game state dictionary.
+        loc (Localization): The localization instance to use for translations.
+
+    Returns:
+        Dict[str, Any]: The arguments, empty for other questions.
+    """
+    detail = state.get("question_detail") or {}
+    if "move" not in detail:
+        return {}
+    naming = state.get("naming") or ENGLISH
+    return {
+        "progression": " – ".join(naming.display(name) for name in detail["progression"]),
+        "move": loc.t("move_" + detail["move"], chord=naming.display(state["current_chord"].name)),
+    }
+
+def question_kind_or_fill_in(question_type: Any) -> QuestionKind:
+    """
+    Returns the registered question type, falling back to fill-in for unknown types.
+    """
+    return QUESTION_KINDS.get(question_type) or QUESTION_KINDS[QuestionType.FILL_IN]
 
 def generate_question_text(state: dict, loc: Localization, chord_list: List[Chord]) -> str:
     """
@@ -18,21 +70,16 @@ def generate_question_text(state: dict, loc: Localization, chord_list: List[Chor
     selected_index = chord_list.index(state["current_chord"])
     chord_type_str = loc.t("major") if state["chord_type"] == ChordType.MAJOR else loc.t("minor")
     hour = (selected_index + 11) % 12 + 1
-    chord_str = str(state["current_chord"])
-
-    question_keys = {
-        QuestionType.FILL_IN: "question_fill_in",
-        QuestionType.CLOCKWISE: "question_clockwise",
-        QuestionType.COUNTERCLOCKWISE: "question_counterclockwise",
-        QuestionType.ALTERNATIVE_CIRCLE: "question_alternative_circle",
-        QuestionType.ANY: "question_any",
-    }
-    key = question_keys.get(state["current_question"], "question_fill_in")
+    chord_str = (state.get("naming") or ENGLISH).display(state["current_chord"].name)
+
+    key = question_kind_or_fill_in(state["current_question"]).text_key
     return loc.t(
         key,
         chord_type=chord_type_str,
         hour=hour,
-        chord=chord_str
+        chord=chord_str,
+        **theory_text_args(state, loc),
+        **progression_text_args(state, loc)
     )
 
 def get_feedback_message(state: dict, loc: Localization) -> str:
@@ -52,27 +99,23 @@ def get_feedback_message(state: dict, loc: Localization) -> str:
     if state["last_result"]["correct"] == False and state.get("last_result").get("reason") is not None:
         return loc.t(state["last_result"]["reason"])
 
+    naming = state.get("naming") or ENGLISH
     is_correct = state.get("last_result").get("correct")
-    chord_str = str(state.get("current_chord"))
-    answer_str = state.get("last_result").get("answer")
-    correct_str = state.get("current_chord").name
-
-    feedback_keys = {
-        (True, QuestionType.FILL_IN): "feedback_correct_fill_in",
-        (True, QuestionType.ALTERNATIVE_CIRCLE): "feedback_correct_alternative_circle",
-        (True, QuestionType.ANY): "feedback_correct_any",
-        (True, QuestionType.CLOCKWISE): "feedback_correct_clockwise",
-        (True, QuestionType.COUNTERCLOCKWISE): "feedback_correct_counterclockwise",
-        (False, QuestionType.FILL_IN): "feedback_incorrect_fill_in",
-        (False, QuestionType.ALTERNATIVE_CIRCLE): "feedback_incorrect_alternative_circle",
-        (False, QuestionType.ANY): "feedback_incorrect_any",
-        (False, QuestionType.CLOCKWISE): "feedback_incorrect_clockwise",
-        (False, QuestionType.COUNTERCLOCKWISE): "feedback_incorrect_counterclockwise",
-    }
-    key = feedback_keys.get((is_correct, state["current_question"]), "feedback_correct_fill_in" if is_correct else "feedback_incorrect_fill_in")
+    chord_str = naming.display(state.get("current_chord").name)
+    answer = state.get("last_result").get("answer")
+    answer_str = naming.display(answer.name if isinstance(answer, Chord) else answer)
+    correct_str = naming.display(state.get("last_result").get("expected", state.get("current_chord").name))
+    chord_type = state.get("chord_type")
+    chord_type_str = loc.t("minor") if chord_type == ChordType.MINOR else loc.t("major")
+
+    kind = question_kind_or_fill_in(state["current_question"])
+    key = kind.correct_key if is_correct else kind.incorrect_key
     return loc.t(
         key,
         answer=answer_str,
         selected=chord_str,
-        correct=correct_str
+        correct=correct_str,
+        chord_type=chord_type_str,
+        **theory_text_args(state, loc),
+        **progression_text_args(state, loc)
     )
\ No newline at end of file
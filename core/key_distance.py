@@ -0,0 +1,94 @@
+from collections import deque
+from typing import List, Tuple
+
+from core.constants import CIRCLE_SIZE
+
+# Keys are numbered 0..2n-1: major key i is i, and its relative minor is n + i.
+KEY_COUNT: int = 2 * CIRCLE_SIZE
+
+# Wrong answers earn at most this much credit, falling linearly to zero at the largest distance.
+PARTIAL_CREDIT_SCALE: float = 0.5
+
+
+def key_index(ring_index: int, minor: bool, circle_size: int = CIRCLE_SIZE) -> int:
+    """
+    Returns the key number of a chord from its position on its ring.
+
+    Args:
+        ring_index (int): Index of the chord on the major or minor ring.
+        minor (bool): Whether the chord is on the minor ring.
+        circle_size (int): Number of chords per ring.
+    """
+    return ring_index % circle_size + (circle_size if minor else 0)
+
+
+def build_distance_matrix(circle_size: int = CIRCLE_SIZE) -> List[List[int]]:
+    """
+    Computes circle distances between every pair of keys by breadth-first search.
+
+    One step is a move to a neighbor on the same ring, or across to the relative key.
+
+    Args:
+        circle_size (int): Number of chords per ring.
+
+    Returns:
+        List[List[int]]: A (2n x 2n) matrix of step counts.
+    """
+    count = 2 * circle_size
+
+    def neighbors(key: int) -> Tuple[int, int, int]:
+        ring, index = divmod(key, circle_size)
+        base = ring * circle_size
+        return (
+            base + (index + 1) % circle_size,
+            base + (index - 1) % circle_size,
+            (key + circle_size) % count,
+        )
+
+    matrix = []
+    for start in range(count):
+        row = [-1] * count
+        row[start] = 0
+        queue = deque([start])
+        while queue:
+            key = queue.popleft()
+            for neighbor in neighbors(key):
+                if row[neighbor] < 0:
+                    row[neighbor] = row[key] + 1
+                    queue.append(neighbor)
+        matrix.append(row)
+    return matrix
+
+
+DISTANCES: List[List[int]] = build_distance_matrix()
+MAX_DISTANCE: int = max(max(row) for row in DISTANCES)
+
+
+def distance(a: int, b: int) -> int:
+    """
+    Returns the number of circle steps between two keys in O(1).
+
+    Args:
+        a (int): First key number.
+        b (int): Second key number.
+    """
+    return DISTANCES[a][b]
+
+
+def partial_credit(steps: int, max_distance: int = MAX_DISTANCE) -> float:
+    """
+    Returns the credit for an answer the given number of steps away from the correct one.
+
+    Args:
+        steps (int): Circle distance to the nearest correct answer.
+        max_distance (int): Largest possible distance on the circle.
+
+    Returns:
+        float: 1.0 for a correct answer, otherwise between 0.0 and PARTIAL_CREDIT_SCALE.
+    """
+    if steps <= 0:
+        return 1.0
+    return PARTIAL_CREDIT_SCALE * max(0, max_distance - steps) / max_distance
+
+
+CREDIT_BY_DISTANCE: Tuple[float, ...] = tuple(partial_credit(d) for d in range(MAX_DISTANCE + 1))
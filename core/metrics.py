@@ -0,0 +1,354 @@
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Default latency buckets in seconds, from 10 microseconds to 1 second.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def format_value(value: float) -> str:
+    """
+    Formats a sample value the way the Prometheus text format expects.
+    """
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, int) or value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """
+    Returns a label set such as {result="correct"}, or an empty string without labels.
+    """
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class _PerThread:
+    """
+    Base for metrics that accumulate into one cell per thread.
+
+    Each thread only ever writes to its own cell, so updates need no lock; cells are summed
+    when the metric is read.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._cells: List[list] = []
+        self._cells_lock = threading.Lock()
+
+    def _new_cell(self) -> list:
+        raise NotImplementedError
+
+    def _cell(self) -> list:
+        cell = self._new_cell()
+        with self._cells_lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+
+class Counter(_PerThread):
+    """
+    A monotonically increasing count.
+    """
+
+    def _new_cell(self) -> list:
+        return [0]
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Adds to the counter.
+
+        Args:
+            amount (float): Non-negative amount to add.
+        """
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._cell()
+        cell[0] += amount
+
+    @property
+    def value(self) -> float:
+        """
+        Returns the current count over all threads.
+        """
+        return sum(cell[0] for cell in self._cells)
+
+
+class Gauge:
+    """
+    A value that can go up and down. The last write wins.
+    """
+
+    def __init__(self) -> None:
+        self.value: float = 0
+
+    def set(self, value: float) -> None:
+        """
+        Sets the gauge.
+        """
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Adds to the gauge.
+        """
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """
+        Subtracts from the gauge.
+        """
+        self.value -= amount
+
+
+class Histogram(_PerThread):
+    """
+    Distribution of observed values over fixed buckets.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """
+        Initializes an empty histogram.
+
+        Args:
+            buckets (Sequence[float]): Ascending upper bounds; +Inf is added implicitly.
+        """
+        super().__init__()
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+
+    def _new_cell(self) -> list:
+        # One count per bucket, one for +Inf, then the sum of observations.
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def observe(self, value: float) -> None:
+        """
+        Records one observation.
+
+        Args:
+            value (float): The observed value, e.g. a duration in seconds.
+        """
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._cell()
+        cell[bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        """
+        Returns the per-bucket (non-cumulative) counts, including +Inf, and the sum.
+        """
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        for cell in list(self._cells):
+            for i in range(len(counts)):
+                counts[i] += cell[i]
+            total += cell[-1]
+        return counts, total
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of observations.
+        """
+        return sum(self.snapshot()[0])
+
+
+class MetricFamily:
+    """
+    A named metric with optional labels; each combination of label values is its own child.
+    """
+
+    def __init__(self, kind: str, name: str, help_text: str, labelnames: Sequence[str], factory) -> None:
+        """
+        Initializes the family.
+
+        Args:
+            kind (str): "counter", "gauge" or "histogram".
+            name (str): Metric name.
+            help_text (str): Description shown in the HELP line.
+            labelnames (Sequence[str]): Names of the labels.
+            factory: Callable creating a child metric.
+        """
+        self.kind = kind
+        self.name = name
+        self.help = help_text
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self.factory = factory
+        self.children: Dict[Tuple[str, ...], object] = {}
+        self.lock = threading.Lock()
+        if not self.labelnames:
+            self.children[()] = factory()
+
+    def labels(self, *values: str):
+        """
+        Returns the child for the given label values, creating it on first use. Without
+        labels, labels() returns the family's only metric.
+
+        Callers on hot paths should look a child up once and keep it.
+        """
+        child = self.children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self.lock:
+                child = self.children.setdefault(values, self.factory())
+        return child
+
+    def render(self) -> List[str]:
+        """
+        Returns the metric in Prometheus text format, one line per entry.
+        """
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self.children.items()):
+            if self.kind == "histogram":
+                counts, total = child.snapshot()
+                cumulative = 0
+                bounds = list(child.buckets) + [float("inf")]
+                for bound, count in zip(bounds, counts):
+                    cumulative += count
+                    labels = format_labels(self.labelnames + ("le",), values + (format_value(bound),))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = format_labels(self.labelnames, values)
+                lines.append(f"{self.name}_sum{labels} {format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+            else:
+                labels = format_labels(self.labelnames, values)
+                lines.append(f"{self.name}{labels} {format_value(child.value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metric families that can be rendered together.
+    """
+
+    def __init__(self) -> None:
+        self.families: Dict[str, MetricFamily] = {}
+        self.lock = threading.Lock()
+
+    def _register(self, kind: str, name: str, help_text: str, labelnames: Sequence[str], factory) -> MetricFamily:
+        with self.lock:
+            family = self.families.get(name)
+            if family is None:
+                family = self.families[name] = MetricFamily(kind, name, help_text, labelnames, factory)
+            elif family.kind != kind or family.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered differently")
+        return family
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        """
+        Returns the counter with the given name, registering it on first use.
+        """
+        return self._register("counter", name, help_text, labelnames, Counter)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        """
+        Returns the gauge with the given name, registering it on first use.
+        """
+        return self._register("gauge", name, help_text, labelnames, Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> MetricFamily:
+        """
+        Returns the histogram with the given name, registering it on first use.
+        """
+        return self._register("histogram", name, help_text, labelnames, lambda: Histogram(buckets))
+
+    def render(self) -> str:
+        """
+        Returns every metric in Prometheus text exposition format.
+        """
+        lines: List[str] = []
+        for name in sorted(self.families):
+            lines.extend(self.families[name].render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY: MetricsRegistry = MetricsRegistry()
+
+
+class MetricsServer:
+    """
+    Serves a registry at /metrics over HTTP from a background thread.
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = "127.0.0.1", port: int = 9464) -> None:
+        """
+        Initializes the server without starting it.
+
+        Args:
+            registry (MetricsRegistry): The metrics to serve.
+            host (str): Interface to listen on; localhost by default.
+            port (int): Port to listen on; 0 picks a free port.
+        """
+        self.registry = registry
+        self.host = host
+        self.requested_port = port
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """
+        Returns the port the server listens on.
+        """
+        return self.httpd.server_address[1] if self.httpd is not None else self.requested_port
+
+    def start(self) -> None:
+        """
+        Starts serving in a daemon thread.
+        """
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer((self.host, self.requested_port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-server", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the server and waits for its thread.
+        """
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.thread.join()
+            self.httpd = None
@@ -0,0 +1,198 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.chord import Chord
+from core.chord_lists import major_chords, minor_chords
+
+LETTERS: str = "CDEFGAB"
+ACCIDENTALS: Tuple[str, ...] = ("", "#", "b", "##", "bb")
+
+
+class NamingSystem:
+    """
+    A compiled note-naming system: how chord names are written and displayed in one tradition.
+
+    The rest of the app works with English chord names. A system is compiled once into two
+    dictionaries, one from everything a student may type to the English name and one from
+    English names to the label shown, so translating an answer or a label is a single lookup.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        note_names: Dict[str, Sequence[str]],
+        quality_names: Dict[str, Sequence[str]],
+        case_sensitive: bool = True,
+    ) -> None:
+        """
+        Compiles the input and display tables of a naming system.
+
+        Args:
+            name (str): Name of the system, e.g. "nordic".
+            note_names (Dict[str, Sequence[str]]): Local spellings of each English note name
+                ("C", "F#", "Bb", ...). The first spelling is the one displayed.
+            quality_names (Dict[str, Sequence[str]]): Local suffixes of each English quality
+                ("", "m" and "dim"). The first suffix is the one displayed.
+            case_sensitive (bool): Whether typed answers must match the case of the spellings.
+        """
+        self.name = name
+        self.case_sensitive = case_sensitive
+        self.inputs: Dict[str, str] = {}
+        self.labels: Dict[str, str] = {}
+        for note, spellings in note_names.items():
+            for quality, suffixes in quality_names.items():
+                english = note + quality
+                self.labels[english] = spellings[0] + suffixes[0]
+                for spelling in spellings:
+                    for suffix in suffixes:
+                        self.inputs.setdefault(self._input_key(spelling + suffix), english)
+        # Chord names on the circle list enharmonic spellings, e.g. "F#/Gb".
+        for chord in major_chords + minor_chords:
+            self.labels[chord.name] = "/".join(self.labels.get(part, part) for part in chord.alternative_names)
+
+    def _input_key(self, text: str) -> str:
+        return text if self.case_sensitive else text.strip().casefold()
+
+    def normalize(self, answer: str) -> str:
+        """
+        Translates a typed answer to its English chord name.
+
+        Args:
+            answer (str): The answer as typed, e.g. "H" or "Mi♭ minore".
+
+        Returns:
+            str: The English name, e.g. "B" or "Ebm", or the answer itself if it is not a
+                name in this system, so English symbols such as "Cmaj7" still work.
+        """
+        return self.inputs.get(answer if self.case_sensitive else answer.strip().casefold(), answer)
+
+    def display(self, name: str) -> str:
+        """
+        Returns the label of an English chord or note name in this system.
+
+        Args:
+            name (str): An English name such as "Bb", "F#m" or "C#/Db".
+
+        Returns:
+            str: The local label, or the name itself if it has none.
+        """
+        return self.labels.get(name, name)
+
+    def label(self, chord: Chord) -> str:
+        """
+        Returns the label drawn on the circle for a chord: its first name, translated.
+        """
+        return self.labels.get(chord.alternative_names[0], chord.alternative_names[0])
+
+
+def english_note_names() -> Dict[str, List[str]]:
+    """
+    Returns every spelled note with up to two accidentals, named as in English.
+    """
+    return {letter + accidental: [letter + accidental] for letter in LETTERS for accidental in ACCIDENTALS}
+
+
+def letter_note_names(
+    letters: Dict[str, str],
+    sharps: Sequence[str] = ("#",),
+    flats: Sequence[str] = ("b",),
+) -> Dict[str, List[str]]:
+    """
+    Returns the spellings of every note in a system that renames the letters.
+
+    Args:
+        letters (Dict[str, str]): Local name of each English letter, e.g. {"D": "Re"}.
+        sharps (Sequence[str]): Accepted sharp signs; the first is displayed.
+        flats (Sequence[str]): Accepted flat signs; the first is displayed.
+    """
+    names: Dict[str, List[str]] = {}
+    for letter, local in letters.items():
+        names[letter] = [local]
+        names[letter + "#"] = [local + sharp for sharp in sharps]
+        names[letter + "b"] = [local + flat for flat in flats]
+        names[letter + "##"] = [local + sharp + sharp for sharp in sharps]
+        names[letter + "bb"] = [local + flat + flat for flat in flats]
+    return names
+
+
+def nordic_note_names(sharp_syllable: str, flat_syllable: str) -> Dict[str, List[str]]:
+    """
+    Returns the note spellings of the German and Scandinavian tradition, where B natural is
+    called H and B flat is called B. Sharps and flats may also be written as syllables, as in
+    "Fis" and "Es" in German or "Fiss" and "Ess" in Swedish.
+
+    Args:
+        sharp_syllable (str): Syllable appended for a sharp, e.g. "is".
+        flat_syllable (str): Syllable appended for a flat, e.g. "es".
+    """
+    names = letter_note_names({letter: ("H" if letter == "B" else letter) for letter in LETTERS})
+    for letter in LETTERS:
+        names[letter + "#"].append(("H" if letter == "B" else letter) + sharp_syllable)
+        if letter == "B":
+            continue
+        # A and E drop the e of the flat syllable: As, Es.
+        syllable = flat_syllable[1:] if letter in "AE" else flat_syllable
+        names[letter + "b"].append(letter + syllable)
+    names["Bb"] = ["B"]
+    return names
+
+
+ENGLISH = NamingSystem("english", english_note_names(), {"": [""], "m": ["m"], "dim": ["dim"]})
+
+NORDIC = NamingSystem(
+    "nordic",
+    nordic_note_names("iss", "ess"),
+    {"": ["", "-dur", " dur"], "m": ["m", "-moll", " moll", "moll"], "dim": ["dim"]},
+    case_sensitive=False,
+)
+
+GERMAN = NamingSystem(
+    "german",
+    nordic_note_names("is", "es"),
+    {"": ["", "-Dur", " Dur"], "m": ["m", "-Moll", " Moll", "Moll"], "dim": ["dim"]},
+    case_sensitive=False,
+)
+
+SOLFEGE = NamingSystem(
+    "solfege",
+    letter_note_names(
+        {"C": "Do", "D": "Re", "E": "Mi", "F": "Fa", "G": "Sol", "A": "La", "B": "Si"},
+        sharps=("#", "♯", " diesis"),
+        flats=("b", "♭", " bemolle"),
+    ),
+    {"": ["", " maggiore", " majeur"], "m": ["m", " minore", " mineur", " min", "-"], "dim": ["dim", "°"]},
+    case_sensitive=False,
+)
+
+# The compiled systems by name, and the one used when a locale does not choose one.
+NAMING_SYSTEMS: Dict[str, NamingSystem] = {
+    system.name: system for system in (ENGLISH, NORDIC, GERMAN, SOLFEGE)
+}
+DEFAULT_NAMING: str = ENGLISH.name
+
+
+def get_naming_system(name: Optional[str]) -> NamingSystem:
+    """
+    Returns a naming system by name.
+
+    Args:
+        name (Optional[str]): Name of the system, or None for the default.
+
+    Raises:
+        ValueError: If there is no system with that name.
+    """
+    system = NAMING_SYSTEMS.get(name or DEFAULT_NAMING)
+    if system is None:
+        raise ValueError(f"Unknown naming system: {name}")
+    return system
+
+
+def naming_for_locale(loc) -> NamingSystem:
+    """
+    Returns the naming system chosen by a locale's "note_naming" string, falling back to the
+    default for unknown names.
+
+    Args:
+        loc (Localization): The localization of the session.
+    """
+    return NAMING_SYSTEMS.get(loc.strings.get("note_naming", DEFAULT_NAMING), ENGLISH)
+
@@ -0,0 +1,403 @@
+import argparse
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.circle import ChordType, QuestionType
+from core.circle_definition import STANDARD_DEFINITION, load_circle_file
+
+logger = logging.getLogger(__name__)
+
+# Answers are stored with the name of the circle they were given on, since ring indices of
+# different circles name different chords. Rows written before circles were stored were all
+# given on the built-in circle.
+STANDARD_CIRCLE_NAME: str = STANDARD_DEFINITION.name
+
+CHORD_TOTALS_TABLE: str = """
+CREATE TABLE IF NOT EXISTS chord_totals (
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    circle TEXT NOT NULL,
+    chord_type INTEGER NOT NULL,
+    chord_index INTEGER NOT NULL,
+    question_type INTEGER NOT NULL,
+    answers INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    score REAL NOT NULL,
+    response_ms INTEGER NOT NULL,
+    PRIMARY KEY (user_id, circle, chord_type, chord_index, question_type)
+) WITHOUT ROWID;
+"""
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    answered_at REAL NOT NULL,
+    circle TEXT NOT NULL,
+    chord_type INTEGER NOT NULL,
+    chord_index INTEGER NOT NULL,
+    question_type INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    score REAL NOT NULL,
+    response_ms INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_by_user_time ON answers(user_id, answered_at);
+CREATE TABLE IF NOT EXISTS user_totals (
+    user_id INTEGER PRIMARY KEY REFERENCES users(id),
+    answers INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    score REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS user_totals_by_score ON user_totals(score DESC);
+""" + CHORD_TOTALS_TABLE
+
+# Adds the circle column to a database written before circles were stored. The primary key
+# of chord_totals changes, so that table is rebuilt.
+MIGRATE_CIRCLE: Tuple[str, ...] = (
+    f"ALTER TABLE answers ADD COLUMN circle TEXT NOT NULL DEFAULT '{STANDARD_CIRCLE_NAME}'",
+    "ALTER TABLE chord_totals RENAME TO chord_totals_without_circle",
+    CHORD_TOTALS_TABLE,
+    "INSERT INTO chord_totals SELECT user_id, ?, chord_type, chord_index, question_type, answers, correct,"
+    " score, response_ms FROM chord_totals_without_circle",
+    "DROP TABLE chord_totals_without_circle",
+)
+
+# Statement texts are constant, so sqlite3's statement cache prepares each of them only once.
+INSERT_USER = "INSERT OR IGNORE INTO users (name) VALUES (?)"
+SELECT_USER = "SELECT id FROM users WHERE name = ?"
+INSERT_ANSWER = (
+    "INSERT INTO answers"
+    " (user_id, answered_at, circle, chord_type, chord_index, question_type, correct, score, response_ms)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+UPSERT_USER_TOTALS = (
+    "INSERT INTO user_totals (user_id, answers, correct, score) VALUES (?, ?, ?, ?)"
+    " ON CONFLICT(user_id) DO UPDATE SET answers = answers + excluded.answers,"
+    " correct = correct + excluded.correct, score = score + excluded.score"
+)
+UPSERT_CHORD_TOTALS = (
+    "INSERT INTO chord_totals"
+    " (user_id, circle, chord_type, chord_index, question_type, answers, correct, score, response_ms)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT(user_id, circle, chord_type, chord_index, question_type) DO UPDATE SET"
+    " answers = answers + excluded.answers, correct = correct + excluded.correct,"
+    " score = score + excluded.score, response_ms = response_ms + excluded.response_ms"
+)
+SELECT_LEADERBOARD = (
+    "SELECT users.name, user_totals.score, user_totals.correct, user_totals.answers"
+    " FROM user_totals JOIN users ON users.id = user_totals.user_id"
+    " ORDER BY user_totals.score DESC LIMIT ?"
+)
+SELECT_USER_TOTALS = (
+    "SELECT user_totals.answers, user_totals.correct, user_totals.score"
+    " FROM user_totals JOIN users ON users.id = user_totals.user_id WHERE users.name = ?"
+)
+SELECT_WEAKEST = (
+    "SELECT chord_totals.chord_type, chord_totals.chord_index, SUM(chord_totals.answers) AS n,"
+    " SUM(chord_totals.correct), SUM(chord_totals.score), SUM(chord_totals.response_ms)"
+    " FROM chord_totals JOIN users ON users.id = chord_totals.user_id"
+    " WHERE users.name = ? AND chord_totals.circle = ?"
+    " GROUP BY chord_totals.chord_type, chord_totals.chord_index HAVING n >= ?"
+    " ORDER BY SUM(chord_totals.score) / n ASC, n DESC LIMIT ?"
+)
+
+# (user, answered_at, circle, chord_index, chord_type, question_type, correct, score, seconds)
+AnswerRow = Tuple[str, float, str, int, ChordType, QuestionType, bool, float, float]
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """
+    Opens a connection in WAL mode, so kiosks can read while another process writes.
+
+    Args:
+        path (str): Path of the database file.
+
+    Returns:
+        sqlite3.Connection: The connection.
+    """
+    conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    return conn
+
+
+def migrate(conn: sqlite3.Connection) -> None:
+    """
+    Brings a database written by an older version up to the current schema.
+
+    The check is repeated inside an immediate transaction, so when several kiosks open an
+    old database at once, only the first one migrates it.
+
+    Args:
+        conn (sqlite3.Connection): A connection to a database with the tables of SCHEMA.
+    """
+    def has_circle() -> bool:
+        return any(row[1] == "circle" for row in conn.execute("PRAGMA table_info(answers)"))
+
+    if has_circle():
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not has_circle():
+            for statement in MIGRATE_CIRCLE:
+                conn.execute(statement, (STANDARD_CIRCLE_NAME,) if "?" in statement else ())
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+class ProgressStore:
+    """
+    Durable per-student progress, stored in SQLite.
+
+    Answers are queued in memory and written in batches by a background thread, so recording
+    an answer never waits on the disk. Running totals per student and per chord are kept up
+    to date in the same transactions, so leaderboard and weakest-chord queries read a few
+    aggregated rows instead of scanning the answer history.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 0.5, batch_size: int = 1000) -> None:
+        """
+        Opens (or creates) the store and starts its writer thread.
+
+        Args:
+            path (str): Path of the database file.
+            flush_interval (float): Longest time in seconds an answer waits before being written.
+            batch_size (int): Maximum number of answers written per transaction.
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.conn = connect(path)
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        migrate(self.conn)
+        self.read_lock = threading.Lock()
+        self.queue: "queue.Queue[Optional[AnswerRow]]" = queue.Queue()
+        self.user_ids: Dict[str, int] = {}
+        self.written: int = 0
+        self.thread = threading.Thread(target=self._writer, name="progress-writer", daemon=True)
+        self.thread.start()
+
+    def record(
+        self,
+        user: str,
+        chord_index: int,
+        chord_type: ChordType,
+        question_type: QuestionType,
+        correct: bool,
+        seconds: float,
+        score: Optional[float] = None,
+        circle: str = STANDARD_CIRCLE_NAME,
+    ) -> None:
+        """
+        Queues one answer for writing. Never blocks.
+
+        Args:
+            user (str): Name of the student.
+            chord_index (int): Index of the chord the question was about.
+            chord_type (ChordType): The chord type of the question.
+            question_type (QuestionType): The question type.
+            correct (bool): Whether the answer was correct.
+            seconds (float): Time taken to answer.
+            score (Optional[float]): Credit earned; defaults to 1.0 if correct, else 0.0.
+            circle (str): Name of the circle the answer was given on.
+        """
+        if score is None:
+            score = 1.0 if correct else 0.0
+        self.queue.put_nowait(
+            (user, time.time(), circle, chord_index, chord_type, question_type, correct, score, seconds)
+        )
+
+    def listener(self, user: str, circle: str = STANDARD_CIRCLE_NAME) -> Callable[..., None]:
+        """
+        Returns an answer listener for GameCore that records a student's answers.
+
+        Args:
+            user (str): Name of the student.
+            circle (str): Name of the circle the game is played on.
+        """
+        return partial(self.record, user, circle=circle)
+
+    def _user_id(self, conn: sqlite3.Connection, name: str) -> int:
+        user_id = self.user_ids.get(name)
+        if user_id is None:
+            conn.execute(INSERT_USER, (name,))
+            user_id = self.user_ids[name] = conn.execute(SELECT_USER, (name,)).fetchone()[0]
+        return user_id
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[AnswerRow]) -> None:
+        """
+        Writes a batch of answers and updates the running totals in one transaction.
+        """
+        answers = []
+        user_totals: Dict[int, List[float]] = defaultdict(lambda: [0, 0, 0.0])
+        chord_totals: Dict[Tuple[int, str, int, int, int], List[float]] = defaultdict(lambda: [0, 0, 0.0, 0])
+        with conn:
+            for user, answered_at, circle, chord_index, chord_type, question_type, correct, score, seconds in batch:
+                user_id = self._user_id(conn, user)
+                response_ms = int(seconds * 1000)
+                answers.append((
+                    user_id, answered_at, circle, chord_type.value, chord_index, question_type.value,
+                    int(correct), score, response_ms,
+                ))
+                totals = user_totals[user_id]
+                totals[0] += 1
+                totals[1] += int(correct)
+                totals[2] += score
+                totals = chord_totals[(user_id, circle, chord_type.value, chord_index, question_type.value)]
+                totals[0] += 1
+                totals[1] += int(correct)
+                totals[2] += score
+                totals[3] += response_ms
+            conn.executemany(INSERT_ANSWER, answers)
+            conn.executemany(UPSERT_USER_TOTALS, [(k, *v) for k, v in user_totals.items()])
+            conn.executemany(UPSERT_CHORD_TOTALS, [(*k, *v) for k, v in chord_totals.items()])
+        self.written += len(batch)
+
+    def _writer(self) -> None:
+        """
+        Writer thread: drains the queue in batches until a None sentinel arrives.
+        """
+        conn = connect(self.path)
+        running = True
+        while running:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch: List[AnswerRow] = []
+            taken = 1
+            while True:
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+            try:
+                if batch:
+                    self._write_batch(conn, batch)
+            except sqlite3.Error:
+                logger.exception("Failed to write %d answers to %s", len(batch), self.path)
+            finally:
+                for _ in range(taken):
+                    self.queue.task_done()
+        conn.close()
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued answer has been written.
+        """
+        self.queue.join()
+
+    def close(self) -> None:
+        """
+        Writes any queued answers and stops the writer thread.
+        """
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        self.conn.close()
+
+    def leaderboard(self, limit: int = 10) -> List[Tuple[str, float, int, int]]:
+        """
+        Returns the students with the highest scores.
+
+        Args:
+            limit (int): Maximum number of students.
+
+        Returns:
+            List[Tuple[str, float, int, int]]: (name, score, correct, answers), best first.
+        """
+        with self.read_lock:
+            return self.conn.execute(SELECT_LEADERBOARD, (limit,)).fetchall()
+
+    def totals(self, user: str) -> Tuple[int, int, float]:
+        """
+        Returns (answers, correct, score) of a student, all zero if unknown.
+        """
+        with self.read_lock:
+            row = self.conn.execute(SELECT_USER_TOTALS, (user,)).fetchone()
+        return tuple(row) if row else (0, 0, 0.0)
+
+    def weakest_chords(
+        self, user: str, limit: int = 5, min_answers: int = 1, circle: str = STANDARD_CIRCLE_NAME
+    ) -> List[Tuple[ChordType, int, int, float, float]]:
+        """
+        Returns the chords of one circle a student scores lowest on, over all question types.
+
+        Args:
+            user (str): Name of the student.
+            limit (int): Maximum number of chords.
+            min_answers (int): Ignore chords answered fewer times than this.
+            circle (str): Name of the circle whose ring indices are returned.
+
+        Returns:
+            List[Tuple[ChordType, int, int, float, float]]: (chord type, chord index, answers,
+                mean score, mean response time in seconds), weakest first.
+        """
+        with self.read_lock:
+            rows = self.conn.execute(SELECT_WEAKEST, (user, circle, min_answers, limit)).fetchall()
+        return [
+            (ChordType(chord_type), chord_index, n, score / n, response_ms / n / 1000)
+            for chord_type, chord_index, n, _, score, response_ms in rows
+        ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point: prints the leaderboard, or a student's weakest chords.
+    """
+    from core.circle import CircleOfFifths
+
+    parser = argparse.ArgumentParser(description="Show stored Circle of Fifths progress.")
+    parser.add_argument("database", help="Path of the progress database.")
+    parser.add_argument("--user", default=None, help="Show this student's weakest chords.")
+    parser.add_argument("--circle", metavar="PATH", default=None,
+                        help="Show the weakest chords on this custom circle instead of the built-in one.")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    circle = CircleOfFifths()
+    if args.circle:
+        try:
+            circle = CircleOfFifths(load_circle_file(args.circle))
+        except ValueError as e:
+            parser.error(str(e))
+
+    store = ProgressStore(args.database)
+    try:
+        if args.user is None:
+            for rank, (name, score, correct, answers) in enumerate(store.leaderboard(args.limit), 1):
+                print(f"{rank:>3}. {name:<20}{score:>10.1f}  {correct}/{answers}")
+        else:
+            answers, correct, score = store.totals(args.user)
+            print(f"{args.user}: {score:.1f} points, {correct}/{answers} correct")
+            for chord_type, index, n, mean_score, mean_time in store.weakest_chords(
+                args.user, args.limit, circle=circle.name
+            ):
+                print(f"  {circle.get_chord_list(chord_type)[index].name:<10}{mean_score:>6.2f}  {mean_time:5.1f}s  ({n} answers)")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+import random
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core.circle import CIRCLE_SIZE
+from core.corpus import MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE, MOVE_RELATIVE, CorpusStats
+from core.key_distance import KEY_COUNT
+
+# Moves a progression drill asks about. Each one determines the next chord from the previous
+# one, so the learner can name it; repeated chords and jumps across the circle cannot be drilled.
+DRILL_MOVES: Tuple[str, ...] = (MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE, MOVE_RELATIVE)
+
+# Hand-specified move weights: resolving counterclockwise (V to I) is the most common move.
+DEFAULT_MOVE_WEIGHTS: Dict[str, float] = {
+    MOVE_CLOCKWISE: 3.0,
+    MOVE_COUNTERCLOCKWISE: 4.0,
+    MOVE_RELATIVE: 2.0,
+}
+
+PROGRESSION_LENGTH: int = 4
+
+
+class AliasTable:
+    """
+    Samples from a fixed discrete distribution in O(1) per draw, with Vose's alias method.
+
+    Building the table takes O(n). Each draw picks a column uniformly and then either keeps it
+    or takes its alias, so it costs one random number whatever the size of the distribution.
+    Tables are read-only once built and can be shared between sessions.
+    """
+
+    __slots__ = ("probabilities", "aliases")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """
+        Builds the table.
+
+        Args:
+            weights (Sequence[float]): Non-negative weight of each outcome, not necessarily
+                normalized.
+
+        Raises:
+            ValueError: If there are no weights, a weight is negative, or all are zero.
+        """
+        count = len(weights)
+        total = float(sum(weights))
+        if count == 0 or total <= 0.0 or min(weights) < 0.0:
+            raise ValueError("Alias tables need non-negative weights with a positive sum")
+        scaled = [weight * count / total for weight in weights]
+        self.probabilities: List[float] = [1.0] * count
+        self.aliases: List[int] = list(range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1.0 up to rounding and keeps its own column.
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    def sample(self, rng: random.Random) -> int:
+        """
+        Draws an outcome index.
+
+        Args:
+            rng (random.Random): The random number generator of the session.
+        """
+        column, coin = divmod(rng.random() * len(self.probabilities), 1.0)
+        column = int(column)
+        return column if coin < self.probabilities[column] else self.aliases[column]
+
+
+def move_target(key: int, move: str, circle_size: int = CIRCLE_SIZE) -> int:
+    """
+    Returns the key reached from a key by one of the DRILL_MOVES.
+
+    Args:
+        key (int): Key number of the starting chord.
+        move (str): MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE or MOVE_RELATIVE.
+        circle_size (int): Number of chords per ring.
+    """
+    ring, index = divmod(key, circle_size)
+    if move == MOVE_CLOCKWISE:
+        return ring * circle_size + (index + 1) % circle_size
+    if move == MOVE_COUNTERCLOCKWISE:
+        return ring * circle_size + (index - 1) % circle_size
+    if move == MOVE_RELATIVE:
+        return (key + circle_size) % (2 * circle_size)
+    raise ValueError(f"Not a drill move: {move}")
+
+
+class TransitionModel:
+    """
+    Markov chain over the keys of a circle: from each key, the next one is reached by one of
+    the DRILL_MOVES, drawn from a per-key alias table.
+    """
+
+    def __init__(self, move_weights: Sequence[Sequence[float]], circle_size: int = CIRCLE_SIZE) -> None:
+        """
+        Builds the alias tables.
+
+        Args:
+            move_weights (Sequence[Sequence[float]]): For every key number, the weight of each
+                of the DRILL_MOVES, in that order.
+            circle_size (int): Number of chords per ring.
+
+        Raises:
+            ValueError: If there is not one row of weights per key, or a row has no positive
+                weight.
+        """
+        if len(move_weights) != 2 * circle_size:
+            raise ValueError(f"Expected move weights for {2 * circle_size} keys, got {len(move_weights)}")
+        self.circle_size = circle_size
+        # Kept so the model can be saved, e.g. with a recording, and rebuilt identically.
+        self.move_weights: List[List[float]] = [[float(weight) for weight in row] for row in move_weights]
+        self.tables: List[AliasTable] = [AliasTable(row) for row in self.move_weights]
+        self.targets: List[Tuple[int, ...]] = [
+            tuple(move_target(key, move, circle_size) for move in DRILL_MOVES)
+            for key in range(2 * circle_size)
+        ]
+
+    @classmethod
+    def from_move_weights(
+        cls,
+        weights: Optional[Dict[str, float]] = None,
+        circle_size: int = CIRCLE_SIZE,
+    ) -> "TransitionModel":
+        """
+        Returns a model that weights the moves the same way from every key.
+
+        Args:
+            weights (Optional[Dict[str, float]]): Weight of each of the DRILL_MOVES. Defaults to
+                DEFAULT_MOVE_WEIGHTS; missing moves get weight 0.
+            circle_size (int): Number of chords per ring.
+        """
+        weights = DEFAULT_MOVE_WEIGHTS if weights is None else weights
+        row = [float(weights.get(move, 0.0)) for move in DRILL_MOVES]
+        return cls([row] * (2 * circle_size), circle_size)
+
+    @classmethod
+    def from_corpus(cls, stats: CorpusStats, smoothing: float = 1.0) -> "TransitionModel":
+        """
+        Returns a model learned from the transitions of a corpus on the built-in circle.
+
+        Each key's weights are its counted moves plus the corpus-wide share of each move times
+        smoothing, so keys the corpus rarely visits still follow its overall style. Keys it never
+        leaves by a drill move use the corpus-wide shares alone.
+
+        Args:
+            stats (CorpusStats): Statistics from core.corpus.analyze_corpus.
+            smoothing (float): Weight of the corpus-wide move distribution in every row.
+        """
+        totals = [float(stats.move_counts.get(move, 0)) for move in DRILL_MOVES]
+        total = sum(totals)
+        prior = [count / total for count in totals] if total else [1.0 / len(DRILL_MOVES)] * len(DRILL_MOVES)
+        rows = []
+        for key in range(KEY_COUNT):
+            row = [
+                stats.transition_count(key, move_target(key, move)) + smoothing * share
+                for move, share in zip(DRILL_MOVES, prior)
+            ]
+            rows.append(row if sum(row) > 0 else prior)
+        return cls(rows)
+
+    def step(self, key: int, rng: random.Random) -> Tuple[str, int]:
+        """
+        Draws the move from a key and the key it leads to, in O(1).
+
+        Args:
+            key (int): Key number of the current chord.
+            rng (random.Random): The random number generator of the session.
+
+        Returns:
+            Tuple[str, int]: One of DRILL_MOVES and the next key number.
+        """
+        choice = self.tables[key].sample(rng)
+        return DRILL_MOVES[choice], self.targets[key][choice]
+
+
+_default_models: Dict[int, TransitionModel] = {}
+
+
+def default_model(circle_size: int = CIRCLE_SIZE) -> TransitionModel:
+    """
+    Returns the model with DEFAULT_MOVE_WEIGHTS for a circle size, built once and shared by
+    every session.
+    """
+    model = _default_models.get(circle_size)
+    if model is None:
+        model = _default_models[circle_size] = TransitionModel.from_move_weights(circle_size=circle_size)
+    return model
+
+
+def walk(model: TransitionModel, rng: random.Random, start: int) -> Iterator[Tuple[str, int]]:
+    """
+    Yields an endless chain of moves from a starting key, drawing each one only when asked.
+
+    Args:
+        model (TransitionModel): The transition model.
+        rng (random.Random): The random number generator of the session.
+        start (int): Key number of the first chord.
+
+    Yields:
+        Tuple[str, int]: Each move and the key number it leads to.
+    """
+    key = start
+    while True:
+        move, key = model.step(key, rng)
+        yield move, key
+
+
+def progressions(
+    model: TransitionModel,
+    rng: random.Random,
+    length: int = PROGRESSION_LENGTH,
+    starts: Optional[Sequence[int]] = None,
+) -> Iterator[List[int]]:
+    """
+    Yields an endless stream of progressions, generated one at a time.
+
+    Args:
+        model (TransitionModel): The transition model.
+        rng (random.Random): The random number generator of the session.
+        length (int): Number of chords per progression.
+        starts (Optional[Sequence[int]]): Key numbers progressions may start on. Defaults to
+            every key.
+
+    Yields:
+        List[int]: The key numbers of each progression.
+    """
+    starts = list(starts) if starts is not None else list(range(2 * model.circle_size))
+    while True:
+        keys = [rng.choice(starts)]
+        chain = walk(model, rng, keys[0])
+        keys.extend(next(chain)[1] for _ in range(length - 1))
+        yield keys
+
@@ -0,0 +1,254 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core import theory
+from core.chord_symbol import try_parse_chord_symbol
+from core.constants import MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE, MOVE_RELATIVE, ChordType, QuestionType
+from core.key_distance import distance, key_index, partial_credit
+
+# Hooks of question types that are not answered by a fixed ring move. Both receive the
+# GameCore asking the question.
+# detail(core, chord_type, index) returns the ring and index of the chord the question is
+# about, which may differ from the drawn one, and the question's extra parameters.
+DetailHook = Callable[[Any, ChordType, int], Tuple[ChordType, int, Dict[str, Any]]]
+# check(core, answer) grades a normalized answer to the current question, returning whether
+# it is correct, its score, and the result shown as feedback (GameCore.last_result).
+CheckHook = Callable[[Any, str], Tuple[bool, float, Dict[str, Any]]]
+
+# Each step of a progression is graded as the ring question that asks for the same move.
+MOVE_QUESTION_TYPES: Dict[str, QuestionType] = {
+    MOVE_CLOCKWISE: QuestionType.CLOCKWISE,
+    MOVE_COUNTERCLOCKWISE: QuestionType.COUNTERCLOCKWISE,
+    MOVE_RELATIVE: QuestionType.ALTERNATIVE_CIRCLE,
+}
+
+
+@dataclass(frozen=True)
+class QuestionKind:
+    """
+    Everything the quiz needs to know about one type of question.
+
+    Attributes:
+        question_type (Enum): The member that identifies the question type, a QuestionType or,
+            for question types added by other modules, a member of their own Enum. Its value
+            is stored with saved progress, so it must be an int no other type uses.
+        text_key (str): Localization key of the question text.
+        correct_key (str): Localization key of the feedback to a correct answer.
+        incorrect_key (str): Localization key of the feedback to a wrong answer.
+        moves (Tuple[Tuple[bool, int], ...]): The correct answers as moves from the question's
+            chord: whether to cross to the other ring, then how many steps clockwise. Empty for
+            questions that are not answered by a fixed ring move, such as theory questions.
+        weight (float): Relative frequency of the question type when several are asked.
+        detail (Optional[DetailHook]): Draws the extra parameters of each question, e.g. the
+            degree asked about. Questions without it have no detail.
+        check (Optional[CheckHook]): Grades answers. Questions without it are graded against
+            the answers their moves lead to.
+        needs_standard_circle (bool): Whether the question type only makes sense on the
+            built-in circle of fifths, like questions about key signatures.
+    """
+    question_type: Enum
+    text_key: str
+    correct_key: str
+    incorrect_key: str
+    moves: Tuple[Tuple[bool, int], ...] = ()
+    weight: float = 1.0
+    detail: Optional[DetailHook] = None
+    check: Optional[CheckHook] = None
+    needs_standard_circle: bool = False
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name of the question type on the command line, e.g. "clockwise".
+        """
+        return self.question_type.name.lower()
+
+
+# Every registered question type, in registration order. Shared by reference, so circles
+# built before a registration still see it.
+QUESTION_KINDS: Dict[Enum, QuestionKind] = {}
+
+
+def register_question_type(kind: QuestionKind) -> QuestionKind:
+    """
+    Adds a question type to the quiz. Register at import time, before any GameCore or
+    StatsTracker is created.
+
+    Args:
+        kind (QuestionKind): The question type.
+
+    Returns:
+        QuestionKind: The registered question type, so the call can wrap a module constant.
+
+    Raises:
+        ValueError: If the question type, its name or its value is already registered, or
+            its weight is not positive.
+    """
+    if kind.weight <= 0:
+        raise ValueError(f"Question type {kind.name} needs a positive weight")
+    for other in QUESTION_KINDS.values():
+        if other.question_type == kind.question_type or other.name == kind.name:
+            raise ValueError(f"Question type {kind.name} is already registered")
+        if other.question_type.value == kind.question_type.value:
+            raise ValueError(f"Question types {other.name} and {kind.name} share the value {kind.question_type.value}")
+    QUESTION_KINDS[kind.question_type] = kind
+    return kind
+
+
+def question_kind(question_type: Enum) -> QuestionKind:
+    """
+    Returns a registered question type.
+
+    Raises:
+        ValueError: If the question type is not registered.
+    """
+    try:
+        return QUESTION_KINDS[question_type]
+    except KeyError:
+        raise ValueError(f"Unknown question type: {question_type}") from None
+
+
+def question_types() -> List[Enum]:
+    """
+    Returns every registered question type, in registration order.
+    """
+    return list(QUESTION_KINDS)
+
+
+def question_type_by_name(name: str) -> Enum:
+    """
+    Returns the registered question type with a command line name, e.g. "fill_in".
+
+    Raises:
+        ValueError: If no registered question type has that name.
+    """
+    for kind in QUESTION_KINDS.values():
+        if kind.name == name.lower():
+            return kind.question_type
+    raise ValueError(f"Unknown question type: {name}")
+
+
+def not_found(reason: str = "not_found") -> Tuple[bool, float, Dict[str, Any]]:
+    """
+    Returns the grade of an answer that is not even a chord, or not a signature.
+    """
+    return False, 0.0, {"correct": False, "reason": reason}
+
+
+def _key_detail(chord_type: ChordType, index: int) -> Dict[str, Any]:
+    key = key_index(index, chord_type == ChordType.MINOR)
+    return {"key": key, "tonic": theory.KEY_TONICS[key], "signature": theory.KEY_SIGNATURES[key][0]}
+
+
+def _degree_detail(core: Any, chord_type: ChordType, index: int) -> Tuple[ChordType, int, Dict[str, Any]]:
+    detail = _key_detail(chord_type, index)
+    key = detail["key"]
+    degree = core.rng.choice(theory.ASKABLE_DEGREES[key])
+    detail["degree"] = degree
+    detail["numeral"] = theory.degree_numeral(key, degree)
+    detail["expected"] = theory.DEGREE_CHORD_NAMES[key][degree]
+    return chord_type, index, detail
+
+
+def _key_from_signature_detail(core: Any, chord_type: ChordType, index: int) -> Tuple[ChordType, int, Dict[str, Any]]:
+    detail = _key_detail(chord_type, index)
+    signatures = theory.KEY_SIGNATURES[detail["key"]]
+    if len(signatures) > 1:
+        detail["signature"] = core.rng.choice(signatures)
+    detail["expected"] = core.circle.get_chord_list(chord_type)[index].name
+    return chord_type, index, detail
+
+
+def _signature_of_key_detail(core: Any, chord_type: ChordType, index: int) -> Tuple[ChordType, int, Dict[str, Any]]:
+    detail = _key_detail(chord_type, index)
+    detail["expected"] = theory.format_signature(detail["signature"])
+    return chord_type, index, detail
+
+
+def _theory_result(core: Any, answer: str, correct: bool, score: float) -> Tuple[bool, float, Dict[str, Any]]:
+    return correct, score, {"correct": correct, "answer": answer, "expected": core.question_detail["expected"]}
+
+
+def _check_degree(core: Any, answer: str) -> Tuple[bool, float, Dict[str, Any]]:
+    if try_parse_chord_symbol(answer) is None:
+        return not_found()
+    key, degree = core.question_detail["key"], core.question_detail["degree"]
+    correct = theory.check_degree_answer(answer, key, degree)
+    chord = core.circle.find_chord(answer)
+    expected = core.circle.mask_index.get(theory.DEGREE_CHORDS[key][degree].mask)
+    if correct or chord is None or expected is None:
+        return _theory_result(core, answer, correct, 1.0 if correct else 0.0)
+    return _theory_result(core, answer, False, partial_credit(core.circle.distance(chord, expected)))
+
+
+def _check_key_from_signature(core: Any, answer: str) -> Tuple[bool, float, Dict[str, Any]]:
+    chord = core.circle.find_chord(answer)
+    if chord is None:
+        return not_found()
+    steps = distance(core.circle.key_indices[chord], core.question_detail["key"])
+    return _theory_result(core, answer, steps == 0, partial_credit(steps))
+
+
+def _check_signature_of_key(core: Any, answer: str) -> Tuple[bool, float, Dict[str, Any]]:
+    if theory.parse_signature(answer) is None:
+        return not_found("not_signature")
+    correct = theory.check_signature_answer(answer, core.question_detail["key"])
+    return _theory_result(core, answer, correct, 1.0 if correct else 0.0)
+
+
+def _progression_detail(core: Any, chord_type: ChordType, index: int) -> Tuple[ChordType, int, Dict[str, Any]]:
+    """
+    Advances the session's progression by one chord, starting a new one from the drawn chord
+    once the last is complete. The question is about the previous chord and asks for the next.
+    """
+    size = core.circle.size
+    keys = core.progression_keys
+    if not keys or len(keys) >= core.progression_length:
+        keys = core.progression_keys = [key_index(index, chord_type == ChordType.MINOR, size)]
+    previous = keys[-1]
+    move, key = core.progression_model.step(previous, core.rng)
+    keys.append(key)
+    names = [core.circle.get_chord(k % size, ChordType.MINOR if k >= size else ChordType.MAJOR).name for k in keys]
+    minor, index = divmod(previous, size)
+    return ChordType.MINOR if minor else ChordType.MAJOR, index, {
+        "move": move,
+        "progression": names[:-1],
+        "step": len(names) - 1,
+        "length": core.progression_length,
+        "expected": names[-1],
+    }
+
+
+def _check_progression_step(core: Any, answer: str) -> Tuple[bool, float, Dict[str, Any]]:
+    chord = core.circle.find_chord(answer)
+    if chord is None:
+        return not_found()
+    question_type = MOVE_QUESTION_TYPES[core.question_detail["move"]]
+    correct, score = core.circle.grade_answer(chord, core.current_chord, question_type, core.chord_type)
+    return correct, score, {"correct": correct, "answer": chord, "expected": core.question_detail["expected"]}
+
+
+def _builtin(question_type: QuestionType, moves: Tuple[Tuple[bool, int], ...] = (), **hooks: Any) -> QuestionKind:
+    suffix = question_type.name.lower()
+    return register_question_type(QuestionKind(
+        question_type,
+        text_key=f"question_{suffix}",
+        correct_key=f"feedback_correct_{suffix}",
+        incorrect_key=f"feedback_incorrect_{suffix}",
+        moves=moves,
+        **hooks,
+    ))
+
+
+_builtin(QuestionType.CLOCKWISE, ((False, 1),))
+_builtin(QuestionType.COUNTERCLOCKWISE, ((False, -1),))
+_builtin(QuestionType.ALTERNATIVE_CIRCLE, ((True, 0),))
+_builtin(QuestionType.ANY, ((False, 1), (False, -1), (True, 0)))
+_builtin(QuestionType.FILL_IN, ((False, 0),))
+_builtin(QuestionType.DIATONIC_DEGREE, detail=_degree_detail, check=_check_degree, needs_standard_circle=True)
+_builtin(QuestionType.KEY_FROM_SIGNATURE, detail=_key_from_signature_detail, check=_check_key_from_signature,
+         needs_standard_circle=True)
+_builtin(QuestionType.SIGNATURE_OF_KEY, detail=_signature_of_key_detail, check=_check_signature_of_key,
+         needs_standard_circle=True)
+_builtin(QuestionType.PROGRESSION, detail=_progression_detail, check=_check_progression_step)
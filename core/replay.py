@@ -0,0 +1,417 @@
+import argparse
+import gzip
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import pygame
+
+from config import Config
+from core.circle import CIRCLE_SIZE, CircleOfFifths
+from core.circle_definition import CircleDefinition, load_compiled_circle, parse_circle_definition
+from core.naming import NAMING_SYSTEMS, NamingSystem
+from core.progression import TransitionModel
+from core.questions import question_kind, question_type_by_name
+
+# Version 2 added the game configuration. Version 1 recordings carry none, which stands for
+# the default game, so they still replay.
+RECORDING_VERSION = 2
+READABLE_VERSIONS = (1, 2)
+
+# Compact event codes used in recording files.
+EVENT_KEYDOWN = "k"
+EVENT_MOUSEBUTTONDOWN = "m"
+EVENT_QUIT = "q"
+
+
+def encode_event(event: pygame.event.Event, timestamp_ms: int) -> Optional[list]:
+    """
+    Encodes a pygame event as a compact list, or returns None for events the game ignores.
+
+    Args:
+        event (pygame.event.Event): The event to encode.
+        timestamp_ms (int): Milliseconds since the start of the recording.
+
+    Returns:
+        Optional[list]: The encoded event, or None if the event is not recorded.
+    """
+    if event.type == pygame.KEYDOWN:
+        return [timestamp_ms, EVENT_KEYDOWN, event.key, event.unicode, getattr(event, "mod", 0)]
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        return [timestamp_ms, EVENT_MOUSEBUTTONDOWN, event.button, event.pos[0], event.pos[1]]
+    if event.type == pygame.QUIT:
+        return [timestamp_ms, EVENT_QUIT]
+    return None
+
+
+def decode_event(entry: Sequence[Any]) -> pygame.event.Event:
+    """
+    Decodes a compact event list back into a pygame event.
+
+    Args:
+        entry (Sequence[Any]): The encoded event as produced by encode_event.
+
+    Returns:
+        pygame.event.Event: The reconstructed event.
+    """
+    code = entry[1]
+    if code == EVENT_KEYDOWN:
+        return pygame.event.Event(pygame.KEYDOWN, key=entry[2], unicode=entry[3], mod=entry[4])
+    if code == EVENT_MOUSEBUTTONDOWN:
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=entry[2], pos=(entry[3], entry[4]))
+    if code == EVENT_QUIT:
+        return pygame.event.Event(pygame.QUIT)
+    raise ValueError(f"Unknown event code in recording: {code!r}")
+
+
+def snapshot_state(game) -> Dict[str, Any]:
+    """
+    Captures the parts of the game state that a replay must reproduce exactly.
+
+    Args:
+        game (CircleOfFifthsGame): The game to inspect.
+
+    Returns:
+        Dict[str, Any]: A JSON-serializable summary of the game state.
+    """
+    core = game.core
+    return {
+        "stats": list(core.get_stats()),
+        "input_text": game.input_text,
+        "game_state": game.state.name,
+        "chord_type": core.chord_type.name,
+        "current_question": core.current_question.name if core.current_question is not None else None,
+        "current_chord": str(core.current_chord) if core.current_chord is not None else None,
+        "selected_chord_indices": sorted(core.get_selected_chord_indices()),
+    }
+
+
+def game_config(
+    question_types: Optional[Sequence[Enum]] = None,
+    rotate: bool = False,
+    naming: Optional[NamingSystem] = None,
+    circle: Optional[CircleDefinition] = None,
+    circle_path: Optional[str] = None,
+    practice_set: Optional[str] = None,
+    progression_model: Optional[TransitionModel] = None,
+    progression_corpus: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Returns the options a game was started with, in the JSON form stored in recordings.
+
+    Every argument defaults to the option's default in CircleOfFifthsGame.
+
+    Args:
+        question_types (Optional[Sequence[Enum]]): Question types asked.
+        rotate (bool): Whether the circle rotates to each question's chord.
+        naming (Optional[NamingSystem]): Naming system chosen over the language's.
+        circle (Optional[CircleDefinition]): Definition of a custom circle. It is stored whole,
+            so the recording replays without the file.
+        circle_path (Optional[str]): Path the definition was read from, for reference.
+        practice_set (Optional[str]): Practice set selected at start.
+        progression_model (Optional[TransitionModel]): Model of progression questions; its
+            move weights are stored.
+        progression_corpus (Optional[Sequence[str]]): Paths the model was learned from, for
+            reference.
+
+    Returns:
+        Dict[str, Any]: The configuration.
+    """
+    return {
+        "questions": [question_kind(question_type).name for question_type in question_types] if question_types else None,
+        "rotate": rotate,
+        "naming": naming.name if naming is not None else None,
+        "circle": circle.to_dict() if circle is not None else None,
+        "circle_digest": circle.digest() if circle is not None else None,
+        "circle_path": circle_path,
+        "practice_set": practice_set,
+        "progression_weights": progression_model.move_weights if progression_model is not None else None,
+        "progression_corpus": list(progression_corpus) if progression_corpus else None,
+    }
+
+
+def build_game(recording: Dict[str, Any], clock: Callable[[], float]):
+    """
+    Builds the game a recording was made with, from its seed, language and configuration.
+
+    Args:
+        recording (Dict[str, Any]): The recording, as returned by load_recording.
+        clock (Callable[[], float]): Time source of the game's animations.
+
+    Returns:
+        CircleOfFifthsGame: The game, with the recorded practice set selected.
+
+    Raises:
+        ValueError: If the configuration names an unknown question type, naming system,
+            practice set or an invalid circle.
+    """
+    from core.game import CircleOfFifthsGame
+
+    config = recording.get("config") or {}
+    circle = None
+    if config.get("circle") is not None:
+        circle = CircleOfFifths(load_compiled_circle(parse_circle_definition(config["circle"])))
+    naming = None
+    if config.get("naming") is not None:
+        naming = NAMING_SYSTEMS.get(config["naming"])
+        if naming is None:
+            raise ValueError(f"Unknown naming system in recording: {config['naming']}")
+    progression_model = None
+    if config.get("progression_weights") is not None:
+        progression_model = TransitionModel(config["progression_weights"], circle.size if circle else CIRCLE_SIZE)
+    questions = config.get("questions")
+    game = CircleOfFifthsGame(
+        recording["lang"],
+        seed=recording["seed"],
+        clock=clock,
+        rotate=config.get("rotate", False),
+        question_types=[question_type_by_name(name) for name in questions] if questions else None,
+        naming=naming,
+        circle=circle,
+        progression_model=progression_model,
+    )
+    if config.get("practice_set"):
+        game.core.use_practice_set(config["practice_set"])
+        game.reset_for_next_question()
+    return game
+
+
+class InputRecorder:
+    """
+    Captures timestamped input events, the question seed and the configuration of a game session.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        lang: str = "en",
+        clock: Callable[[], float] = time.perf_counter,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initializes the recorder.
+
+        Args:
+            seed (Optional[int]): Seed for the session. A random one is chosen if None.
+            lang (str): Language code of the recorded session.
+            clock (Callable[[], float]): Clock returning seconds, used for timestamps.
+            config (Optional[Dict[str, Any]]): Options of the recorded game, as returned by
+                game_config. Defaults to the default game.
+        """
+        self.seed: int = seed if seed is not None else random.randrange(2**32)
+        self.lang: str = lang
+        self.config: Dict[str, Any] = config if config is not None else game_config()
+        self.clock = clock
+        self.start: float = clock()
+        self.events: List[list] = []
+
+    def capture(self, events: Sequence[pygame.event.Event]) -> None:
+        """
+        Records the input events the game is about to handle.
+
+        Args:
+            events (Sequence[pygame.event.Event]): Events for the current frame.
+        """
+        if not events:
+            return
+        timestamp_ms = int((self.clock() - self.start) * 1000)
+        for event in events:
+            entry = encode_event(event, timestamp_ms)
+            if entry is not None:
+                self.events.append(entry)
+
+    def save(self, path: str, game=None) -> None:
+        """
+        Writes the recording to a gzip-compressed JSON file.
+
+        Args:
+            path (str): Destination path.
+            game (CircleOfFifthsGame, optional): The recorded game. If given, its final
+                state is stored so that replays can be verified against it.
+        """
+        data = {
+            "version": RECORDING_VERSION,
+            "seed": self.seed,
+            "lang": self.lang,
+            "config": self.config,
+            "fps": Config.FPS,
+            "duration_ms": int((self.clock() - self.start) * 1000),
+            "events": self.events,
+            "final": snapshot_state(game) if game is not None else None,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def load_recording(path: str) -> Dict[str, Any]:
+    """
+    Loads a recording written by InputRecorder.save.
+
+    Args:
+        path (str): Path to the recording.
+
+    Returns:
+        Dict[str, Any]: The recording data.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") not in READABLE_VERSIONS:
+        raise ValueError(f"Unsupported recording version: {data.get('version')!r}")
+    return data
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Returns the nearest-rank percentile of a sequence of values.
+
+    Args:
+        values (Sequence[float]): The values.
+        pct (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile value, or 0.0 for an empty sequence.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class ReplayResult:
+    """
+    Outcome of a replay run.
+
+    Attributes:
+        frames (int): Number of frames simulated.
+        frame_times (List[float]): Wall-clock seconds spent on each frame.
+        final (Dict[str, Any]): Final game state reached by the replay.
+        expected (Optional[Dict[str, Any]]): Final state stored in the recording, if any.
+        mismatches (List[str]): Names of state fields that differ from the expected state.
+    """
+    frames: int
+    frame_times: List[float]
+    final: Dict[str, Any]
+    expected: Optional[Dict[str, Any]]
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def matched(self) -> bool:
+        """
+        Returns True if the replay reproduced the recorded final state.
+        """
+        return not self.mismatches
+
+    def frame_time_percentile(self, pct: float) -> float:
+        """
+        Returns a percentile of the frame times in seconds.
+
+        Args:
+            pct (float): The percentile, between 0 and 100.
+        """
+        return percentile(self.frame_times, pct)
+
+
+def setup_headless() -> None:
+    """
+    Selects the SDL dummy drivers and initializes pygame, so no window or audio device is needed.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+
+def replay(recording: Dict[str, Any], speed: float = 0.0, game_factory=None) -> ReplayResult:
+    """
+    Feeds a recording back through CircleOfFifthsGame.handle_events frame by frame.
+
+    Recorded timestamps are mapped onto a virtual frame clock running at the recorded FPS,
+    so the result does not depend on how fast the host renders.
+
+    Args:
+        recording (Dict[str, Any]): The recording, as returned by load_recording.
+        speed (float): Playback speed relative to real time. 0 replays as fast as possible.
+        game_factory (Callable, optional): Builds the game from (lang, seed). Defaults to
+            the recorded game, as built by build_game.
+
+    Returns:
+        ReplayResult: Frame timings and the comparison against the recorded final state.
+    """
+    frame_ms = 1000.0 / recording.get("fps", Config.FPS)
+    frame = 0
+    if game_factory is None:
+        # Animations follow the virtual frame clock too, so they replay identically.
+        game = build_game(recording, lambda: frame * frame_ms / 1000.0)
+    else:
+        game = game_factory(recording["lang"], recording["seed"])
+    events = recording["events"]
+    end_ms = max(recording.get("duration_ms", 0), events[-1][0] if events else 0)
+
+    frame_times: List[float] = []
+    position = 0
+    while game.running:
+        now_ms = frame * frame_ms
+        batch = []
+        while position < len(events) and events[position][0] <= now_ms:
+            batch.append(decode_event(events[position]))
+            position += 1
+        started = time.perf_counter()
+        game.step(batch)
+        elapsed = time.perf_counter() - started
+        frame_times.append(elapsed)
+        frame += 1
+        if position >= len(events) and now_ms >= end_ms:
+            break
+        if speed > 0:
+            remaining = frame_ms / 1000.0 / speed - elapsed
+            if remaining > 0:
+                time.sleep(remaining)
+
+    final = snapshot_state(game)
+    game.renderer.close()
+    expected = recording.get("final")
+    mismatches = []
+    if expected is not None:
+        mismatches = [key for key, value in expected.items() if final.get(key) != value]
+    return ReplayResult(frame, frame_times, final, expected, mismatches)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point: replays a recording headlessly and checks the outcome.
+
+    Returns:
+        int: Process exit code, non-zero if the final state or frame times are off.
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded Circle of Fifths session.")
+    parser.add_argument("recording", help="Path to a recording file.")
+    parser.add_argument("--speed", type=float, default=0.0,
+                        help="Playback speed relative to real time (0 = as fast as possible).")
+    parser.add_argument("--max-p99-ms", type=float, default=None,
+                        help="Fail if the 99th percentile frame time exceeds this many milliseconds.")
+    args = parser.parse_args(argv)
+
+    setup_headless()
+    result = replay(load_recording(args.recording), speed=args.speed)
+    p50 = result.frame_time_percentile(50) * 1000
+    p99 = result.frame_time_percentile(99) * 1000
+    print(f"frames={result.frames} p50={p50:.3f}ms p99={p99:.3f}ms max={max(result.frame_times) * 1000:.3f}ms")
+
+    status = 0
+    if not result.matched:
+        print("final state mismatch: " + ", ".join(result.mismatches))
+        status = 1
+    if args.max_p99_ms is not None and p99 > args.max_p99_ms:
+        print(f"p99 frame time {p99:.3f}ms exceeds {args.max_p99_ms:.3f}ms")
+        status = 1
+    pygame.quit()
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+import time
+from typing import Callable
+
+
+def rotation_for_index(index: int, segments: int = 12) -> float:
+    """
+    Returns the rotation that brings a segment of the circle to 12 o'clock.
+
+    Args:
+        index (int): Index of the segment.
+        segments (int): Number of segments in the circle.
+
+    Returns:
+        float: Clockwise rotation in degrees, in [0, 360).
+    """
+    return (-index * 360 / segments) % 360
+
+
+def ease_out_cubic(t: float) -> float:
+    """
+    Easing curve that starts fast and settles gently, for t in [0, 1].
+    """
+    return 1 - (1 - t) ** 3
+
+
+class RotationAnimator:
+    """
+    Animates the rotation of the circle towards a target angle, always taking the shorter way round.
+    """
+
+    def __init__(self, duration: float = 0.35, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Initializes the animator at rest at 0 degrees.
+
+        Args:
+            duration (float): Length of each animation in seconds.
+            clock (Callable[[], float]): Time source in seconds.
+        """
+        self.duration = duration
+        self.clock = clock
+        self.angle: float = 0.0
+        self.start_angle: float = 0.0
+        self.delta: float = 0.0
+        self.started: float = 0.0
+        self.animating: bool = False
+
+    @property
+    def target(self) -> float:
+        """
+        Returns the angle the current animation ends at, in [0, 360).
+        """
+        return (self.start_angle + self.delta) % 360
+
+    def rotate_to(self, target: float) -> None:
+        """
+        Starts animating from the current angle to the target angle.
+
+        Args:
+            target (float): Clockwise rotation in degrees.
+        """
+        self.start_angle = self.update()
+        self.delta = (target - self.start_angle + 180) % 360 - 180
+        self.started = self.clock()
+        self.animating = self.delta != 0
+
+    def snap_to(self, target: float) -> None:
+        """
+        Jumps to the target angle without animating.
+
+        Args:
+            target (float): Clockwise rotation in degrees.
+        """
+        self.angle = self.start_angle = target % 360
+        self.delta = 0.0
+        self.animating = False
+
+    def update(self) -> float:
+        """
+        Advances the animation to the current time.
+
+        Returns:
+            float: The current angle in degrees, in [0, 360).
+        """
+        if not self.animating:
+            return self.angle
+        t = (self.clock() - self.started) / self.duration if self.duration > 0 else 1.0
+        if t >= 1.0:
+            self.animating = False
+            self.angle = self.target
+        else:
+            self.angle = (self.start_angle + self.delta * ease_out_cubic(max(t, 0.0))) % 360
+        return self.angle
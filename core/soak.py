@@ -0,0 +1,307 @@
+import argparse
+import math
+import random
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, List, Optional, Sequence
+
+import pygame
+
+from config import Config
+from core.replay import percentile, setup_headless
+
+DEFAULT_FRAMES: int = 1_000_000
+# Frames between samples of memory and frame times, and frames played before the baseline
+# sample, so caches and prefetched questions have filled up.
+SAMPLE_EVERY: int = 10_000
+WARMUP_FRAMES: int = 20_000
+# Default bounds on growth from the baseline sample to the last one.
+MAX_GROWTH_BYTES: int = 512 * 1024
+# Frame times are compared as a ratio, since tracing slows every frame by a similar factor.
+MAX_P99_DRIFT: float = 1.5
+# Allocation sites listed in the growth report.
+TOP_SITES: int = 10
+
+
+class ScriptedStudent:
+    """
+    Plays the quiz like a student at a kiosk: types answers key by key, submits them, moves
+    on to the next question, and now and then answers wrongly, corrects a typo, switches the
+    heatmap or toggles a chord off and on again.
+    """
+
+    def __init__(
+        self,
+        game,
+        rng: random.Random,
+        frames_per_event: int = 4,
+        mistake_every: int = 4,
+        click_every: int = 7,
+    ) -> None:
+        """
+        Args:
+            game (CircleOfFifthsGame): The game to play.
+            rng (random.Random): Source of the student's choices.
+            frames_per_event (int): Frames between two inputs.
+            mistake_every (int): Every this many questions, the answer is wrong.
+            click_every (int): Every this many questions, a chord is toggled and the heatmap
+                switched.
+        """
+        self.game = game
+        self.rng = rng
+        self.frames_per_event = frames_per_event
+        self.mistake_every = mistake_every
+        self.click_every = click_every
+        self.questions = 0
+        self.pending: Deque[List[pygame.event.Event]] = deque()
+
+    def events(self, frame: int) -> List[pygame.event.Event]:
+        """
+        Returns the input events of a frame.
+
+        Args:
+            frame (int): Number of the frame, counted from 0.
+        """
+        if frame % self.frames_per_event:
+            return []
+        if not self.pending:
+            self._plan_question()
+        return self.pending.popleft()
+
+    def _plan_question(self) -> None:
+        self.questions += 1
+        core = self.game.core
+        answers = core.circle.get_next_chord(core.current_chord, core.current_question, core.chord_type)
+        name = (answers[0] if answers else core.current_chord).name.split("/")[0]
+        answer = core.naming.display(name)
+        if self.questions % self.mistake_every == 0:
+            answer = "X"
+        typo = self.rng.choice("abcdefg")
+        self.pending.append([key(typo, ord(typo))])
+        self.pending.append([key("", pygame.K_BACKSPACE)])
+        self.pending.extend([key(char, ord(char.lower()))] for char in answer)
+        self.pending.append([key("\r", pygame.K_RETURN)])
+        if self.questions % self.click_every == 0:
+            self.pending.append([key("", pygame.K_F2)])
+            # Both clicks land in the same frame, so they hit the same wedge even while the
+            # circle rotates, and the selection ends up unchanged.
+            pos = wedge_position(self.rng.randrange(core.circle.size), core.circle.size, self.game.rotation_angle())
+            click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+            self.pending.append([click, click])
+        self.pending.append([key("\r", pygame.K_RETURN)])
+
+
+def key(unicode: str, code: int) -> pygame.event.Event:
+    """
+    Returns a KEYDOWN event.
+    """
+    return pygame.event.Event(pygame.KEYDOWN, key=code, unicode=unicode, mod=0)
+
+
+def wedge_position(index: int, segments: int, rotation: float = 0.0) -> tuple:
+    """
+    Returns the window coordinates of the middle of a major chord's wedge.
+
+    Args:
+        index (int): Ring index of the chord.
+        segments (int): Number of chords per ring.
+        rotation (float): Clockwise rotation of the circle in degrees.
+    """
+    radius = (Config.CIRCLE_RADIUS + Config.CIRCLE_INNER_RADIUS) / 2
+    angle = math.radians(index * 360 / segments + rotation)
+    cx, cy = Config.CIRCLE_CENTER
+    return int(round(cx + radius * math.sin(angle))), int(round(cy - radius * math.cos(angle)))
+
+
+@dataclass
+class SoakSample:
+    """
+    Memory use and frame times over one sampling window.
+
+    Attributes:
+        frame (int): Number of frames played when the sample was taken.
+        memory (int): Bytes allocated by Python and still alive, as traced by tracemalloc.
+        p50 (float): Median frame time of the window in seconds.
+        p99 (float): 99th percentile frame time of the window in seconds.
+    """
+    frame: int
+    memory: int
+    p50: float
+    p99: float
+
+
+@dataclass
+class SoakResult:
+    """
+    Outcome of a soak run.
+
+    Attributes:
+        frames (int): Number of frames played.
+        questions (int): Number of questions answered.
+        samples (List[SoakSample]): The baseline sample and every one after it.
+        growth (List[tracemalloc.StatisticDiff]): Allocation sites that grew the most from the
+            baseline to the end, largest first.
+        failures (List[str]): Bounds that were exceeded.
+    """
+    frames: int
+    questions: int
+    samples: List[SoakSample]
+    growth: List[tracemalloc.StatisticDiff]
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """
+        Returns True if memory and frame times stayed within their bounds.
+        """
+        return not self.failures
+
+    @property
+    def memory_growth(self) -> int:
+        """
+        Returns the bytes gained from the baseline sample to the last one.
+        """
+        return self.samples[-1].memory - self.samples[0].memory if self.samples else 0
+
+    @property
+    def p99_drift(self) -> float:
+        """
+        Returns the 99th percentile frame time of the last window relative to the baseline
+        window, e.g. 1.2 for 20% slower.
+        """
+        if not self.samples or self.samples[0].p99 <= 0.0:
+            return 1.0
+        return self.samples[-1].p99 / self.samples[0].p99
+
+
+def soak(
+    frames: int = DEFAULT_FRAMES,
+    sample_every: int = SAMPLE_EVERY,
+    warmup_frames: int = WARMUP_FRAMES,
+    seed: int = 0,
+    lang: str = "en",
+    rotate: bool = False,
+    max_growth_bytes: int = MAX_GROWTH_BYTES,
+    max_p99_drift: float = MAX_P99_DRIFT,
+    top: int = TOP_SITES,
+    game_factory: Optional[Callable] = None,
+) -> SoakResult:
+    """
+    Plays the full game loop headlessly with scripted input and tracks memory and frame times.
+
+    The game runs on a virtual frame clock at Config.FPS, as in replays, but as fast as the
+    host allows. After the warm-up, a baseline sample and a tracemalloc snapshot are taken;
+    later samples are compared against them. Call setup_headless() first.
+
+    Args:
+        frames (int): Frames to play, including the warm-up.
+        sample_every (int): Frames per sampling window.
+        warmup_frames (int): Frames played before the baseline sample.
+        seed (int): Seed of the questions and of the scripted student.
+        lang (str): Language of the game.
+        rotate (bool): Rotate the circle to each question's chord.
+        max_growth_bytes (int): Traced memory may grow by at most this many bytes.
+        max_p99_drift (float): The 99th percentile frame time of the last window may be at
+            most this many times that of the baseline window.
+        top (int): Number of allocation sites in the growth report.
+        game_factory (Callable, optional): Builds the game from (lang, seed, clock).
+            Defaults to CircleOfFifthsGame.
+
+    Returns:
+        SoakResult: The samples, the growth by allocation site and any exceeded bounds.
+
+    Raises:
+        ValueError: If the run is too short to take a sample after the warm-up.
+    """
+    if sample_every <= 0 or frames < warmup_frames + sample_every:
+        raise ValueError("A soak run needs at least one sampling window after the warm-up")
+    frame_seconds = 1.0 / Config.FPS
+    frame = 0
+    if game_factory is None:
+        from core.game import CircleOfFifthsGame
+        game_factory = lambda lang, seed, clock: CircleOfFifthsGame(lang, seed=seed, clock=clock, rotate=rotate)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    # The harness's own bookkeeping is not part of the game's footprint.
+    ignored = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+    try:
+        game = game_factory(lang, seed, lambda: frame * frame_seconds)
+        student = ScriptedStudent(game, random.Random(seed))
+        samples: List[SoakSample] = []
+        window: List[float] = []
+        baseline: Optional[tracemalloc.Snapshot] = None
+        while frame < frames and game.running:
+            events = student.events(frame)
+            started = time.perf_counter()
+            game.step(events)
+            window.append(time.perf_counter() - started)
+            frame += 1
+            if frame >= warmup_frames and (frame - warmup_frames) % sample_every == 0:
+                if baseline is None:
+                    baseline = tracemalloc.take_snapshot().filter_traces(ignored)
+                samples.append(SoakSample(
+                    frame, tracemalloc.get_traced_memory()[0], percentile(window, 50), percentile(window, 99)
+                ))
+                window = []
+        final = tracemalloc.take_snapshot().filter_traces(ignored)
+        game.renderer.close()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    growth = [stat for stat in final.compare_to(baseline, "lineno") if stat.size_diff > 0][:top]
+    result = SoakResult(frame, student.questions, samples, growth)
+    if not game.running:
+        result.failures.append(f"game stopped after {frame} frames")
+    if result.memory_growth > max_growth_bytes:
+        result.failures.append(f"memory grew by {result.memory_growth} bytes, more than {max_growth_bytes}")
+    if result.p99_drift > max_p99_drift:
+        result.failures.append(f"p99 frame time drifted by a factor of {result.p99_drift:.2f}, more than {max_p99_drift:.2f}")
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point: soaks the game headlessly and reports drift.
+
+    Returns:
+        int: Process exit code, non-zero if memory or frame times drifted beyond the bounds.
+    """
+    parser = argparse.ArgumentParser(description="Soak-test the Circle of Fifths game loop.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Frames to play.")
+    parser.add_argument("--sample-every", type=int, default=SAMPLE_EVERY, help="Frames per sample.")
+    parser.add_argument("--warmup", type=int, default=WARMUP_FRAMES, help="Frames before the baseline sample.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--rotate", action="store_true", help="Rotate the circle to each question's chord.")
+    parser.add_argument("--max-growth-kib", type=float, default=MAX_GROWTH_BYTES / 1024,
+                        help="Fail if traced memory grows by more than this many KiB.")
+    parser.add_argument("--max-p99-drift", type=float, default=MAX_P99_DRIFT,
+                        help="Fail if the 99th percentile frame time grows by more than this factor.")
+    parser.add_argument("--top", type=int, default=TOP_SITES, help="Allocation sites to report.")
+    args = parser.parse_args(argv)
+
+    setup_headless()
+    result = soak(
+        args.frames, args.sample_every, args.warmup, args.seed, args.lang, args.rotate,
+        int(args.max_growth_kib * 1024), args.max_p99_drift, args.top,
+    )
+    print(f"frames={result.frames} questions={result.questions}")
+    print(f"  {'frame':>10}{'memory KiB':>12}{'p50 ms':>9}{'p99 ms':>9}")
+    for sample in result.samples:
+        print(f"  {sample.frame:>10}{sample.memory / 1024:>12.1f}{sample.p50 * 1000:>9.3f}{sample.p99 * 1000:>9.3f}")
+    print(f"growth by allocation site (+{result.memory_growth / 1024:.1f} KiB total):")
+    for stat in result.growth:
+        print(f"  {stat}")
+    for failure in result.failures:
+        print(failure)
+    pygame.quit()
+    return 0 if result.passed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,308 @@
+import math
+from array import array
+from typing import Dict, Iterable, Optional, Tuple
+
+from core.circle import ChordType, QuestionType
+from core.questions import question_types
+
+# Response times are bucketed logarithmically: SUB_BUCKETS linear steps per power of two,
+# starting at MIN_SECONDS. With 1 ms and 17 octaves the range covers 1 ms to about 131 s.
+MIN_SECONDS: float = 0.001
+SUB_BUCKETS: int = 4
+OCTAVES: int = 17
+NUM_BUCKETS: int = OCTAVES * SUB_BUCKETS
+
+
+def bucket_index(seconds: float) -> int:
+    """
+    Returns the histogram bucket for a duration in O(1), using the float exponent.
+
+    Args:
+        seconds (float): The duration.
+
+    Returns:
+        int: The bucket index, clamped to [0, NUM_BUCKETS - 1].
+    """
+    scaled = seconds / MIN_SECONDS
+    if scaled < 1.0:
+        return 0
+    mantissa, exponent = math.frexp(scaled)
+    index = (exponent - 1) * SUB_BUCKETS + int((mantissa * 2.0 - 1.0) * SUB_BUCKETS)
+    return index if index < NUM_BUCKETS else NUM_BUCKETS - 1
+
+
+def bucket_upper_bound(index: int) -> float:
+    """
+    Returns the upper bound in seconds of a histogram bucket.
+
+    Args:
+        index (int): The bucket index.
+    """
+    octave, sub = divmod(index, SUB_BUCKETS)
+    return MIN_SECONDS * (2.0 ** octave) * (1.0 + (sub + 1) / SUB_BUCKETS)
+
+
+def percentile_from_counts(counts, offset: int, total: int, pct: float) -> float:
+    """
+    Returns a percentile from a run of NUM_BUCKETS bucket counts.
+
+    Args:
+        counts: Array holding the bucket counts.
+        offset (int): Index of the first bucket within counts.
+        total (int): Sum of the bucket counts.
+        pct (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: Upper bound of the bucket containing the percentile, or 0.0 if empty.
+    """
+    if total == 0:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * total))
+    seen = 0
+    for i in range(NUM_BUCKETS):
+        seen += counts[offset + i]
+        if seen >= rank:
+            return bucket_upper_bound(i)
+    return bucket_upper_bound(NUM_BUCKETS - 1)
+
+
+class LogHistogram:
+    """
+    Fixed-size histogram of durations with logarithmically spaced buckets.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty histogram.
+        """
+        self.counts: array = array("Q", bytes(8 * NUM_BUCKETS))
+        self.total: int = 0
+        self.sum: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Adds one duration to the histogram.
+
+        Args:
+            seconds (float): The duration.
+        """
+        self.counts[bucket_index(seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+
+    def merge(self, other: "LogHistogram") -> None:
+        """
+        Adds the counts of another histogram to this one.
+
+        Args:
+            other (LogHistogram): The histogram to merge in.
+        """
+        for i in range(NUM_BUCKETS):
+            self.counts[i] += other.counts[i]
+        self.total += other.total
+        self.sum += other.sum
+
+    def mean(self) -> float:
+        """
+        Returns the exact mean of the recorded durations, or 0.0 if empty.
+        """
+        return self.sum / self.total if self.total else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        Returns an approximate percentile of the recorded durations.
+
+        Args:
+            pct (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: Upper bound of the bucket containing the percentile, or 0.0 if empty.
+        """
+        return percentile_from_counts(self.counts, 0, self.total, pct)
+
+
+class StatsTracker:
+    """
+    Accuracy and response-time statistics per (chord, chord type, question type).
+
+    Counters live in preallocated flat arrays, so recording an answer is O(1). Response-time
+    histograms take 32-bit counts and are allocated per slot on its first answer, so a session
+    only pays for the chords and question types it is asked; memory stays bounded however long
+    the session runs.
+    """
+
+    def __init__(self, circle_size: int = 12) -> None:
+        """
+        Initializes empty statistics.
+
+        Args:
+            circle_size (int): Number of chords per ring.
+        """
+        self.circle_size = circle_size
+        self.chord_types = list(ChordType)
+        # Every registered question type, including ones added by other modules.
+        self.question_types = question_types()
+        self._chord_type_pos = {t: i for i, t in enumerate(self.chord_types)}
+        self._question_type_pos = {q: i for i, q in enumerate(self.question_types)}
+        size = circle_size * len(self.chord_types) * len(self.question_types)
+        self.size = size
+        self.attempts: array = array("Q", bytes(8 * size))
+        self.correct: array = array("Q", bytes(8 * size))
+        self.time_sum: array = array("d", bytes(8 * size))
+        self.score_sum: array = array("d", bytes(8 * size))
+        self.histograms: Dict[int, array] = {}
+        self.overall: LogHistogram = LogHistogram()
+        self.version: int = 0
+
+    def key(self, chord_index: int, chord_type: ChordType, question_type: QuestionType) -> int:
+        """
+        Returns the flat slot index for a (chord, chord type, question type) combination.
+        """
+        return (
+            (chord_index * len(self.chord_types) + self._chord_type_pos[chord_type])
+            * len(self.question_types)
+            + self._question_type_pos[question_type]
+        )
+
+    def record(
+        self,
+        chord_index: int,
+        chord_type: ChordType,
+        question_type: QuestionType,
+        correct: bool,
+        seconds: float,
+        score: Optional[float] = None,
+    ) -> None:
+        """
+        Records one answer.
+
+        Args:
+            chord_index (int): Index of the chord the question was about.
+            chord_type (ChordType): The chord type of the question.
+            question_type (QuestionType): The question type.
+            correct (bool): Whether the answer was correct.
+            seconds (float): Time taken to answer.
+            score (Optional[float]): Credit earned, including partial credit. Defaults to
+                1.0 for correct and 0.0 for wrong answers.
+        """
+        slot = self.key(chord_index, chord_type, question_type)
+        self.attempts[slot] += 1
+        if correct:
+            self.correct[slot] += 1
+        if score is None:
+            score = 1.0 if correct else 0.0
+        self.score_sum[slot] += score
+        self.time_sum[slot] += seconds
+        self._slot_histogram(slot)[bucket_index(seconds)] += 1
+        self.overall.record(seconds)
+        self.version += 1
+
+    def _slot_histogram(self, slot: int) -> array:
+        histogram = self.histograms.get(slot)
+        if histogram is None:
+            histogram = self.histograms[slot] = array("I", bytes(4 * NUM_BUCKETS))
+        return histogram
+
+    def _slots(
+        self,
+        chord_index: Optional[int],
+        chord_type: Optional[ChordType],
+        question_type: Optional[QuestionType],
+    ) -> Iterable[int]:
+        chord_indices = range(self.circle_size) if chord_index is None else (chord_index,)
+        chord_types = self.chord_types if chord_type is None else (chord_type,)
+        question_types = self.question_types if question_type is None else (question_type,)
+        for i in chord_indices:
+            for t in chord_types:
+                for q in question_types:
+                    yield self.key(i, t, q)
+
+    def accuracy(
+        self,
+        chord_index: Optional[int] = None,
+        chord_type: Optional[ChordType] = None,
+        question_type: Optional[QuestionType] = None,
+    ) -> Tuple[int, int]:
+        """
+        Returns (correct, attempts), aggregated over any criteria left as None.
+        """
+        correct = attempts = 0
+        for slot in self._slots(chord_index, chord_type, question_type):
+            correct += self.correct[slot]
+            attempts += self.attempts[slot]
+        return correct, attempts
+
+    def score(
+        self,
+        chord_index: Optional[int] = None,
+        chord_type: Optional[ChordType] = None,
+        question_type: Optional[QuestionType] = None,
+    ) -> float:
+        """
+        Returns the total credit earned, aggregated over any criteria left as None.
+        """
+        return sum(self.score_sum[slot] for slot in self._slots(chord_index, chord_type, question_type))
+
+    def mean_response_time(
+        self,
+        chord_index: Optional[int] = None,
+        chord_type: Optional[ChordType] = None,
+        question_type: Optional[QuestionType] = None,
+    ) -> float:
+        """
+        Returns the mean response time in seconds, aggregated over any criteria left as None.
+        """
+        total = attempts = 0
+        for slot in self._slots(chord_index, chord_type, question_type):
+            total += self.time_sum[slot]
+            attempts += self.attempts[slot]
+        return total / attempts if attempts else 0.0
+
+    def histogram(
+        self,
+        chord_index: Optional[int] = None,
+        chord_type: Optional[ChordType] = None,
+        question_type: Optional[QuestionType] = None,
+    ) -> LogHistogram:
+        """
+        Returns the response-time histogram, aggregated over any criteria left as None.
+        """
+        result = LogHistogram()
+        for slot in self._slots(chord_index, chord_type, question_type):
+            counts = self.histograms.get(slot)
+            if counts is not None:
+                for i in range(NUM_BUCKETS):
+                    result.counts[i] += counts[i]
+            result.total += self.attempts[slot]
+            result.sum += self.time_sum[slot]
+        return result
+
+    def percentiles(self, pcts: Iterable[float] = (50, 90)) -> Tuple[float, ...]:
+        """
+        Returns response-time percentiles over all answers, in seconds.
+
+        Args:
+            pcts (Iterable[float]): The percentiles to compute.
+        """
+        return tuple(self.overall.percentile(p) for p in pcts)
+
+    def merge(self, other: "StatsTracker") -> None:
+        """
+        Adds the statistics of another tracker with the same layout to this one.
+
+        Args:
+            other (StatsTracker): The tracker to merge in.
+        """
+        if other.size != self.size:
+            raise ValueError("Cannot merge statistics with different layouts")
+        for i in range(self.size):
+            self.attempts[i] += other.attempts[i]
+            self.correct[i] += other.correct[i]
+            self.time_sum[i] += other.time_sum[i]
+            self.score_sum[i] += other.score_sum[i]
+        for slot, counts in other.histograms.items():
+            histogram = self._slot_histogram(slot)
+            for i in range(NUM_BUCKETS):
+                histogram[i] += counts[i]
+        self.overall.merge(other.overall)
+        self.version += 1
@@ -0,0 +1,198 @@
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core.chord import Chord
+from core.chord_symbol import ChordSymbol, mask_pitch_classes
+from core.circle import ChordType
+
+# Semitone intervals above the root for each chord type.
+TRIAD_INTERVALS: Dict[ChordType, Tuple[int, int, int]] = {
+    ChordType.MAJOR: (0, 4, 7),
+    ChordType.MINOR: (0, 3, 7),
+}
+
+# Semitones above the root that can take the place of the third and of the fifth, most
+# common first, so suspended and altered chords are voiced like triads.
+THIRD_INTERVALS: Tuple[int, ...] = (4, 3, 5, 2)
+FIFTH_INTERVALS: Tuple[int, ...] = (7, 6, 8)
+
+# Voicings as (chord tone, octave offset) pairs; chord tone 0 is the root, 1 the third, 2 the fifth.
+# Further chord tones, such as sevenths, are added above the root in its own octave.
+VOICINGS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    "close": ((0, 0), (1, 0), (2, 0)),
+    "first_inversion": ((1, 0), (2, 0), (0, 1)),
+    "open": ((0, -1), (2, -1), (1, 0)),
+    "spread": ((0, -1), (2, -1), (0, 0), (1, 0)),
+}
+
+# Timbres as (harmonic number, relative amplitude) pairs.
+TIMBRES: Dict[str, Tuple[Tuple[int, float], ...]] = {
+    "sine": ((1, 1.0),),
+    "organ": ((1, 1.0), (2, 0.5), (3, 0.25), (4, 0.125)),
+    "soft": ((1, 1.0), (3, 1 / 9), (5, 1 / 25)),
+}
+
+BASE_MIDI_NOTE: int = 60  # Middle C; roots are placed in the octave above it.
+ATTACK_SECONDS: float = 0.01
+PEAK_LEVEL: float = 0.8
+
+
+def chord_intervals(symbol: ChordSymbol, chord_type: ChordType) -> Tuple[int, ...]:
+    """
+    Returns the semitone intervals above the root of a chord symbol's pitch classes.
+
+    Args:
+        symbol (ChordSymbol): The chord symbol.
+        chord_type (ChordType): Whether the chord is major or minor; its triad is used if the
+            symbol has no third or fifth.
+
+    Returns:
+        Tuple[int, ...]: The root, third and fifth, then the remaining chord tones in
+        ascending order.
+    """
+    tones = [(pc - symbol.root) % 12 for pc in mask_pitch_classes(symbol.mask)]
+    third = next((i for i in THIRD_INTERVALS if i in tones), None)
+    fifth = next((i for i in FIFTH_INTERVALS if i in tones), None)
+    if 0 not in tones or third is None or fifth is None:
+        return TRIAD_INTERVALS[chord_type]
+    return (0, third, fifth) + tuple(sorted(i for i in tones if i not in (0, third, fifth)))
+
+
+def chord_pitches(chord: Chord, chord_type: ChordType, voicing: str = "close") -> List[int]:
+    """
+    Returns the MIDI note numbers of a chord in the given voicing.
+
+    Args:
+        chord (Chord): The chord; the root and chord tones are taken from its chord symbol.
+        chord_type (ChordType): Whether the chord is major or minor.
+        voicing (str): One of VOICINGS.
+
+    Returns:
+        List[int]: MIDI note numbers, lowest voice first.
+    """
+    symbol = chord.symbol
+    root = BASE_MIDI_NOTE + symbol.root
+    intervals = chord_intervals(symbol, chord_type)
+    pitches = [root + intervals[tone] + 12 * octave for tone, octave in VOICINGS[voicing]]
+    pitches.extend(root + interval for interval in intervals[3:])
+    return sorted(pitches)
+
+
+def synthesize(
+    pitches: Iterable[int],
+    timbre: str = "organ",
+    duration: float = 1.0,
+    sample_rate: int = 44100,
+    channels: int = 2,
+) -> np.ndarray:
+    """
+    Synthesizes a chord into a 16-bit PCM buffer with a single vectorized evaluation.
+
+    Args:
+        pitches (Iterable[int]): MIDI note numbers to sound together.
+        timbre (str): One of TIMBRES.
+        duration (float): Length in seconds.
+        sample_rate (int): Samples per second.
+        channels (int): Number of interleaved output channels.
+
+    Returns:
+        np.ndarray: C-contiguous int16 array of shape (samples, channels), or (samples,) for mono.
+    """
+    t = np.arange(int(duration * sample_rate), dtype=np.float64) / sample_rate
+    freqs = 440.0 * 2.0 ** ((np.asarray(list(pitches), dtype=np.float64) - 69) / 12)
+    harmonics = np.array([h for h, _ in TIMBRES[timbre]], dtype=np.float64)
+    amplitudes = np.array([a for _, a in TIMBRES[timbre]], dtype=np.float64)
+
+    # (notes, harmonics) partial frequencies, summed over one (partials, samples) sine evaluation.
+    partials = (freqs[:, None] * harmonics[None, :]).ravel()
+    weights = np.tile(amplitudes, len(freqs))
+    audible = partials < sample_rate / 2
+    wave = weights[audible] @ np.sin(2 * np.pi * partials[audible, None] * t[None, :])
+
+    envelope = np.minimum(t / ATTACK_SECONDS, 1.0) * np.exp(-3.0 * t / max(duration, 1e-9))
+    wave *= envelope
+    peak = np.abs(wave).max()
+    if peak > 0:
+        wave *= PEAK_LEVEL * 32767 / peak
+    pcm = wave.astype(np.int16)
+    if channels == 1:
+        return pcm
+    return np.ascontiguousarray(np.repeat(pcm[:, None], channels, axis=1))
+
+
+class WaveformBank:
+    """
+    In-memory, optionally disk-backed, cache of synthesized chord waveforms.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 44100,
+        channels: int = 2,
+        duration: float = 1.0,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes an empty bank.
+
+        Args:
+            sample_rate (int): Samples per second; must match the mixer.
+            channels (int): Number of output channels; must match the mixer.
+            duration (float): Length of each chord in seconds.
+            cache_dir (Optional[str]): Directory for .npy files. If None, nothing is written to disk.
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.duration = duration
+        self.cache_dir = cache_dir
+        self.waveforms: Dict[Tuple[int, Tuple[int, ...], str], np.ndarray] = {}
+
+    def _path(self, mask: int, pitches: Tuple[int, ...], timbre: str) -> str:
+        notes = "-".join(str(p) for p in pitches)
+        name = f"{mask:03x}_{notes}_{timbre}_{self.sample_rate}_{self.channels}_{int(self.duration * 1000)}.npy"
+        return os.path.join(self.cache_dir, name)
+
+    def get(self, chord: Chord, chord_type: ChordType, voicing: str = "close", timbre: str = "organ") -> np.ndarray:
+        """
+        Returns the waveform of a chord, synthesizing it on first use.
+
+        Args:
+            chord (Chord): The chord.
+            chord_type (ChordType): Whether the chord is major or minor.
+            voicing (str): One of VOICINGS.
+            timbre (str): One of TIMBRES.
+
+        Returns:
+            np.ndarray: The int16 waveform. The same array is returned on later calls.
+        """
+        mask = chord.symbol.mask
+        pitches = tuple(chord_pitches(chord, chord_type, voicing))
+        key = (mask, pitches, timbre)
+        waveform = self.waveforms.get(key)
+        if waveform is not None:
+            return waveform
+
+        path = self._path(mask, pitches, timbre) if self.cache_dir else None
+        if path and os.path.exists(path):
+            waveform = np.load(path)
+        else:
+            waveform = synthesize(pitches, timbre, self.duration, self.sample_rate, self.channels)
+            if path:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(path, waveform)
+        self.waveforms[key] = waveform
+        return waveform
+
+    def warm(self, chords: Iterable[Tuple[Chord, ChordType]], voicing: str = "close", timbre: str = "organ") -> None:
+        """
+        Synthesizes (or loads) every given chord ahead of time.
+
+        Args:
+            chords (Iterable[Tuple[Chord, ChordType]]): Chords with their types.
+            voicing (str): One of VOICINGS.
+            timbre (str): One of TIMBRES.
+        """
+        for chord, chord_type in chords:
+            self.get(chord, chord_type, voicing, timbre)
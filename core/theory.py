@@ -0,0 +1,209 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+from core.chord import Chord
+from core.chord_lists import major_chords, minor_chords
+from core.chord_symbol import NOTE_PITCH_CLASSES, ChordSymbol, pitch_class, try_parse_chord_symbol
+
+# Keys are numbered like in core.key_distance: major key i is the chord at index i of the major
+# ring, and its relative minor is key 12 + i. The degree, signature and spelling tables below
+# are built once at import, so answering a theory question is a couple of dictionary lookups.
+LETTERS: str = "CDEFGAB"
+FIFTHS_LETTERS: str = "FCGDAEB"
+MAX_ACCIDENTALS: int = 7
+
+MAJOR_SCALE: Tuple[int, ...] = (0, 2, 4, 5, 7, 9, 11)
+MINOR_SCALE: Tuple[int, ...] = (0, 2, 3, 5, 7, 8, 10)
+
+# Triad quality on each scale degree (natural minor for minor keys).
+MAJOR_DEGREE_QUALITIES: Tuple[str, ...] = ("", "m", "m", "", "", "m", "dim")
+MINOR_DEGREE_QUALITIES: Tuple[str, ...] = ("m", "dim", "", "m", "m", "", "")
+
+MAJOR_NUMERALS: Tuple[str, ...] = ("I", "ii", "iii", "IV", "V", "vi", "vii°")
+MINOR_NUMERALS: Tuple[str, ...] = ("i", "ii°", "III", "iv", "v", "VI", "VII")
+
+_ACCIDENTAL_SUFFIXES: Dict[int, str] = {-2: "bb", -1: "b", 0: "", 1: "#", 2: "##"}
+_SIGNATURE_RE = re.compile(
+    r"^\s*(\d+)\s*(#|♯|b|♭|sharps?|flats?|kors|b-?förtecken)?\s*$", re.IGNORECASE
+)
+
+
+def tonic_for_signature(signature: int, minor: bool) -> str:
+    """
+    Returns the spelled tonic of the key with the given signature.
+
+    Args:
+        signature (int): Number of sharps (positive) or flats (negative), from -7 to 7.
+        minor (bool): Whether the key is minor.
+
+    Returns:
+        str: The tonic, e.g. "Eb" for three flats major or "C" for three flats minor.
+    """
+    position = signature + (4 if minor else 1)
+    letter = FIFTHS_LETTERS[position % 7]
+    accidentals = position // 7
+    return letter + ("#" * accidentals if accidentals > 0 else "b" * -accidentals)
+
+
+def spell_scale(tonic: str, minor: bool) -> List[str]:
+    """
+    Spells the seven notes of a major or natural minor scale, one per letter.
+
+    Args:
+        tonic (str): The spelled tonic, e.g. "F#" or "Bb".
+        minor (bool): Whether to spell the natural minor scale.
+
+    Returns:
+        List[str]: The note names, starting with the tonic.
+    """
+    letter = tonic[0]
+    root = pitch_class(letter, tonic[1:])
+    intervals = MINOR_SCALE if minor else MAJOR_SCALE
+    start = LETTERS.index(letter)
+    notes = []
+    for degree, interval in enumerate(intervals):
+        note_letter = LETTERS[(start + degree) % 7]
+        offset = (root + interval - NOTE_PITCH_CLASSES[note_letter] + 6) % 12 - 6
+        notes.append(note_letter + _ACCIDENTAL_SUFFIXES[offset])
+    return notes
+
+
+def parse_signature(text: str) -> Optional[int]:
+    """
+    Parses a key-signature answer such as "3b", "2#", "3 flats", "1 sharp" or "0".
+
+    Args:
+        text (str): The answer.
+
+    Returns:
+        Optional[int]: Sharps as a positive and flats as a negative number, or None if the text
+            is not a signature. A count above zero without sharps or flats is also None.
+    """
+    match = _SIGNATURE_RE.match(text)
+    if match is None:
+        return None
+    count, kind = int(match.group(1)), (match.group(2) or "").lower()
+    if count == 0:
+        return 0
+    if not kind or count > MAX_ACCIDENTALS:
+        return None
+    return count if kind in ("#", "♯") or kind.startswith(("sharp", "kors")) else -count
+
+
+def _key_chords() -> List[Chord]:
+    return list(major_chords) + list(minor_chords)
+
+
+def _build_tables():
+    circle_size = len(major_chords)
+    chords = _key_chords()
+
+    signatures: List[Tuple[int, ...]] = []
+    tonics: List[str] = []
+    for key, chord in enumerate(chords):
+        minor = key >= circle_size
+        names = set(chord.alternative_names)
+        valid = tuple(
+            s for s in range(MAX_ACCIDENTALS, -MAX_ACCIDENTALS - 1, -1)
+            if tonic_for_signature(s, minor) + ("m" if minor else "") in names
+        )
+        # Prefer the spelling with fewer accidentals, then the chord's main name.
+        main = chord.alternative_names[0]
+        valid = tuple(sorted(
+            valid, key=lambda s: (abs(s), tonic_for_signature(s, minor) + ("m" if minor else "") != main)
+        ))
+        signatures.append(valid)
+        tonics.append(tonic_for_signature(valid[0], minor))
+
+    scales = [spell_scale(tonic, key >= circle_size) for key, tonic in enumerate(tonics)]
+    degree_names: List[Tuple[str, ...]] = []
+    degree_symbols: List[Tuple[ChordSymbol, ...]] = []
+    for key, scale in enumerate(scales):
+        qualities = MINOR_DEGREE_QUALITIES if key >= circle_size else MAJOR_DEGREE_QUALITIES
+        degree_names.append(tuple(note + quality for note, quality in zip(scale, qualities)))
+        degree_symbols.append(tuple(
+            ChordSymbol.get(pitch_class(note[0], note[1:]), quality) for note, quality in zip(scale, qualities)
+        ))
+
+    signature_keys: Dict[Tuple[int, bool], int] = {}
+    for key, valid in enumerate(signatures):
+        for s in valid:
+            signature_keys[(s, key >= circle_size)] = key
+    return signatures, tonics, scales, degree_names, degree_symbols, signature_keys
+
+
+KEY_SIGNATURES: List[Tuple[int, ...]]
+KEY_TONICS: List[str]
+KEY_SCALES: List[List[str]]
+DEGREE_CHORD_NAMES: List[Tuple[str, ...]]
+DEGREE_CHORDS: List[Tuple[ChordSymbol, ...]]
+SIGNATURE_KEYS: Dict[Tuple[int, bool], int]
+(KEY_SIGNATURES, KEY_TONICS, KEY_SCALES, DEGREE_CHORD_NAMES, DEGREE_CHORDS, SIGNATURE_KEYS) = _build_tables()
+
+# Degrees asked about: those whose triad is a major or minor chord on the circle.
+ASKABLE_DEGREES: List[Tuple[int, ...]] = [
+    tuple(d for d, symbol in enumerate(symbols) if symbol.quality in ("", "m")) for symbols in DEGREE_CHORDS
+]
+
+
+def degree_numeral(key: int, degree: int) -> str:
+    """
+    Returns the roman numeral of a scale degree, in the case that shows its quality.
+
+    Args:
+        key (int): Key number.
+        degree (int): Scale degree from 0 (tonic) to 6.
+    """
+    return (MINOR_NUMERALS if key >= len(major_chords) else MAJOR_NUMERALS)[degree]
+
+
+def signature_text_args(signature: int) -> Tuple[str, int]:
+    """
+    Returns the localization key and count describing a key signature.
+
+    Args:
+        signature (int): Sharps as a positive and flats as a negative number.
+
+    Returns:
+        Tuple[str, int]: e.g. ("signature_flats", 3) for three flats.
+    """
+    if signature == 0:
+        return "signature_none", 0
+    count = abs(signature)
+    if signature > 0:
+        return ("signature_sharp" if count == 1 else "signature_sharps"), count
+    return ("signature_flat" if count == 1 else "signature_flats"), count
+
+
+def format_signature(signature: int) -> str:
+    """
+    Returns the compact spelling of a key signature, e.g. "3b", "2#" or "0".
+    """
+    if signature == 0:
+        return "0"
+    return f"{abs(signature)}{'#' if signature > 0 else 'b'}"
+
+
+def check_degree_answer(answer: str, key: int, degree: int) -> bool:
+    """
+    Checks a chord answer against a diatonic degree of a key. Any enharmonic spelling or
+    alias of the quality is accepted.
+
+    Args:
+        answer (str): The answered chord name.
+        key (int): Key number.
+        degree (int): Scale degree from 0 to 6.
+    """
+    symbol = try_parse_chord_symbol(answer)
+    return symbol is not None and symbol is DEGREE_CHORDS[key][degree]
+
+
+def check_signature_answer(answer: str, key: int) -> bool:
+    """
+    Checks a key-signature answer for a key.
+
+    Args:
+        answer (str): The answer, e.g. "3b".
+        key (int): Key number.
+    """
+    return parse_signature(answer) in KEY_SIGNATURES[key]
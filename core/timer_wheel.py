@@ -0,0 +1,248 @@
+import math
+from typing import Callable, Dict, List, Optional
+
+# Each level of the wheel has 2 ** SLOT_BITS slots; with 10 ms ticks, four levels of 64 slots
+# span about 46 hours before timers spill into the overflow list.
+SLOT_BITS: int = 6
+LEVELS: int = 4
+TICK_SECONDS: float = 0.01
+
+# Level of timers beyond the last wheel; also indexes the last entry of TimerWheel.counts.
+OVERFLOW: int = -1
+# Tolerance in ticks when converting seconds to ticks, so that a time computed from a tick
+# (such as a deadline) converts back to the same tick despite floating-point rounding.
+TICK_EPSILON: float = 1e-6
+
+
+class Timer:
+    """
+    A callback scheduled on a TimerWheel. Keep it to cancel the callback.
+    """
+
+    __slots__ = ("tick", "callback", "level", "slot")
+
+    def __init__(self, tick: int, callback: Callable[[], None]) -> None:
+        """
+        Initializes an unscheduled timer.
+
+        Args:
+            tick (int): The tick the timer expires on.
+            callback (Callable[[], None]): Called when the timer expires.
+        """
+        self.tick = tick
+        self.callback = callback
+        self.level: Optional[int] = None
+        self.slot: int = 0
+
+    @property
+    def pending(self) -> bool:
+        """
+        Returns whether the timer is still scheduled.
+        """
+        return self.level is not None
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel: O(1) scheduling and cancellation.
+
+    Time is divided into integer ticks. A timer sits on the lowest level whose slots cover the
+    distance to its tick; when the wheel reaches a slot of a higher level, that slot is
+    cascaded down, so every timer moves at most LEVELS - 1 times before it fires. Advancing
+    jumps straight from one occupied slot to the next, so its cost depends on the timers that
+    expire or cascade, not on the time that has passed. Timers never fire early.
+    """
+
+    def __init__(self, tick_seconds: float = TICK_SECONDS, start: float = 0.0) -> None:
+        """
+        Initializes an empty wheel.
+
+        Args:
+            tick_seconds (float): Length of one tick.
+            start (float): Current time in seconds.
+        """
+        self.tick_seconds = tick_seconds
+        self.mask = (1 << SLOT_BITS) - 1
+        self.current_tick: int = self.tick_at(start)
+        self.wheels: List[List[Dict[Timer, None]]] = [
+            [{} for _ in range(1 << SLOT_BITS)] for _ in range(LEVELS)
+        ]
+        self.overflow: Dict[Timer, None] = {}
+        # Number of timers on each level, overflow last.
+        self.counts: List[int] = [0] * (LEVELS + 1)
+        self.count: int = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def tick_at(self, seconds: float) -> int:
+        """
+        Returns the last tick that has started by a time.
+        """
+        return math.floor(seconds / self.tick_seconds + TICK_EPSILON)
+
+    def _place(self, timer: Timer) -> None:
+        difference = timer.tick ^ self.current_tick
+        for level in range(LEVELS):
+            # The timer belongs on the first level above which it agrees with the current tick.
+            if difference >> (SLOT_BITS * (level + 1)) == 0:
+                slot = (timer.tick >> (SLOT_BITS * level)) & self.mask
+                self.wheels[level][slot][timer] = None
+                timer.level, timer.slot = level, slot
+                self.counts[level] += 1
+                return
+        self.overflow[timer] = None
+        timer.level = OVERFLOW
+        self.counts[OVERFLOW] += 1
+
+    def schedule_at(self, when: float, callback: Callable[[], None]) -> Timer:
+        """
+        Schedules a callback at an absolute time.
+
+        Args:
+            when (float): Time in seconds; times already past fire on the next tick.
+            callback (Callable[[], None]): Called with no arguments when the timer expires.
+
+        Returns:
+            Timer: Handle for cancel().
+        """
+        tick = max(math.ceil(when / self.tick_seconds - TICK_EPSILON), self.current_tick + 1)
+        timer = Timer(tick, callback)
+        self._place(timer)
+        self.count += 1
+        return timer
+
+    def schedule(self, now: float, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+        Schedules a callback after a delay.
+
+        Args:
+            now (float): Current time in seconds.
+            delay (float): Delay in seconds.
+            callback (Callable[[], None]): Called with no arguments when the timer expires.
+        """
+        return self.schedule_at(now + delay, callback)
+
+    def cancel(self, timer: Timer) -> None:
+        """
+        Cancels a timer. Cancelling a timer that already fired does nothing.
+        """
+        if timer.level is None:
+            return
+        # pop: the timer may be in a batch that advance() has already taken out of its slot.
+        if timer.level == OVERFLOW:
+            removed = self.overflow.pop(timer, False) is None
+        else:
+            removed = self.wheels[timer.level][timer.slot].pop(timer, False) is None
+        if removed:
+            self.counts[timer.level] -= 1
+        timer.level = None
+        self.count -= 1
+
+    def _lowest_level(self) -> int:
+        for level in range(LEVELS):
+            if self.counts[level]:
+                return level
+        return OVERFLOW
+
+    def _next_slot(self, level: int) -> int:
+        """
+        Returns the next occupied slot of a level after the current tick's. Every timer on a
+        level agrees with the current tick above it and lies ahead of it, so the slot exists.
+        """
+        digit = (self.current_tick >> (SLOT_BITS * level)) & self.mask
+        slots = self.wheels[level]
+        for slot in range(digit + (level == 0), 1 << SLOT_BITS):
+            if slots[slot]:
+                return slot
+        raise AssertionError("timer count out of sync with the wheel")
+
+    def _next_event(self) -> int:
+        """
+        Returns the next tick on which a timer expires or an occupied slot cascades. The
+        lowest occupied level always holds the earliest timers.
+        """
+        level = self._lowest_level()
+        if level == OVERFLOW:
+            span = SLOT_BITS * LEVELS
+            return ((self.current_tick >> span) + 1) << span
+        span = SLOT_BITS * (level + 1)
+        base = (self.current_tick >> span) << span
+        return base | (self._next_slot(level) << (SLOT_BITS * level))
+
+    def _cascade(self) -> None:
+        for level in range(1, LEVELS):
+            if self.current_tick & ((1 << (SLOT_BITS * level)) - 1):
+                return
+            slot = (self.current_tick >> (SLOT_BITS * level)) & self.mask
+            timers = self.wheels[level][slot]
+            if not timers:
+                continue
+            self.wheels[level][slot] = {}
+            self.counts[level] -= len(timers)
+            for timer in timers:
+                self._place(timer)
+        if self.current_tick & ((1 << (SLOT_BITS * LEVELS)) - 1) == 0 and self.overflow:
+            timers, self.overflow = self.overflow, {}
+            self.counts[OVERFLOW] = 0
+            for timer in timers:
+                self._place(timer)
+
+    def advance(self, now: float) -> int:
+        """
+        Moves the wheel to the given time, running the callbacks of every expired timer in
+        order of expiry. Callbacks may schedule or cancel timers.
+
+        Args:
+            now (float): Current time in seconds.
+
+        Returns:
+            int: Number of callbacks run.
+        """
+        return self.advance_to_tick(self.tick_at(now))
+
+    def advance_to_tick(self, target: int) -> int:
+        """
+        Moves the wheel to the given tick, like advance().
+        """
+        fired = 0
+        while self.count and self.current_tick < target:
+            event = self._next_event()
+            if event > target:
+                break
+            self.current_tick = event
+            self._cascade()
+            slot = event & self.mask
+            timers = self.wheels[0][slot]
+            if not timers:
+                continue
+            self.wheels[0][slot] = {}
+            self.counts[0] -= len(timers)
+            for timer in timers:
+                # Checked just before the call: an earlier callback may have cancelled it.
+                if timer.level is None:
+                    continue
+                timer.level = None
+                self.count -= 1
+                timer.callback()
+                fired += 1
+        self.current_tick = max(self.current_tick, target)
+        return fired
+
+    def next_deadline_tick(self) -> Optional[int]:
+        """
+        Returns the tick of the earliest pending timer, or None if no timer is pending.
+        """
+        if self.count == 0:
+            return None
+        level = self._lowest_level()
+        timers = self.overflow if level == OVERFLOW else self.wheels[level][self._next_slot(level)]
+        return min(timer.tick for timer in timers)
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Returns when the earliest pending timer expires, in seconds, or None if no timer is
+        pending. Advancing to this time fires it, so a loop may sleep until then.
+        """
+        tick = self.next_deadline_tick()
+        return None if tick is None else tick * self.tick_seconds
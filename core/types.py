@@ -1,6 +1,9 @@
 from typing import TypedDict, Set, Optional
 from core.circle import ChordType, QuestionType
 from core.chord import Chord
+from core.naming import NamingSystem
+from core.stats import StatsTracker
+from core.game_core import Question
 
 class GameStateDict(TypedDict):
     """
@@ -10,17 +13,37 @@ class GameStateDict(TypedDict):
         chord_type (ChordType): The current chord type (major or minor).
         current_chord (Optional[Chord]): The currently selected chord for the question.
         current_question (Optional[QuestionType]): The type of the current question.
+        question_detail (dict): Extra parameters of theory and progression questions, e.g. the
+            degree asked about or the chords of the progression so far.
+        question_number (Optional[int]): Serial number of the current question in the session.
+        upcoming (list[Question]): Questions drawn ahead of the current one, in asking order.
         selected_chord_indices (Set[int]): The set of selected chord indices.
         last_result (Optional[dict]): The result of the last submitted answer.
         game_state (str): The current state of the game (e.g., 'ACTIVE', 'INACTIVE').
         chord_list (list[Chord]): The list of chords for the current chord type.
         stats (tuple[int, int]): A tuple containing (number of correct answers, total questions).
+        response_times (tuple[float, float]): Median and 90th percentile response times in seconds.
+        score (float): Total credit earned, including partial credit for near misses.
+        rotation (float): Clockwise rotation of the circle in degrees.
+        naming (NamingSystem): How chord names are written and displayed in this session.
+        heatmap (Optional[str]): Heatmap overlay mode, "accuracy" or "response_time", or None.
+        stats_tracker (StatsTracker): Per-chord statistics, used by the heatmap.
     """
     chord_type: ChordType
     current_chord: Optional[Chord]
     current_question: Optional[QuestionType]
+    question_detail: dict
+    question_number: Optional[int]
+    upcoming: list[Question]
     selected_chord_indices: Set[int]
     last_result: Optional[dict]
     game_state: str
     chord_list: list[Chord]
-    stats: tuple[int, int]
\ No newline at end of file
+    stats: tuple[int, int]
+    response_times: tuple[float, float]
+    score: float
+    rotation: float
+    naming: NamingSystem
+    heatmap: Optional[str]
+    stats_tracker: StatsTracker
+    feedback_flash: bool
\ No newline at end of file
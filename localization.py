@@ -1,6 +1,33 @@
 import json
+import logging
 import os
-from typing import Dict, Any, Optional
+import string
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from core.metrics import REGISTRY
+
+LOCALES_DIR = "locales"
+REFERENCE_LANG = "en"
+
+logger = logging.getLogger(__name__)
+
+LOOKUPS = REGISTRY.counter("localization_lookups_total", "Localized string lookups.").labels()
+MISSING = REGISTRY.counter("localization_missing_total", "Lookups of keys missing from the locale.").labels()
+
+
+def locale_path(lang: str, locales_dir: str = LOCALES_DIR) -> str:
+    """
+    Returns the path of the JSON file for a language.
+
+    Args:
+        lang (str): Language code (e.g., "en", "sv").
+        locales_dir (str): Directory containing the locale files.
+
+    Returns:
+        str: The path to the locale file.
+    """
+    return os.path.join(locales_dir, f"{lang}.json")
 
 class Localization:
     """
@@ -45,7 +72,7 @@ class Localization:
         Args:
             lang (str): Language code (e.g., "en", "sv").
         """
-        path = os.path.join("locales", f"{lang}.json")
+        path = locale_path(lang)
         with open(path, encoding="utf-8") as f:
             self.strings = json.load(f)
 
@@ -60,5 +87,189 @@ class Localization:
         Returns:
             str: The formatted localized string, or the key if not found.
         """
-        template = self.strings.get(key, key)
-        return template.format(**kwargs)
\ No newline at end of file
+        LOOKUPS.inc()
+        template = self.strings.get(key)
+        if template is None:
+            MISSING.inc()
+            template = key
+        return template.format(**kwargs)
+
+
+def placeholders(template: str) -> Set[str]:
+    """
+    Returns the names of the format placeholders in a template string.
+
+    Args:
+        template (str): A str.format template, e.g. "{answer} is correct".
+
+    Returns:
+        Set[str]: The placeholder names.
+    """
+    try:
+        return {name for _, name, _, _ in string.Formatter().parse(template) if name}
+    except ValueError:
+        return set()
+
+
+class LocaleReport:
+    """
+    Differences between a locale's string table and the reference locale.
+    """
+
+    def __init__(self, reference: Dict[str, str], strings: Dict[str, str]) -> None:
+        """
+        Compares a string table against the reference table.
+
+        Args:
+            reference (Dict[str, str]): The reference strings (usually en.json).
+            strings (Dict[str, str]): The strings to check.
+        """
+        self.missing: List[str] = sorted(set(reference) - set(strings))
+        self.extra: List[str] = sorted(set(strings) - set(reference))
+        self.placeholder_mismatches: Dict[str, Tuple[Set[str], Set[str]]] = {}
+        for key in sorted(set(reference) & set(strings)):
+            expected = placeholders(reference[key])
+            actual = placeholders(strings[key])
+            if expected != actual:
+                self.placeholder_mismatches[key] = (expected, actual)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns True if the keys and placeholders match the reference.
+        """
+        return not (self.missing or self.extra or self.placeholder_mismatches)
+
+    def lines(self) -> List[str]:
+        """
+        Returns a human-readable description of every difference.
+        """
+        result = [f"missing key: {key}" for key in self.missing]
+        result += [f"extra key: {key}" for key in self.extra]
+        for key, (expected, actual) in self.placeholder_mismatches.items():
+            result.append(f"placeholders differ in {key}: expected {sorted(expected)}, got {sorted(actual)}")
+        return result
+
+
+class LocaleWatcher:
+    """
+    Reloads a Localization's strings when its file changes, without blocking the caller.
+
+    A background thread polls the file modification times and parses changed files. The
+    parsed table is handed over through apply(), which the render loop calls between frames
+    and which only swaps a reference.
+    """
+
+    def __init__(
+        self,
+        loc: Localization,
+        interval: float = 0.5,
+        locales_dir: str = LOCALES_DIR,
+        reference_lang: str = REFERENCE_LANG,
+    ) -> None:
+        """
+        Initializes the watcher. Call start() to begin polling.
+
+        Args:
+            loc (Localization): The localization whose strings are replaced on change.
+            interval (float): Seconds between modification time checks.
+            locales_dir (str): Directory containing the locale files.
+            reference_lang (str): Language the other locales are validated against.
+        """
+        self.loc = loc
+        self.interval = interval
+        self.path = locale_path(loc.lang, locales_dir)
+        self.reference_path = locale_path(reference_lang, locales_dir)
+        self.last_report: Optional[LocaleReport] = None
+        self.last_error: Optional[str] = None
+        self._mtimes: Dict[str, int] = {}
+        self._reference: Dict[str, str] = {}
+        self._pending: Optional[Tuple[Dict[str, str], LocaleReport]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        for path in (self.path, self.reference_path):
+            self._mtimes[path] = self._mtime(path)
+
+    @staticmethod
+    def _mtime(path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def start(self) -> None:
+        """
+        Starts the polling thread.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="LocaleWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the polling thread and waits for it to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def poll(self) -> bool:
+        """
+        Checks the watched files once and parses them if they changed.
+
+        Runs on the watcher thread; may also be called directly, e.g. from tests.
+
+        Returns:
+            bool: True if a new string table is waiting to be applied.
+        """
+        changed = False
+        for path in (self.path, self.reference_path):
+            mtime = self._mtime(path)
+            if mtime != self._mtimes.get(path):
+                self._mtimes[path] = mtime
+                changed = True
+        if not changed:
+            return False
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                strings = json.load(f)
+            with open(self.reference_path, encoding="utf-8") as f:
+                self._reference = json.load(f)
+        except (OSError, ValueError) as e:
+            # Editors often save in several steps; keep the current table and retry on the next change.
+            self.last_error = f"{self.path}: {e}"
+            logger.warning("Could not reload locale: %s", self.last_error)
+            return False
+
+        report = LocaleReport(self._reference, strings)
+        for line in report.lines():
+            logger.warning("%s: %s", self.path, line)
+        with self._lock:
+            self._pending = (strings, report)
+        self.last_error = None
+        return True
+
+    def apply(self) -> bool:
+        """
+        Swaps in a reloaded string table, if one is ready. Never waits for the watcher thread.
+
+        Returns:
+            bool: True if the strings were replaced and the screen should be redrawn.
+        """
+        if self._pending is None or not self._lock.acquire(blocking=False):
+            return False
+        try:
+            pending, self._pending = self._pending, None
+        finally:
+            self._lock.release()
+        if pending is None:
+            return False
+        self.loc.strings, self.last_report = pending
+        return True
@@ -1,13 +1,134 @@
+import argparse
 import pygame
+from config import Config
 from core.game import CircleOfFifthsGame
+from core.circle import ChordType, CircleOfFifths
+from core.circle_definition import load_compiled_circle, read_circle_definition
+from core.click_log import ClickLog
+from core.corpus import analyze_corpus
+from core.metrics import MetricsServer
+from core.naming import NAMING_SYSTEMS
+from core.progress_store import STANDARD_CIRCLE_NAME, ProgressStore
+from core.progression import TransitionModel
+from core.questions import QUESTION_KINDS, question_type_by_name
+from core.replay import InputRecorder, game_config
+from core.synth import VOICINGS, TIMBRES
+from ui.audio import ChordPlayer, configure_mixer
+from ui.screen_recorder import ScreenRecorder
 
 def main():
     """
     Initializes pygame and starts the Circle of Fifths game.
     """
+    parser = argparse.ArgumentParser(description="Circle of Fifths practice app.")
+    parser.add_argument("--lang", default="en", help="Language code, e.g. en or sv.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible questions.")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="Record input events and the seed to PATH for later replay.")
+    parser.add_argument("--record-screen", metavar="PATH", default=None,
+                        help="Record the screen to PATH: an animated .png, or a directory of PNG frames.")
+    parser.add_argument("--ear-training", action="store_true", help="Play each question's chord.")
+    parser.add_argument("--voicing", choices=sorted(VOICINGS), default="close")
+    parser.add_argument("--timbre", choices=sorted(TIMBRES), default="organ")
+    parser.add_argument("--audio-cache", metavar="DIR", default=None,
+                        help="Directory for cached chord waveforms.")
+    parser.add_argument("--watch-locales", action="store_true",
+                        help="Reload the locale file whenever it is saved.")
+    parser.add_argument("--rotate", action="store_true",
+                        help="Rotate the circle so each question's chord turns to the top.")
+    parser.add_argument("--questions", nargs="+", metavar="TYPE", default=["fill_in"],
+                        choices=[kind.name for kind in QUESTION_KINDS.values()],
+                        help="Question types to ask, e.g. fill_in diatonic_degree signature_of_key.")
+    parser.add_argument("--naming", choices=sorted(NAMING_SYSTEMS), default=None,
+                        help="How chord names are written, e.g. nordic for H and B. Defaults to the language's.")
+    parser.add_argument("--circle", metavar="PATH", default=None,
+                        help="Practice a custom circle from a .json or .toml definition, e.g. circles/fourths.json.")
+    parser.add_argument("--practice-set", default=None,
+                        help="Name of a practice set in the circle definition to select at start.")
+    parser.add_argument("--circle-cache", metavar="DIR", default=None,
+                        help="Directory for compiled circle definitions.")
+    parser.add_argument("--progression-corpus", nargs="+", metavar="PATH", default=None,
+                        help="Learn the moves of progression questions from chord charts in these files or directories.")
+    parser.add_argument("--click-log", metavar="PATH", default=None,
+                        help="Save every mouse click to PATH (.npz) on quit, for python -m core.click_log.")
+    parser.add_argument("--user", default=None, help="Student name to store progress under.")
+    parser.add_argument("--progress-db", metavar="PATH", default="progress.db",
+                        help="SQLite database for stored progress (used with --user).")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="Serve Prometheus metrics at http://127.0.0.1:PORT/metrics.")
+    args = parser.parse_args()
+
+    circle = CircleOfFifths()
+    circle_definition = None
+    if args.circle:
+        try:
+            circle_definition = read_circle_definition(args.circle)
+            circle = CircleOfFifths(load_compiled_circle(circle_definition, args.circle_cache))
+        except ValueError as e:
+            parser.error(str(e))
+    if args.practice_set and args.practice_set not in circle.compiled.practice_sets:
+        parser.error(f"{circle.name} has no practice set named {args.practice_set}")
+    if args.user and not circle.is_standard and circle.name == STANDARD_CIRCLE_NAME:
+        parser.error(f"--user needs a custom circle with a name other than {STANDARD_CIRCLE_NAME}")
+    progression_model = None
+    if args.progression_corpus:
+        if not circle.is_standard:
+            parser.error("--progression-corpus needs the built-in circle of fifths")
+        progression_model = TransitionModel.from_corpus(analyze_corpus(args.progression_corpus))
+
+    metrics_server = None
+    if args.metrics_port is not None:
+        metrics_server = MetricsServer(port=args.metrics_port)
+        metrics_server.start()
+
+    question_types = [question_type_by_name(name) for name in args.questions]
+    naming = NAMING_SYSTEMS.get(args.naming)
+    recorder = None
+    if args.record:
+        recorder = InputRecorder(args.seed, args.lang, config=game_config(
+            question_types, args.rotate, naming, circle_definition, args.circle, args.practice_set,
+            progression_model, args.progression_corpus,
+        ))
+    seed = recorder.seed if recorder is not None else args.seed
+
+    chord_player = None
+    if args.ear_training:
+        configure_mixer()
     pygame.init()
-    game = CircleOfFifthsGame("en")
+    if args.ear_training:
+        chord_player = ChordPlayer(args.voicing, args.timbre, cache_dir=args.audio_cache)
+        chord_player.preload(
+            [(chord, ChordType.MAJOR) for chord in circle.major_chords]
+            + [(chord, ChordType.MINOR) for chord in circle.minor_chords]
+        )
+    screen_recorder = None
+    if args.record_screen:
+        screen_recorder = ScreenRecorder(args.record_screen, (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        screen_recorder.start()
+    game = CircleOfFifthsGame(args.lang, seed=seed, recorder=recorder, chord_player=chord_player,
+                              watch_locales=args.watch_locales, rotate=args.rotate,
+                              question_types=question_types,
+                              naming=naming, screen_recorder=screen_recorder,
+                              circle=circle, progression_model=progression_model,
+                              click_log=ClickLog(segments=circle.size) if args.click_log else None)
+    if args.practice_set:
+        game.core.use_practice_set(args.practice_set)
+        game.reset_for_next_question()
+    store = None
+    if args.user:
+        store = ProgressStore(args.progress_db)
+        game.core.add_answer_listener(store.listener(args.user, circle.name))
     game.run()
+    if store is not None:
+        store.close()
+    if screen_recorder is not None:
+        print(f"Recorded {screen_recorder.written} frames, dropped {screen_recorder.dropped}.")
+    if metrics_server is not None:
+        metrics_server.stop()
+    if recorder is not None:
+        recorder.save(args.record, game)
+    if game.click_log is not None:
+        game.click_log.save(args.click_log)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,83 @@
+import unittest
+from core.animation import AnimationScheduler, Blink, Countdown, Fade, Flash
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+class TestAnimation(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = AnimationScheduler(self.clock)
+
+    def test_blink_toggles_on_time_not_frames(self):
+        blink = Blink(self.scheduler, interval=0.5)
+        blink.start()
+        self.clock.now = 0.49
+        self.assertFalse(self.scheduler.update())
+        self.assertFalse(blink.on)
+        self.clock.now = 0.5
+        self.assertTrue(self.scheduler.update())
+        self.assertTrue(blink.on)
+        # A single late frame catches up on every toggle it missed.
+        self.clock.now = 1.5
+        self.scheduler.update()
+        self.assertTrue(blink.on)
+
+    def test_blink_reset(self):
+        blink = Blink(self.scheduler, interval=0.5)
+        blink.start()
+        self.clock.now = 0.6
+        self.scheduler.update()
+        blink.reset()
+        self.assertFalse(blink.on)
+        self.assertTrue(self.scheduler.update())
+        self.assertAlmostEqual(self.scheduler.next_deadline(), 1.1)
+
+    def test_every_does_not_drift(self):
+        runs = []
+        self.scheduler.every(0.1, lambda: runs.append(self.clock.now))
+        for now in (0.13, 0.21, 0.37, 0.4):
+            self.clock.now = now
+            self.scheduler.update()
+        self.assertEqual(len(runs), 4)
+
+    def test_flash(self):
+        flash = Flash(self.scheduler, duration=0.3)
+        flash.trigger()
+        self.assertTrue(flash.active)
+        self.assertTrue(self.scheduler.update())
+        self.clock.now = 0.3
+        self.scheduler.update()
+        self.assertFalse(flash.active)
+
+    def test_fade_requests_every_frame(self):
+        fade = Fade(self.scheduler, duration=0.2)
+        self.assertEqual(fade.value(), 1.0)
+        fade.start()
+        self.clock.now = 0.1
+        self.assertAlmostEqual(fade.value(), 0.5)
+        self.assertEqual(self.scheduler.next_deadline(), 0.1)
+        self.assertTrue(self.scheduler.update())
+        self.clock.now = 0.2
+        self.scheduler.update()
+        self.assertFalse(fade.running)
+        self.assertIsNone(self.scheduler.next_deadline())
+
+    def test_countdown(self):
+        expired = []
+        countdown = Countdown(self.scheduler, 3, on_expire=lambda: expired.append(True))
+        countdown.start()
+        self.clock.now = 2.0
+        self.scheduler.update()
+        self.assertEqual(countdown.remaining, 1)
+        self.clock.now = 3.0
+        self.scheduler.update()
+        self.assertTrue(countdown.done)
+        self.assertEqual(expired, [True])
+        self.assertIsNone(self.scheduler.next_deadline())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from core.chord import Chord
+from core.circle import ChordType
+from core.replay import setup_headless
+from ui.audio import ChordPlayer, configure_mixer
+
+
+class TestChordPlayer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        configure_mixer()
+        setup_headless()
+        if not pygame.mixer.get_init():
+            raise unittest.SkipTest("no audio mixer available")
+
+    def test_sounds_are_built_once_and_played(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            player = ChordPlayer(voicing="open", timbre="sine", duration=0.05, cache_dir=tmp)
+            chords = [(Chord("C"), ChordType.MAJOR), (Chord("Am7"), ChordType.MINOR)]
+            player.preload(chords)
+            self.assertEqual(len(player.sounds), 2)
+            self.assertEqual(len(os.listdir(tmp)), 2)
+            sound = player.sound(Chord("C"), ChordType.MAJOR)
+            self.assertIs(player.sounds[(Chord("C"), ChordType.MAJOR)], sound)
+            self.assertAlmostEqual(sound.get_length(), 0.05, places=2)
+            player.play(Chord("Am7"), ChordType.MINOR)
+            self.assertEqual(len(player.sounds), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import numpy as np
+from core.batch import NOT_FOUND, BatchGameCore, distances
+from core.circle import ChordType, QuestionType
+from core.key_distance import distance
+from core.naming import NORDIC
+
+RING_QUESTIONS = [
+    QuestionType.FILL_IN, QuestionType.CLOCKWISE, QuestionType.COUNTERCLOCKWISE,
+    QuestionType.ALTERNATIVE_CIRCLE, QuestionType.ANY,
+]
+
+class TestBatchGameCore(unittest.TestCase):
+    def test_grades_like_circle(self):
+        engine = BatchGameCore(24 * 24, seed=1, question_types=RING_QUESTIONS)
+        circle = engine.circle
+        keys, answers = np.divmod(np.arange(24 * 24), 24)
+        engine.current_index[:] = keys % 12
+        engine.chord_type[:] = keys // 12
+        for q, question_type in enumerate(RING_QUESTIONS):
+            engine.current_question[:] = q
+            correct = engine.submit_answers(answers.astype(np.int16))
+            for key, answer, ok, score in zip(keys, answers, correct, engine.last_score):
+                chord, chord_type = engine.chords[key], ChordType.MINOR if key >= 12 else ChordType.MAJOR
+                given = engine.chords[answer]
+                self.assertEqual(ok, circle.check_answer(given, chord, question_type, chord_type))
+                self.assertAlmostEqual(score, circle.score_answer(given, chord, question_type, chord_type))
+
+    def test_vectorized_distances(self):
+        a = np.array([0, 0, 12])
+        b = np.array([1, 12, 18])
+        np.testing.assert_array_equal(distances(a, b), [distance(x, y) for x, y in zip(a, b)])
+
+    def test_next_questions_respects_selection(self):
+        engine = BatchGameCore(1000, seed=2, question_types=RING_QUESTIONS)
+        engine.selection[:] = False
+        engine.selection[:, [2, 5]] = True
+        engine.next_questions()
+        self.assertTrue(np.isin(engine.current_index, [2, 5]).all())
+        self.assertEqual(set(engine.current_index.tolist()), {2, 5})
+        self.assertEqual(set(engine.chord_type.tolist()), {0, 1})
+        self.assertEqual(set(engine.current_question.tolist()), set(range(len(RING_QUESTIONS))))
+        engine.selection[3] = False
+        with self.assertRaises(ValueError):
+            engine.next_questions()
+
+    def test_seed_reproduces_questions(self):
+        a, b = BatchGameCore(50, seed=3), BatchGameCore(50, seed=3)
+        a.next_questions()
+        b.next_questions()
+        np.testing.assert_array_equal(a.current_keys(), b.current_keys())
+
+    def test_string_answers_and_counters(self):
+        engine = BatchGameCore(3, seed=4)
+        engine.next_questions()
+        names = [chord.alternative_names[0] for chord in np.array(engine.chords, dtype=object)[engine.current_keys()]]
+        correct = engine.submit_answers([names[0], "X", names[2]], seconds=np.array([1.0, 2.0, 3.0]))
+        self.assertEqual(correct.tolist(), [True, False, True])
+        self.assertEqual(engine.last_answer[1], NOT_FOUND)
+        self.assertEqual(engine.total_score.tolist(), [1.0, 0.0, 1.0])
+        self.assertEqual(engine.time_sum.tolist(), [1.0, 2.0, 3.0])
+
+    def test_grading_without_question_rejected(self):
+        engine = BatchGameCore(3, seed=1)
+        engine.next_questions(np.array([0, 1]))
+        with self.assertRaises(ValueError):
+            engine.submit_answers(["C", "G", "D"])
+        engine.submit_answers(["C", "G"], np.array([0, 1]))
+        self.assertEqual(engine.total_questions.tolist(), [1, 1, 0])
+
+    def test_theory_questions_rejected(self):
+        with self.assertRaises(ValueError):
+            BatchGameCore(1, question_types=[QuestionType.DIATONIC_DEGREE])
+        with self.assertRaises(ValueError):
+            BatchGameCore(1, question_types=[QuestionType.PROGRESSION])
+
+class TestBatchSession(unittest.TestCase):
+    def test_view_behaves_like_game_core(self):
+        engine = BatchGameCore(4, seed=5, naming=NORDIC)
+        session = engine.session(2)
+        self.assertIsNone(session.current_chord)
+        self.assertIsNone(session.last_result)
+        session.set_selected_chord_indices([5])
+        self.assertEqual(session.get_selected_chord_indices(), {5})
+        session.next_question()
+        self.assertEqual(session.current_index, 5)
+        self.assertEqual(session.current_question, QuestionType.FILL_IN)
+        answer = "H" if session.chord_type == ChordType.MAJOR else "Giss-moll"
+        self.assertTrue(session.submit_answer(answer))
+        self.assertEqual(session.last_result["answer"], session.current_chord)
+        self.assertEqual(session.get_stats(), (1, 1))
+        self.assertEqual(session.get_score(), 1.0)
+        self.assertEqual(engine.total_questions.tolist(), [0, 0, 1, 0])
+        state = session.get_state()
+        self.assertEqual(state["current_chord"], session.current_chord)
+        self.assertFalse(session.submit_answer("nonsense"))
+        self.assertEqual(session.last_result["reason"], "not_found")
+        with self.assertRaises(IndexError):
+            engine.session(4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from core.chord_symbol import (
+    parse_chord_symbol, try_parse_chord_symbol, transpose_mask, mask_from_pitch_classes, ChordSymbol
+)
+
+class TestChordSymbol(unittest.TestCase):
+    def test_triads(self):
+        c = parse_chord_symbol("C")
+        self.assertEqual(c.root, 0)
+        self.assertEqual(c.pitch_classes, [0, 4, 7])
+        self.assertEqual(parse_chord_symbol("Cm").pitch_classes, [0, 3, 7])
+        self.assertEqual(parse_chord_symbol("F#m").pitch_classes, [1, 6, 9])
+        self.assertEqual(parse_chord_symbol("Bb").root, 10)
+
+    def test_extended_qualities(self):
+        self.assertEqual(parse_chord_symbol("C7").pitch_classes, [0, 4, 7, 10])
+        self.assertEqual(parse_chord_symbol("Cmaj7").pitch_classes, [0, 4, 7, 11])
+        self.assertEqual(parse_chord_symbol("Cm7b5").pitch_classes, [0, 3, 6, 10])
+        self.assertEqual(parse_chord_symbol("Csus4").pitch_classes, [0, 5, 7])
+        self.assertIs(parse_chord_symbol("CM7"), parse_chord_symbol("Cmaj7"))
+        self.assertIs(parse_chord_symbol("Cø"), parse_chord_symbol("Cm7b5"))
+
+    def test_slash_chords_and_inversions(self):
+        c_over_e = parse_chord_symbol("C/E")
+        self.assertEqual(c_over_e.bass, 4)
+        self.assertTrue(c_over_e.same_notes(parse_chord_symbol("C")))
+        self.assertEqual(parse_chord_symbol("C/D").pitch_classes, [0, 2, 4, 7])
+        self.assertIsNone(parse_chord_symbol("C/C").bass)
+
+    def test_interning_and_enharmonics(self):
+        self.assertIs(parse_chord_symbol("F#"), parse_chord_symbol("Gb"))
+        self.assertIs(parse_chord_symbol("D♭m"), parse_chord_symbol("C#m"))
+        self.assertIs(ChordSymbol.get(12), parse_chord_symbol("C"))
+
+    def test_transpose(self):
+        self.assertIs(parse_chord_symbol("C7").transpose(7), parse_chord_symbol("G7"))
+        self.assertIs(parse_chord_symbol("C/E").transpose(-1), parse_chord_symbol("B/D#"))
+        mask = mask_from_pitch_classes([0, 4, 7])
+        self.assertEqual(transpose_mask(mask, 5), mask_from_pitch_classes([5, 9, 0]))
+        self.assertEqual(transpose_mask(mask, -12), mask)
+
+    def test_contains(self):
+        self.assertTrue(parse_chord_symbol("C7").contains(parse_chord_symbol("C")))
+        self.assertFalse(parse_chord_symbol("C").contains(parse_chord_symbol("C7")))
+
+    def test_invalid(self):
+        for text in ("", "H", "Cxyz", "Nonexistent"):
+            self.assertIsNone(try_parse_chord_symbol(text))
+        with self.assertRaises(ValueError):
+            parse_chord_symbol("Q7")
+
+if __name__ == "__main__":
+    unittest.main()
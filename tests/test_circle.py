@@ -22,6 +22,13 @@ class TestCircleOfFifths(unittest.TestCase):
         self.assertTrue(chord.contains("C"))
         self.assertIsNone(self.circle.find_chord("Nonexistent"))
 
+    def test_find_chord_by_pitch_content(self):
+        c_major = self.circle.find_chord("C")
+        self.assertIs(self.circle.find_chord("Cmaj"), c_major)
+        self.assertIs(self.circle.find_chord("C/E"), c_major)
+        self.assertIs(self.circle.find_chord("Ebm"), self.circle.find_chord("D#m"))
+        self.assertIsNone(self.circle.find_chord("C7"))
+
     def test_get_chord_wraps(self):
         chord_list = self.circle.get_chord_list(ChordType.MAJOR)
         chord = self.circle.get_chord(12, ChordType.MAJOR)
@@ -68,6 +75,22 @@ class TestCircleOfFifths(unittest.TestCase):
         self.assertTrue(self.circle.check_answer(next_chord, chord, QuestionType.CLOCKWISE, ChordType.MAJOR))
         self.assertFalse(self.circle.check_answer(chord, chord, QuestionType.CLOCKWISE, ChordType.MAJOR))
 
+    def test_score_answer_partial_credit(self):
+        major = self.circle.get_chord_list(ChordType.MAJOR)
+        minor = self.circle.get_chord_list(ChordType.MINOR)
+        self.assertEqual(self.circle.score_answer(major[1], major[0], QuestionType.CLOCKWISE, ChordType.MAJOR), 1.0)
+        near = self.circle.score_answer(major[2], major[0], QuestionType.CLOCKWISE, ChordType.MAJOR)
+        far = self.circle.score_answer(minor[7], major[0], QuestionType.CLOCKWISE, ChordType.MAJOR)
+        self.assertGreater(near, far)
+        self.assertGreater(near, 0.0)
+        self.assertLess(near, 1.0)
+
+    def test_distance(self):
+        major = self.circle.get_chord_list(ChordType.MAJOR)
+        minor = self.circle.get_chord_list(ChordType.MINOR)
+        self.assertEqual(self.circle.distance(major[0], minor[0]), 1)
+        self.assertEqual(self.circle.distance(major[0], major[3]), 3)
+
     def test_get_neighbor_indices(self):
         chord_list = self.circle.get_chord_list(ChordType.MAJOR)
         chord = chord_list[0]
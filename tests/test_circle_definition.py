@@ -0,0 +1,123 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from core import circle_definition
+from core.batch import BatchGameCore
+from core.circle import ChordType, CircleOfFifths, QuestionType
+from core.circle_definition import (
+    STANDARD_DEFINITION, compile_circle, load_circle_file, parse_circle_definition, standard_circle,
+)
+from core.collision import get_chord_index
+from core.game_core import GameCore
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CIRCLES = os.path.join(os.path.dirname(HERE), "circles")
+
+TRIAD = {"name": "triad", "major": ["C", "G", "D"], "minor": ["Am", "Em", "Bm"]}
+
+class TestCircleDefinition(unittest.TestCase):
+    def test_standard_circle_matches_builtin_tables(self):
+        compiled = compile_circle(STANDARD_DEFINITION)
+        standard = standard_circle()
+        self.assertEqual(compiled.key_indices, standard.key_indices)
+        self.assertEqual(compiled.name_index, standard.name_index)
+        self.assertEqual(compiled.distances, standard.distances)
+        self.assertIs(CircleOfFifths().compiled, standard)
+        self.assertTrue(CircleOfFifths().is_standard)
+
+    def test_fourths_json(self):
+        circle = CircleOfFifths(load_circle_file(os.path.join(CIRCLES, "fourths.json")))
+        self.assertFalse(circle.is_standard)
+        c, f = circle.find_chord("C"), circle.find_chord("F")
+        self.assertEqual(circle.get_next_chord(c, QuestionType.CLOCKWISE), [f])
+        self.assertEqual(circle.grade_answer(f, c, QuestionType.CLOCKWISE, ChordType.MAJOR), (True, 1.0))
+        self.assertEqual(circle.compiled.practice_sets["flat_keys"], [0, 1, 2, 3, 4, 5])
+
+    def test_sevenths_toml(self):
+        circle = CircleOfFifths(load_circle_file(os.path.join(CIRCLES, "sevenths.toml")))
+        self.assertEqual(circle.size, 12)
+        self.assertEqual(circle.find_chord("Gbmaj7").name, "F#maj7/Gbmaj7")
+        am7 = circle.find_chord("Am7")
+        self.assertEqual(circle.get_next_chord(am7, QuestionType.ALTERNATIVE_CIRCLE, ChordType.MINOR), [circle.major_chords[0]])
+
+    def test_custom_size(self):
+        circle = CircleOfFifths(compile_circle(parse_circle_definition(TRIAD)))
+        self.assertEqual(circle.size, 3)
+        self.assertEqual(circle.get_chord(4), circle.find_chord("G"))
+        self.assertEqual(circle.distance(circle.find_chord("C"), circle.find_chord("Bm")), 2)
+        self.assertEqual(get_chord_index((0, 0), (10, -10), segments=3), 0)
+        self.assertEqual(get_chord_index((0, 0), (10, 5), segments=3), 1)
+
+    def test_validation(self):
+        invalid = [
+            [],
+            dict(TRIAD, extra=1),
+            dict(TRIAD, name=""),
+            dict(TRIAD, minor=["Am", "Em"]),
+            {"name": "x", "major": ["C", "G"], "minor": ["Am", "Em"]},
+            dict(TRIAD, minor=["Am", "Em", "C"]),
+            dict(TRIAD, major=["C", "G", 3]),
+            dict(TRIAD, practice_sets={"bad": [3]}),
+            dict(TRIAD, practice_sets={"bad": []}),
+            dict(TRIAD, practice_sets=[0]),
+        ]
+        for data in invalid:
+            with self.assertRaises(ValueError, msg=data):
+                parse_circle_definition(data)
+
+    def test_unparseable_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "broken.json")
+            with open(path, "w") as f:
+                f.write("{")
+            with self.assertRaises(ValueError):
+                load_circle_file(path)
+
+    def test_compiled_tables_cached_on_disk(self):
+        definition = parse_circle_definition(dict(TRIAD, name="cached"))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, "triad.json")
+            with open(path, "w") as f:
+                json.dump(definition.to_dict(), f)
+            first = load_circle_file(path, cache_dir)
+            self.assertIs(load_circle_file(path, cache_dir), first)
+            cached = [name for name in os.listdir(cache_dir) if name.endswith(".pickle")]
+            self.assertEqual(cached, [f"circle_{definition.digest()}.pickle"])
+            # A new process starts with an empty memory cache and loads the pickle.
+            circle_definition._compiled.clear()
+            reloaded = load_circle_file(path, cache_dir)
+            self.assertIsNot(reloaded, first)
+            self.assertEqual(reloaded.key_indices, first.key_indices)
+
+    def test_game_core_on_custom_circle(self):
+        circle = CircleOfFifths(load_circle_file(os.path.join(CIRCLES, "fourths.json")))
+        core = GameCore(seed=3, circle=circle)
+        core.use_practice_set("sharp_keys")
+        self.assertEqual(core.get_selected_chord_indices(), {0, 7, 8, 9, 10, 11})
+        for _ in range(20):
+            core.next_question()
+            self.assertIn(core.current_index, core.get_selected_chord_indices())
+            self.assertTrue(core.submit_answer(core.current_chord.alternative_names[0]))
+        with self.assertRaises(ValueError):
+            core.use_practice_set("missing")
+        with self.assertRaises(ValueError):
+            GameCore(circle=circle, question_types=[QuestionType.DIATONIC_DEGREE])
+
+    def test_batch_on_custom_circle(self):
+        circle = CircleOfFifths(compile_circle(parse_circle_definition(TRIAD)))
+        engine = BatchGameCore(4, seed=1, question_types=[QuestionType.CLOCKWISE], circle=circle)
+        engine.next_questions()
+        answers = ["C", "G", "Bm", "Em"]
+        correct = engine.submit_answers(answers)
+        for i, answer in enumerate(answers):
+            view = engine.session(i)
+            expected = circle.grade_answer(
+                circle.find_chord(answer), view.current_chord, QuestionType.CLOCKWISE, view.chord_type
+            )
+            self.assertEqual((bool(correct[i]), float(engine.last_score[i])), expected)
+        self.assertTrue(np.all(engine.current_index < 3))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import numpy as np
+import pygame
+from config import Config
+from core.click_log import ClickLog, classify_clicks, click_counts, load_click_logs, main
+from core.collision import RING_HOLE, RING_MAJOR, RING_MINOR
+from core.game import CircleOfFifthsGame
+from core.replay import setup_headless
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+class TestClickLog(unittest.TestCase):
+    def test_buffers_grow(self):
+        log = ClickLog(capacity=2, clock=FakeClock())
+        for i in range(5):
+            log.record((i, 2 * i), 1, 15.0)
+        clicks = log.arrays()
+        self.assertEqual(len(log), 5)
+        self.assertEqual(clicks["x"].tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(clicks["y"].tolist(), [0, 2, 4, 6, 8])
+        self.assertEqual(clicks["time"].tolist(), [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertTrue(np.all(clicks["rotation"] == 15.0))
+
+    def test_save_load_and_count(self):
+        cx, cy = Config.CIRCLE_CENTER
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for n, pos in enumerate([(cx, cy - 170), (cx, cy - 100), (cx, cy)]):
+                log = ClickLog()
+                log.record(pos, 1)
+                log.record((cx + 1, cy - Config.CIRCLE_RADIUS + 5), 3)
+                paths.append(os.path.join(tmp, f"session{n}.npz"))
+                log.save(paths[-1])
+            clicks = load_click_logs(paths)
+        self.assertEqual(len(clicks["x"]), 6)
+        ring, segment, border = classify_clicks(clicks)
+        self.assertEqual(ring.tolist(), [RING_MAJOR, RING_MAJOR, RING_MINOR, RING_MAJOR, RING_HOLE, RING_MAJOR])
+        counts = click_counts(ring, segment, border)
+        self.assertEqual(counts["clicks"][0, 0], 4)
+        self.assertEqual(counts["clicks"][1, 0], 1)
+        self.assertEqual(counts["near_border"][0, 0], 3)
+        self.assertEqual(counts["hole"].sum(), 1)
+        self.assertEqual(counts["outside"].sum(), 0)
+
+    def test_segment_count_is_saved_and_used(self):
+        cx, cy = Config.CIRCLE_CENTER
+        # Just right of 12 o'clock: wedge 0 on a 12-chord ring, wedge 1 on a 24-chord ring.
+        pos = (cx + 40, cy - 170)
+        with tempfile.TemporaryDirectory() as tmp:
+            small, large = os.path.join(tmp, "small.npz"), os.path.join(tmp, "large.npz")
+            log = ClickLog(segments=24)
+            log.record(pos, 1)
+            log.save(large)
+            log = ClickLog()
+            log.record(pos, 1)
+            log.save(small)
+            clicks = load_click_logs([large])
+            with self.assertRaises(ValueError):
+                load_click_logs([small, large])
+            self.assertEqual(int(clicks["segments"]), 24)
+            self.assertEqual(classify_clicks(clicks)[1].tolist(), [1])
+            self.assertEqual(classify_clicks(load_click_logs([small]))[1].tolist(), [0])
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                self.assertEqual(main([large]), 0)
+            self.assertIn("  23 ", out.getvalue())
+
+    def test_game_logs_every_click(self):
+        setup_headless()
+        log = ClickLog()
+        game = CircleOfFifthsGame("en", seed=1, click_log=log)
+        try:
+            game.handle_events([
+                pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 20)),
+                pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3, pos=Config.CIRCLE_CENTER),
+                pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0), rel=(0, 0), buttons=(0, 0, 0)),
+            ])
+        finally:
+            game.renderer.close()
+        clicks = log.arrays()
+        self.assertEqual(clicks["button"].tolist(), [1, 3])
+        self.assertEqual(clicks["x"].tolist(), [10, Config.CIRCLE_CENTER[0]])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,9 @@
 import unittest
-from core.collision import is_inside_circle, get_chord_index
+import math
+import numpy as np
+from core.collision import (
+    RING_HOLE, RING_MAJOR, RING_MINOR, RING_OUTSIDE, classify_points, is_inside_circle, get_chord_index
+)
 
 class TestCollision(unittest.TestCase):
     def test_is_inside_circle_true(self):
@@ -41,5 +45,35 @@ class TestCollision(unittest.TestCase):
             idx = get_chord_index(center, (int(x), int(y)))
             self.assertEqual(idx, i)
 
+    def test_get_chord_index_rotated(self):
+        import math
+        center = (0, 0)
+        for rotation in (30, -90, 45, 200):
+            for i in range(12):
+                angle_deg = i * 30 - 90 + rotation
+                x = 100 * math.cos(math.radians(angle_deg))
+                y = 100 * math.sin(math.radians(angle_deg))
+                self.assertEqual(get_chord_index(center, (round(x), round(y)), rotation), i)
+
+    def test_classify_points_matches_scalar_hit_test(self):
+        rng = np.random.default_rng(3)
+        xs, ys = rng.uniform(-220, 220, 500), rng.uniform(-220, 220, 500)
+        rotations = rng.uniform(0, 360, 500)
+        ring, segment, _ = classify_points((0, 0), xs, ys, 200, 125, 40, rotations)
+        for x, y, rotation, s in zip(xs, ys, rotations, segment):
+            self.assertEqual(get_chord_index((0, 0), (x, y), rotation), s)
+        inside = np.array([is_inside_circle((0, 0), 200, (x, y)) for x, y in zip(xs, ys)])
+        np.testing.assert_array_equal(ring != RING_OUTSIDE, inside)
+
+    def test_classify_points_rings_and_borders(self):
+        xs = np.array([0, 0, 0, 0, 160 * math.sin(math.radians(13))])
+        ys = np.array([-170, -100, -10, -250, -160 * math.cos(math.radians(13))])
+        ring, segment, border = classify_points((0, 0), xs, ys, 200, 125, 40)
+        self.assertEqual(ring.tolist(), [RING_MAJOR, RING_MINOR, RING_HOLE, RING_OUTSIDE, RING_MAJOR])
+        self.assertEqual(segment.tolist(), [0, 0, 0, 0, 0])
+        np.testing.assert_allclose(border[:4], [30, 25, 30, 50])
+        # 2 degrees from the divider at 15 degrees, 160 pixels out.
+        self.assertAlmostEqual(border[4], 160 * math.sin(math.radians(2)))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from core.corpus import (
+    KeyResolver, CorpusStats, analyze_corpus, analyze_lines, chord_tokens, classify_move, read_chunk,
+    MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE, MOVE_JUMP, MOVE_RELATIVE, MOVE_SAME
+)
+
+CHART = """Title: Test song
+C    G    Am   F
+Some lyrics go here
+[C]Sing a [G]long [Am]song [F]now
+| Dm7 | G7 | Cmaj7 | Bdim |
+"""
+
+class TestCorpus(unittest.TestCase):
+    def setUp(self):
+        self.resolver = KeyResolver()
+
+    def test_classify_move(self):
+        self.assertEqual(classify_move(0, 0), (MOVE_SAME, 0))
+        self.assertEqual(classify_move(0, 1), (MOVE_CLOCKWISE, 1))
+        self.assertEqual(classify_move(0, 11), (MOVE_COUNTERCLOCKWISE, 1))
+        self.assertEqual(classify_move(0, 12), (MOVE_RELATIVE, 1))
+        self.assertEqual(classify_move(0, 3), (MOVE_JUMP, 3))
+
+    def test_resolve_reduces_extended_chords(self):
+        self.assertEqual(self.resolver.resolve("C"), 0)
+        self.assertEqual(self.resolver.resolve("Am7"), 12)
+        self.assertEqual(self.resolver.resolve("G7"), 1)
+        self.assertEqual(self.resolver.resolve("Bb"), 10)
+        self.assertIsNone(self.resolver.resolve("Bdim"))
+
+    def test_chord_tokens(self):
+        self.assertEqual(chord_tokens("C  G | Am F"), ["C", "G", "Am", "F"])
+        self.assertEqual(chord_tokens("[C]Hello [G7]world"), ["C", "G7"])
+        self.assertEqual(chord_tokens("Hello world"), [])
+
+    def test_analyze_lines(self):
+        stats = analyze_lines(CHART.splitlines(), self.resolver, "song")
+        self.assertEqual(stats.chords, 11)
+        self.assertEqual(stats.unresolved, 1)
+        self.assertEqual(stats.transition_total, 10)
+        self.assertEqual(stats.transition_count(0, 1), 2)  # C -> G
+        self.assertEqual(stats.transition_count(1, 12), 2)  # G -> Am
+
+    def test_read_chunk_splits_on_line_boundaries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "song.txt")
+            with open(path, "w") as f:
+                f.write(CHART)
+            size = os.path.getsize(path)
+            for step in (1, 7, 16, size):
+                lines = []
+                for start in range(0, size, step):
+                    lines.extend(read_chunk(path, start, min(start + step, size)))
+                self.assertEqual("".join(lines), CHART)
+
+    def test_chunked_merge_is_exact(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("a.txt", "b.txt"):
+                with open(os.path.join(tmp, name), "w") as f:
+                    f.write(CHART * 3)
+            whole = analyze_corpus([tmp], workers=1, chunk_bytes=1 << 20)
+            chunked = analyze_corpus([tmp], workers=1, chunk_bytes=13)
+            self.assertEqual(whole.files, 2)
+            self.assertEqual(chunked.files, 2)
+            self.assertEqual(list(chunked.transitions), list(whole.transitions))
+            self.assertEqual(chunked.move_counts, whole.move_counts)
+            # Transitions do not cross file boundaries.
+            self.assertEqual(whole.transition_total, 2 * (3 * 11 - 1))
+
+    def test_process_pool_matches_single_process(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "a.txt")
+            with open(path, "w") as f:
+                f.write(CHART * 20)
+            single = analyze_corpus([path], workers=1, chunk_bytes=64)
+            pooled = analyze_corpus([path], workers=2, chunk_bytes=64)
+            self.assertEqual(list(pooled.transitions), list(single.transitions))
+            self.assertEqual(list(pooled.step_counts), list(single.step_counts))
+
+    def test_top_transitions(self):
+        stats = CorpusStats.empty()
+        for key in (0, 1, 0, 1, 12):
+            stats.add_chord(key)
+        self.assertEqual(stats.top_transitions(1), [(0, 1, 2)])
+
+if __name__ == "__main__":
+    unittest.main()
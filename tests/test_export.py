@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+import pygame
+from config import Config
+from core.circle import ChordType, CircleOfFifths
+from core.circle_definition import load_circle_file
+from core.naming import NORDIC
+from core.replay import setup_headless
+from ui.export import CardRenderer, CardSpec, all_highlights, build_deck, export_deck, selections_for
+
+SVG = "{http://www.w3.org/2000/svg}"
+CIRCLES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "circles")
+
+class TestExport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        setup_headless()
+        cls.renderer = CardRenderer()
+
+    def test_deck_is_cross_product(self):
+        deck = build_deck(selections_for("singles"), all_highlights(), (False, True), ("en", "sv"))
+        self.assertEqual(len(deck), 12 * 25 * 2 * 2)
+        self.assertEqual(len({card.filename for card in deck}), len(deck))
+        self.assertEqual(len(selections_for("pairs")), 66)
+        with self.assertRaises(ValueError):
+            selections_for("triples")
+
+    def test_selection_is_sorted(self):
+        card = build_deck([(3, 1)], [None], (True,))[0]
+        self.assertEqual(card, CardSpec((1, 3), None, True, "en"))
+        self.assertEqual(card.filename, "card_en_s00a_none_labels")
+        self.assertEqual(CardSpec((), (ChordType.MINOR, 4), False, "sv").filename, "card_sv_s000_min04_blank")
+
+    def test_surface_is_cropped_card(self):
+        card = CardSpec((0,), (ChordType.MAJOR, 0), True, "en")
+        surface = self.renderer.render_surface(card)
+        self.assertEqual(surface.get_size(), self.renderer.card_rect.size)
+        corner = surface.get_at((0, surface.get_height() - 1))
+        self.assertEqual(tuple(corner)[:3], Config.COLORS["background"])
+
+    def test_svg_contents(self):
+        card = CardSpec((0, 1), (ChordType.MINOR, 2), True, "en")
+        root = ET.fromstring(self.renderer.render_svg(card))
+        polygons = root.findall(SVG + "polygon")
+        # 24 wedges plus the highlight.
+        self.assertEqual(len(polygons), 25)
+        texts = root.findall(SVG + "text")
+        self.assertEqual(len(texts), 24 + 1)
+        caption = texts[-1]
+        self.assertEqual(caption.text, self.renderer.caption(card))
+        self.assertEqual(caption.get("font-size"), str(Config.FONT_SMALL_SIZE))
+        self.assertEqual({text.get("font-size") for text in texts[:-1]}, {str(Config.FONT_LABEL_SIZE)})
+
+    def test_labels_follow_the_naming_system(self):
+        card = CardSpec((), None, True, "en")
+        labels = [text.text for text in ET.fromstring(self.renderer.render_svg(card)).findall(SVG + "text")]
+        self.assertEqual(labels[5], "B")
+        nordic = CardRenderer(naming=NORDIC)
+        labels = [text.text for text in ET.fromstring(nordic.render_svg(card)).findall(SVG + "text")]
+        self.assertEqual(labels[5], "H")
+        self.assertEqual(labels[14], "Hm")
+
+    def test_custom_circle(self):
+        compiled = load_circle_file(os.path.join(CIRCLES, "sevenths.toml"))
+        renderer = CardRenderer(CircleOfFifths(compiled))
+        card = CardSpec((0,), (ChordType.MINOR, 1), True, "en")
+        root = ET.fromstring(renderer.render_svg(card))
+        labels = [text.text for text in root.findall(SVG + "text")]
+        self.assertEqual(labels[:2], ["Cmaj7", "Gmaj7"])
+        self.assertEqual(labels[12:14], ["Am7", "Em7"])
+        self.assertEqual(labels[-1], renderer.caption(card))
+        cards = build_deck([(0,)], [(ChordType.MAJOR, 0)], (True,))
+        with tempfile.TemporaryDirectory() as out_dir:
+            paths = export_deck(cards, out_dir, ("svg",), workers=1, circle=compiled, naming="german")
+            with open(paths[0], encoding="utf-8") as f:
+                self.assertIn("Cmaj7", f.read())
+
+    def test_svg_without_labels_or_highlight(self):
+        root = ET.fromstring(self.renderer.render_svg(CardSpec((), None, False, "en")))
+        self.assertEqual(len(root.findall(SVG + "polygon")), 24)
+        self.assertEqual(root.findall(SVG + "text"), [])
+
+    def test_export_deck_writes_files(self):
+        cards = build_deck([(0,)], [None, (ChordType.MAJOR, 5)], (True,))
+        with tempfile.TemporaryDirectory() as out_dir:
+            paths = export_deck(cards, os.path.join(out_dir, "deck"), workers=1)
+            self.assertEqual(len(paths), 4)
+            self.assertEqual(sorted(os.listdir(os.path.join(out_dir, "deck"))), sorted(os.path.basename(p) for p in paths))
+            png = [p for p in paths if p.endswith(".png")][0]
+            self.assertEqual(pygame.image.load(png).get_size(), self.renderer.card_rect.size)
+
+if __name__ == "__main__":
+    unittest.main()
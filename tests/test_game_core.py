@@ -39,6 +39,17 @@ class TestGameCore(unittest.TestCase):
         self.assertEqual(self.core.last_result["answer"], chord)
         self.assertEqual(self.core.correct_answers, 1)
         self.assertEqual(self.core.total_questions, 1)
+        self.assertEqual(self.core.last_result["score"], 1.0)
+        self.assertEqual(self.core.get_score(), 1.0)
+
+    def test_submit_answer_partial_credit(self):
+        self.core.set_selected_chord_indices([0])
+        self.core.next_question()
+        chord_list = self.core.get_chord_list(self.core.chord_type)
+        self.assertFalse(self.core.submit_answer(chord_list[1].alternative_names[0]))
+        self.assertGreater(self.core.last_result["score"], 0.0)
+        self.assertLess(self.core.last_result["score"], 1.0)
+        self.assertAlmostEqual(self.core.stats.score(), self.core.get_score())
 
     def test_submit_answer_incorrect(self):
         self.core.set_selected_chord_indices([0])
@@ -51,6 +62,27 @@ class TestGameCore(unittest.TestCase):
         self.assertEqual(self.core.correct_answers, 0)
         self.assertEqual(self.core.total_questions, 1)
 
+    def test_seed_reproduces_questions(self):
+        a = GameCore(seed=123)
+        b = GameCore(seed=123)
+        for _ in range(10):
+            a.next_question()
+            b.next_question()
+            self.assertEqual(a.current_chord, b.current_chord)
+            self.assertEqual(a.chord_type, b.chord_type)
+
+    def test_submit_answer_records_response_time(self):
+        now = [10.0]
+        core = GameCore(seed=1, clock=lambda: now[0])
+        core.set_selected_chord_indices([0])
+        core.next_question()
+        now[0] += 2.5
+        core.submit_answer(core.current_chord.alternative_names[0])
+        self.assertAlmostEqual(core.last_result["response_time"], 2.5)
+        self.assertEqual(core.stats.accuracy(0, core.chord_type, QuestionType.FILL_IN), (1, 1))
+        p50, = core.get_response_percentiles((50,))
+        self.assertGreaterEqual(p50, 2.5)
+
     def test_get_stats(self):
         self.core.correct_answers = 3
         self.core.total_questions = 5
@@ -80,5 +112,87 @@ class TestGameCore(unittest.TestCase):
         self.assertEqual(self.core.major_chords, self.core.circle.major_chords)
         self.assertEqual(self.core.minor_chords, self.core.circle.minor_chords)
 
+    def test_theory_questions(self):
+        core = GameCore(seed=3, question_types=[QuestionType.DIATONIC_DEGREE])
+        core.next_question()
+        detail = core.question_detail
+        self.assertEqual(core.current_question, QuestionType.DIATONIC_DEGREE)
+        self.assertTrue(core.submit_answer(detail["expected"]))
+        self.assertEqual(core.last_result["expected"], detail["expected"])
+
+        core = GameCore(seed=3, question_types=[QuestionType.SIGNATURE_OF_KEY])
+        core.next_question()
+        self.assertFalse(core.submit_answer("lots"))
+        self.assertEqual(core.last_result["reason"], "not_signature")
+        core.next_question()
+        self.assertTrue(core.submit_answer(core.question_detail["expected"]))
+
+        core = GameCore(seed=3, question_types=[QuestionType.KEY_FROM_SIGNATURE])
+        core.next_question()
+        self.assertTrue(core.submit_answer(core.current_chord.alternative_names[-1]))
+
+    def test_single_question_type_keeps_seeded_sequence(self):
+        a = GameCore(seed=9)
+        b = GameCore(seed=9, question_types=[QuestionType.FILL_IN])
+        for _ in range(5):
+            a.next_question()
+            b.next_question()
+            self.assertEqual(a.current_chord, b.current_chord)
+
+    def test_progression_questions(self):
+        core = GameCore(seed=5, question_types=[QuestionType.PROGRESSION], progression_length=3)
+        core.set_selected_chord_indices([0])
+        for step in (1, 2, 1, 2):
+            core.next_question()
+            detail = core.question_detail
+            self.assertEqual(core.current_question, QuestionType.PROGRESSION)
+            self.assertEqual(detail["step"], step)
+            self.assertEqual(detail["progression"][-1], core.current_chord.name)
+            if step == 1:
+                self.assertIn(core.current_chord.name, ("C", "Am"))
+            self.assertTrue(core.submit_answer(detail["expected"].split("/")[0]))
+            self.assertEqual(core.last_result["expected"], detail["expected"])
+        core.next_question()
+        expected = core.circle.find_chord(core.question_detail["expected"])
+        wrong = next(c for c in core.major_chords + core.minor_chords if core.circle.distance(c, expected) == 1)
+        self.assertFalse(core.submit_answer(wrong.alternative_names[0]))
+        self.assertGreater(core.last_result["score"], 0.0)
+
+    def test_progression_restarts_on_new_selection(self):
+        core = GameCore(seed=1, question_types=[QuestionType.PROGRESSION])
+        core.next_question()
+        core.set_selected_chord_indices([3])
+        core.next_question()
+        self.assertEqual(core.question_detail["step"], 1)
+        self.assertIn(core.current_chord.name, ("A", "F#m/Gbm"))
+
+    def test_progression_model_must_match_circle(self):
+        from core.progression import TransitionModel
+        with self.assertRaises(ValueError):
+            GameCore(progression_model=TransitionModel.from_move_weights(circle_size=3))
+
+    def test_questions_drawn_ahead(self):
+        core = GameCore(seed=2, prefetch_depth=3)
+        core.next_question()
+        upcoming = core.upcoming_questions()
+        self.assertEqual(len(upcoming), 3)
+        core.next_question()
+        self.assertIs(core.question, upcoming[0])
+        self.assertEqual(core.current_chord, upcoming[0].chord)
+        self.assertEqual(core.get_state()["question_number"], upcoming[0].number)
+
+    def test_selection_change_discards_upcoming_questions(self):
+        ahead = GameCore(seed=4)
+        plain = GameCore(seed=4, prefetch_depth=0)
+        for core in (ahead, plain):
+            core.next_question()
+            core.set_selected_chord_indices([1, 2])
+        self.assertEqual(ahead.upcoming_questions(), [])
+        for _ in range(6):
+            ahead.next_question()
+            plain.next_question()
+            self.assertEqual((ahead.current_chord, ahead.chord_type), (plain.current_chord, plain.chord_type))
+            self.assertTrue(all(q.index in (1, 2) for q in ahead.upcoming_questions()))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -2,6 +2,7 @@ import unittest
 from core.game_text import generate_question_text, get_feedback_message
 from core.chord import Chord
 from core.circle import QuestionType, ChordType
+from core.naming import NORDIC
 from unittest.mock import MagicMock
 
 class DummyLoc:
@@ -40,6 +41,31 @@ class TestGameText(unittest.TestCase):
         self.assertIn("question_clockwise", result)
         self.assertIn("chord_type=", result)
 
+    def test_generate_question_text_theory(self):
+        state = {
+            "current_chord": self.chord_list[2],
+            "chord_type": ChordType.MAJOR,
+            "current_question": QuestionType.DIATONIC_DEGREE,
+            "question_detail": {"key": 2, "tonic": "D", "signature": 2, "degree": 4, "numeral": "V", "expected": "A"},
+        }
+        result = generate_question_text(state, self.loc, self.chord_list)
+        self.assertIn("question_diatonic_degree", result)
+        self.assertIn("degree=V", result)
+        self.assertIn("tonic=D", result)
+        self.assertIn(("signature_sharps", {"count": 2}), self.loc.calls)
+
+    def test_generate_question_text_progression(self):
+        state = {
+            "current_chord": self.chord_list[1],
+            "chord_type": ChordType.MAJOR,
+            "current_question": QuestionType.PROGRESSION,
+            "question_detail": {"move": "counterclockwise", "progression": ["D", "G"], "step": 2, "length": 4, "expected": "C"},
+        }
+        result = generate_question_text(state, self.loc, self.chord_list)
+        self.assertIn("question_progression", result)
+        self.assertIn("progression=D – G", result)
+        self.assertIn(("move_counterclockwise", {"chord": "G"}), self.loc.calls)
+
     def test_get_feedback_message_none(self):
         state = {"last_result": None}
         result = get_feedback_message(state, self.loc)
@@ -78,5 +104,17 @@ class TestGameText(unittest.TestCase):
         result = get_feedback_message(state, self.loc)
         self.assertIn("feedback_correct_fill_in", result)
 
+    def test_feedback_uses_naming_system(self):
+        state = {
+            "last_result": {"correct": False, "answer": Chord("A#/Bb")},
+            "current_chord": Chord("B"),
+            "current_question": QuestionType.FILL_IN,
+            "naming": NORDIC,
+        }
+        get_feedback_message(state, self.loc)
+        _, kwargs = self.loc.calls[-1]
+        self.assertEqual(kwargs["answer"], "A#/B")
+        self.assertEqual(kwargs["correct"], "H")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
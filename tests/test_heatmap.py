@@ -0,0 +1,75 @@
+import math
+import unittest
+import numpy as np
+import pygame
+from core.circle import ChordType, QuestionType
+from core.replay import setup_headless
+from core.stats import StatsTracker
+from ui.heatmap import (
+    DIVIDER_COLOR, HEATMAP_ACCURACY, HEATMAP_RESPONSE_TIME, NO_DATA_COLOR, HeatmapOverlay, next_heatmap_mode, wedge_values
+)
+from ui.render import LAYER_COLORKEY
+
+class TestHeatmap(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        setup_headless()
+
+    def setUp(self):
+        self.stats = StatsTracker()
+        self.stats.record(0, ChordType.MAJOR, QuestionType.FILL_IN, True, 1.0)
+        self.stats.record(3, ChordType.MINOR, QuestionType.FILL_IN, False, 4.0)
+        self.overlay = HeatmapOverlay((100, 100), 90, 60, 20)
+
+    def pixel(self, pixels, angle_deg, radius):
+        x = 92 + int(radius * math.cos(math.radians(angle_deg)))
+        y = 92 + int(radius * math.sin(math.radians(angle_deg)))
+        return tuple(int(c) for c in pixels[x, y])
+
+    def test_next_heatmap_mode(self):
+        self.assertEqual(next_heatmap_mode(None), HEATMAP_ACCURACY)
+        self.assertEqual(next_heatmap_mode(HEATMAP_ACCURACY), HEATMAP_RESPONSE_TIME)
+        self.assertIsNone(next_heatmap_mode(HEATMAP_RESPONSE_TIME))
+
+    def test_wedge_values(self):
+        accuracy = wedge_values(self.stats, HEATMAP_ACCURACY)
+        self.assertEqual(accuracy[0, 0], 1.0)
+        self.assertEqual(accuracy[1, 3], 0.0)
+        self.assertTrue(np.isnan(accuracy[0, 1]))
+        times = wedge_values(self.stats, HEATMAP_RESPONSE_TIME)
+        self.assertEqual(times[0, 0], 1.0)
+        self.assertEqual(times[1, 3], 0.0)
+
+    def test_rasterize(self):
+        pixels = self.overlay.rasterize(wedge_values(self.stats, HEATMAP_ACCURACY))
+        strong = self.pixel(pixels, -90, 85)
+        self.assertGreater(strong[1], strong[0])
+        weak = self.pixel(pixels, 0, 40)
+        self.assertGreater(weak[0], weak[1])
+        gray = self.pixel(pixels, -60, 85)
+        self.assertTrue(gray[0] == gray[1] == gray[2] <= NO_DATA_COLOR[0])
+        self.assertEqual(self.pixel(pixels, 0, 10), (0, 0, 0))
+        self.assertEqual(self.pixel(pixels, 45, 120), LAYER_COLORKEY)
+        self.assertEqual(self.pixel(pixels, -75, 85), DIVIDER_COLOR)
+        # Brighter towards the outer edge of the ring.
+        self.assertGreater(sum(strong), sum(self.pixel(pixels, -90, 62)))
+
+    def test_rasterize_rotated(self):
+        pixels = self.overlay.rasterize(wedge_values(self.stats, HEATMAP_ACCURACY), rotation=30.0)
+        gray = self.pixel(pixels, -90, 85)
+        self.assertTrue(gray[0] == gray[1] == gray[2])
+        strong = self.pixel(pixels, -60, 85)
+        self.assertGreater(strong[1], strong[0])
+
+    def test_draw_caches_until_stats_change(self):
+        surface = pygame.Surface((200, 200))
+        self.overlay.draw(surface, self.stats, HEATMAP_ACCURACY)
+        key = self.overlay.cache_key
+        self.overlay.draw(surface, self.stats, HEATMAP_ACCURACY)
+        self.assertEqual(self.overlay.cache_key, key)
+        self.stats.record(1, ChordType.MAJOR, QuestionType.FILL_IN, True, 1.0)
+        self.overlay.draw(surface, self.stats, HEATMAP_ACCURACY)
+        self.assertNotEqual(self.overlay.cache_key, key)
+
+if __name__ == "__main__":
+    unittest.main()
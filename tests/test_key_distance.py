@@ -0,0 +1,34 @@
+import sys
+import subprocess
+import unittest
+from core.key_distance import DISTANCES, MAX_DISTANCE, CREDIT_BY_DISTANCE, distance, key_index, partial_credit
+
+class TestKeyDistance(unittest.TestCase):
+    def test_basic_distances(self):
+        c, g, f, am = key_index(0, False), key_index(1, False), key_index(11, False), key_index(0, True)
+        self.assertEqual(distance(c, c), 0)
+        self.assertEqual(distance(c, g), 1)
+        self.assertEqual(distance(c, f), 1)
+        self.assertEqual(distance(c, am), 1)
+        self.assertEqual(distance(c, key_index(6, False)), 6)
+        self.assertEqual(distance(c, key_index(6, True)), 7)
+        self.assertEqual(MAX_DISTANCE, 7)
+
+    def test_symmetric(self):
+        self.assertEqual(DISTANCES, [list(column) for column in zip(*DISTANCES)])
+        self.assertEqual(len(DISTANCES), 24)
+
+    def test_circle_does_not_load_numpy(self):
+        code = "import sys, core.circle, core.key_distance; print('numpy' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_partial_credit(self):
+        self.assertEqual(partial_credit(0), 1.0)
+        self.assertGreater(partial_credit(1), partial_credit(2))
+        self.assertLessEqual(partial_credit(1), 0.5)
+        self.assertEqual(partial_credit(MAX_DISTANCE), 0.0)
+        self.assertEqual(CREDIT_BY_DISTANCE[2], partial_credit(2))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from localization import Localization, LocaleReport, LocaleWatcher, placeholders
+
+class TestLocalization(unittest.TestCase):
+    def test_t_formats_and_falls_back_to_key(self):
+        loc = Localization("en")
+        self.assertEqual(loc.t("major"), "major")
+        self.assertEqual(loc.t("unknown_key"), "unknown_key")
+
+    def test_placeholders(self):
+        self.assertEqual(placeholders("{answer} is {correct}."), {"answer", "correct"})
+        self.assertEqual(placeholders("plain"), set())
+
+    def test_report(self):
+        reference = {"a": "{x} and {y}", "b": "text", "c": "c"}
+        strings = {"a": "{x}", "b": "text", "d": "extra"}
+        report = LocaleReport(reference, strings)
+        self.assertEqual(report.missing, ["c"])
+        self.assertEqual(report.extra, ["d"])
+        self.assertIn("a", report.placeholder_mismatches)
+        self.assertFalse(report.ok)
+        self.assertEqual(len(report.lines()), 3)
+
+    def test_shipped_locales_match_reference(self):
+        with open(os.path.join("locales", "en.json"), encoding="utf-8") as f:
+            reference = json.load(f)
+        for name in os.listdir("locales"):
+            with open(os.path.join("locales", name), encoding="utf-8") as f:
+                report = LocaleReport(reference, json.load(f))
+            self.assertTrue(report.ok, f"{name}: {report.lines()}")
+
+class TestLocaleWatcher(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        shutil.copy(os.path.join("locales", "en.json"), self.dir)
+        self.loc = Localization("en")
+        self.original = dict(self.loc.strings)
+
+    def tearDown(self):
+        self.loc.strings = self.original
+        shutil.rmtree(self.dir)
+
+    def write(self, strings):
+        path = os.path.join(self.dir, "en.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(strings, f)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_poll_and_apply(self):
+        watcher = LocaleWatcher(self.loc, locales_dir=self.dir)
+        self.assertFalse(watcher.poll())
+        self.assertFalse(watcher.apply())
+        strings = dict(self.original, major="MAJOR")
+        self.write(strings)
+        self.assertTrue(watcher.poll())
+        self.assertEqual(self.loc.t("major"), "major")
+        self.assertTrue(watcher.apply())
+        self.assertEqual(self.loc.t("major"), "MAJOR")
+        self.assertTrue(watcher.last_report.ok)
+
+    def test_invalid_json_keeps_strings(self):
+        watcher = LocaleWatcher(self.loc, locales_dir=self.dir)
+        path = os.path.join(self.dir, "en.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{ broken")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertFalse(watcher.poll())
+        self.assertIsNotNone(watcher.last_error)
+        self.assertFalse(watcher.apply())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import threading
+import unittest
+import urllib.request
+from urllib.error import HTTPError
+from core.metrics import MetricsRegistry, MetricsServer, REGISTRY
+from core.game_core import GameCore
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_sums_threads(self):
+        counter = self.registry.counter("events_total", "Events.").labels()
+        def work():
+            for _ in range(1000):
+                counter.inc()
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(counter.value, 4000)
+
+    def test_histogram_render(self):
+        hist = self.registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0)).labels()
+        for value in (0.05, 0.5, 0.5, 5.0):
+            hist.observe(value)
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{le="1"} 3', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn("latency_seconds_count 4", text)
+        self.assertIn("latency_seconds_sum 6.05", text)
+        self.assertIn("# TYPE latency_seconds histogram", text)
+
+    def test_labels_and_gauge(self):
+        answers = self.registry.counter("answers_total", "Answers.", ("result",))
+        answers.labels("correct").inc(2)
+        self.registry.gauge("score", "Score.").labels().set(1.5)
+        text = self.registry.render()
+        self.assertIn('answers_total{result="correct"} 2', text)
+        self.assertIn("score 1.5", text)
+        with self.assertRaises(ValueError):
+            answers.labels()
+        with self.assertRaises(ValueError):
+            self.registry.gauge("answers_total", "Answers.")
+
+    def test_game_core_is_instrumented(self):
+        questions = REGISTRY.counter("quiz_questions_total", "").labels()
+        before = questions.value
+        core = GameCore(seed=0)
+        core.next_question()
+        core.submit_answer("nonsense")
+        self.assertEqual(questions.value, before + 1)
+        self.assertIn('quiz_answers_total{result="not_found"}', REGISTRY.render())
+
+    def test_server(self):
+        self.registry.counter("hits_total", "Hits.").labels().inc()
+        server = MetricsServer(self.registry, port=0)
+        server.start()
+        try:
+            url = f"http://127.0.0.1:{server.port}"
+            with urllib.request.urlopen(url + "/metrics") as response:
+                self.assertIn("hits_total 1", response.read().decode())
+                self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+            with self.assertRaises(HTTPError):
+                urllib.request.urlopen(url + "/other")
+        finally:
+            server.stop()
+
+if __name__ == "__main__":
+    unittest.main()
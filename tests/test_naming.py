@@ -0,0 +1,58 @@
+import unittest
+from core.chord_lists import major_chords, minor_chords
+from core.circle import ChordType
+from core.game_core import GameCore
+from core.naming import ENGLISH, NORDIC, GERMAN, SOLFEGE, NAMING_SYSTEMS, get_naming_system, naming_for_locale
+from localization import Localization
+
+class TestNamingSystems(unittest.TestCase):
+    def test_english_is_unchanged(self):
+        self.assertEqual(ENGLISH.normalize("Bb"), "Bb")
+        self.assertEqual(ENGLISH.normalize("Cmaj7"), "Cmaj7")
+        self.assertEqual([ENGLISH.label(c) for c in major_chords], [c.alternative_names[0] for c in major_chords])
+
+    def test_nordic(self):
+        self.assertEqual(NORDIC.normalize("H"), "B")
+        self.assertEqual(NORDIC.normalize("B"), "Bb")
+        self.assertEqual(NORDIC.normalize("hm"), "Bm")
+        self.assertEqual(NORDIC.normalize("Fiss"), "F#")
+        self.assertEqual(NORDIC.normalize("Ess"), "Eb")
+        self.assertEqual(NORDIC.normalize("a-moll"), "Am")
+        self.assertEqual(NORDIC.label(major_chords[5]), "H")
+        self.assertEqual(NORDIC.display("A#/Bb"), "A#/B")
+
+    def test_german(self):
+        self.assertEqual(GERMAN.normalize("Es"), "Eb")
+        self.assertEqual(GERMAN.normalize("As"), "Ab")
+        self.assertEqual(GERMAN.normalize("Cis-Moll"), "C#m")
+
+    def test_solfege(self):
+        self.assertEqual(SOLFEGE.normalize("Do"), "C")
+        self.assertEqual(SOLFEGE.normalize("Mi♭ minore"), "Ebm")
+        self.assertEqual(SOLFEGE.normalize("sol#m"), "G#m")
+        self.assertEqual(SOLFEGE.normalize("Eb"), "Eb")
+        self.assertEqual(SOLFEGE.label(minor_chords[0]), "Lam")
+
+    def test_every_circle_label_reads_back(self):
+        for system in NAMING_SYSTEMS.values():
+            for chord in major_chords + minor_chords:
+                self.assertEqual(system.normalize(system.label(chord)), chord.alternative_names[0])
+
+    def test_lookup(self):
+        self.assertIs(get_naming_system(None), ENGLISH)
+        self.assertIs(get_naming_system("nordic"), NORDIC)
+        with self.assertRaises(ValueError):
+            get_naming_system("klingon")
+        self.assertIs(naming_for_locale(Localization("sv")), NORDIC)
+        self.assertIs(naming_for_locale(Localization("en")), ENGLISH)
+
+    def test_game_core_accepts_local_names(self):
+        core = GameCore(seed=1, naming=NORDIC)
+        core.set_selected_chord_indices([5])
+        core.next_question()
+        expected = "H" if core.chord_type == ChordType.MAJOR else "Giss-moll"
+        self.assertTrue(core.submit_answer(expected))
+        self.assertIs(core.get_state()["naming"], NORDIC)
+
+if __name__ == "__main__":
+    unittest.main()
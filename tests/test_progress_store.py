@@ -0,0 +1,130 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from core.circle import ChordType, CircleOfFifths, QuestionType
+from core.circle_definition import load_circle_file
+from core.game_core import GameCore
+from core.progress_store import ProgressStore
+
+CIRCLES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "circles")
+
+# The tables as written before answers were stored with their circle.
+SCHEMA_WITHOUT_CIRCLE = """
+CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE answers (
+    id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users(id), answered_at REAL NOT NULL,
+    chord_type INTEGER NOT NULL, chord_index INTEGER NOT NULL, question_type INTEGER NOT NULL,
+    correct INTEGER NOT NULL, score REAL NOT NULL, response_ms INTEGER NOT NULL
+);
+CREATE TABLE user_totals (
+    user_id INTEGER PRIMARY KEY REFERENCES users(id), answers INTEGER NOT NULL, correct INTEGER NOT NULL,
+    score REAL NOT NULL
+);
+CREATE TABLE chord_totals (
+    user_id INTEGER NOT NULL REFERENCES users(id), chord_type INTEGER NOT NULL, chord_index INTEGER NOT NULL,
+    question_type INTEGER NOT NULL, answers INTEGER NOT NULL, correct INTEGER NOT NULL, score REAL NOT NULL,
+    response_ms INTEGER NOT NULL, PRIMARY KEY (user_id, chord_type, chord_index, question_type)
+) WITHOUT ROWID;
+INSERT INTO users VALUES (1, 'ann');
+INSERT INTO answers VALUES (1, 1, 0.0, 2, 4, 5, 0, 0.0, 2000);
+INSERT INTO user_totals VALUES (1, 1, 0, 0.0);
+INSERT INTO chord_totals VALUES (1, 2, 4, 5, 1, 0, 0.0, 2000);
+"""
+
+class TestProgressStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "progress.db")
+        self.store = ProgressStore(self.path, flush_interval=0.05)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_leaderboard_orders_by_score(self):
+        for _ in range(3):
+            self.store.record("ann", 0, ChordType.MAJOR, QuestionType.FILL_IN, True, 1.0)
+        self.store.record("bo", 0, ChordType.MAJOR, QuestionType.FILL_IN, False, 2.0, 0.5)
+        self.store.flush()
+        board = self.store.leaderboard()
+        self.assertEqual([row[0] for row in board], ["ann", "bo"])
+        self.assertEqual(board[0][1:], (3.0, 3, 3))
+        self.assertEqual(self.store.totals("bo"), (1, 0, 0.5))
+        self.assertEqual(self.store.totals("nobody"), (0, 0, 0.0))
+
+    def test_weakest_chords(self):
+        self.store.record("ann", 1, ChordType.MAJOR, QuestionType.FILL_IN, True, 1.0)
+        self.store.record("ann", 2, ChordType.MINOR, QuestionType.FILL_IN, False, 3.0)
+        self.store.record("ann", 2, ChordType.MINOR, QuestionType.CLOCKWISE, True, 1.0)
+        self.store.flush()
+        weakest = self.store.weakest_chords("ann")
+        self.assertEqual(weakest[0][:3], (ChordType.MINOR, 2, 2))
+        self.assertAlmostEqual(weakest[0][3], 0.5)
+        self.assertAlmostEqual(weakest[0][4], 2.0)
+        self.assertEqual(self.store.weakest_chords("ann", min_answers=2), weakest[:1])
+
+    def test_weakest_chords_are_kept_per_circle(self):
+        self.store.record("ann", 3, ChordType.MAJOR, QuestionType.FILL_IN, False, 1.0, circle="fourths")
+        self.store.record("ann", 5, ChordType.MAJOR, QuestionType.FILL_IN, False, 1.0)
+        self.store.record("ann", 3, ChordType.MAJOR, QuestionType.FILL_IN, True, 1.0)
+        self.store.flush()
+        self.assertEqual([row[:3] for row in self.store.weakest_chords("ann")],
+                         [(ChordType.MAJOR, 5, 1), (ChordType.MAJOR, 3, 1)])
+        self.assertEqual([row[:3] for row in self.store.weakest_chords("ann", circle="fourths")],
+                         [(ChordType.MAJOR, 3, 1)])
+        self.assertEqual(self.store.totals("ann"), (3, 1, 1.0))
+
+    def test_old_databases_are_migrated(self):
+        path = os.path.join(self.tmp.name, "old.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA_WITHOUT_CIRCLE)
+        conn.close()
+        store = ProgressStore(path, flush_interval=0.05)
+        try:
+            store.record("ann", 4, ChordType.MINOR, QuestionType.CLOCKWISE, True, 1.0)
+            store.flush()
+            self.assertEqual(store.weakest_chords("ann")[0][:3], (ChordType.MINOR, 4, 2))
+            self.assertEqual(store.weakest_chords("ann", circle="fourths"), [])
+            circles = store.conn.execute("SELECT DISTINCT circle FROM answers").fetchall()
+            self.assertEqual(circles, [("fifths",)])
+        finally:
+            store.close()
+        ProgressStore(path).close()
+
+    def test_persists_across_reopen(self):
+        self.store.record("ann", 0, ChordType.MAJOR, QuestionType.FILL_IN, True, 1.0)
+        self.store.close()
+        self.store = ProgressStore(self.path)
+        self.assertEqual(self.store.totals("ann"), (1, 1, 1.0))
+
+    def test_batches_large_backlogs(self):
+        store = self.store
+        store.batch_size = 7
+        for i in range(50):
+            store.record(f"user{i % 4}", i % 12, ChordType.MAJOR, QuestionType.FILL_IN, i % 2 == 0, 0.5)
+        store.flush()
+        self.assertEqual(store.written, 50)
+        self.assertEqual(sum(row[3] for row in store.leaderboard()), 50)
+
+    def test_game_core_listener(self):
+        core = GameCore(seed=1)
+        core.add_answer_listener(self.store.listener("ann"))
+        core.next_question()
+        core.submit_answer(core.current_chord.alternative_names[0])
+        self.store.flush()
+        self.assertEqual(self.store.totals("ann"), (1, 1, 1.0))
+
+    def test_listener_records_the_circle(self):
+        circle = CircleOfFifths(load_circle_file(os.path.join(CIRCLES, "fourths.json")))
+        core = GameCore(seed=1, circle=circle)
+        core.add_answer_listener(self.store.listener("ann", circle.name))
+        core.next_question()
+        core.submit_answer(core.current_chord.alternative_names[0])
+        self.store.flush()
+        self.assertEqual(self.store.weakest_chords("ann"), [])
+        weakest = self.store.weakest_chords("ann", circle="fourths")
+        self.assertEqual(weakest[0][:3], (core.chord_type, core.current_index, 1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+from itertools import islice
+from core.corpus import CorpusStats, MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE, MOVE_RELATIVE
+from core.progression import (
+    DRILL_MOVES, AliasTable, TransitionModel, default_model, move_target, progressions, walk,
+)
+
+class TestAliasTable(unittest.TestCase):
+    def test_frequencies_follow_weights(self):
+        weights = [1.0, 0.0, 3.0, 6.0]
+        table = AliasTable(weights)
+        rng = random.Random(1)
+        counts = [0] * len(weights)
+        draws = 20000
+        for _ in range(draws):
+            counts[table.sample(rng)] += 1
+        self.assertEqual(counts[1], 0)
+        for count, weight in zip(counts, weights):
+            self.assertAlmostEqual(count / draws, weight / sum(weights), delta=0.02)
+
+    def test_single_outcome(self):
+        table = AliasTable([5])
+        self.assertEqual({table.sample(random.Random(i)) for i in range(10)}, {0})
+
+    def test_invalid_weights(self):
+        for weights in ([], [0, 0], [1, -1]):
+            with self.assertRaises(ValueError):
+                AliasTable(weights)
+
+class TestTransitionModel(unittest.TestCase):
+    def test_move_target(self):
+        self.assertEqual(move_target(0, MOVE_CLOCKWISE), 1)
+        self.assertEqual(move_target(0, MOVE_COUNTERCLOCKWISE), 11)
+        self.assertEqual(move_target(0, MOVE_RELATIVE), 12)
+        self.assertEqual(move_target(12, MOVE_RELATIVE), 0)
+        self.assertEqual(move_target(23, MOVE_CLOCKWISE), 12)
+        self.assertEqual(move_target(2, MOVE_COUNTERCLOCKWISE, circle_size=3), 1)
+
+    def test_hand_specified_weights(self):
+        model = TransitionModel.from_move_weights({MOVE_CLOCKWISE: 1.0})
+        rng = random.Random(0)
+        self.assertEqual(list(islice(walk(model, rng, 0), 3)), [(MOVE_CLOCKWISE, 1), (MOVE_CLOCKWISE, 2), (MOVE_CLOCKWISE, 3)])
+        self.assertIs(default_model(), default_model())
+        with self.assertRaises(ValueError):
+            TransitionModel([[1.0, 1.0, 1.0]], circle_size=3)
+
+    def test_learned_from_corpus(self):
+        stats = CorpusStats.empty()
+        for _ in range(50):
+            stats.add_transition(1, 0)  # G -> C
+        stats.add_transition(0, 1)
+        model = TransitionModel.from_corpus(stats, smoothing=0.0)
+        rng = random.Random(2)
+        self.assertEqual({model.step(1, rng) for _ in range(20)}, {(MOVE_COUNTERCLOCKWISE, 0)})
+        self.assertEqual({model.step(0, rng) for _ in range(20)}, {(MOVE_CLOCKWISE, 1)})
+        # Keys the corpus never left from follow its overall move distribution.
+        moves = {model.step(5, rng)[0] for _ in range(200)}
+        self.assertEqual(moves, {MOVE_CLOCKWISE, MOVE_COUNTERCLOCKWISE})
+
+    def test_progressions_are_lazy_chains(self):
+        model = default_model()
+        stream = progressions(model, random.Random(4), length=5, starts=[0, 12])
+        for keys in islice(stream, 20):
+            self.assertEqual(len(keys), 5)
+            self.assertIn(keys[0], (0, 12))
+            for a, b in zip(keys, keys[1:]):
+                self.assertIn(b, [move_target(a, move) for move in DRILL_MOVES])
+        a = list(islice(progressions(model, random.Random(8)), 3))
+        b = list(islice(progressions(model, random.Random(8)), 3))
+        self.assertEqual(a, b)
+
+if __name__ == "__main__":
+    unittest.main()
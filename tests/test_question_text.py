@@ -0,0 +1,81 @@
+import time
+import unittest
+import pygame
+from config import Config
+from core.circle import CircleOfFifths
+from core.game_core import GameCore
+from core.game_text import generate_question_text
+from core.naming import ENGLISH
+from core.replay import setup_headless
+from localization import Localization
+from ui.question_text import QUESTION_TEXTS_PRERENDERED, QuestionTextPrerenderer, question_state
+
+def wait_for(prerenderer, number, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with prerenderer.lock:
+            if number in prerenderer.ready:
+                return
+        time.sleep(0.005)
+    raise AssertionError(f"question {number} was not rendered")
+
+class TestQuestionTextPrerenderer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        setup_headless()
+
+    def setUp(self):
+        self.loc = Localization("en")
+        self.circle = CircleOfFifths()
+        self.prerenderer = QuestionTextPrerenderer(self.loc, self.circle)
+        self.prerenderer.start()
+        self.core = GameCore(seed=6)
+        self.core.next_question()
+
+    def tearDown(self):
+        self.prerenderer.close()
+
+    def test_prerenders_upcoming_questions(self):
+        upcoming = self.core.upcoming_questions()
+        self.prerenderer.submit(upcoming, ENGLISH)
+        self.prerenderer.submit(upcoming, ENGLISH)
+        self.assertEqual(self.prerenderer.requests.qsize(), len(upcoming))
+        wait_for(self.prerenderer, upcoming[-1].number)
+        first = upcoming[0]
+        text = generate_question_text(
+            question_state(first, ENGLISH), self.loc, self.circle.get_chord_list(first.chord_type)
+        )
+        surface = self.prerenderer.take(first.number)
+        self.assertEqual(surface.get_size(), pygame.font.SysFont(None, Config.FONT_SMALL_SIZE).size(text))
+        self.assertIsNone(self.prerenderer.take(first.number))
+        self.assertEqual(set(self.prerenderer.ready), {q.number for q in upcoming[1:]})
+
+    def test_reloaded_strings_invalidate(self):
+        question = self.core.upcoming_questions()[0]
+        self.prerenderer.submit([question], ENGLISH)
+        wait_for(self.prerenderer, question.number)
+        original = self.loc.strings
+        self.loc.strings = dict(original)
+        try:
+            self.assertIsNone(self.prerenderer.take(question.number))
+        finally:
+            self.loc.strings = original
+
+    def test_game_shows_prerendered_question(self):
+        from core.game import CircleOfFifthsGame
+        game = CircleOfFifthsGame("en", seed=3)
+        try:
+            game.step([])
+            upcoming = game.core.upcoming_questions()[0]
+            wait_for(game.renderer.question_text, upcoming.number)
+            before = QUESTION_TEXTS_PRERENDERED.value
+            game.reset_for_next_question()
+            game.redraw = True
+            game.step([])
+            self.assertEqual(QUESTION_TEXTS_PRERENDERED.value, before + 1)
+            self.assertEqual(game.renderer.question_surface[0], upcoming.number)
+        finally:
+            game.renderer.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import json
+import os
+import unittest
+from collections import Counter
+from enum import Enum
+
+from core.batch import BatchGameCore
+from core.circle import ChordType, CircleOfFifths, QuestionType
+from core.game_core import GameCore
+from core.game_text import generate_question_text, get_feedback_message
+from core.questions import (
+    QUESTION_KINDS, QuestionKind, question_kind, question_type_by_name, question_types,
+    register_question_type,
+)
+from core.stats import StatsTracker
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "locales")
+
+
+class ExtraQuestionType(Enum):
+    TRITONE = 100
+    TWO_STEPS = 101
+
+
+class DummyLoc:
+    def t(self, key, **kwargs):
+        return key
+
+
+class TestRegistry(unittest.TestCase):
+    def test_every_question_type_is_registered_in_order(self):
+        self.assertEqual(question_types(), list(QuestionType))
+        self.assertEqual(question_type_by_name("fill_in"), QuestionType.FILL_IN)
+        self.assertEqual(question_kind(QuestionType.ANY).name, "any")
+
+    def test_localization_keys_exist(self):
+        for lang in ("en", "sv"):
+            with open(os.path.join(LOCALES_DIR, f"{lang}.json"), encoding="utf-8") as f:
+                strings = json.load(f)
+            for kind in QUESTION_KINDS.values():
+                for key in (kind.text_key, kind.correct_key, kind.incorrect_key):
+                    self.assertIn(key, strings, f"{lang}: {key}")
+
+    def test_unknown_types_are_rejected(self):
+        with self.assertRaises(ValueError):
+            question_kind(ExtraQuestionType.TRITONE)
+        with self.assertRaises(ValueError):
+            question_type_by_name("tritone")
+        with self.assertRaises(ValueError):
+            GameCore(seed=1, question_types=[ExtraQuestionType.TRITONE])
+
+    def test_conflicting_registrations_are_rejected(self):
+        fill_in = QUESTION_KINDS[QuestionType.FILL_IN]
+        with self.assertRaises(ValueError):
+            register_question_type(fill_in)
+
+        class Clash(Enum):
+            OTHER = QuestionType.FILL_IN.value
+
+        with self.assertRaises(ValueError):
+            register_question_type(QuestionKind(Clash.OTHER, "q", "c", "i"))
+        with self.assertRaises(ValueError):
+            register_question_type(QuestionKind(ExtraQuestionType.TRITONE, "q", "c", "i", weight=0.0))
+        self.assertNotIn(ExtraQuestionType.TRITONE, QUESTION_KINDS)
+
+
+class TestThirdPartyQuestionType(unittest.TestCase):
+    def setUp(self):
+        self.kind = register_question_type(QuestionKind(
+            ExtraQuestionType.TRITONE,
+            text_key="question_tritone",
+            correct_key="feedback_correct_tritone",
+            incorrect_key="feedback_incorrect_tritone",
+            moves=((False, 6),),
+            weight=9.0,
+        ))
+
+    def tearDown(self):
+        del QUESTION_KINDS[ExtraQuestionType.TRITONE]
+
+    def test_answers_are_checked_through_the_registered_moves(self):
+        circle = CircleOfFifths()
+        c, f_sharp = circle.get_chord(0), circle.get_chord(6)
+        self.assertEqual(circle.get_next_chord(c, ExtraQuestionType.TRITONE), [f_sharp])
+        self.assertTrue(circle.check_answer(f_sharp, c, ExtraQuestionType.TRITONE, ChordType.MAJOR))
+        self.assertEqual(circle.grade_answer(c, c, ExtraQuestionType.TRITONE, ChordType.MAJOR)[0], False)
+
+    def test_answer_sets_are_built_once(self):
+        circle = CircleOfFifths()
+        circle.get_next_chord(circle.get_chord(0), ExtraQuestionType.TRITONE)
+        answers = circle.answer_sets[(ExtraQuestionType.TRITONE, ChordType.MAJOR)]
+        circle.get_next_chord(circle.get_chord(3), ExtraQuestionType.TRITONE)
+        self.assertIs(circle.answer_sets[(ExtraQuestionType.TRITONE, ChordType.MAJOR)], answers)
+
+    def test_text_uses_the_registered_keys(self):
+        circle = CircleOfFifths()
+        state = {
+            "current_chord": circle.get_chord(0),
+            "chord_type": ChordType.MAJOR,
+            "current_question": ExtraQuestionType.TRITONE,
+            "last_result": {"correct": False, "answer": circle.get_chord(1)},
+        }
+        self.assertEqual(generate_question_text(state, DummyLoc(), circle.major_chords), "question_tritone")
+        self.assertEqual(get_feedback_message(state, DummyLoc()), "feedback_incorrect_tritone")
+
+    def test_weights_set_the_question_mix(self):
+        core = GameCore(seed=3, question_types=[QuestionType.FILL_IN, ExtraQuestionType.TRITONE])
+        counts = Counter()
+        for _ in range(500):
+            core.next_question()
+            counts[core.current_question] += 1
+        self.assertGreater(counts[ExtraQuestionType.TRITONE], 6 * counts[QuestionType.FILL_IN])
+        self.assertGreater(counts[QuestionType.FILL_IN], 0)
+
+    def test_batch_engine_draws_the_weighted_mix(self):
+        engine = BatchGameCore(sessions=2000, seed=3, question_types=[QuestionType.FILL_IN, ExtraQuestionType.TRITONE])
+        engine.next_questions()
+        counts = Counter(engine.current_question.tolist())
+        self.assertGreater(counts[1], 6 * counts[0])
+        self.assertGreater(counts[0], 0)
+
+    def test_game_and_stats_accept_the_type(self):
+        core = GameCore(seed=5, question_types=[ExtraQuestionType.TRITONE])
+        core.next_question()
+        expected = core.circle.get_next_chord(core.current_chord, ExtraQuestionType.TRITONE, core.chord_type)[0]
+        self.assertTrue(core.submit_answer(expected.name.split("/")[0]))
+        self.assertIn(ExtraQuestionType.TRITONE, StatsTracker().question_types)
+        BatchGameCore(sessions=2, seed=1, question_types=[ExtraQuestionType.TRITONE])
+
+
+def interval_detail(core, chord_type, index):
+    return chord_type, index, {"semitones": core.rng.choice([3, 4, 7])}
+
+
+def check_interval(core, answer):
+    correct = answer == str(core.question_detail["semitones"])
+    return correct, 1.0 if correct else 0.0, {"correct": correct, "answer": answer}
+
+
+class TestQuestionTypeHooks(unittest.TestCase):
+    def setUp(self):
+        register_question_type(QuestionKind(
+            ExtraQuestionType.TWO_STEPS,
+            text_key="question_interval",
+            correct_key="feedback_correct_interval",
+            incorrect_key="feedback_incorrect_interval",
+            detail=interval_detail,
+            check=check_interval,
+        ))
+
+    def tearDown(self):
+        del QUESTION_KINDS[ExtraQuestionType.TWO_STEPS]
+
+    def test_detail_and_check_hooks_ask_and_grade(self):
+        core = GameCore(seed=2, question_types=[ExtraQuestionType.TWO_STEPS])
+        core.next_question()
+        semitones = core.question_detail["semitones"]
+        self.assertIn(semitones, (3, 4, 7))
+        self.assertTrue(core.submit_answer(str(semitones)))
+        self.assertEqual(core.last_result["score"], 1.0)
+        core.next_question()
+        self.assertFalse(core.submit_answer("C"))
+        self.assertEqual(core.stats.attempts[core.stats.key(core.current_index, core.chord_type, ExtraQuestionType.TWO_STEPS)], 1)
+
+    def test_batch_engine_rejects_checked_types(self):
+        with self.assertRaises(ValueError):
+            BatchGameCore(sessions=1, question_types=[ExtraQuestionType.TWO_STEPS])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import pygame
+from core.chord_lists import major_chords, minor_chords
+from core.circle import ChordType
+from core.replay import setup_headless
+from ui.render import LAYER_CACHE_SIZE, CircleOfFifthsDrawable, quantize_rotation
+
+class TestRenderCaches(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        setup_headless()
+
+    def setUp(self):
+        self.drawable = CircleOfFifthsDrawable(major_chords, minor_chords)
+
+    def test_quantize_rotation(self):
+        self.assertEqual(quantize_rotation(29.6), 30)
+        self.assertEqual(quantize_rotation(-0.2), 0)
+        self.assertEqual(quantize_rotation(359.7), 0)
+
+    def test_circle_layer_reused_per_rotation(self):
+        layer, _ = self.drawable._circle_layer([0, 1], 0.0)
+        self.assertIs(self.drawable._circle_layer([0, 1], 0.0)[0], layer)
+        self.assertIsNot(self.drawable._circle_layer([0, 1], 15.0)[0], layer)
+
+    def test_circle_layer_keyed_by_selection(self):
+        layer, _ = self.drawable._circle_layer([0, 1], 0.0)
+        # The selection is a set: order does not matter, contents do.
+        self.assertIs(self.drawable._circle_layer([1, 0], 0.0)[0], layer)
+        other, _ = self.drawable._circle_layer([0, 2], 0.0)
+        self.assertIsNot(other, layer)
+        self.assertNotEqual(pygame.image.tobytes(other, "RGB"), pygame.image.tobytes(layer, "RGB"))
+
+    def test_layer_cache_evicts_least_recently_used(self):
+        first, _ = self.drawable._circle_layer([], 0.0)
+        for rotation in range(1, LAYER_CACHE_SIZE + 1):
+            self.drawable._circle_layer([], float(rotation))
+        self.assertEqual(len(self.drawable.layer_cache), LAYER_CACHE_SIZE)
+        self.assertIsNot(self.drawable._circle_layer([], 0.0)[0], first)
+
+    def test_set_center_invalidates(self):
+        layer, origin = self.drawable._circle_layer([0], 0.0)
+        self.drawable.set_center((300, 300))
+        moved, moved_origin = self.drawable._circle_layer([0], 0.0)
+        self.assertIsNot(moved, layer)
+        self.assertEqual(moved_origin[0] - origin[0], -100)
+
+    def test_label_layout(self):
+        self.assertIs(self.drawable._label_layout(0.0), self.drawable.label_sprites)
+        layout = self.drawable._label_layout(10.0)
+        self.assertIs(self.drawable._label_layout(10.0), layout)
+        # Labels reuse the rendered text and only move.
+        self.assertIs(layout[0][0], self.drawable.label_sprites[0][0])
+        self.assertNotEqual(layout[0][1], self.drawable.label_sprites[0][1])
+
+    def test_segment_sprites_reused_at_segment_angles(self):
+        sprites = self.drawable.segments_sprites
+        self.assertIs(self.drawable._segment_sprite(2, ChordType.MAJOR, 30.0), sprites[3])
+        self.assertIs(self.drawable._segment_sprite(11, ChordType.MINOR, 60.0), self.drawable.inner_segments_sprites[1])
+        sprite = self.drawable._segment_sprite(2, ChordType.MAJOR, 10.0)
+        self.assertIs(self.drawable._segment_sprite(2, ChordType.MAJOR, 10.0), sprite)
+        self.assertNotIn(sprite, sprites)
+
+    def test_cached_layer_matches_fresh_draw(self):
+        cached = pygame.Surface((800, 600))
+        self.drawable.draw_circle(cached, [0, 5], 45.0)
+        self.drawable.draw_circle(cached, [0, 5], 45.0)
+        fresh = pygame.Surface((800, 600))
+        CircleOfFifthsDrawable(major_chords, minor_chords).draw_circle(fresh, [0, 5], 45.0)
+        self.assertEqual(pygame.image.tobytes(cached, "RGB"), pygame.image.tobytes(fresh, "RGB"))
+
+if __name__ == "__main__":
+    unittest.main()
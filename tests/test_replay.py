@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+import pygame
+from core.circle import CircleOfFifths, QuestionType
+from core.circle_definition import load_compiled_circle, read_circle_definition
+from core.corpus import MOVE_CLOCKWISE, MOVE_RELATIVE
+from core.naming import NORDIC
+from core.progression import TransitionModel
+from core.replay import (
+    InputRecorder, encode_event, decode_event, game_config, load_recording, replay, setup_headless, percentile
+)
+from core.game import CircleOfFifthsGame
+
+FOURTHS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "circles", "fourths.json")
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+class TestReplay(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        setup_headless()
+
+    def key(self, key, unicode=""):
+        return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0)
+
+    def test_encode_decode_roundtrip(self):
+        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 20))
+        decoded = decode_event(encode_event(event, 5))
+        self.assertEqual(decoded.type, pygame.MOUSEBUTTONDOWN)
+        self.assertEqual(decoded.pos, (10, 20))
+        self.assertIsNone(encode_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0)), 0))
+
+    def test_same_seed_same_questions(self):
+        a = CircleOfFifthsGame("en", seed=42)
+        b = CircleOfFifthsGame("en", seed=42)
+        for _ in range(5):
+            self.assertEqual(a.core.current_chord, b.core.current_chord)
+            a.reset_for_next_question()
+            b.reset_for_next_question()
+
+    def test_record_and_replay_reproduces_final_state(self):
+        clock = FakeClock()
+        recorder = InputRecorder(seed=7, clock=clock)
+        game = CircleOfFifthsGame("en", seed=recorder.seed, recorder=recorder)
+        answer = game.core.current_chord.alternative_names[0]
+        for ch in answer:
+            clock.now += 0.1
+            game.step([self.key(ord(ch.lower()), ch)])
+        clock.now += 0.1
+        game.step([self.key(pygame.K_RETURN)])
+        clock.now += 0.1
+        game.step([self.key(pygame.K_RETURN)])
+        clock.now += 0.1
+        game.step([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(400, 180))])
+        self.assertEqual(game.core.get_stats(), (1, 1))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.rec")
+            recorder.save(path, game)
+            recording = load_recording(path)
+
+        result = replay(recording)
+        self.assertTrue(result.matched, result.mismatches)
+        self.assertEqual(result.final["stats"], [1, 1])
+        self.assertEqual(len(result.frame_times), result.frames)
+
+    def test_recording_restores_the_game_configuration(self):
+        definition = read_circle_definition(FOURTHS)
+        circle = CircleOfFifths(load_compiled_circle(definition))
+        model = TransitionModel.from_move_weights({MOVE_CLOCKWISE: 1.0, MOVE_RELATIVE: 5.0}, circle.size)
+        question_types = [QuestionType.CLOCKWISE, QuestionType.PROGRESSION]
+        config = game_config(question_types, True, NORDIC, definition, FOURTHS, "flat_keys", model, ["songs/"])
+        clock = FakeClock()
+        recorder = InputRecorder(seed=11, clock=clock, config=config)
+        game = CircleOfFifthsGame("en", seed=recorder.seed, recorder=recorder, clock=clock, rotate=True,
+                                  question_types=question_types, naming=NORDIC, circle=circle,
+                                  progression_model=model)
+        game.core.use_practice_set("flat_keys")
+        game.reset_for_next_question()
+        for _ in range(6):
+            core = game.core
+            expected = (core.question_detail or {}).get("expected")
+            if expected is None:
+                expected = core.circle.get_next_chord(core.current_chord, core.current_question, core.chord_type)[0].name
+            for ch in core.naming.display(expected.split("/")[0]) + "\r\r":
+                clock.now += 0.1
+                game.step([self.key(pygame.K_RETURN if ch == "\r" else ord(ch.lower()), ch)])
+        self.assertEqual(game.core.get_stats(), (6, 6))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.rec")
+            recorder.save(path, game)
+            recording = load_recording(path)
+
+        self.assertEqual(recording["version"], 2)
+        self.assertEqual(recording["config"]["questions"], ["clockwise", "progression"])
+        self.assertEqual(recording["config"]["circle_path"], FOURTHS)
+        self.assertEqual(recording["config"]["circle_digest"], definition.digest())
+        result = replay(recording)
+        self.assertTrue(result.matched, result.mismatches)
+        self.assertEqual(result.final["selected_chord_indices"], [0, 1, 2, 3, 4, 5])
+        default = replay(recording, game_factory=lambda lang, seed: CircleOfFifthsGame(lang, seed=seed))
+        self.assertFalse(default.matched)
+
+    def test_version_1_recordings_replay_with_defaults(self):
+        recorder = InputRecorder(seed=3, clock=FakeClock())
+        game = CircleOfFifthsGame("en", seed=recorder.seed, recorder=recorder)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.rec")
+            recorder.save(path, game)
+            recording = load_recording(path)
+        recording["version"] = 1
+        del recording["config"]
+        self.assertTrue(replay(recording).matched)
+
+    def test_quit_stops_game(self):
+        game = CircleOfFifthsGame("en", seed=1)
+        game.step([self.key(pygame.K_ESCAPE)])
+        self.assertFalse(game.running)
+
+    def test_idle_loop_sleeps_until_animation_deadline(self):
+        now = [0.0]
+        game = CircleOfFifthsGame("en", seed=1, clock=lambda: now[0])
+        game.step([])
+        # The chord highlight next blinks after BLINK_SECONDS, capped by MAX_IDLE_MS.
+        self.assertEqual(game.idle_ms(), 250)
+        now[0] = 0.4
+        self.assertEqual(game.idle_ms(), 100)
+        now[0] = 0.5
+        game.step([])
+        self.assertTrue(game.blink.on)
+        self.assertIsInstance(game.wait_for_events(0), list)
+
+    def test_percentile(self):
+        self.assertEqual(percentile([], 50), 0.0)
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2)
+        self.assertEqual(percentile([1, 2, 3, 4], 100), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from core.rotation import RotationAnimator, rotation_for_index
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+class TestRotation(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.animator = RotationAnimator(duration=1.0, clock=self.clock)
+
+    def test_rotation_for_index(self):
+        self.assertEqual(rotation_for_index(0), 0)
+        self.assertEqual(rotation_for_index(1), 330)
+        self.assertEqual(rotation_for_index(6), 180)
+
+    def test_animates_to_target(self):
+        self.animator.rotate_to(90)
+        self.assertTrue(self.animator.animating)
+        self.clock.now = 0.5
+        midway = self.animator.update()
+        self.assertGreater(midway, 45)
+        self.assertLess(midway, 90)
+        self.clock.now = 1.0
+        self.assertEqual(self.animator.update(), 90)
+        self.assertFalse(self.animator.animating)
+
+    def test_takes_shorter_way_round(self):
+        self.animator.snap_to(30)
+        self.animator.rotate_to(330)
+        self.clock.now = 0.5
+        angle = self.animator.update()
+        self.assertTrue(angle < 30 or angle > 330)
+        self.clock.now = 2.0
+        self.assertEqual(self.animator.update(), 330)
+
+    def test_retarget_mid_animation_starts_from_current_angle(self):
+        self.animator.rotate_to(90)
+        self.clock.now = 0.5
+        current = self.animator.update()
+        self.animator.rotate_to(0)
+        self.assertEqual(self.animator.update(), current)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zlib
+import pygame
+from core.replay import setup_headless
+from ui.screen_recorder import ScreenRecorder, is_animation_path
+
+def read_chunks(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    chunks, pos = [], 8
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        chunks.append((kind, data[pos + 8:pos + 8 + length]))
+        pos += 12 + length
+    return chunks
+
+class TestScreenRecorder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        setup_headless()
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.frame = pygame.Surface((4, 3))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_is_animation_path(self):
+        self.assertTrue(is_animation_path("session.png"))
+        self.assertTrue(is_animation_path("session.APNG"))
+        self.assertFalse(is_animation_path("frames"))
+
+    def test_animated_png(self):
+        path = os.path.join(self.dir, "session.png")
+        recorder = ScreenRecorder(path, (4, 3), capacity=2)
+        recorder.start()
+        for i, color in enumerate([(255, 0, 0), (0, 255, 0), (0, 0, 255)]):
+            self.frame.fill(color)
+            while not recorder.capture(self.frame, timestamp=i * 0.5):
+                pass
+        recorder.close()
+        chunks = read_chunks(path)
+        kinds = [kind for kind, _ in chunks]
+        self.assertEqual(kinds[:2], [b"IHDR", b"acTL"])
+        self.assertEqual(struct.unpack(">II", chunks[1][1]), (3, 0))
+        self.assertEqual(kinds.count(b"fcTL"), 3)
+        self.assertEqual(kinds.count(b"fdAT"), 2)
+        self.assertEqual(kinds[-1], b"IEND")
+        first_delay = struct.unpack(">IIIIIHHBB", chunks[2][1])[5]
+        self.assertEqual(first_delay, 500)
+        pixels = zlib.decompress(dict(chunks)[b"IDAT"])
+        self.assertEqual(pixels[:4], b"\x00\xff\x00\x00")
+        # The loaded image is the first frame.
+        self.assertEqual(pygame.image.load(path).get_at((0, 0))[:3], (255, 0, 0))
+
+    def test_png_sequence(self):
+        out = os.path.join(self.dir, "frames")
+        recorder = ScreenRecorder(out, (4, 3), capacity=4)
+        recorder.start()
+        for i in range(3):
+            recorder.capture(self.frame, timestamp=1.0 + i)
+        recorder.close()
+        self.assertEqual(recorder.written, 3)
+        self.assertTrue(os.path.exists(os.path.join(out, "frame_00002.png")))
+        with open(os.path.join(out, "frames.txt"), encoding="utf-8") as f:
+            self.assertEqual(f.read().split(), ["frame_00000.png", "0.000", "frame_00001.png", "1.000",
+                                                "frame_00002.png", "2.000"])
+
+    def test_drops_frames_when_buffers_are_full(self):
+        recorder = ScreenRecorder(os.path.join(self.dir, "frames"), (4, 3), capacity=2)
+        results = [recorder.capture(self.frame, timestamp=i) for i in range(3)]
+        self.assertEqual(results, [True, True, False])
+        self.assertEqual((recorder.recorded, recorder.dropped), (2, 1))
+        recorder.start()
+        recorder.close()
+        self.assertEqual(recorder.written, 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tracemalloc
+import unittest
+
+from config import Config
+from core.collision import get_chord_index
+from core.game import CircleOfFifthsGame
+from core.replay import setup_headless
+from core.soak import soak, wedge_position
+
+LEAKED = []
+
+
+class LeakyGame(CircleOfFifthsGame):
+    def step(self, events=None):
+        LEAKED.append(bytearray(1000))
+        super().step(events)
+
+
+class TestSoak(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        setup_headless()
+
+    def tearDown(self):
+        LEAKED.clear()
+
+    def test_short_run_passes_and_plays(self):
+        games = []
+
+        def factory(lang, seed, clock):
+            games.append(CircleOfFifthsGame(lang, seed=seed, clock=clock))
+            return games[0]
+
+        result = soak(600, sample_every=200, warmup_frames=200, max_growth_bytes=1 << 20,
+                      max_p99_drift=1000.0, game_factory=factory)
+        self.assertTrue(result.passed, result.failures)
+        self.assertEqual(result.frames, 600)
+        self.assertEqual([sample.frame for sample in result.samples], [200, 400, 600])
+        core = games[0].core
+        self.assertGreater(result.questions, 5)
+        self.assertGreater(core.correct_answers, 0)
+        self.assertLess(core.correct_answers, core.total_questions)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_leak_is_reported_by_allocation_site(self):
+        factory = lambda lang, seed, clock: LeakyGame(lang, seed=seed, clock=clock)
+        result = soak(400, sample_every=200, warmup_frames=100, max_growth_bytes=50_000,
+                      max_p99_drift=1000.0, game_factory=factory)
+        self.assertFalse(result.passed)
+        self.assertIn("memory grew", result.failures[0])
+        self.assertGreater(result.memory_growth, 200_000)
+        sites = [os.path.basename(stat.traceback[0].filename) for stat in result.growth]
+        self.assertIn("test_soak.py", sites)
+
+    def test_frame_time_drift_fails(self):
+        result = soak(300, sample_every=100, warmup_frames=100, max_p99_drift=0.0)
+        self.assertFalse(result.passed)
+        self.assertIn("p99 frame time", result.failures[-1])
+
+    def test_run_must_outlast_warmup(self):
+        with self.assertRaises(ValueError):
+            soak(100, sample_every=100, warmup_frames=50)
+
+    def test_wedge_position_hits_the_wedge(self):
+        for rotation in (0.0, 75.0):
+            for index in range(12):
+                pos = wedge_position(index, 12, rotation)
+                self.assertEqual(get_chord_index(Config.CIRCLE_CENTER, pos, rotation, 12), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from core.stats import (
+    LogHistogram, StatsTracker, bucket_index, bucket_upper_bound, NUM_BUCKETS, MIN_SECONDS
+)
+from core.circle import ChordType, QuestionType
+
+class TestLogHistogram(unittest.TestCase):
+    def test_bucket_bounds_contain_value(self):
+        for seconds in (0.001, 0.0137, 0.25, 1.0, 2.5, 9.9, 60.0):
+            index = bucket_index(seconds)
+            self.assertLessEqual(seconds, bucket_upper_bound(index))
+            if index > 0:
+                self.assertGreater(seconds, bucket_upper_bound(index - 1) * 0.999)
+
+    def test_bucket_index_clamps(self):
+        self.assertEqual(bucket_index(0.0), 0)
+        self.assertEqual(bucket_index(MIN_SECONDS / 10), 0)
+        self.assertEqual(bucket_index(1e9), NUM_BUCKETS - 1)
+
+    def test_percentile_and_mean(self):
+        h = LogHistogram()
+        self.assertEqual(h.percentile(50), 0.0)
+        for seconds in [1.0] * 9 + [10.0]:
+            h.record(seconds)
+        self.assertAlmostEqual(h.mean(), 1.9)
+        self.assertLess(h.percentile(50), 1.3)
+        self.assertGreaterEqual(h.percentile(100), 10.0)
+        self.assertEqual(len(h.counts), NUM_BUCKETS)
+
+    def test_merge(self):
+        a, b = LogHistogram(), LogHistogram()
+        a.record(0.5)
+        b.record(2.0)
+        a.merge(b)
+        self.assertEqual(a.total, 2)
+        self.assertAlmostEqual(a.sum, 2.5)
+
+class TestStatsTracker(unittest.TestCase):
+    def test_record_and_aggregate(self):
+        stats = StatsTracker()
+        stats.record(0, ChordType.MAJOR, QuestionType.FILL_IN, True, 1.0)
+        stats.record(0, ChordType.MAJOR, QuestionType.FILL_IN, False, 3.0)
+        stats.record(5, ChordType.MINOR, QuestionType.CLOCKWISE, True, 2.0)
+        self.assertEqual(stats.accuracy(0, ChordType.MAJOR, QuestionType.FILL_IN), (1, 2))
+        self.assertEqual(stats.accuracy(chord_type=ChordType.MINOR), (1, 1))
+        self.assertEqual(stats.accuracy(), (2, 3))
+        self.assertAlmostEqual(stats.mean_response_time(0), 2.0)
+        self.assertEqual(stats.histogram(0).total, 2)
+        self.assertEqual(stats.version, 3)
+
+    def test_record_does_not_grow(self):
+        stats = StatsTracker()
+        self.assertEqual(len(stats.histograms), 0)
+        for i in range(1000):
+            stats.record(i % 12, ChordType.MAJOR, QuestionType.FILL_IN, True, i / 100)
+        self.assertEqual(len(stats.histograms), 12)
+        for i in range(1000):
+            stats.record(i % 12, ChordType.MAJOR, QuestionType.FILL_IN, False, i / 100)
+        self.assertEqual(len(stats.histograms), 12)
+        self.assertEqual(stats.histogram(3, ChordType.MAJOR, QuestionType.FILL_IN).total, 168)
+        self.assertEqual(sum(stats.histogram(3, ChordType.MAJOR, QuestionType.FILL_IN).counts), 168)
+
+    def test_merge(self):
+        a, b = StatsTracker(), StatsTracker()
+        a.record(1, ChordType.MAJOR, QuestionType.FILL_IN, True, 1.0)
+        b.record(1, ChordType.MAJOR, QuestionType.FILL_IN, False, 1.0)
+        b.record(2, ChordType.MINOR, QuestionType.FILL_IN, True, 2.0)
+        a.merge(b)
+        self.assertEqual(a.accuracy(1), (1, 2))
+        self.assertEqual(sum(a.histogram(1).counts), 2)
+        self.assertEqual(sum(a.histogram(2).counts), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.chord import Chord
+from core.circle import ChordType
+from core.synth import chord_pitches, synthesize, WaveformBank
+
+class TestSynth(unittest.TestCase):
+    def test_chord_pitches(self):
+        self.assertEqual(chord_pitches(Chord("C"), ChordType.MAJOR), [60, 64, 67])
+        self.assertEqual(chord_pitches(Chord("Am"), ChordType.MINOR), [69, 72, 76])
+        self.assertEqual(chord_pitches(Chord("F#m/Gbm"), ChordType.MINOR), [66, 69, 73])
+        self.assertEqual(chord_pitches(Chord("C"), ChordType.MAJOR, "first_inversion"), [64, 67, 72])
+
+    def test_chord_pitches_follow_the_chord_symbol(self):
+        self.assertEqual(chord_pitches(Chord("Cmaj7"), ChordType.MAJOR), [60, 64, 67, 71])
+        self.assertEqual(chord_pitches(Chord("Am7"), ChordType.MINOR), [69, 72, 76, 79])
+        self.assertEqual(chord_pitches(Chord("Csus4"), ChordType.MAJOR), [60, 65, 67])
+        self.assertEqual(chord_pitches(Chord("Cmaj7"), ChordType.MAJOR, "open"), [48, 55, 64, 71])
+        self.assertEqual(chord_pitches(Chord("C5"), ChordType.MAJOR), [60, 64, 67])
+
+    def test_synthesize_format(self):
+        pcm = synthesize([60, 64, 67], "organ", duration=0.1, sample_rate=8000, channels=2)
+        self.assertEqual(pcm.dtype, np.int16)
+        self.assertEqual(pcm.shape, (800, 2))
+        self.assertTrue(pcm.flags["C_CONTIGUOUS"])
+        self.assertGreater(np.abs(pcm).max(), 20000)
+        mono = synthesize([60], "sine", duration=0.1, sample_rate=8000, channels=1)
+        self.assertEqual(mono.shape, (800,))
+
+    def test_bank_caches_in_memory_and_on_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            bank = WaveformBank(8000, 1, 0.05, cache_dir=tmp)
+            first = bank.get(Chord("G"), ChordType.MAJOR)
+            self.assertIs(bank.get(Chord("G"), ChordType.MAJOR), first)
+            self.assertEqual(len(os.listdir(tmp)), 1)
+            self.assertIsNot(bank.get(Chord("G7"), ChordType.MAJOR), first)
+            self.assertEqual(len(os.listdir(tmp)), 2)
+            reloaded = WaveformBank(8000, 1, 0.05, cache_dir=tmp).get(Chord("G"), ChordType.MAJOR)
+            np.testing.assert_array_equal(reloaded, first)
+
+    def test_bank_keys_include_the_chord_tones(self):
+        bank = WaveformBank(8000, 1, 0.05)
+        bank.get(Chord("Cmaj7"), ChordType.MAJOR)
+        bank.get(Chord("C"), ChordType.MAJOR)
+        self.assertEqual(len(bank.waveforms), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+import unittest
+from core.game_core import GameCore
+from ui.terminal import TerminalFrame, TerminalRenderer, diff_frames, STYLE_HIGHLIGHT
+
+class FakeScreen:
+    def __init__(self, width=80, height=30):
+        self.width = width
+        self.height = height
+        self.writes = []
+    def getmaxyx(self):
+        return self.height, self.width
+    def addstr(self, y, x, text, attr=0):
+        self.writes.append((y, x, text))
+    def move(self, y, x):
+        pass
+    def refresh(self):
+        pass
+
+class TestTerminal(unittest.TestCase):
+    def setUp(self):
+        self.core = GameCore(seed=3)
+        self.core.next_question()
+        self.screen = FakeScreen()
+        self.renderer = TerminalRenderer(self.screen)
+
+    def state(self, game_state="ACTIVE"):
+        state = self.core.get_state()
+        state["game_state"] = game_state
+        state["chord_list"] = self.core.get_chord_list(state["chord_type"])
+        state["stats"] = self.core.get_stats()
+        return state
+
+    def test_diff_identical_frames_is_empty(self):
+        a = TerminalFrame(10, 3)
+        b = TerminalFrame(10, 3)
+        a.put(1, 2, "abc")
+        b.put(1, 2, "abc")
+        self.assertEqual(diff_frames(a, b), [])
+
+    def test_diff_merges_adjacent_cells(self):
+        a = TerminalFrame(10, 3)
+        b = TerminalFrame(10, 3)
+        b.put(1, 2, "abc")
+        self.assertEqual(diff_frames(a, b), [(1, 2, "abc", 0)])
+        self.assertEqual(len(diff_frames(None, b)), 3)
+
+    def test_keystroke_writes_only_changed_cells(self):
+        self.renderer.render(self.state(), "", False)
+        first = sum(len(text) for _, _, text in self.screen.writes)
+        self.screen.writes.clear()
+        self.renderer.render(self.state(), "C", False)
+        self.assertEqual(self.screen.writes, [(2, 2, "C")])
+        self.assertLess(1, first)
+
+    def test_blink_hides_highlight(self):
+        frame = self.renderer.compose(self.state(), "", False, 80, 30)
+        blinked = self.renderer.compose(self.state(), "", True, 80, 30)
+        count = lambda f: sum(row.count(STYLE_HIGHLIGHT) for row in f.styles)
+        self.assertGreater(count(frame), 0)
+        self.assertEqual(count(blinked), 0)
+
+    def test_labels_shown_when_inactive(self):
+        frame = self.renderer.compose(self.state("INACTIVE"), "", False, 80, 30)
+        text = "\n".join("".join(row) for row in frame.chars)
+        self.assertIn("Am", text)
+
+    def test_does_not_import_pygame(self):
+        code = "import sys, ui.terminal; sys.exit('pygame' in sys.modules)"
+        self.assertEqual(subprocess.call([sys.executable, "-c", code]), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from core.theory import (
+    DEGREE_CHORD_NAMES, KEY_SIGNATURES, KEY_TONICS, SIGNATURE_KEYS, ASKABLE_DEGREES,
+    check_degree_answer, check_signature_answer, degree_numeral, parse_signature, spell_scale,
+    tonic_for_signature
+)
+
+class TestTheory(unittest.TestCase):
+    def test_tonic_for_signature(self):
+        self.assertEqual(tonic_for_signature(0, False), "C")
+        self.assertEqual(tonic_for_signature(-3, False), "Eb")
+        self.assertEqual(tonic_for_signature(-3, True), "C")
+        self.assertEqual(tonic_for_signature(6, False), "F#")
+        self.assertEqual(tonic_for_signature(-7, False), "Cb")
+
+    def test_spell_scale(self):
+        self.assertEqual(spell_scale("F#", False), ["F#", "G#", "A#", "B", "C#", "D#", "E#"])
+        self.assertEqual(spell_scale("Bb", False), ["Bb", "C", "D", "Eb", "F", "G", "A"])
+        self.assertEqual(spell_scale("C", True), ["C", "D", "Eb", "F", "G", "Ab", "Bb"])
+
+    def test_key_signatures(self):
+        self.assertEqual(KEY_SIGNATURES[0], (0,))
+        self.assertEqual(KEY_SIGNATURES[6], (6, -6))   # F#/Gb
+        self.assertEqual(KEY_SIGNATURES[7], (-5, 7))   # Db preferred over C#
+        self.assertEqual(KEY_TONICS[7], "Db")
+        self.assertEqual(SIGNATURE_KEYS[(-3, False)], 9)  # Eb major
+        self.assertEqual(SIGNATURE_KEYS[(-3, True)], 21)  # C minor
+
+    def test_degrees(self):
+        d_major = 2
+        self.assertEqual(DEGREE_CHORD_NAMES[d_major][4], "A")
+        bb_major = 10
+        self.assertEqual(DEGREE_CHORD_NAMES[bb_major][1], "Cm")
+        self.assertEqual(degree_numeral(bb_major, 1), "ii")
+        self.assertEqual(degree_numeral(12, 3), "iv")
+        self.assertNotIn(6, ASKABLE_DEGREES[0])
+
+    def test_check_degree_answer_accepts_enharmonics(self):
+        self.assertTrue(check_degree_answer("A", 2, 4))
+        self.assertTrue(check_degree_answer("Cmin", 10, 1))
+        self.assertFalse(check_degree_answer("A#", 6, 2))
+        self.assertTrue(check_degree_answer("Bbm", 6, 2))  # A#m spelled as Bbm
+        self.assertFalse(check_degree_answer("not a chord", 0, 0))
+
+    def test_parse_signature(self):
+        self.assertEqual(parse_signature("3b"), -3)
+        self.assertEqual(parse_signature("2 #"), 2)
+        self.assertEqual(parse_signature("1 sharp"), 1)
+        self.assertEqual(parse_signature("4 flats"), -4)
+        self.assertEqual(parse_signature("0"), 0)
+        self.assertIsNone(parse_signature("3"))
+        self.assertIsNone(parse_signature("9#"))
+        self.assertTrue(check_signature_answer("6b", 6))
+        self.assertTrue(check_signature_answer("6#", 6))
+        self.assertFalse(check_signature_answer("5#", 6))
+
+if __name__ == "__main__":
+    unittest.main()
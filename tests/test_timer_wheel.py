@@ -0,0 +1,96 @@
+import unittest
+from core.timer_wheel import LEVELS, OVERFLOW, SLOT_BITS, TimerWheel
+
+class TestTimerWheel(unittest.TestCase):
+    def setUp(self):
+        self.wheel = TimerWheel(tick_seconds=0.01)
+        self.fired = []
+
+    def schedule(self, when, name):
+        return self.wheel.schedule_at(when, lambda: self.fired.append(name))
+
+    def test_fires_in_order(self):
+        self.schedule(0.30, "c")
+        self.schedule(0.10, "a")
+        self.schedule(0.20, "b")
+        self.assertEqual(self.wheel.advance(0.25), 2)
+        self.assertEqual(self.fired, ["a", "b"])
+        self.wheel.advance(0.30)
+        self.assertEqual(self.fired, ["a", "b", "c"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_never_fires_early(self):
+        self.schedule(0.105, "a")
+        self.wheel.advance(0.10)
+        self.assertEqual(self.fired, [])
+        self.wheel.advance(0.11)
+        self.assertEqual(self.fired, ["a"])
+
+    def test_past_time_fires_on_next_tick(self):
+        self.wheel.advance(1.0)
+        self.schedule(0.5, "late")
+        self.wheel.advance(1.01)
+        self.assertEqual(self.fired, ["late"])
+
+    def test_cancel(self):
+        timer = self.schedule(0.1, "a")
+        self.wheel.cancel(timer)
+        self.assertFalse(timer.pending)
+        self.wheel.cancel(timer)
+        self.wheel.advance(1.0)
+        self.assertEqual(self.fired, [])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_callback_cancels_timer_in_same_tick(self):
+        # Timers of one tick fire in the order they were scheduled.
+        handle = {}
+        self.wheel.schedule_at(0.1, lambda: self.wheel.cancel(handle["second"]))
+        handle["second"] = self.schedule(0.1, "b")
+        self.wheel.advance(0.1)
+        self.assertEqual(self.fired, [])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_cascades_from_higher_levels(self):
+        far = (1 << (2 * SLOT_BITS)) * 0.01 + 0.05
+        timer = self.schedule(far, "far")
+        self.assertEqual(timer.level, 2)
+        self.wheel.advance(far - 0.01)
+        self.assertEqual(self.fired, [])
+        self.wheel.advance(far)
+        self.assertEqual(self.fired, ["far"])
+
+    def test_overflow(self):
+        beyond = (1 << (LEVELS * SLOT_BITS)) * 0.01 + 1.0
+        timer = self.schedule(beyond, "beyond")
+        self.assertEqual(timer.level, OVERFLOW)
+        self.wheel.advance(beyond)
+        self.assertEqual(self.fired, ["beyond"])
+
+    def test_next_deadline(self):
+        self.assertIsNone(self.wheel.next_deadline())
+        self.schedule(0.2, "a")
+        self.assertAlmostEqual(self.wheel.next_deadline(), 0.2)
+        self.schedule(100.0, "b")
+        self.wheel.advance(0.2)
+        self.assertAlmostEqual(self.wheel.next_deadline(), 100.0)
+        self.assertEqual(self.wheel.next_deadline_tick(), 10000)
+
+    def test_deadlines_reach_their_timers(self):
+        # 18.56 / 0.01 is just below 1856 in floating point.
+        for when in (18.56, 100.0, 0.07, 1234.57):
+            self.schedule(when, when)
+        steps = 0
+        while self.wheel.next_deadline() is not None:
+            self.wheel.advance(self.wheel.next_deadline())
+            steps += 1
+        self.assertEqual(self.fired, [0.07, 18.56, 100.0, 1234.57])
+        self.assertEqual(steps, 4)
+
+    def test_advance_skips_idle_time(self):
+        self.schedule(0.05, "a")
+        self.wheel.advance(10_000_000.0)
+        self.assertEqual(self.fired, ["a"])
+        self.assertEqual(self.wheel.current_tick, 1_000_000_000)
+
+if __name__ == "__main__":
+    unittest.main()
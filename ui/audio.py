@@ -0,0 +1,101 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+from core.chord import Chord
+from core.circle import ChordType
+from core.synth import WaveformBank
+
+# A short mixer buffer keeps the delay between a question appearing and its chord sounding low.
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 256
+
+
+def configure_mixer(
+    frequency: int = MIXER_FREQUENCY,
+    channels: int = MIXER_CHANNELS,
+    buffer: int = MIXER_BUFFER,
+) -> None:
+    """
+    Requests a low-latency 16-bit mixer. Must be called before pygame.init().
+
+    Args:
+        frequency (int): Sample rate in Hz.
+        channels (int): Number of output channels.
+        buffer (int): Mixer buffer size in samples.
+    """
+    pygame.mixer.pre_init(frequency, MIXER_SIZE, channels, buffer)
+
+
+class ChordPlayer:
+    """
+    Plays chords through pygame.mixer from a cache of pre-built Sound objects.
+    """
+
+    def __init__(
+        self,
+        voicing: str = "close",
+        timbre: str = "organ",
+        duration: float = 1.0,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes the player, matching the waveform format to the running mixer.
+
+        Args:
+            voicing (str): Chord voicing, one of core.synth.VOICINGS.
+            timbre (str): Timbre, one of core.synth.TIMBRES.
+            duration (float): Length of each chord in seconds.
+            cache_dir (Optional[str]): Directory for the on-disk waveform cache.
+        """
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        frequency, size, channels = pygame.mixer.get_init()
+        if size != MIXER_SIZE:
+            raise ValueError(f"ChordPlayer needs a 16-bit signed mixer, got format {size}")
+        self.voicing = voicing
+        self.timbre = timbre
+        self.bank = WaveformBank(frequency, channels, duration, cache_dir)
+        self.sounds: Dict[Tuple[Chord, ChordType], pygame.mixer.Sound] = {}
+
+    def sound(self, chord: Chord, chord_type: ChordType) -> pygame.mixer.Sound:
+        """
+        Returns the Sound for a chord, building it from the waveform bank on first use.
+
+        The int16 array is handed to pygame through the buffer protocol, without an
+        intermediate bytes object.
+
+        Args:
+            chord (Chord): The chord.
+            chord_type (ChordType): Whether the chord is major or minor.
+        """
+        key = (chord, chord_type)
+        sound = self.sounds.get(key)
+        if sound is None:
+            waveform = self.bank.get(chord, chord_type, self.voicing, self.timbre)
+            sound = pygame.mixer.Sound(buffer=waveform)
+            self.sounds[key] = sound
+        return sound
+
+    def preload(self, chords: Iterable[Tuple[Chord, ChordType]]) -> None:
+        """
+        Builds the Sound objects for the given chords, so later playback never synthesizes.
+
+        Args:
+            chords (Iterable[Tuple[Chord, ChordType]]): Chords with their types.
+        """
+        for chord, chord_type in chords:
+            self.sound(chord, chord_type)
+
+    def play(self, chord: Chord, chord_type: ChordType) -> None:
+        """
+        Plays a chord, cutting off the previous one.
+
+        Args:
+            chord (Chord): The chord.
+            chord_type (ChordType): Whether the chord is major or minor.
+        """
+        pygame.mixer.stop()
+        self.sound(chord, chord_type).play()
@@ -0,0 +1,412 @@
+import argparse
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+import pygame
+
+from config import Config
+from core.circle import CIRCLE_SIZE, ChordType, CircleOfFifths, QuestionType
+from core.circle_definition import CompiledCircle, load_circle_file
+from core.game_text import generate_question_text
+from core.naming import NAMING_SYSTEMS, NamingSystem, naming_for_locale
+from localization import Localization
+from ui.render import CircleOfFifthsDrawable, hsv_color, polar_to_cartesian
+
+LINE_COLOR = (40, 40, 40)
+CARD_MARGIN = 20
+
+
+@dataclass(frozen=True)
+class CardSpec:
+    """
+    Describes one worksheet or flashcard image.
+
+    Attributes:
+        selection (Tuple[int, ...]): Indices of the wedges drawn as selected.
+        highlight (Optional[Tuple[ChordType, int]]): Chord type and index of the highlighted wedge.
+        labels (bool): Whether the chord labels are shown.
+        lang (str): Language code for the caption.
+    """
+    selection: Tuple[int, ...]
+    highlight: Optional[Tuple[ChordType, int]]
+    labels: bool
+    lang: str
+
+    @property
+    def filename(self) -> str:
+        """
+        Returns a file name stem that is unique for each card.
+        """
+        mask = sum(1 << i for i in self.selection)
+        if self.highlight is None:
+            highlight = "none"
+        else:
+            chord_type, index = self.highlight
+            # "maj"/"min": the first letter alone does not tell MAJOR from MINOR.
+            highlight = f"{chord_type.name[:3].lower()}{index:02d}"
+        labels = "labels" if self.labels else "blank"
+        return f"card_{self.lang}_s{mask:03x}_{highlight}_{labels}"
+
+
+def all_highlights(include_none: bool = True, segments: int = CIRCLE_SIZE) -> List[Optional[Tuple[ChordType, int]]]:
+    """
+    Returns every highlight choice: each wedge of both rings, optionally preceded by no highlight.
+
+    Args:
+        include_none (bool): Whether to include a card without a highlighted wedge.
+        segments (int): Number of chords per ring.
+    """
+    highlights: List[Optional[Tuple[ChordType, int]]] = [None] if include_none else []
+    highlights += [(chord_type, i) for chord_type in ChordType for i in range(segments)]
+    return highlights
+
+
+def build_deck(
+    selections: Iterable[Sequence[int]],
+    highlights: Iterable[Optional[Tuple[ChordType, int]]],
+    labels: Iterable[bool] = (False, True),
+    langs: Iterable[str] = ("en",),
+) -> List[CardSpec]:
+    """
+    Builds the cross product of selection x highlighted chord x label visibility x locale.
+
+    Args:
+        selections (Iterable[Sequence[int]]): Selected wedge index sets.
+        highlights (Iterable[Optional[Tuple[ChordType, int]]]): Highlighted wedges.
+        labels (Iterable[bool]): Label visibility values.
+        langs (Iterable[str]): Language codes.
+
+    Returns:
+        List[CardSpec]: One spec per combination.
+    """
+    return [
+        CardSpec(tuple(sorted(selection)), highlight, show_labels, lang)
+        for selection, highlight, show_labels, lang in itertools.product(
+            [tuple(s) for s in selections], list(highlights), list(labels), list(langs)
+        )
+    ]
+
+
+class CardRenderer:
+    """
+    Renders cards to off-screen surfaces and SVG documents, using the same drawable as the game.
+    """
+
+    def __init__(self, circle: Optional[CircleOfFifths] = None, naming: Optional[NamingSystem] = None) -> None:
+        """
+        Initializes the fonts; drawables are built per naming system on first use.
+
+        Args:
+            circle (Optional[CircleOfFifths]): The circle to draw. Defaults to the built-in
+                circle of fifths.
+            naming (Optional[NamingSystem]): Naming system of the labels and captions. Defaults
+                to the naming system of each card's language, as in the game.
+        """
+        self.circle = circle or CircleOfFifths()
+        self.naming = naming
+        self.font_small: pygame.font.Font = pygame.font.SysFont(None, Config.FONT_SMALL_SIZE)
+        self.font_label: pygame.font.Font = pygame.font.SysFont(None, Config.FONT_LABEL_SIZE)
+        self.drawables: Dict[str, CircleOfFifthsDrawable] = {}
+        self.localizations: Dict[str, Localization] = {}
+        # Cards are cropped to the circle and the caption line; PNG encoding dominates the
+        # export time, so every background pixel left out makes the deck faster to write.
+        cx, cy = Config.CIRCLE_CENTER
+        extent = Config.CIRCLE_RADIUS + CARD_MARGIN
+        self.card_rect = pygame.Rect(cx - extent, 0, 2 * extent, cy + extent)
+
+    def _loc(self, lang: str) -> Localization:
+        if lang not in self.localizations:
+            self.localizations[lang] = Localization(lang)
+        return self.localizations[lang]
+
+    def naming_for(self, lang: str) -> NamingSystem:
+        """
+        Returns the naming system of a card's labels and caption.
+
+        Args:
+            lang (str): Language code of the card.
+        """
+        return self.naming or naming_for_locale(self._loc(lang))
+
+    def drawable(self, lang: str) -> CircleOfFifthsDrawable:
+        """
+        Returns the circle drawable labeled in the naming system of a language.
+
+        Args:
+            lang (str): Language code of the card.
+        """
+        naming = self.naming_for(lang)
+        drawable = self.drawables.get(naming.name)
+        if drawable is None:
+            drawable = self.drawables[naming.name] = CircleOfFifthsDrawable(
+                self.circle.major_chords, self.circle.minor_chords,
+                center=Config.CIRCLE_CENTER,
+                radius=Config.CIRCLE_RADIUS,
+                inner_radius=Config.CIRCLE_INNER_RADIUS,
+                text_radius=Config.CIRCLE_TEXT_RADIUS,
+                inner_outer_radius=Config.CIRCLE_INNER_OUTER_RADIUS,
+                font=self.font_label,
+                naming=naming,
+            )
+        return drawable
+
+    def caption(self, card: CardSpec) -> str:
+        """
+        Returns the localized question text for the highlighted chord, or an empty string.
+
+        Args:
+            card (CardSpec): The card to caption.
+        """
+        if card.highlight is None:
+            return ""
+        chord_type, index = card.highlight
+        chord_list = self.circle.get_chord_list(chord_type)
+        state = {
+            "current_chord": chord_list[index],
+            "chord_type": chord_type,
+            "current_question": QuestionType.FILL_IN,
+            "naming": self.naming_for(card.lang),
+        }
+        return generate_question_text(state, self._loc(card.lang), chord_list)
+
+    def render_surface(self, card: CardSpec) -> pygame.Surface:
+        """
+        Draws a card onto a new off-screen surface, the same way GameRenderer draws a frame.
+
+        Args:
+            card (CardSpec): The card to draw.
+
+        Returns:
+            pygame.Surface: The rendered card, cropped to card_rect.
+        """
+        surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        surface.fill(Config.COLORS["background"])
+
+        drawable = self.drawable(card.lang)
+        drawable.draw_circle(surface, card.selection)
+        if card.highlight is not None:
+            chord_type, index = card.highlight
+            chord_list = self.circle.get_chord_list(chord_type)
+            drawable.draw_highlighted_chord(surface, chord_list[index], chord_type, False)
+        if card.labels:
+            drawable.draw_circle_labels(surface)
+
+        text = self.caption(card)
+        if text:
+            caption = self.font_small.render(text, True, Config.COLORS["text"])
+            surface.blit(caption, caption.get_rect(center=(self.card_rect.centerx, 20)))
+        return surface.subsurface(self.card_rect)
+
+    def render_svg(self, card: CardSpec) -> str:
+        """
+        Builds an SVG document with the same geometry as render_surface.
+
+        Args:
+            card (CardSpec): The card to draw.
+
+        Returns:
+            str: The SVG document.
+        """
+        d = self.drawable(card.lang)
+        cx, cy = d.CENTER
+
+        def rgb(color) -> str:
+            return "#%02x%02x%02x" % tuple(color[:3])
+
+        def points(poly) -> str:
+            return " ".join(f"{x},{y}" for x, y in poly)
+
+        r = self.card_rect
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{r.width}" height="{r.height}" '
+            f'viewBox="{r.x} {r.y} {r.width} {r.height}">',
+            f'<rect x="{r.x}" y="{r.y}" width="{r.width}" height="{r.height}" fill="{rgb(Config.COLORS["background"])}"/>',
+        ]
+        for i, poly in enumerate(d.segments_polygons):
+            color = hsv_color(i, d.SEGMENTS, i in card.selection)
+            parts.append(f'<polygon points="{points(poly)}" fill="{rgb(color)}"/>')
+        for i, poly in enumerate(d.inner_segments_polygons):
+            color = hsv_color(i - 3, d.SEGMENTS, i in card.selection)
+            parts.append(f'<polygon points="{points(poly)}" fill="{rgb(color)}"/>')
+        parts.append(f'<circle cx="{cx}" cy="{cy}" r="{d.RADIUS + 1}" fill="none" '
+                     f'stroke="{rgb(d.COLOR_WHITE)}" stroke-width="2"/>')
+        parts.append(f'<circle cx="{cx}" cy="{cy}" r="{d.INNER_RADIUS + 1}" fill="none" '
+                     f'stroke="{rgb(d.COLOR_BLACK)}" stroke-width="3"/>')
+        parts.append(f'<circle cx="{cx}" cy="{cy}" r="{d.INNER_OUTER_RADIUS}" fill="{rgb(d.COLOR_BLACK)}"/>')
+        for i in range(d.SEGMENTS):
+            line_deg = -90 + i * 360 / d.SEGMENTS - 360 / (d.SEGMENTS * 2)
+            x1, y1 = polar_to_cartesian(d.CENTER, line_deg, d.INNER_OUTER_RADIUS)
+            x2, y2 = polar_to_cartesian(d.CENTER, line_deg, d.RADIUS)
+            parts.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+                         f'stroke="{rgb(LINE_COLOR)}" stroke-width="2"/>')
+
+        if card.highlight is not None:
+            chord_type, index = card.highlight
+            polygons = d.segments_polygons if chord_type == ChordType.MAJOR else d.inner_segments_polygons
+            parts.append(f'<polygon points="{points(polygons[index])}" fill="{rgb(d.COLOR_HIGHLIGHT)}" '
+                         f'fill-opacity="{d.COLOR_HIGHLIGHT[3] / 255:.3f}"/>')
+        if card.labels:
+            for chords, radius in ((d.major_chords, d.TEXT_RADIUS), (d.minor_chords, d.INNER_RADIUS - 30)):
+                for i, chord in enumerate(chords):
+                    x, y = polar_to_cartesian(d.CENTER, -90 + i * 360 / d.SEGMENTS, radius)
+                    parts.append(f'<text x="{x}" y="{y}" font-family="sans-serif" '
+                                 f'font-size="{Config.FONT_LABEL_SIZE}" text-anchor="middle" dominant-baseline="central" '
+                                 f'fill="{rgb(d.COLOR_BLACK)}">{escape(d.naming.label(chord))}</text>')
+
+        text = self.caption(card)
+        if text:
+            parts.append(f'<text x="{r.centerx}" y="20" font-family="sans-serif" '
+                         f'font-size="{Config.FONT_SMALL_SIZE}" text-anchor="middle" dominant-baseline="central" '
+                         f'fill="{rgb(Config.COLORS["text"])}">{escape(text)}</text>')
+        parts.append("</svg>")
+        return "\n".join(parts)
+
+    def export(self, card: CardSpec, out_dir: str, formats: Sequence[str]) -> List[str]:
+        """
+        Writes one card in each requested format.
+
+        Args:
+            card (CardSpec): The card to export.
+            out_dir (str): Output directory.
+            formats (Sequence[str]): Formats to write, "png" and/or "svg".
+
+        Returns:
+            List[str]: Paths of the written files.
+        """
+        paths = []
+        stem = os.path.join(out_dir, card.filename)
+        if "png" in formats:
+            pygame.image.save(self.render_surface(card), stem + ".png")
+            paths.append(stem + ".png")
+        if "svg" in formats:
+            with open(stem + ".svg", "w", encoding="utf-8") as f:
+                f.write(self.render_svg(card))
+            paths.append(stem + ".svg")
+        return paths
+
+
+_worker_renderer: Optional[CardRenderer] = None
+_worker_args: Tuple[str, Tuple[str, ...]] = ("", ())
+
+
+def _init_worker(
+    out_dir: str,
+    formats: Tuple[str, ...],
+    circle: Optional[CompiledCircle] = None,
+    naming: Optional[str] = None,
+) -> None:
+    """
+    Process pool initializer: sets up headless pygame and one CardRenderer per worker.
+
+    The circle travels as its compiled tables and the naming system by name, since both are
+    rebuilt cheaply in each worker.
+    """
+    global _worker_renderer, _worker_args
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.font.init()
+    _worker_renderer = CardRenderer(CircleOfFifths(circle), NAMING_SYSTEMS[naming] if naming else None)
+    _worker_args = (out_dir, formats)
+
+
+def _export_card(card: CardSpec) -> List[str]:
+    out_dir, formats = _worker_args
+    return _worker_renderer.export(card, out_dir, formats)
+
+
+def export_deck(
+    cards: Sequence[CardSpec],
+    out_dir: str,
+    formats: Sequence[str] = ("png", "svg"),
+    workers: Optional[int] = None,
+    chunksize: int = 32,
+    circle: Optional[CompiledCircle] = None,
+    naming: Optional[str] = None,
+) -> List[str]:
+    """
+    Renders a deck of cards to files, spread over a process pool.
+
+    Each worker builds its fonts, drawable and localizations once and then renders its share
+    of the cards; only the small CardSpec objects and resulting paths cross process boundaries.
+
+    Args:
+        cards (Sequence[CardSpec]): The cards to render.
+        out_dir (str): Output directory, created if missing.
+        formats (Sequence[str]): Formats to write, "png" and/or "svg".
+        workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+            With 1, cards are rendered in the calling process.
+        chunksize (int): Number of cards sent to a worker at a time.
+        circle (Optional[CompiledCircle]): The circle to draw. Defaults to the built-in circle
+            of fifths.
+        naming (Optional[str]): Name of the naming system of the labels and captions, one of
+            core.naming.NAMING_SYSTEMS. Defaults to that of each card's language.
+
+    Returns:
+        List[str]: Paths of all written files.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    formats = tuple(formats)
+    initargs = (out_dir, formats, circle, naming)
+    if workers == 1:
+        _init_worker(*initargs)
+        return [path for card in cards for path in _export_card(card)]
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+        return [path for paths in pool.map(_export_card, cards, chunksize=chunksize) for path in paths]
+
+
+def selections_for(mode: str, segments: int = CIRCLE_SIZE) -> List[Tuple[int, ...]]:
+    """
+    Returns the selection sets for a named selection mode.
+
+    Args:
+        mode (str): "full" (every wedge selected), "singles" (one wedge each) or
+            "pairs" (every pair of wedges).
+        segments (int): Number of chords per ring.
+    """
+    if mode == "full":
+        return [tuple(range(segments))]
+    if mode == "singles":
+        return [(i,) for i in range(segments)]
+    if mode == "pairs":
+        return list(itertools.combinations(range(segments), 2))
+    raise ValueError(f"Unknown selection mode: {mode}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command line entry point for exporting worksheets and flashcards.
+    """
+    parser = argparse.ArgumentParser(description="Export Circle of Fifths worksheets and flashcards.")
+    parser.add_argument("out_dir", help="Directory to write the images to.")
+    parser.add_argument("--selection", choices=("full", "singles", "pairs"), default="full")
+    parser.add_argument("--langs", nargs="+", default=["en"])
+    parser.add_argument("--formats", nargs="+", choices=("png", "svg"), default=["png", "svg"])
+    parser.add_argument("--labels", choices=("both", "shown", "hidden"), default="both")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--circle", metavar="PATH", default=None,
+                        help="Draw a custom circle from a .json or .toml definition, e.g. circles/fourths.json.")
+    parser.add_argument("--circle-cache", metavar="DIR", default=None,
+                        help="Directory for compiled circle definitions.")
+    parser.add_argument("--naming", choices=sorted(NAMING_SYSTEMS), default=None,
+                        help="Naming system of the chord labels. Defaults to that of each language.")
+    args = parser.parse_args(argv)
+
+    circle = None
+    if args.circle:
+        try:
+            circle = load_circle_file(args.circle, args.circle_cache)
+        except ValueError as e:
+            parser.error(str(e))
+    segments = circle.size if circle else CIRCLE_SIZE
+    labels = {"both": (False, True), "shown": (True,), "hidden": (False,)}[args.labels]
+    cards = build_deck(selections_for(args.selection, segments), all_highlights(True, segments), labels, args.langs)
+    paths = export_deck(cards, args.out_dir, args.formats, args.workers, circle=circle, naming=args.naming)
+    print(f"Exported {len(cards)} cards ({len(paths)} files) to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
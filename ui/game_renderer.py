@@ -1,33 +1,66 @@
+import time
+from typing import Optional, Tuple
 import pygame
+from core.metrics import REGISTRY
 from core.game_text import generate_question_text, get_feedback_message
 from config import Config
 from core.types import GameStateDict
-from core.chord_lists import major_chords, minor_chords
+from core.circle import CircleOfFifths
 from ui.render import CircleOfFifthsDrawable
+from ui.heatmap import HeatmapOverlay
 from ui.interfaces import IGameRenderer
+from ui.question_text import QUESTION_TEXTS_PRERENDERED, QUESTION_TEXTS_RENDERED, QuestionTextPrerenderer
 from localization import Localization
+from core.naming import NamingSystem, naming_for_locale
+
+FRAME_SECONDS = REGISTRY.histogram("render_frame_seconds", "Time spent rendering a frame.").labels()
 
 class GameRenderer(IGameRenderer):
     """
     Handles all rendering for the Circle of Fifths game.
     """
 
-    def __init__(self, lang: str = "en") -> None:
-        
+    def __init__(
+        self, lang: str = "en", naming: Optional[NamingSystem] = None, circle: Optional[CircleOfFifths] = None
+    ) -> None:
+        """
+        Initializes the window, fonts and circle drawable.
+
+        Args:
+            lang (str): Language code for localization.
+            naming (Optional[NamingSystem]): Naming system of the circle labels. Defaults to
+                the naming system of the language.
+            circle (Optional[CircleOfFifths]): The circle to draw. Defaults to the built-in
+                circle of fifths.
+        """
         self.screen: pygame.Surface = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-        self.overlay: pygame.Surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), pygame.SRCALPHA)
         self.font_small: pygame.font.Font = pygame.font.SysFont(None, Config.FONT_SMALL_SIZE)
         self.font_large: pygame.font.Font = pygame.font.SysFont(None, Config.FONT_LARGE_SIZE)
         self.loc: Localization = Localization(lang)
+        self.naming: NamingSystem = naming or naming_for_locale(self.loc)
 
+        circle = circle or CircleOfFifths()
         self.circle_render = CircleOfFifthsDrawable(
-            major_chords, minor_chords,
+            circle.major_chords, circle.minor_chords,
             center=Config.CIRCLE_CENTER,
             radius=Config.CIRCLE_RADIUS,
             inner_radius=Config.CIRCLE_INNER_RADIUS,
             text_radius=Config.CIRCLE_TEXT_RADIUS,
             inner_outer_radius=Config.CIRCLE_INNER_OUTER_RADIUS,
+            font=pygame.font.SysFont(None, Config.FONT_LABEL_SIZE),
+            naming=self.naming,
+        )
+        self.heatmap = HeatmapOverlay(
+            Config.CIRCLE_CENTER,
+            Config.CIRCLE_RADIUS,
+            Config.CIRCLE_INNER_RADIUS,
+            Config.CIRCLE_INNER_OUTER_RADIUS,
+            segments=circle.size,
         )
+        self.question_text = QuestionTextPrerenderer(self.loc, circle)
+        self.question_text.start()
+        # Number of the question shown, the strings its text was formatted with, and the text.
+        self.question_surface: Optional[Tuple[Optional[int], dict, pygame.Surface]] = None
 
     def render(self, state: GameStateDict, input_text: str, blink: bool) -> None:
         """
@@ -38,23 +71,28 @@ class GameRenderer(IGameRenderer):
             input_text (str): The current user input text.
             blink (bool): Whether the blink effect is active.
         """
+        started = time.perf_counter()
         self.screen.fill(Config.COLORS["background"])
-        self.overlay.fill((0, 0, 0, 0))
 
-        self.circle_render.draw_circle(self.screen, state["selected_chord_indices"])
+        rotation = state.get("rotation", 0.0)
+        self.circle_render.draw_circle(self.screen, state["selected_chord_indices"], rotation)
+        heatmap = state.get("heatmap")
+        if heatmap is not None:
+            self.heatmap.draw(self.screen, state["stats_tracker"], heatmap, rotation)
         if state.get("current_chord") is not None:
             self.circle_render.draw_highlighted_chord(
-                self.overlay, state["current_chord"], state["chord_type"], blink
+                self.screen, state["current_chord"], state["chord_type"], blink, rotation
             )
         if state.get("game_state") != "ACTIVE":
-            self.circle_render.draw_circle_labels(self.overlay)
+            self.circle_render.draw_circle_labels(self.screen, rotation)
 
-        self.screen.blit(self.overlay, (0, 0))
         self.render_question(state)
         self.render_input(input_text)
         self.render_results(state)
         self.render_stats(state)
+        self.render_heatmap_label(state)
         pygame.display.flip()
+        FRAME_SECONDS.observe(time.perf_counter() - started)
 
     def render_question(self, state) -> None:
         """
@@ -63,13 +101,41 @@ class GameRenderer(IGameRenderer):
         Args:
             state (GameStateDict): The current game state dictionary.
         """
-        chord_list = state["chord_list"]
-        question_surface = self.font_small.render(
-            generate_question_text(state, self.loc, chord_list), True, Config.COLORS["text"]
-        )
+        self.question_text.submit(state.get("upcoming") or (), state.get("naming") or self.naming)
+        question_surface = self.question_surface_for(state)
         question_text_rect = question_surface.get_rect(center=(400, 20))
         self.screen.blit(question_surface, question_text_rect)
 
+    def question_surface_for(self, state) -> pygame.Surface:
+        """
+        Returns the rendered text of the current question: kept from the previous frame,
+        prerendered while an earlier question was shown, or rendered now.
+
+        Args:
+            state (GameStateDict): The current game state dictionary.
+        """
+        number = state.get("question_number")
+        strings = self.loc.strings
+        cached = self.question_surface
+        if number is not None and cached is not None and cached[0] == number and cached[1] is strings:
+            return cached[2]
+        surface = self.question_text.take(number) if number is not None else None
+        if surface is not None:
+            QUESTION_TEXTS_PRERENDERED.inc()
+        else:
+            surface = self.font_small.render(
+                generate_question_text(state, self.loc, state["chord_list"]), True, Config.COLORS["text"]
+            )
+            QUESTION_TEXTS_RENDERED.inc()
+        self.question_surface = (number, strings, surface)
+        return surface
+
+    def close(self) -> None:
+        """
+        Stops the question text worker.
+        """
+        self.question_text.close()
+
     def render_input(self, input_text: str) -> None:
         """
         Renders the user's current input.
@@ -90,7 +156,8 @@ class GameRenderer(IGameRenderer):
         """
         if state.get("last_result") is not None:
             text = get_feedback_message(state, self.loc)
-            result_surface = self.font_small.render(text, True, Config.COLORS["text"])
+            color = Config.COLORS["flash"] if state.get("feedback_flash") else Config.COLORS["text"]
+            result_surface = self.font_small.render(text, True, color)
             result_text_rect = result_surface.get_rect(center=(400, 110))
             self.screen.blit(result_surface, result_text_rect)
 
@@ -105,4 +172,28 @@ class GameRenderer(IGameRenderer):
         answers_surface = self.font_small.render(
             f"{correct} / {total}", True, Config.COLORS["text"]
         )
-        self.screen.blit(answers_surface, (700, 20))
\ No newline at end of file
+        self.screen.blit(answers_surface, (700, 20))
+
+        if total:
+            score_surface = self.font_small.render(
+                f"{state.get('score', float(correct)):.1f}", True, Config.COLORS["text"]
+            )
+            self.screen.blit(score_surface, (700, 40))
+            p50, p90 = state.get("response_times", (0.0, 0.0))
+            times_surface = self.font_small.render(
+                f"p50 {p50:.1f}s  p90 {p90:.1f}s", True, Config.COLORS["text"]
+            )
+            self.screen.blit(times_surface, (660, 60))
+
+    def render_heatmap_label(self, state) -> None:
+        """
+        Names the heatmap mode in the bottom-left corner while the overlay is shown.
+
+        Args:
+            state (GameStateDict): The current game state dictionary.
+        """
+        heatmap = state.get("heatmap")
+        if heatmap is None:
+            return
+        label_surface = self.font_small.render(self.loc.t(f"heatmap_{heatmap}"), True, Config.COLORS["text"])
+        self.screen.blit(label_surface, (10, Config.SCREEN_HEIGHT - 25))
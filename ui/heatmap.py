@@ -0,0 +1,200 @@
+import numpy as np
+import pygame
+from typing import Optional, Tuple
+
+from core.circle import ChordType
+from core.stats import StatsTracker
+from ui.render import LAYER_COLORKEY, quantize_rotation
+
+HEATMAP_ACCURACY: str = "accuracy"
+HEATMAP_RESPONSE_TIME: str = "response_time"
+# Order in which the heatmap key cycles through the modes; None turns the overlay off.
+HEATMAP_MODES: Tuple[Optional[str], ...] = (None, HEATMAP_ACCURACY, HEATMAP_RESPONSE_TIME)
+
+# Color stops from weak (0.0) to strong (1.0): red, yellow, green.
+GRADIENT_STOPS: Tuple[float, ...] = (0.0, 0.5, 1.0)
+GRADIENT_COLORS: Tuple[Tuple[int, int, int], ...] = ((200, 50, 40), (220, 190, 60), (60, 180, 90))
+NO_DATA_COLOR: Tuple[int, int, int] = (90, 90, 90)
+# Brightness at the inner and outer edge of each ring, in SHADE_LEVELS steps.
+SHADE_INNER: float = 0.55
+SHADE_OUTER: float = 1.0
+SHADE_LEVELS: int = 64
+# The overlay is opaque, so it draws the wedge dividers and ring outlines itself.
+DIVIDER_COLOR: Tuple[int, int, int] = (40, 40, 40)
+DIVIDER_WIDTH: float = 2.0
+OUTER_OUTLINE_COLOR: Tuple[int, int, int] = (255, 255, 255)
+INNER_OUTLINE_COLOR: Tuple[int, int, int] = (0, 0, 0)
+
+def next_heatmap_mode(mode: Optional[str]) -> Optional[str]:
+    """
+    Returns the heatmap mode after the given one, wrapping back to off.
+    """
+    return HEATMAP_MODES[(HEATMAP_MODES.index(mode) + 1) % len(HEATMAP_MODES)]
+
+def wedge_values(stats: StatsTracker, mode: str, segments: int = 12) -> np.ndarray:
+    """
+    Returns the strength of every wedge, from 0.0 (weakest) to 1.0 (strongest).
+
+    Args:
+        stats (StatsTracker): The learner's statistics.
+        mode (str): HEATMAP_ACCURACY, or HEATMAP_RESPONSE_TIME to rate wedges by how fast
+            they are answered relative to the slowest and fastest wedge.
+        segments (int): Number of wedges per ring.
+
+    Returns:
+        np.ndarray: Array of shape (2, segments), major ring first, NaN where nothing was answered.
+    """
+    values = np.full((2, segments), np.nan)
+    for ring, chord_type in enumerate((ChordType.MAJOR, ChordType.MINOR)):
+        for i in range(segments):
+            correct, attempts = stats.accuracy(i, chord_type)
+            if not attempts:
+                continue
+            if mode == HEATMAP_ACCURACY:
+                values[ring, i] = correct / attempts
+            else:
+                values[ring, i] = stats.mean_response_time(i, chord_type)
+    if mode == HEATMAP_RESPONSE_TIME:
+        answered = ~np.isnan(values)
+        if answered.any():
+            fastest, slowest = values[answered].min(), values[answered].max()
+            span = slowest - fastest
+            values[answered] = 1.0 - (values[answered] - fastest) / span if span > 0 else 1.0
+    return values
+
+class HeatmapOverlay:
+    """
+    Colors the wedges of the circle by the learner's strength, with a radial gradient per ring.
+
+    The polar coordinates of every pixel are computed once and reduced to a wedge index and a
+    shade level, so a redraw is one NumPy gather from a small color table followed by a single
+    surfarray call. The layer is cached until the statistics, the mode or the rotation change.
+    """
+
+    def __init__(
+        self,
+        center: Tuple[int, int],
+        radius: int,
+        inner_radius: int,
+        inner_outer_radius: int,
+        segments: int = 12,
+    ) -> None:
+        """
+        Precomputes the per-pixel geometry of the overlay.
+
+        Args:
+            center (Tuple[int, int]): Center of the circle.
+            radius (int): Outer radius of the major ring.
+            inner_radius (int): Radius between the major and minor ring.
+            inner_outer_radius (int): Inner radius of the minor ring.
+            segments (int): Number of wedges per ring.
+        """
+        self.center = center
+        self.segments = segments
+        extent = radius + 2
+        size = 2 * extent + 1
+        self.rect = pygame.Rect(center[0] - extent, center[1] - extent, size, size)
+
+        # surfarray arrays are indexed [x, y].
+        offsets = np.arange(size, dtype=np.float32) - extent
+        dx, dy = np.meshgrid(offsets, offsets, indexing="ij")
+        self.distance = np.hypot(dx, dy)
+        # Angle of each pixel in wedge units, where wedge i is centered on i (0 at 12 o'clock).
+        self.position = (np.degrees(np.arctan2(dy, dx)) + 90.0) / np.float32(360.0 / segments)
+
+        major = (self.distance > inner_radius) & (self.distance <= radius)
+        minor = (self.distance > inner_outer_radius) & (self.distance <= inner_radius)
+        self.ring = np.where(major, 0, np.where(minor, 1, -1)).astype(np.int16)
+        # Table rows of pixels that do not depend on the rotation, -1 for wedge pixels. The
+        # outlines match the circles CircleOfFifthsDrawable draws over its wedges.
+        self.fixed = np.full((size, size), -1, dtype=np.intp)
+        self.fixed[self.ring < 0] = 2 * segments + 1
+        self.fixed[(self.distance > radius - 1) & (self.distance <= radius + 1)] = 2 * segments + 2
+        self.fixed[(self.distance > inner_radius - 2) & (self.distance <= inner_radius + 1)] = 2 * segments + 3
+        self.fixed[self.distance <= inner_outer_radius] = 2 * segments + 3
+
+        outer = np.where(major, radius, inner_radius)
+        inner = np.where(major, inner_radius, inner_outer_radius)
+        t = np.clip((self.distance - inner) / (outer - inner), 0.0, 1.0)
+        self.shade_level = np.rint(t * (SHADE_LEVELS - 1)).astype(np.intp)
+
+        self.layer = pygame.Surface((size, size))
+        self.layer.set_colorkey(LAYER_COLORKEY)
+        self.cells: Optional[np.ndarray] = None
+        self.cells_rotation: Optional[float] = None
+        self.cache_key = None
+
+    def _cells(self, rotation: float) -> np.ndarray:
+        """
+        Returns the color-table row of every pixel for a rotation: ring * segments + wedge,
+        then rows for the divider lines, pixels outside the rings, and the two outlines.
+        """
+        if self.cells_rotation == rotation:
+            return self.cells
+        position = self.position - np.float32(rotation * self.segments / 360.0)
+        nearest = np.rint(position)
+        segment = nearest.astype(np.intp) % self.segments
+        cells = self.ring * self.segments + segment
+        # Pixels within a pixel of a wedge boundary form the divider lines.
+        boundary = (0.5 - np.abs(position - nearest)) * (2 * np.pi / self.segments) * self.distance
+        cells[boundary < DIVIDER_WIDTH / 2] = 2 * self.segments
+        fixed = self.fixed >= 0
+        cells[fixed] = self.fixed[fixed]
+        self.cells, self.cells_rotation = cells, rotation
+        return cells
+
+    def color_table(self, values: np.ndarray) -> np.ndarray:
+        """
+        Returns the color of every table row at every shade level.
+
+        Args:
+            values (np.ndarray): Wedge strengths of shape (2, segments), NaN for no data.
+
+        Returns:
+            np.ndarray: uint8 array of shape (2 * segments + 4, SHADE_LEVELS, 3).
+        """
+        flat = values.reshape(-1)
+        colors = np.empty((flat.size, 3), dtype=np.float32)
+        for channel in range(3):
+            colors[:, channel] = np.interp(flat, GRADIENT_STOPS, [color[channel] for color in GRADIENT_COLORS])
+        colors[np.isnan(flat)] = NO_DATA_COLOR
+        shades = np.linspace(SHADE_INNER, SHADE_OUTER, SHADE_LEVELS, dtype=np.float32)
+        table = np.empty((flat.size + 4, SHADE_LEVELS, 3), dtype=np.uint8)
+        table[:flat.size] = (colors[:, None, :] * shades[None, :, None]).astype(np.uint8)
+        table[flat.size] = DIVIDER_COLOR
+        table[flat.size + 1] = LAYER_COLORKEY
+        table[flat.size + 2] = OUTER_OUTLINE_COLOR
+        table[flat.size + 3] = INNER_OUTLINE_COLOR
+        return table
+
+    def rasterize(self, values: np.ndarray, rotation: float = 0.0) -> np.ndarray:
+        """
+        Computes the RGB pixels of the overlay.
+
+        Args:
+            values (np.ndarray): Wedge strengths of shape (2, segments), NaN for no data.
+            rotation (float): Clockwise rotation of the circle in degrees.
+
+        Returns:
+            np.ndarray: uint8 array of shape (width, height, 3); pixels outside the rings hold
+                the colorkey.
+        """
+        return self.color_table(values)[self._cells(rotation), self.shade_level]
+
+    def draw(self, surface: pygame.Surface, stats: StatsTracker, mode: str, rotation: float = 0.0) -> None:
+        """
+        Blits the heatmap onto a surface, rasterizing it only if something changed.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            stats (StatsTracker): The learner's statistics.
+            mode (str): HEATMAP_ACCURACY or HEATMAP_RESPONSE_TIME.
+            rotation (float): Clockwise rotation of the circle in degrees.
+        """
+        rotation = quantize_rotation(rotation)
+        key = (id(stats), stats.version, mode, rotation)
+        if key != self.cache_key:
+            pixels = self.rasterize(wedge_values(stats, mode, self.segments), rotation)
+            pygame.surfarray.blit_array(self.layer, pixels)
+            self.cache_key = key
+        surface.blit(self.layer, self.rect)
@@ -18,4 +18,10 @@ class IGameRenderer(ABC):
             input_text (str): The current user input text.
             blink (bool): Whether the blink effect is active.
         """
+        pass
+
+    def close(self) -> None:
+        """
+        Releases resources such as worker threads. The default does nothing.
+        """
         pass
\ No newline at end of file
@@ -0,0 +1,130 @@
+import queue
+import threading
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+import pygame
+
+from config import Config
+from core.circle import CircleOfFifths
+from core.game_core import Question
+from core.game_text import generate_question_text
+from core.metrics import REGISTRY
+from core.naming import NamingSystem
+from localization import Localization
+
+QUESTION_TEXTS = REGISTRY.counter(
+    "question_text_total", "Question texts shown, by whether they were rendered ahead.", ("source",)
+)
+QUESTION_TEXTS_PRERENDERED = QUESTION_TEXTS.labels("prerendered")
+QUESTION_TEXTS_RENDERED = QUESTION_TEXTS.labels("rendered")
+
+
+def question_state(question: Question, naming: NamingSystem) -> Dict[str, Any]:
+    """
+    Returns the part of the game state generate_question_text reads, for a drawn question.
+    """
+    return {
+        "current_chord": question.chord,
+        "chord_type": question.chord_type,
+        "current_question": question.question_type,
+        "question_detail": question.detail,
+        "naming": naming,
+    }
+
+
+class QuestionTextPrerenderer:
+    """
+    Formats and rasterizes the text of upcoming questions on a worker thread, so showing the
+    next question only swaps in a finished surface.
+
+    Surfaces are keyed by question number and remember the locale strings they were formatted
+    with; after a locale reload they no longer match and the text is rendered again.
+    """
+
+    def __init__(
+        self,
+        loc: Localization,
+        circle: CircleOfFifths,
+        font_size: int = Config.FONT_SMALL_SIZE,
+        color: Tuple[int, int, int] = Config.COLORS["text"],
+    ) -> None:
+        """
+        Loads the worker's font. Call start() to begin rendering.
+
+        Args:
+            loc (Localization): Localization of the question texts.
+            circle (CircleOfFifths): The circle the questions are about.
+            font_size (int): Size of the question font.
+            color (Tuple[int, int, int]): Color of the text.
+        """
+        self.loc = loc
+        self.circle = circle
+        self.color = color
+        # The worker has a font of its own; a font must not be used by two threads at once.
+        self.font: pygame.font.Font = pygame.font.SysFont(None, font_size)
+        self.requests: "queue.SimpleQueue[Optional[Tuple[Question, NamingSystem]]]" = queue.SimpleQueue()
+        self.submitted: Set[int] = set()
+        self.ready: Dict[int, Tuple[Dict[str, str], pygame.Surface]] = {}
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Starts the worker thread.
+        """
+        self.thread = threading.Thread(target=self._run, name="question-text", daemon=True)
+        self.thread.start()
+
+    def submit(self, questions: Iterable[Question], naming: NamingSystem) -> None:
+        """
+        Queues the questions that have not been queued yet. Never blocks.
+
+        Args:
+            questions (Iterable[Question]): Upcoming questions, e.g. GameCore.upcoming_questions().
+            naming (NamingSystem): How chord names are displayed.
+        """
+        for question in questions:
+            if question.number not in self.submitted:
+                self.submitted.add(question.number)
+                self.requests.put((question, naming))
+
+    def take(self, number: int) -> Optional[pygame.Surface]:
+        """
+        Returns the prerendered text of a question, or None if it is not ready or was
+        formatted with strings that have since been reloaded. Texts of earlier questions are
+        dropped.
+
+        Args:
+            number (int): The question's number.
+        """
+        with self.lock:
+            entry = self.ready.pop(number, None)
+            for stale in [n for n in self.ready if n < number]:
+                del self.ready[stale]
+        self.submitted = {n for n in self.submitted if n > number}
+        if entry is None or entry[0] is not self.loc.strings:
+            return None
+        return entry[1]
+
+    def _run(self) -> None:
+        while True:
+            item = self.requests.get()
+            if item is None:
+                break
+            question, naming = item
+            strings = self.loc.strings
+            chord_list = self.circle.get_chord_list(question.chord_type)
+            text = generate_question_text(question_state(question, naming), self.loc, chord_list)
+            surface = self.font.render(text, True, self.color)
+            with self.lock:
+                self.ready[question.number] = (strings, surface)
+
+    def close(self) -> None:
+        """
+        Stops the worker thread.
+        """
+        if self.thread is None:
+            return
+        self.requests.put(None)
+        self.thread.join()
+        self.thread = None
@@ -1,9 +1,11 @@
 import pygame
 import math
 import colorsys
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Tuple
 
 from core.circle import ChordType
+from core.naming import ENGLISH, NamingSystem
 
 def hsv_color(i: int, total: int, selected: bool = False) -> Tuple[int, int, int]:
     """
@@ -40,6 +42,21 @@ def polar_to_cartesian(center: Tuple[int, int], angle_deg: float, radius: float)
     y = center[1] + radius * math.sin(angle_rad)
     return (int(x), int(y))
 
+# Rotations are rounded to this many degrees, so animation frames can share cached layers.
+ROTATION_STEP: float = 1.0
+# Maximum number of rotated layers, label layouts and highlight sprites kept per drawable.
+LAYER_CACHE_SIZE: int = 24
+LAYER_COLORKEY: Tuple[int, int, int] = (255, 0, 255)
+
+def quantize_rotation(rotation: float) -> float:
+    """
+    Rounds a rotation to the nearest ROTATION_STEP, normalized to [0, 360).
+
+    Args:
+        rotation (float): Clockwise rotation in degrees.
+    """
+    return (round(rotation / ROTATION_STEP) * ROTATION_STEP) % 360
+
 class CircleOfFifthsDrawable:
     """
     Handles rendering of the Circle of Fifths, including chords, highlights, and labels.
@@ -54,7 +71,8 @@ class CircleOfFifthsDrawable:
         inner_radius=125,
         text_radius=160,
         inner_outer_radius=40,
-        font=None
+        font=None,
+        naming: NamingSystem = ENGLISH,
     ):
         """
         Initializes the drawable circle with chord lists and font.
@@ -68,6 +86,7 @@ class CircleOfFifthsDrawable:
             text_radius (int, optional): Radius for text labels. Defaults to 160.
             inner_outer_radius (int, optional): Inner radius for the inner circle. Defaults to 40.
             font (pygame.font.Font, optional): Font to use for labels. Defaults to None.
+            naming (NamingSystem, optional): Naming system of the labels. Defaults to English.
         """
         self.major_chords = major_chords or []
         self.minor_chords = minor_chords or []
@@ -82,12 +101,21 @@ class CircleOfFifthsDrawable:
         self.INNER_OUTER_RADIUS: int = inner_outer_radius
         self.SEGMENTS: int = len(self.major_chords)
         self.FONT = font or pygame.font.SysFont(None, 30)
+        self.naming: NamingSystem = naming
 
         self.COLOR_BLACK: Tuple[int, int, int] = (30, 30, 30)
         self.COLOR_WHITE: Tuple[int, int, int] = (220, 220, 220)
+        self.COLOR_HIGHLIGHT: Tuple[int, int, int, int] = (255, 255, 255, 220)
+
+        self.major_indices: Dict = {chord: i for i, chord in enumerate(self.major_chords)}
+        self.minor_indices: Dict = {chord: i for i, chord in enumerate(self.minor_chords)}
 
         self.segments_polygons: List[List[Tuple[int, int]]] = []
         self.inner_segments_polygons: List[List[Tuple[int, int]]] = []
+        self.segments_sprites: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        self.inner_segments_sprites: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        self.label_sprites: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        self.layer_cache: "OrderedDict[Hashable, object]" = OrderedDict()
         self.precalculate_wedges()
 
     def set_center(self, center: Tuple[int, int]) -> None:
@@ -100,53 +128,193 @@ class CircleOfFifthsDrawable:
         self.CENTER = center
         self.precalculate_wedges()
 
-    def _draw_lines(self, surface: pygame.Surface, item_list: List) -> None:
+    def _draw_lines(
+        self, surface: pygame.Surface, item_list: List, rotation: float = 0.0, offset: Tuple[int, int] = (0, 0)
+    ) -> None:
         """
         Draws the lines and dividers for the circle.
 
         Args:
             surface (pygame.Surface): The surface to draw on.
             item_list (List): List of items to draw lines for.
+            rotation (float): Clockwise rotation of the circle in degrees.
+            offset (Tuple[int, int]): Position of the surface's top-left corner on screen.
         """
         for i, _ in enumerate(item_list):
-            angle_deg = -90 + i * 30
+            angle_deg = -90 + i * (360 / self.SEGMENTS) + rotation
             line_deg = angle_deg  - 360/(self.SEGMENTS*2)
             # Divider lines
             line_end = polar_to_cartesian(self.CENTER, line_deg, self.RADIUS)
             line_start = polar_to_cartesian(self.CENTER, line_deg, self.INNER_OUTER_RADIUS)
-            pygame.draw.line(surface, (40, 40, 40), line_start, line_end, 2)
+            pygame.draw.line(
+                surface, (40, 40, 40),
+                (line_start[0] - offset[0], line_start[1] - offset[1]),
+                (line_end[0] - offset[0], line_end[1] - offset[1]),
+                2,
+            )
 
-    def _draw_text(self, surface: pygame.Surface, note_list: List, radius: int) -> None:
+    def _make_text_sprites(
+        self, note_list: List, radius: int, rotation: float = 0.0
+    ) -> List[Tuple[pygame.Surface, pygame.Rect]]:
         """
-        Draws the text labels for the notes.
+        Renders the text labels for the notes once, positioned for blitting.
 
         Args:
-            surface (pygame.Surface): The surface to draw on.
-            note_list (List): List of notes to draw.
+            note_list (List): List of notes to label.
             radius (int): Radius for the text position.
+            rotation (float): Clockwise rotation of the circle in degrees.
+
+        Returns:
+            List[Tuple[pygame.Surface, pygame.Rect]]: Rendered label and destination rect per note.
         """
+        sprites = []
         for i, note in enumerate(note_list):
-            angle_deg = -90 + i * 30
+            angle_deg = -90 + i * (360 / self.SEGMENTS) + rotation
             text_pos = polar_to_cartesian(self.CENTER, angle_deg, radius)
-            text = self.FONT.render(note.alternative_names[0], True, self.COLOR_BLACK)
-            text_rect = text.get_rect(center=text_pos)
-            surface.blit(text, text_rect)
-    
+            text = self.FONT.render(self.naming.label(note), True, self.COLOR_BLACK)
+            sprites.append((text, text.get_rect(center=text_pos)))
+        return sprites
+
+    def _make_wedge_sprite(
+        self, polygon: List[Tuple[int, int]], color: Tuple[int, int, int, int]
+    ) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Pre-renders a translucent wedge onto a surface cropped to the wedge's bounding rect.
+
+        Args:
+            polygon (List[Tuple[int, int]]): The wedge polygon in screen coordinates.
+            color (Tuple[int, int, int, int]): RGBA fill color.
+
+        Returns:
+            Tuple[pygame.Surface, pygame.Rect]: The sprite and its destination rect.
+        """
+        xs = [x for x, _ in polygon]
+        ys = [y for _, y in polygon]
+        rect = pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+        sprite = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.polygon(sprite, color, [(x - rect.x, y - rect.y) for x, y in polygon])
+        return sprite, rect
+
     def precalculate_wedges(self) -> None:
         """
-        Precompute the polygons for the outer and inner wedges.
+        Precompute the polygons for the outer and inner wedges, and the highlight and label
+        sprites that depend on them, so that highlighting a wedge or showing the labels
+        costs only small alpha blits.
+        """
+        self.segments_polygons, self.inner_segments_polygons = self._make_wedge_polygons(0.0)
+        self.layer_cache.clear()
+
+        self.segments_sprites = [
+            self._make_wedge_sprite(poly, self.COLOR_HIGHLIGHT) for poly in self.segments_polygons
+        ]
+        self.inner_segments_sprites = [
+            self._make_wedge_sprite(poly, self.COLOR_HIGHLIGHT) for poly in self.inner_segments_polygons
+        ]
+        self.label_sprites = (
+            self._make_text_sprites(self.major_chords, self.TEXT_RADIUS)
+            + self._make_text_sprites(self.minor_chords, self.INNER_RADIUS - 30)
+        )
+
+    def _make_wedge_polygons(
+        self, rotation: float
+    ) -> Tuple[List[List[Tuple[int, int]]], List[List[Tuple[int, int]]]]:
+        """
+        Computes the outer and inner wedge polygons for the circle rotated by the given angle.
+
+        Args:
+            rotation (float): Clockwise rotation in degrees.
+
+        Returns:
+            Tuple[List[List[Tuple[int, int]]], List[List[Tuple[int, int]]]]: Outer and inner polygons.
         """
-        self.segments_polygons = []
-        self.inner_segments_polygons = []
+        outer = []
+        inner = []
         for i in range(self.SEGMENTS):
-            angle_start = -90 + i * (360 / self.SEGMENTS) - 360/(self.SEGMENTS*2)
+            angle_start = -90 + i * (360 / self.SEGMENTS) - 360/(self.SEGMENTS*2) + rotation
             angle_end = angle_start + (360 / self.SEGMENTS)
-            # Outer wedge
-            poly = self._make_wedge_polygon(angle_start, angle_end, self.RADIUS, self.INNER_RADIUS)
-            self.segments_polygons.append(poly)
-            # Inner wedge
-            poly_inner = self._make_wedge_polygon(angle_start, angle_end, self.INNER_RADIUS, self.INNER_OUTER_RADIUS)
-            self.inner_segments_polygons.append(poly_inner)
+            outer.append(self._make_wedge_polygon(angle_start, angle_end, self.RADIUS, self.INNER_RADIUS))
+            inner.append(self._make_wedge_polygon(angle_start, angle_end, self.INNER_RADIUS, self.INNER_OUTER_RADIUS))
+        return outer, inner
+
+    def _cached(self, key: Hashable, factory):
+        """
+        Returns a cached rotated layer, sprite or layout, building it on a miss and evicting
+        the least recently used entry beyond LAYER_CACHE_SIZE.
+        """
+        value = self.layer_cache.get(key)
+        if value is None:
+            value = factory()
+            self.layer_cache[key] = value
+            if len(self.layer_cache) > LAYER_CACHE_SIZE:
+                self.layer_cache.popitem(last=False)
+        else:
+            self.layer_cache.move_to_end(key)
+        return value
+
+    def _segment_sprite(
+        self, index: int, ring: ChordType, rotation: float
+    ) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Returns the highlight sprite of a wedge on the circle rotated by a quantized angle.
+
+        At multiples of the segment angle each wedge lies exactly where another wedge lies
+        unrotated, so those rotations reuse the precomputed sprites.
+        """
+        sprites = self.segments_sprites if ring == ChordType.MAJOR else self.inner_segments_sprites
+        steps = rotation / (360 / self.SEGMENTS)
+        if steps == int(steps):
+            return sprites[(index + int(steps)) % self.SEGMENTS]
+
+        def build() -> Tuple[pygame.Surface, pygame.Rect]:
+            outer, inner = self._make_wedge_polygons(rotation)
+            polygons = outer if ring == ChordType.MAJOR else inner
+            return self._make_wedge_sprite(polygons[index], self.COLOR_HIGHLIGHT)
+
+        return self._cached(("highlight", rotation, ring, index), build)
+
+    def _label_layout(self, rotation: float) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Returns the label sprites moved to their positions on the circle rotated by a quantized
+        angle. Labels stay upright; only their positions follow the rotation.
+        """
+        if rotation == 0:
+            return self.label_sprites
+
+        def build() -> List[Tuple[pygame.Surface, pygame.Rect]]:
+            layout = []
+            for ring, radius in ((0, self.TEXT_RADIUS), (1, self.INNER_RADIUS - 30)):
+                for i in range(self.SEGMENTS):
+                    text, _ = self.label_sprites[ring * self.SEGMENTS + i]
+                    angle_deg = -90 + i * (360 / self.SEGMENTS) + rotation
+                    text_pos = polar_to_cartesian(self.CENTER, angle_deg, radius)
+                    layout.append((text, text.get_rect(center=text_pos)))
+            return layout
+
+        return self._cached(("labels", rotation), build)
+
+    def _circle_layer(self, selected_chord_indices, rotation: float) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Returns the rendered circle for a selection and quantized rotation, and its screen position.
+
+        Layers are drawn once into colorkeyed surfaces just large enough for the circle, so
+        redrawing an unchanged or recently seen circle is a single blit.
+        """
+        selection = frozenset(selected_chord_indices)
+
+        def build() -> Tuple[pygame.Surface, Tuple[int, int]]:
+            size = 2 * self.RADIUS + 5
+            origin = (self.CENTER[0] - size // 2, self.CENTER[1] - size // 2)
+            layer = pygame.Surface((size, size))
+            layer.fill(LAYER_COLORKEY)
+            layer.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+            if rotation == 0:
+                outer, inner = self.segments_polygons, self.inner_segments_polygons
+            else:
+                outer, inner = self._make_wedge_polygons(rotation)
+            self._draw_geometry(layer, selection, outer, inner, rotation, origin)
+            return layer, origin
+
+        return self._cached(("circle", rotation, selection), build)
 
     def _make_wedge_polygon(
         self, angle_start: float, angle_end: float, outer_radius: float, inner_radius: float
@@ -170,51 +338,78 @@ class CircleOfFifthsDrawable:
             points.append(polar_to_cartesian(self.CENTER, angle, inner_radius))
         return points
 
-    def draw_circle(self, surface: pygame.Surface, selected_chord_indices: List[int]) -> None:
+    def _draw_geometry(
+        self,
+        surface: pygame.Surface,
+        selected_chord_indices,
+        outer: List[List[Tuple[int, int]]],
+        inner: List[List[Tuple[int, int]]],
+        rotation: float,
+        offset: Tuple[int, int],
+    ) -> None:
+        """
+        Draws the wedges, borders and dividers onto a surface positioned at offset on screen.
+        """
+        def shift(poly: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+            return [(x - offset[0], y - offset[1]) for x, y in poly]
+
+        center = (self.CENTER[0] - offset[0], self.CENTER[1] - offset[1])
+        for i, poly in enumerate(outer):
+            color = hsv_color(i, self.SEGMENTS, i in selected_chord_indices)
+            pygame.draw.polygon(surface, color, shift(poly))
+        for i, poly in enumerate(inner):
+            color = hsv_color(i-3, self.SEGMENTS, i in selected_chord_indices)
+            pygame.draw.polygon(surface, color, shift(poly))
+
+        # Draw the border circle
+        pygame.draw.circle(surface, self.COLOR_WHITE, center, self.RADIUS+1, 2)
+        pygame.draw.circle(surface, self.COLOR_BLACK, center, self.INNER_RADIUS+1, 3)
+        pygame.draw.circle(surface, self.COLOR_BLACK, center, self.INNER_OUTER_RADIUS)
+
+        self._draw_lines(surface, self.major_chords, rotation, offset)
+
+    def draw_circle(
+        self, surface: pygame.Surface, selected_chord_indices: List[int], rotation: float = 0.0
+    ) -> None:
         """
-        Draws the circle of fifths on the given surface.
+        Draws the circle of fifths on the given surface from a cached layer.
 
         Args:
             surface (pygame.Surface): The surface to draw on.
             selected_chord_indices (List[int]): Indices of selected chords.
+            rotation (float): Clockwise rotation of the circle in degrees.
         """
-        for i, poly in enumerate(self.segments_polygons):
-            color = hsv_color(i, self.SEGMENTS, i in selected_chord_indices)
-            pygame.draw.polygon(surface, color, poly)
-        for i, poly in enumerate(self.inner_segments_polygons):
-            color = hsv_color(i-3, self.SEGMENTS, i in selected_chord_indices)
-            pygame.draw.polygon(surface, color, poly)
-
-        # Draw the border circle
-        pygame.draw.circle(surface, self.COLOR_WHITE, self.CENTER, self.RADIUS+1, 2)
-        pygame.draw.circle(surface, self.COLOR_BLACK, self.CENTER, self.INNER_RADIUS+1, 3)
-        pygame.draw.circle(surface, self.COLOR_BLACK, self.CENTER, self.INNER_OUTER_RADIUS)
-        
-        self._draw_lines(surface, self.major_chords)
+        layer, origin = self._circle_layer(selected_chord_indices, quantize_rotation(rotation))
+        surface.blit(layer, origin)
 
-    def draw_circle_labels(self, surface: pygame.Surface) -> None:
+    def draw_circle_labels(self, surface: pygame.Surface, rotation: float = 0.0) -> None:
         """
-        Draws the labels for the notes and chords on the circle.
+        Draws the labels for the notes and chords on the circle from the cached label sprites.
 
         Args:
             surface (pygame.Surface): The surface to draw on.
+            rotation (float): Clockwise rotation of the circle in degrees.
         """
-        self._draw_text(surface, self.major_chords, self.TEXT_RADIUS)
-        self._draw_text(surface, self.minor_chords, self.INNER_RADIUS - 30)
-    
+        surface.blits(self._label_layout(quantize_rotation(rotation)), doreturn=False)
+
     def draw_highlighted_chord(
-        self, surface: pygame.Surface, chord, chord_type: ChordType, blink: bool
+        self, surface: pygame.Surface, chord, chord_type: ChordType, blink: bool, rotation: float = 0.0
     ) -> None:
         """
-        Draws the highlighted chord on the circle.
+        Draws the highlighted chord on the circle by blitting its pre-rendered wedge sprite.
 
         Args:
             surface (pygame.Surface): The surface to draw on.
             chord: The chord to highlight.
             chord_type (ChordType): The type of chord (major or minor).
-            blink (bool): Whether to blink the highlight.
+            blink (bool): Whether to blink the highlight. While blinking nothing is drawn.
+            rotation (float): Clockwise rotation of the circle in degrees.
         """
-        color = (255, 255, 255, 220) if not blink else (0, 0, 0, 0)
-        index = self.major_chords.index(chord) if chord_type == ChordType.MAJOR else self.minor_chords.index(chord)
-        polygon_list = self.segments_polygons if chord_type == ChordType.MAJOR else self.inner_segments_polygons
-        pygame.draw.polygon(surface, color, polygon_list[index])
+        if blink:
+            return
+        if chord_type == ChordType.MAJOR:
+            index = self.major_indices[chord]
+        else:
+            index = self.minor_indices[chord]
+        sprite, rect = self._segment_sprite(index, chord_type, quantize_rotation(rotation))
+        surface.blit(sprite, rect)
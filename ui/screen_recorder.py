@@ -0,0 +1,224 @@
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+import pygame
+
+from core.metrics import REGISTRY
+
+FRAMES = REGISTRY.counter("screen_recorder_frames_total", "Frames handed to the screen recorder, by outcome.", ("outcome",))
+FRAMES_RECORDED = FRAMES.labels("recorded")
+FRAMES_DROPPED = FRAMES.labels("dropped")
+
+PNG_SIGNATURE: bytes = b"\x89PNG\r\n\x1a\n"
+# Delay of the last frame of an animation, which has no next frame to measure against.
+LAST_FRAME_SECONDS: float = 1.0
+# zlib level for animation frames; low levels keep the worker ahead of the game.
+COMPRESSION_LEVEL: int = 3
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    """
+    Returns a PNG chunk: length, type, data and CRC.
+    """
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def is_animation_path(path: str) -> bool:
+    """
+    Returns whether a recording path names an animated PNG rather than a directory of frames.
+    """
+    return path.lower().endswith((".png", ".apng"))
+
+
+class ApngWriter:
+    """
+    Streams frames into an animated PNG file.
+
+    Each frame is compressed as soon as it arrives but written once the next frame arrives,
+    because a frame's delay is the time until the next one. The frame count in the header is
+    patched in when the file is closed.
+    """
+
+    def __init__(self, path: str, size: Tuple[int, int]) -> None:
+        """
+        Opens the file and writes the header.
+
+        Args:
+            path (str): Output file.
+            size (Tuple[int, int]): Frame width and height.
+        """
+        self.size = size
+        self.file: BinaryIO = open(path, "wb")
+        width, height = size
+        self.file.write(PNG_SIGNATURE)
+        self.file.write(png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        self.actl_offset = self.file.tell()
+        self.file.write(png_chunk(b"acTL", struct.pack(">II", 0, 0)))
+        self.frames = 0
+        self.sequence = 0
+        self.pending: Optional[Tuple[bytes, float]] = None
+
+    def _compress(self, rgb: bytes) -> bytes:
+        stride = self.size[0] * 3
+        # Filter type 0 (none) in front of every row.
+        rows = b"".join(b"\x00" + rgb[y:y + stride] for y in range(0, len(rgb), stride))
+        return zlib.compress(rows, COMPRESSION_LEVEL)
+
+    def _write_frame(self, data: bytes, delay: float) -> None:
+        width, height = self.size
+        delay_ms = max(1, min(65535, round(delay * 1000)))
+        self.file.write(png_chunk(
+            b"fcTL", struct.pack(">IIIIIHHBB", self.sequence, width, height, 0, 0, delay_ms, 1000, 0, 0)
+        ))
+        self.sequence += 1
+        if self.frames == 0:
+            self.file.write(png_chunk(b"IDAT", data))
+        else:
+            self.file.write(png_chunk(b"fdAT", struct.pack(">I", self.sequence) + data))
+            self.sequence += 1
+        self.frames += 1
+
+    def add(self, rgb: bytes, timestamp: float) -> None:
+        """
+        Adds a frame.
+
+        Args:
+            rgb (bytes): Packed RGB pixels, row by row.
+            timestamp (float): Time the frame was shown, in seconds.
+        """
+        data = self._compress(rgb)
+        if self.pending is not None:
+            previous, previous_time = self.pending
+            self._write_frame(previous, timestamp - previous_time)
+        self.pending = (data, timestamp)
+
+    def close(self) -> None:
+        """
+        Writes the last frame and the trailer, and fixes up the frame count.
+        """
+        if self.pending is not None:
+            self._write_frame(self.pending[0], LAST_FRAME_SECONDS)
+            self.pending = None
+        self.file.write(png_chunk(b"IEND", b""))
+        self.file.seek(self.actl_offset)
+        self.file.write(png_chunk(b"acTL", struct.pack(">II", self.frames, 0)))
+        self.file.close()
+
+
+class ScreenRecorder:
+    """
+    Records rendered frames without blocking the game loop.
+
+    Frames are copied into a fixed ring of pre-allocated surfaces and encoded by a worker
+    thread, either as numbered PNG files in a directory or as one animated PNG. When every
+    buffer is still waiting to be encoded, the new frame is dropped and counted instead of
+    making the game wait.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: Tuple[int, int],
+        capacity: int = 8,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Allocates the frame buffers. Call start() to begin encoding.
+
+        Args:
+            path (str): A .png or .apng file for an animation, otherwise a directory for
+                numbered PNG frames.
+            size (Tuple[int, int]): Size of the recorded surface.
+            capacity (int): Number of frame buffers.
+            clock (Callable[[], float]): Clock returning seconds, used to time the frames.
+        """
+        self.path = path
+        self.size = size
+        self.clock = clock
+        self.buffers: List[pygame.Surface] = [pygame.Surface(size) for _ in range(capacity)]
+        self.free: "queue.SimpleQueue[int]" = queue.SimpleQueue()
+        for slot in range(capacity):
+            self.free.put(slot)
+        self.filled: "queue.SimpleQueue[Optional[Tuple[int, float]]]" = queue.SimpleQueue()
+        self.recorded: int = 0
+        self.dropped: int = 0
+        self.written: int = 0
+        self.timestamps: List[float] = []
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Starts the encoding thread.
+        """
+        self.thread = threading.Thread(target=self._run, name="screen-recorder", daemon=True)
+        self.thread.start()
+
+    def capture(self, surface: pygame.Surface, timestamp: Optional[float] = None) -> bool:
+        """
+        Copies a frame into a free buffer. Never blocks.
+
+        Args:
+            surface (pygame.Surface): The frame, e.g. the display surface after a flip.
+            timestamp (Optional[float]): Time of the frame in seconds; defaults to the clock.
+
+        Returns:
+            bool: True if the frame was queued, False if it was dropped.
+        """
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            FRAMES_DROPPED.inc()
+            return False
+        self.buffers[slot].blit(surface, (0, 0))
+        self.filled.put((slot, self.clock() if timestamp is None else timestamp))
+        self.recorded += 1
+        FRAMES_RECORDED.inc()
+        return True
+
+    def _run(self) -> None:
+        animation = ApngWriter(self.path, self.size) if is_animation_path(self.path) else None
+        if animation is None:
+            os.makedirs(self.path, exist_ok=True)
+        try:
+            while True:
+                item = self.filled.get()
+                if item is None:
+                    break
+                slot, timestamp = item
+                buffer = self.buffers[slot]
+                if animation is not None:
+                    rgb = pygame.image.tobytes(buffer, "RGB")
+                    self.free.put(slot)
+                    animation.add(rgb, timestamp)
+                else:
+                    pygame.image.save(buffer, os.path.join(self.path, f"frame_{self.written:05d}.png"))
+                    self.free.put(slot)
+                    self.timestamps.append(timestamp)
+                self.written += 1
+        finally:
+            if animation is not None:
+                animation.close()
+            else:
+                self._write_timestamps()
+
+    def _write_timestamps(self) -> None:
+        start = self.timestamps[0] if self.timestamps else 0.0
+        with open(os.path.join(self.path, "frames.txt"), "w", encoding="utf-8") as f:
+            for i, timestamp in enumerate(self.timestamps):
+                f.write(f"frame_{i:05d}.png {timestamp - start:.3f}\n")
+
+    def close(self) -> None:
+        """
+        Encodes the frames still queued, finishes the output and stops the thread.
+        """
+        if self.thread is None:
+            return
+        self.filled.put(None)
+        self.thread.join()
+        self.thread = None
@@ -0,0 +1,422 @@
+import argparse
+import curses
+import math
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from config import Config
+from core.animation import BLINK_SECONDS, AnimationScheduler, Blink
+from core.chord_lists import major_chords, minor_chords
+from core.circle import ChordType
+from core.collision import get_chord_index
+from core.game_core import GameCore
+from core.game_text import generate_question_text, get_feedback_message
+from core.naming import NamingSystem, naming_for_locale
+from core.types import GameStateDict
+from localization import Localization
+from ui.interfaces import IGameRenderer
+
+# Cell styles; mapped to curses attributes by TerminalRenderer.
+STYLE_TEXT = 0
+STYLE_MAJOR = 1
+STYLE_MAJOR_SELECTED = 2
+STYLE_MINOR = 3
+STYLE_MINOR_SELECTED = 4
+STYLE_HIGHLIGHT = 5
+STYLE_LABEL = 6
+
+# Terminal cells are roughly twice as tall as they are wide.
+CELL_ASPECT = 2.0
+CIRCLE_TOP = 5
+
+# Longest wait for a key when no animation is due, so the loop stays responsive to resizes.
+MAX_WAIT_MS = 1000
+
+# Ring identifiers for circle cells.
+RING_NONE = 0
+RING_MAJOR = 1
+RING_MINOR = 2
+
+Run = Tuple[int, int, str, int]
+
+
+class TerminalFrame:
+    """
+    A grid of character cells, each with a style.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Initializes an empty frame.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+        """
+        self.width = width
+        self.height = height
+        self.chars: List[List[str]] = [[" "] * width for _ in range(height)]
+        self.styles: List[List[int]] = [[STYLE_TEXT] * width for _ in range(height)]
+
+    def put(self, y: int, x: int, text: str, style: int = STYLE_TEXT) -> None:
+        """
+        Writes text starting at the given cell, clipped to the frame.
+
+        Args:
+            y (int): Row.
+            x (int): Column of the first character.
+            text (str): Text to write.
+            style (int): Style for the written cells.
+        """
+        if not 0 <= y < self.height:
+            return
+        row_chars = self.chars[y]
+        row_styles = self.styles[y]
+        for i, ch in enumerate(text):
+            col = x + i
+            if 0 <= col < self.width:
+                row_chars[col] = ch
+                row_styles[col] = style
+
+    def put_centered(self, y: int, x: int, text: str, style: int = STYLE_TEXT) -> None:
+        """
+        Writes text centered on the given cell.
+        """
+        self.put(y, x - len(text) // 2, text, style)
+
+
+def diff_frames(previous: Optional[TerminalFrame], current: TerminalFrame) -> List[Run]:
+    """
+    Returns the runs of cells that differ between two frames.
+
+    Adjacent changed cells with the same style are merged into one run, so a changed word
+    is emitted as a single write.
+
+    Args:
+        previous (Optional[TerminalFrame]): The frame currently on screen, or None to redraw everything.
+        current (TerminalFrame): The new frame.
+
+    Returns:
+        List[Run]: (row, column, text, style) tuples to write.
+    """
+    runs: List[Run] = []
+    full = (
+        previous is None
+        or previous.width != current.width
+        or previous.height != current.height
+    )
+    for y in range(current.height):
+        chars = current.chars[y]
+        styles = current.styles[y]
+        if not full:
+            prev_chars = previous.chars[y]
+            prev_styles = previous.styles[y]
+            if prev_chars == chars and prev_styles == styles:
+                continue
+        x = 0
+        while x < current.width:
+            if not full and prev_chars[x] == chars[x] and prev_styles[x] == styles[x]:
+                x += 1
+                continue
+            start = x
+            style = styles[x]
+            x += 1
+            while x < current.width and styles[x] == style and (
+                full or prev_chars[x] != chars[x] or prev_styles[x] != styles[x]
+            ):
+                x += 1
+            runs.append((y, start, "".join(chars[start:x]), style))
+    return runs
+
+
+class CircleLayout:
+    """
+    Precomputed mapping from terminal cells to circle rings and segments.
+    """
+
+    def __init__(self, width: int, height: int, segments: int = 12) -> None:
+        """
+        Computes the ring and segment of every cell in the circle area.
+
+        Args:
+            width (int): Number of columns of the terminal.
+            height (int): Number of rows of the terminal.
+            segments (int): Number of chords in the circle.
+        """
+        self.segments = segments
+        rows = max(height - CIRCLE_TOP, 3)
+        self.radius = max(min((rows - 1) / 2, (width - 2) / (2 * CELL_ASPECT)), 1.0)
+        self.center = (width // 2, CIRCLE_TOP + rows // 2)
+        scale = self.radius / Config.CIRCLE_RADIUS
+        self.inner_radius = Config.CIRCLE_INNER_RADIUS * scale
+        self.hole_radius = Config.CIRCLE_INNER_OUTER_RADIUS * scale
+        self.major_text_radius = Config.CIRCLE_TEXT_RADIUS * scale
+        self.minor_text_radius = (Config.CIRCLE_INNER_RADIUS - 30) * scale
+
+        # (row, column, ring, segment) for every cell that lies on the circle.
+        self.cells: List[Tuple[int, int, int, int]] = []
+        cx, cy = self.center
+        top = max(cy - int(self.radius) - 1, 0)
+        bottom = min(cy + int(self.radius) + 2, height)
+        for y in range(top, bottom):
+            for x in range(width):
+                dx = (x - cx) / CELL_ASPECT
+                dy = y - cy
+                r = math.hypot(dx, dy)
+                if r > self.radius or r <= self.hole_radius:
+                    continue
+                ring = RING_MAJOR if r > self.inner_radius else RING_MINOR
+                segment = get_chord_index((0, 0), (dx, dy)) % segments
+                self.cells.append((y, x, ring, segment))
+
+    def label_position(self, index: int, chord_type: ChordType) -> Tuple[int, int]:
+        """
+        Returns the (row, column) at which a chord label is centered.
+        """
+        radius = self.major_text_radius if chord_type == ChordType.MAJOR else self.minor_text_radius
+        angle = math.radians(-90 + index * 360 / self.segments)
+        x = self.center[0] + radius * math.cos(angle) * CELL_ASPECT
+        y = self.center[1] + radius * math.sin(angle)
+        return int(round(y)), int(round(x))
+
+
+class TerminalRenderer(IGameRenderer):
+    """
+    Renders the game as text art in a curses window, writing only the cells that changed.
+    """
+
+    def __init__(self, screen, lang: str = "en") -> None:
+        """
+        Initializes the renderer.
+
+        Args:
+            screen: A curses window (or any object with getmaxyx, addstr and refresh).
+            lang (str): Language code for localization.
+        """
+        self.screen = screen
+        self.loc: Localization = Localization(lang)
+        self.naming: NamingSystem = naming_for_locale(self.loc)
+        self.previous: Optional[TerminalFrame] = None
+        self.layout: Optional[CircleLayout] = None
+        self.layout_size: Tuple[int, int] = (0, 0)
+        self.attrs = {style: 0 for style in range(STYLE_LABEL + 1)}
+        self.attrs[STYLE_HIGHLIGHT] = curses.A_REVERSE
+        self.attrs[STYLE_LABEL] = curses.A_BOLD
+        self.cells_written: int = 0
+
+    def setup_colors(self) -> None:
+        """
+        Maps cell styles to terminal colors, if the terminal supports them.
+        """
+        if not curses.has_colors():
+            return
+        curses.start_color()
+        curses.use_default_colors()
+        pairs = {
+            STYLE_MAJOR: curses.COLOR_BLUE,
+            STYLE_MAJOR_SELECTED: curses.COLOR_CYAN,
+            STYLE_MINOR: curses.COLOR_MAGENTA,
+            STYLE_MINOR_SELECTED: curses.COLOR_YELLOW,
+        }
+        for style, color in pairs.items():
+            curses.init_pair(style, color, -1)
+            self.attrs[style] = curses.color_pair(style)
+        self.attrs[STYLE_MAJOR_SELECTED] |= curses.A_BOLD
+        self.attrs[STYLE_MINOR_SELECTED] |= curses.A_BOLD
+
+    def compose(self, state: GameStateDict, input_text: str, blink: bool, width: int, height: int) -> TerminalFrame:
+        """
+        Builds the text frame for the given game state.
+
+        Args:
+            state (GameStateDict): The current game state dictionary.
+            input_text (str): The current user input text.
+            blink (bool): Whether the blink effect is active.
+            width (int): Number of columns.
+            height (int): Number of rows.
+
+        Returns:
+            TerminalFrame: The composed frame.
+        """
+        if self.layout is None or self.layout_size != (width, height):
+            self.layout = CircleLayout(width, height, len(state["chord_list"]))
+            self.layout_size = (width, height)
+        frame = TerminalFrame(width, height)
+
+        frame.put(0, 0, generate_question_text(state, self.loc, state["chord_list"]))
+        correct, total = state.get("stats", (0, 0))
+        stats = f"{correct} / {total}"
+        frame.put(0, width - len(stats), stats)
+        frame.put(2, 0, "> " + input_text)
+        if state.get("last_result") is not None:
+            frame.put(3, 0, get_feedback_message(state, self.loc))
+
+        selected = set(state["selected_chord_indices"])
+        highlight_ring, highlight_segment = RING_NONE, -1
+        if state.get("current_chord") is not None and not blink:
+            highlight_ring = RING_MAJOR if state["chord_type"] == ChordType.MAJOR else RING_MINOR
+            highlight_segment = state["chord_list"].index(state["current_chord"])
+
+        for y, x, ring, segment in self.layout.cells:
+            if ring == highlight_ring and segment == highlight_segment:
+                frame.chars[y][x] = " "
+                frame.styles[y][x] = STYLE_HIGHLIGHT
+            elif ring == RING_MAJOR:
+                is_selected = segment in selected
+                frame.chars[y][x] = "#" if is_selected else "."
+                frame.styles[y][x] = STYLE_MAJOR_SELECTED if is_selected else STYLE_MAJOR
+            else:
+                is_selected = segment in selected
+                frame.chars[y][x] = "=" if is_selected else ","
+                frame.styles[y][x] = STYLE_MINOR_SELECTED if is_selected else STYLE_MINOR
+
+        if state.get("game_state") != "ACTIVE":
+            for chord_type, chords in ((ChordType.MAJOR, major_chords), (ChordType.MINOR, minor_chords)):
+                for i, chord in enumerate(chords):
+                    y, x = self.layout.label_position(i, chord_type)
+                    frame.put_centered(y, x, self.naming.label(chord), STYLE_LABEL)
+        return frame
+
+    def render(self, state: GameStateDict, input_text: str, blink: bool) -> None:
+        """
+        Renders the game state, writing only the cells that differ from the previous frame.
+
+        Args:
+            state (GameStateDict): The current game state dictionary.
+            input_text (str): The current user input text.
+            blink (bool): Whether the blink effect is active.
+        """
+        height, width = self.screen.getmaxyx()
+        frame = self.compose(state, input_text, blink, width, height)
+        runs = diff_frames(self.previous, frame)
+        for y, x, text, style in runs:
+            # Writing the bottom-right cell moves the cursor off screen, which curses reports as an error.
+            if y == height - 1 and x + len(text) >= width:
+                text = text[: width - 1 - x]
+            if text:
+                self.screen.addstr(y, x, text, self.attrs[style])
+                self.cells_written += len(text)
+        self.screen.move(2, min(2 + len(input_text), width - 1))
+        self.screen.refresh()
+        self.previous = frame
+
+
+class TerminalGame:
+    """
+    Runs the quiz on GameCore with keyboard input from curses and a TerminalRenderer.
+    """
+
+    ACTIVE = "ACTIVE"
+    INACTIVE = "INACTIVE"
+    ADVANCE = "ADVANCE"
+
+    def __init__(self, screen, lang: str = "en", seed: Optional[int] = None) -> None:
+        """
+        Initializes the terminal game.
+
+        Args:
+            screen: The curses window to draw on.
+            lang (str): Language code for localization.
+            seed (Optional[int]): Seed for the question generator.
+        """
+        self.screen = screen
+        self.renderer = TerminalRenderer(screen, lang)
+        self.core = GameCore(seed, naming=self.renderer.naming)
+        self.core.next_question()
+        self.input_text: str = ""
+        self.state: str = self.ACTIVE
+        self.redraw: bool = True
+        self.running: bool = True
+        self.animations = AnimationScheduler()
+        self.blink = Blink(self.animations, BLINK_SECONDS)
+        self.blink.start()
+
+    def handle_key(self, key) -> None:
+        """
+        Handles one key from curses get_wch, mirroring CircleOfFifthsGame.handle_events.
+
+        Args:
+            key (Union[str, int]): A character or a curses key code.
+        """
+        self.redraw = True
+        enter = key in ("\n", "\r", curses.KEY_ENTER)
+        if key == "\x1b":
+            self.running = False
+        elif self.state == self.ACTIVE:
+            if key in (curses.KEY_BACKSPACE, "\x7f", "\b"):
+                self.input_text = self.input_text[:-1]
+            elif enter:
+                self.state = self.INACTIVE
+                self.core.submit_answer(self.input_text)
+            elif isinstance(key, str) and key.isprintable():
+                self.input_text += key
+        elif self.state == self.INACTIVE and enter:
+            self.state = self.ADVANCE
+        if self.state == self.ADVANCE and enter:
+            self.input_text = ""
+            self.core.next_question()
+            self.state = self.ACTIVE
+            self.blink.reset()
+
+    def render(self) -> None:
+        """
+        Renders the current state if anything changed.
+        """
+        if not self.redraw:
+            return
+        state: GameStateDict = self.core.get_state()
+        state["game_state"] = self.state
+        state["chord_list"] = self.core.get_chord_list(state["chord_type"])
+        state["stats"] = self.core.get_stats()
+        self.redraw = False
+        self.renderer.render(state, self.input_text, self.blink.on)
+
+    def wait_ms(self) -> int:
+        """
+        Returns how long the loop may wait for a key before an animation is due, in whole
+        milliseconds between one frame and MAX_WAIT_MS.
+        """
+        deadline = self.animations.next_deadline()
+        if deadline is None:
+            return MAX_WAIT_MS
+        wait = math.ceil((deadline - self.animations.now()) * 1000)
+        return max(1000 // Config.FPS, min(MAX_WAIT_MS, wait))
+
+    def run(self) -> None:
+        """
+        Main loop: waits for a key until the next animation deadline, runs due animations
+        and renders.
+        """
+        self.renderer.setup_colors()
+        while self.running:
+            self.screen.timeout(self.wait_ms())
+            try:
+                key = self.screen.get_wch()
+            except curses.error:
+                key = None
+            if key == curses.KEY_RESIZE:
+                self.renderer.previous = None
+                self.screen.clear()
+                self.redraw = True
+            elif key is not None:
+                self.handle_key(key)
+            if self.animations.update():
+                self.redraw = True
+            self.render()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command line entry point for the terminal front end.
+    """
+    parser = argparse.ArgumentParser(description="Circle of Fifths practice in the terminal.")
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    # Make Esc respond immediately instead of after curses' default one second delay.
+    os.environ.setdefault("ESCDELAY", "25")
+    curses.wrapper(lambda screen: TerminalGame(screen, args.lang, args.seed).run())
+
+
+if __name__ == "__main__":
+    main()